@@ -0,0 +1,139 @@
+#! /usr/bin/env python3
+"""
+Measures the rate of converting rows of encoder values or positions with
+the batched functions of :mod:`forcedimension_core.dhd.expert.batch`
+against calling the per-sample function of
+:mod:`forcedimension_core.dhd.expert` in a Python loop.
+
+Each conversion is timed against the no-op stub library (see
+``stub.py``), so the rates are those of the bindings:
+
+* ``loop``: the per-sample function, once per row
+* ``batch``: the batched function on one thread
+* ``batch xN``: the batched function split across N threads
+
+Usage::
+
+    python3 benchmarks/bench_batch.py [--json] [--rows N] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from typing import Any, Callable, Dict, List
+
+# Imported first: it selects a backend the package can import without the
+# Force Dimension SDK.
+import stub  # isort: skip
+
+from bench_overhead import metadata
+
+import forcedimension_core.dhd.expert as expert
+from forcedimension_core import runtime
+from forcedimension_core.dhd.expert import batch
+
+FUNCTIONS = (
+    ('deltaEncoderToPosition', 'i', 'd'),
+    ('deltaPositionToEncoder', 'd', 'i'),
+    ('wristEncoderToOrientation', 'i', 'd'),
+    ('wristOrientationToEncoder', 'd', 'i'),
+)
+
+
+def _rows(typecode: str, rows: int) -> Any:
+    data = array(typecode, bytes(array(typecode).itemsize * 3 * rows))
+
+    return memoryview(data).cast('B').cast(typecode, (rows, 3))
+
+
+def _loop(func: Callable, src: Any, out: Any):
+    values = src.tolist()
+    result = [0, 0, 0]
+
+    def loop():
+        for row in values:
+            func(row, result)
+
+    return loop
+
+
+def _rate(func: Callable, rows: int, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return rows / best
+
+
+def run(
+    rows: int = 100_000, workers: int = 0, repeat: int = 5
+) -> List[Dict[str, Any]]:
+    previous = stub.install()
+    runtime.preload()
+
+    workers = workers or os.cpu_count() or 1
+    results = []
+
+    try:
+        for name, src_type, out_type in FUNCTIONS:
+            src = _rows(src_type, rows)
+            out = _rows(out_type, rows)
+            batched = getattr(batch, name)
+
+            entry: Dict[str, Any] = {'name': name}
+
+            for key, func in (
+                ('loop', _loop(getattr(expert, name), src, out)),
+                ('batch', lambda: batched(src, out)),
+                (f'batch_x{workers}', lambda: batched(src, out, -1, workers)),
+            ):
+                entry[key] = round(_rate(func, rows, repeat))
+
+            results.append(entry)
+    finally:
+        runtime.install(previous)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument(
+        '--workers', type=int, default=0,
+        help='threads of the threaded run (default: one per CPU)'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+
+    results = run(args.rows, args.workers, args.repeat)
+
+    if args.json:
+        json.dump(
+            {'meta': metadata(), 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+        return
+
+    keys = [key for key in results[0] if key != 'name']
+
+    print(f"{'rows/s':<28}" + ''.join(f"{key:>14}" for key in keys))
+
+    for entry in results:
+        print(
+            f"{entry['name']:<28}" +
+            ''.join(f"{entry[key]:>14,}" for key in keys)
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#! /usr/bin/env python3
+"""
+Measures what the pre-bound symbol references of the wrapper modules save
+per call over looking the symbol up on the runtime library.
+
+Before, every wrapper called ``_runtime._libdhd.dhdGetPosition(...)``: a
+module attribute lookup and a library attribute lookup on each call. The
+wrappers now call a module global (``_dhdGetPosition(...)``) that the
+runtime keeps pointing at the resolved function. Both call paths are timed
+for every symbol declared by the dhd and drd modules, against the no-op
+stub library (see ``stub.py``), so the difference is the lookup cost alone.
+
+Usage::
+
+    python3 benchmarks/bench_bound.py [--json] [--filter REGEX]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+from typing import Any, Dict, List, Optional
+
+# Imported first: it selects a backend the package can import without the
+# Force Dimension SDK.
+import stub  # isort: skip
+
+from bench_overhead import _raw_args, _time, metadata
+
+from forcedimension_core import runtime
+
+
+def run(
+    pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.02
+) -> List[Dict[str, Any]]:
+    previous = stub.install()
+    runtime.preload()
+
+    results = []
+
+    try:
+        for name, (argtypes, _) in sorted(stub.prototypes().items()):
+            if pattern is not None and not re.search(pattern, name):
+                continue
+
+            args = _raw_args(argtypes)
+            namespace = {f'_{name}': getattr(runtime._libdrd, name)}
+
+            lookup = _time(
+                eval(f'lambda a: _runtime._libdrd.{name}(*a)',
+                     {'_runtime': runtime}),
+                [args], repeat, min_time
+            )[0]
+
+            bound = _time(
+                eval(f'lambda a: _{name}(*a)', namespace),
+                [args], repeat, min_time
+            )[0]
+
+            results.append({
+                'name': name,
+                'lookup_ns': round(lookup * 1e9, 1),
+                'bound_ns': round(bound * 1e9, 1),
+                'saving_ns': round((lookup - bound) * 1e9, 1),
+            })
+    finally:
+        runtime.install(previous)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--filter', help='only time symbols whose name matches this regex'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--min-time', type=float, default=0.02,
+        help='minimum duration of one timing run in seconds'
+    )
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat, args.min_time)
+
+    if not results:
+        return
+
+    savings = [entry['saving_ns'] for entry in results]
+    summary = {
+        'symbols': len(results),
+        'median_saving_ns': round(statistics.median(savings), 1),
+        'mean_saving_ns': round(statistics.mean(savings), 1),
+    }
+
+    if args.json:
+        json.dump(
+            {'meta': metadata(), 'summary': summary, 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+        return
+
+    print(f"{'symbol':<48} {'lookup ns':>10} {'bound ns':>10} "
+          f"{'saving':>8}")
+
+    for entry in results:
+        print(
+            f"{entry['name']:<48} {entry['lookup_ns']:>10.1f} "
+            f"{entry['bound_ns']:>10.1f} {entry['saving_ns']:>8.1f}"
+        )
+
+    print(
+        f"\n{summary['symbols']} symbols, saving per call: "
+        f"median {summary['median_saving_ns']:.1f} ns, "
+        f"mean {summary['mean_saving_ns']:.1f} ns"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#! /usr/bin/env python3
+"""
+Measures the cost of the checked functions of dhd.checked and drd.checked
+against checking the return value by hand.
+
+Each function is timed three ways on a successful call, against the no-op
+stub library (see ``stub.py``):
+
+* ``raw``: the unchecked function, ignoring its return value
+* ``manual``: the unchecked function followed by the usual
+  ``if result == -1: raise errno_to_exception(dhd.errorGetLast())(...)``
+* ``checked``: the function of :mod:`forcedimension_core.dhd.checked` or
+  :mod:`forcedimension_core.drd.checked`
+
+Usage::
+
+    python3 benchmarks/bench_checked.py [--json] [--filter REGEX]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+from typing import Any, Dict, List, Optional
+
+# Imported first: it selects a backend the package can import without the
+# Force Dimension SDK.
+import stub  # isort: skip
+
+from bench_overhead import _time, make_args, metadata
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.drd as drd
+from forcedimension_core import runtime
+from forcedimension_core.util import errno_to_exception
+
+
+def _manual(func):
+    op = f'{func.__module__}.{func.__name__}'
+
+    def manual(*args):
+        if (result := func(*args)) == -1:
+            raise errno_to_exception(dhd.errorGetLast())(op=op)
+
+        return result
+
+    return manual
+
+
+def run(
+    pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.02
+) -> List[Dict[str, Any]]:
+    previous = stub.install()
+    runtime.preload()
+
+    results = []
+
+    try:
+        for module in (dhd, drd):
+            prefix = module.__name__[len('forcedimension_core.'):]
+
+            for name, checked in sorted(vars(module.checked).items()):
+                if name.startswith('_') or not callable(checked):
+                    continue
+
+                if pattern is not None and not re.search(
+                    pattern, f'{prefix}.{name}'
+                ):
+                    continue
+
+                func = checked.__wrapped__
+
+                try:
+                    args, _ = make_args(func)
+                    checked(*args)
+                except Exception:
+                    # Fails against the stub, e.g. waits for a device
+                    continue
+
+                raw = _time(func, args, repeat, min_time)[0]
+                manual = _time(_manual(func), args, repeat, min_time)[0]
+                timed = _time(checked, args, repeat, min_time)[0]
+
+                results.append({
+                    'name': f'{prefix}.{name}',
+                    'raw_ns': round(raw * 1e9, 1),
+                    'manual_ns': round(manual * 1e9, 1),
+                    'checked_ns': round(timed * 1e9, 1),
+                })
+    finally:
+        runtime.install(previous)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--filter', help='only time functions whose name matches this regex'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--min-time', type=float, default=0.02,
+        help='minimum duration of one timing run in seconds'
+    )
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat, args.min_time)
+
+    if not results:
+        return
+
+    summary = {
+        'functions': len(results),
+        'median_manual_overhead_ns': round(statistics.median(
+            e['manual_ns'] - e['raw_ns'] for e in results
+        ), 1),
+        'median_checked_overhead_ns': round(statistics.median(
+            e['checked_ns'] - e['raw_ns'] for e in results
+        ), 1),
+    }
+
+    if args.json:
+        json.dump(
+            {'meta': metadata(), 'summary': summary, 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+        return
+
+    print(f"{'function':<48} {'raw ns':>8} {'manual ns':>10} "
+          f"{'checked ns':>11}")
+
+    for entry in results:
+        print(
+            f"{entry['name']:<48} {entry['raw_ns']:>8.1f} "
+            f"{entry['manual_ns']:>10.1f} {entry['checked_ns']:>11.1f}"
+        )
+
+    print(
+        f"\n{summary['functions']} functions, overhead over the unchecked "
+        f"call: median {summary['median_manual_overhead_ns']:.1f} ns by "
+        f"hand, {summary['median_checked_overhead_ns']:.1f} ns checked"
+    )
+
+
+if __name__ == '__main__':
+    main()
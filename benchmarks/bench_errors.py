@@ -0,0 +1,108 @@
+#! /usr/bin/env python3
+"""
+Measures the cost of raising and catching the errors of
+:mod:`forcedimension_core.dhd.adaptors`, as retry loops do.
+
+Three ways of raising ``DHDErrorTimeout`` are timed:
+
+* ``eager``: an error formatting its message at construction, as the
+  adaptors did before
+* ``lazy``: constructing the error of the adaptors, whose message is only
+  formatted by ``str()``
+* ``reused``: raising one preallocated error with ``raise error.reset()``
+
+Usage::
+
+    python3 benchmarks/bench_errors.py [--json]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Optional
+
+# Imported first: through stub, it selects a backend the package can import
+# without the Force Dimension SDK.
+from bench_overhead import _time, metadata  # isort: skip
+
+from forcedimension_core.dhd.adaptors import DHDErrorTimeout
+
+OP = 'forcedimension_core.dhd.getPosition'
+
+
+class EagerTimeout(OSError):
+    def __init__(
+        self,
+        *args,
+        op: Optional[str] = None,
+        ID: Optional[int] = None,
+        **kwargs
+    ):
+        op_seg = "" if op is None else f"{op} failed. "
+        id_seg = "" if ID is None else f" occured on device {ID}"
+
+        return super().__init__(f"{op_seg}timeout{id_seg}")
+
+
+def eager(ID):
+    try:
+        raise EagerTimeout(op=OP, ID=ID)
+    except OSError:
+        pass
+
+
+def lazy(ID):
+    try:
+        raise DHDErrorTimeout(op=OP, ID=ID)
+    except OSError:
+        pass
+
+
+_error = DHDErrorTimeout(op=OP)
+
+
+def reused(ID):
+    try:
+        raise _error.reset(ID=ID)
+    except OSError:
+        pass
+
+
+def run(repeat: int = 5, min_time: float = 0.05) -> Dict[str, Any]:
+    return {
+        name: round(_time(func, [0], repeat, min_time)[0] * 1e9, 1)
+        for name, func in (
+            ('eager_ns', eager), ('lazy_ns', lazy), ('reused_ns', reused)
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--min-time', type=float, default=0.05,
+        help='minimum duration of one timing run in seconds'
+    )
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.min_time)
+
+    if args.json:
+        json.dump(
+            {'meta': metadata(), 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+        return
+
+    print("raise and catch DHDErrorTimeout(op=..., ID=...):")
+
+    for name, ns in results.items():
+        print(f"  {name[:-3]:<8} {ns:>8.1f} ns")
+
+
+if __name__ == '__main__':
+    main()
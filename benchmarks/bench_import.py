@@ -0,0 +1,96 @@
+#! /usr/bin/env python3
+"""
+Measures the startup cost of importing forcedimension_core with lazy
+prototype registration against the cost of binding every prototype up front
+(the behaviour prior to lazy binding, reproduced with runtime.preload()).
+
+Every sample is taken in a fresh interpreter so that module caches do not
+skew the results.
+
+Usage::
+
+    python3 benchmarks/bench_import.py [--samples N] [--mock]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import time
+t0 = time.perf_counter()
+import forcedimension_core
+t1 = time.perf_counter()
+forcedimension_core.runtime.preload()
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def _sample(env):
+    out = subprocess.run(
+        [sys.executable, '-c', _PROBE],
+        env=env, check=True, capture_output=True, text=True
+    )
+
+    import_time, bind_time = out.stdout.strip().splitlines()[-1].split()
+
+    return float(import_time), float(bind_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--samples', type=int, default=20)
+    parser.add_argument(
+        '--mock', action='store_true',
+        help='use the mock runtime instead of an installed libdrd'
+    )
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        filter(None, (
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env.get('PYTHONPATH')
+        ))
+    )
+
+    if args.mock:
+        env['__fdsdkpy_unittest__'] = 'True'
+
+    samples = [_sample(env) for _ in range(args.samples)]
+    lazy = [import_time for import_time, _ in samples]
+    eager = [import_time + bind_time for import_time, bind_time in samples]
+    bind = [bind_time for _, bind_time in samples]
+
+    results = {
+        name: {
+            'median_ms': statistics.median(data) * 1e3,
+            'min_ms': min(data) * 1e3,
+        }
+        for name, data in (('lazy', lazy), ('eager', eager), ('bind', bind))
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, res in results.items():
+        print(
+            f"{name:>6}: median {res['median_ms']:8.3f} ms  "
+            f"min {res['min_ms']:8.3f} ms"
+        )
+
+    print(
+        f"{len(samples)} fresh interpreters; 'bind' is the prototype "
+        "registration cost every process no longer pays at import"
+    )
+
+
+if __name__ == '__main__':
+    main()
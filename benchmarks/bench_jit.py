@@ -0,0 +1,237 @@
+#! /usr/bin/env python3
+"""
+Measures the rate of a haptic loop (read the position, compute a spring
+force, set it) written in Python against the same loop compiled, calling
+the library through :func:`forcedimension_core.runtime.symbol_addresses()`.
+
+The loop runs against the no-op stub library (see ``stub.py``), so the
+rates are those of the loop itself. It is run:
+
+* ``python``: with :func:`forcedimension_core.dhd.getPosition()` and
+  :func:`forcedimension_core.dhd.setForce()`
+* ``ctypes``: from Python, through the function pointers of
+  :meth:`forcedimension_core.runtime.SymbolAddress.to_ctypes()`
+* ``c``: compiled with the C compiler that builds the stub
+* ``numba``: compiled by Numba (if it is installed)
+
+Usage::
+
+    python3 benchmarks/bench_jit.py [--json] [--loops N]
+"""
+
+import argparse
+import ctypes as ct
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Imported first: it selects a backend the package can import without the
+# Force Dimension SDK.
+import stub  # isort: skip
+
+from bench_overhead import metadata
+
+import forcedimension_core.dhd as dhd
+from forcedimension_core import containers, runtime
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None  # type: ignore
+
+K = 150.  # spring constant in [N]/[m]
+
+SYMBOLS = ('dhdGetPosition', 'dhdSetForce')
+
+_LOOP_SOURCE = """\
+typedef int (*get_position_t)(double *, double *, double *, signed char);
+typedef int (*set_force_t)(double, double, double, signed char);
+
+int loop(
+    get_position_t get_position, set_force_t set_force, double *pos,
+    long n, signed char ID
+)
+{
+    for (long i = 0; i < n; ++i) {
+        if (get_position(pos, pos + 1, pos + 2, ID) == -1) return -1;
+
+        if (set_force(
+            -%r * pos[0], -%r * pos[1], -%r * pos[2], ID
+        ) == -1) return -1;
+    }
+
+    return 0;
+}
+""" % (K, K, K)
+
+
+def _python(n: int, ID: int):
+    pos = containers.Vec3()
+    f = [0., 0., 0.]
+
+    for _ in range(n):
+        dhd.getPosition(pos, ID)
+        f[0] = -K * pos[0]
+        f[1] = -K * pos[1]
+        f[2] = -K * pos[2]
+        dhd.setForce(f, ID)
+
+
+def _ctypes(symbols: Dict[str, runtime.SymbolAddress]) -> Callable:
+    get_position = symbols['dhdGetPosition'].to_ctypes()
+    set_force = symbols['dhdSetForce'].to_ctypes()
+
+    def loop(n: int, ID: int):
+        pos = containers.Vec3()
+        px, py, pz = pos.ptrs
+
+        for _ in range(n):
+            get_position(px, py, pz, ID)
+            set_force(-K * pos[0], -K * pos[1], -K * pos[2], ID)
+
+    return loop
+
+
+def _c(symbols: Dict[str, runtime.SymbolAddress]) -> Optional[Callable]:
+    if (cc := os.environ.get('CC') or shutil.which('cc')) is None:
+        return None
+
+    build_dir = stub.default_build_dir()
+    os.makedirs(build_dir, exist_ok=True)
+
+    src_path = os.path.join(build_dir, 'jit_loop.c')
+    lib_path = os.path.join(build_dir, 'jit_loop.so')
+
+    with open(src_path, 'w') as f:
+        f.write(_LOOP_SOURCE)
+
+    subprocess.run(
+        [cc, '-O2', '-shared', '-fPIC', '-o', lib_path, src_path], check=True
+    )
+
+    c_loop = ct.CDLL(lib_path).loop
+    c_loop.argtypes = [
+        ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_long, ct.c_byte
+    ]
+    c_loop.restype = ct.c_int
+
+    get_position = symbols['dhdGetPosition'].address
+    set_force = symbols['dhdSetForce'].address
+
+    def loop(n: int, ID: int):
+        pos = containers.Vec3()
+        c_loop(get_position, set_force, pos.buffer_info()[0], n, ID)
+
+    return loop
+
+
+def _numba(symbols: Dict[str, runtime.SymbolAddress]) -> Optional[Callable]:
+    if numba is None:
+        return None
+
+    get_position = symbols['dhdGetPosition'].to_ctypes()
+    set_force = symbols['dhdSetForce'].to_ctypes()
+
+    @numba.njit
+    def jitted(pos, n, ID):
+        for _ in range(n):
+            if get_position(
+                pos[0:].ctypes, pos[1:].ctypes, pos[2:].ctypes, ID
+            ) == -1:
+                return -1
+
+            if set_force(-K * pos[0], -K * pos[1], -K * pos[2], ID) == -1:
+                return -1
+
+        return 0
+
+    def loop(n: int, ID: int):
+        pos = containers.numpy.Vec3()
+        jitted(pos.view(np.ndarray), n, ID)
+
+    # Compile ahead of the timing.
+    loop(1, 0)
+
+    return loop
+
+
+def _rate(loop: Callable, n: int, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loop(n, 0)
+        best = min(best, time.perf_counter() - start)
+
+    return n / best
+
+
+def run(loops: int = 100_000, repeat: int = 5) -> List[Dict[str, Any]]:
+    previous = stub.install()
+    runtime.preload(SYMBOLS)
+
+    results = []
+
+    try:
+        symbols = runtime.symbol_addresses(SYMBOLS)
+
+        for name, loop in (
+            ('python', _python),
+            ('ctypes', _ctypes(symbols)),
+            ('c', _c(symbols)),
+            ('numba', _numba(symbols)),
+        ):
+            if loop is None:
+                continue
+
+            results.append({
+                'name': name,
+                'loops_per_s': round(_rate(loop, loops, repeat)),
+            })
+    finally:
+        runtime.install(previous)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--loops', type=int, default=100_000,
+        help='number of iterations of one timing run'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+
+    results = run(args.loops, args.repeat)
+    baseline = results[0]['loops_per_s']
+
+    for entry in results:
+        entry['speedup'] = round(entry['loops_per_s'] / baseline, 2)
+
+    if args.json:
+        json.dump(
+            {'meta': metadata(), 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+        return
+
+    print(f"{'loop':<8} {'loops/s':>14} {'speedup':>8}")
+
+    for entry in results:
+        print(
+            f"{entry['name']:<8} {entry['loops_per_s']:>14,} "
+            f"{entry['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
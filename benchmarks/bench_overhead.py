@@ -0,0 +1,419 @@
+#! /usr/bin/env python3
+"""
+Measures the per-call overhead of every public wrapper in dhd, dhd.direct,
+dhd.expert, dhd.expert.direct, drd and drd.direct.
+
+The wrappers are run against a compiled no-op stub of libdrd (see
+``stub.py``), so the time of a call is the cost of the bindings plus the
+foreign function call itself. The symbols each wrapper calls are recorded
+once, and the time of calling those symbols directly is reported
+alongside, giving the overhead the Python side adds on top of the FFI.
+
+Wrappers that take containers are timed once with the array-based
+containers of :mod:`forcedimension_core.containers` and once with
+:mod:`forcedimension_core.containers.numpy` (if NumPy is installed).
+
+Usage::
+
+    python3 benchmarks/bench_overhead.py [--json | --csv] [--filter REGEX]
+    python3 benchmarks/bench_overhead.py --json > 1.0.0.json
+    python3 benchmarks/bench_overhead.py --compare 1.0.0.json
+"""
+
+import argparse
+import csv
+import ctypes as ct
+import enum
+import inspect
+import json
+import platform
+import re
+import statistics
+import sys
+import timeit
+import typing
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Imported first: it selects a backend the package can import without the
+# Force Dimension SDK.
+import stub  # isort: skip
+
+import forcedimension_core
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.direct as dhd_direct
+import forcedimension_core.dhd.expert as expert
+import forcedimension_core.dhd.expert.direct as expert_direct
+import forcedimension_core.drd as drd
+import forcedimension_core.drd.direct as drd_direct
+from forcedimension_core import containers, runtime
+
+MODULES = (dhd, dhd_direct, expert, expert_direct, drd, drd_direct)
+
+try:
+    import forcedimension_core.containers.numpy as np_containers
+except ImportError:
+    np_containers = None  # type: ignore
+
+
+def wrappers(pattern: Optional[str] = None) -> List[Tuple[str, Callable]]:
+    """
+    Get every public function defined in the benchmarked modules, as
+    ``(qualified name, function)`` pairs.
+    """
+
+    found = []
+
+    for module in MODULES:
+        prefix = module.__name__[len('forcedimension_core.'):]
+
+        for name, func in vars(module).items():
+            if name.startswith('_') or not inspect.isfunction(func):
+                continue
+
+            if func.__module__ != module.__name__:
+                continue
+
+            if pattern is None or re.search(pattern, f'{prefix}.{name}'):
+                found.append((f'{prefix}.{name}', func))
+
+    return found
+
+
+# Candidate arguments for each annotation, smallest first. The largest
+# candidate is used if a wrapper rejects the smallest one.
+def _candidates(annotation: Any, impl: Any) -> Optional[List[Callable]]:
+    text = str(annotation)
+
+    def nested(n):
+        if impl is containers:
+            return lambda: [[0.] * n for _ in range(n)]
+
+        return getattr(impl, f'Mat{n}x{n}')
+
+    if 'MutableArray[int, float]]' in text:
+        return [nested(3), nested(6)]
+
+    if 'SupportsPtrs3' in text:
+        if 'c_double' in text:
+            return [impl.Vec3]
+        if 'c_int' in text:
+            return [impl.Enc3]
+        if 'c_ushort' in text:
+            return [impl.Mot3]
+
+    if 'SupportsPtr[' in text:
+        if 'c_double' in text:
+            return [impl.Vec3, impl.Mat3x3, impl.Mat6x6]
+        if 'c_int' in text:
+            return [impl.Enc3, impl.DOFInt]
+        if 'c_ushort' in text:
+            return [impl.Mot3, impl.DOFMotor]
+
+    if 'Array[int, float]' in text:
+        return [impl.Vec3, impl.DOFFloat]
+
+    if 'Array[int, int]' in text:
+        return [impl.Enc3, impl.DOFInt]
+
+    return None
+
+
+def _scalar(param: inspect.Parameter) -> Any:
+    annotation = param.annotation
+
+    if param.default is not param.empty and param.name != 'ID':
+        return param.default
+
+    if annotation in (ct.c_double, ct.c_int, ct.c_ushort):
+        return annotation()
+
+    if annotation is containers.Status:
+        return containers.Status()
+
+    if inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation))
+
+    if annotation is str:
+        return 'stub'
+
+    if annotation is bool:
+        return False
+
+    if annotation is float:
+        return 0.
+
+    if typing.get_origin(annotation) is typing.Union:
+        return None
+
+    return 0
+
+
+def make_args(
+    func: Callable, impl: Any = containers
+) -> Tuple[List[Any], bool]:
+    """
+    Build arguments that ``func`` accepts.
+
+    :returns:
+        The arguments, and whether any of them is a container (so the
+        wrapper is worth timing with other container types).
+    """
+
+    params = list(inspect.signature(func).parameters.values())
+    candidates = [_candidates(p.annotation, impl) for p in params]
+    uses_containers = any(c is not None for c in candidates)
+
+    def build(choice):
+        return [
+            _scalar(p) if c is None else c[choice]()
+            for p, c in zip(params, candidates)
+        ]
+
+    args = build(0)
+
+    try:
+        func(*args)
+    except (IndexError, TypeError, ValueError):
+        args = build(-1)
+
+    return args, uses_containers
+
+
+class _Recorder:
+    """
+    Proxies a library and records the names of the symbols called.
+    """
+
+    class _Function:
+        def __init__(self, name, func, log):
+            self.__dict__.update(_name=name, _func=func, _log=log)
+
+        def __setattr__(self, name, value):
+            setattr(self._func, name, value)
+
+        def __getattr__(self, name):
+            return getattr(self._func, name)
+
+        def __call__(self, *args):
+            self._log.append(self._name)
+            return self._func(*args)
+
+    def __init__(self, lib):
+        self._lib = lib
+        self.log: List[str] = []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return _Recorder._Function(name, getattr(self._lib, name), self.log)
+
+
+def _raw_args(argtypes: List[Any]) -> List[Any]:
+    args = []
+
+    for argtype in argtypes:
+        if argtype is ct.c_char_p:
+            args.append(ct.create_string_buffer(64))
+        elif issubclass(argtype, ct._Pointer):
+            args.append(ct.cast((argtype._type_ * 64)(), argtype))
+        elif argtype in (ct.c_double, ct.c_float):
+            args.append(0.)
+        else:
+            args.append(0)
+
+    return args
+
+
+def _time(func: Callable, args: List[Any], repeat: int, min_time: float):
+    timer = timeit.Timer('f(*a)', globals={'f': func, 'a': args})
+
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+
+    times = [t / number for t in timer.repeat(repeat, number)]
+
+    return min(times), statistics.median(times)
+
+
+def run(
+    pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.02
+) -> List[Dict[str, Any]]:
+    lib = stub.load()
+    recorder = _Recorder(lib)
+    prototypes = stub.prototypes()
+
+    impls = [('array', containers)]
+    if np_containers is not None:
+        impls.append(('numpy', np_containers))
+
+    # Resolve what to time (and which symbols each wrapper calls) first,
+    # with the recorder installed.
+    runtime.install(recorder)
+    cases = []
+
+    for name, func in wrappers(pattern):
+        for impl_name, impl in impls:
+            try:
+                args, uses_containers = make_args(func, impl)
+
+                recorder.log.clear()
+                func(*args)
+            except Exception as ex:
+                cases.append((name, impl_name, func, None, [], repr(ex)))
+                break
+
+            cases.append(
+                (name, impl_name, func, args, list(recorder.log), None)
+            )
+
+            if not uses_containers:
+                break
+
+    runtime.install(lib)
+    runtime.preload()
+
+    raw_cache: Dict[str, float] = {}
+
+    def raw(symbol):
+        if symbol not in raw_cache:
+            argtypes, _ = prototypes[symbol]
+            raw_cache[symbol] = _time(
+                getattr(runtime._libdrd, symbol), _raw_args(argtypes),
+                repeat, min_time
+            )[0]
+
+        return raw_cache[symbol]
+
+    results = []
+
+    for name, impl_name, func, args, symbols, error in cases:
+        entry: Dict[str, Any] = {
+            'name': name,
+            'containers': impl_name,
+            'symbols': symbols,
+        }
+
+        if error is not None:
+            entry['error'] = error
+        else:
+            best, median = _time(func, args, repeat, min_time)
+            ffi = sum(raw(symbol) for symbol in symbols)
+
+            entry.update(
+                min_ns=round(best * 1e9, 1),
+                median_ns=round(median * 1e9, 1),
+                ffi_ns=round(ffi * 1e9, 1),
+                overhead_ns=round((best - ffi) * 1e9, 1),
+            )
+
+        results.append(entry)
+
+    return results
+
+
+def metadata() -> Dict[str, Any]:
+    return {
+        'forcedimension_core': getattr(forcedimension_core, '__version__', None),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def _key(entry):
+    return entry['name'], entry['containers']
+
+
+def compare(results, baseline) -> None:
+    previous = {_key(entry): entry for entry in baseline['results']}
+
+    print(f"{'wrapper':<52} {'containers':<10} {'before':>10} "
+          f"{'after':>10} {'change':>8}")
+
+    for entry in results:
+        if (old := previous.get(_key(entry))) is None:
+            continue
+
+        if 'min_ns' not in entry or 'min_ns' not in old:
+            continue
+
+        change = (entry['min_ns'] - old['min_ns']) / old['min_ns'] * 100
+        print(
+            f"{entry['name']:<52} {entry['containers']:<10} "
+            f"{old['min_ns']:>10.1f} {entry['min_ns']:>10.1f} "
+            f"{change:>+7.1f}%"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--filter', help='only time wrappers whose name matches this regex'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--min-time', type=float, default=0.02,
+        help='minimum duration of one timing run in seconds'
+    )
+    parser.add_argument(
+        '--compare', metavar='JSON',
+        help='print the change relative to a previous --json run'
+    )
+
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--json', action='store_true')
+    output.add_argument('--csv', action='store_true')
+
+    args = parser.parse_args()
+
+    # Deprecated wrappers are still part of the surface being measured.
+    warnings.simplefilter('ignore', DeprecationWarning)
+
+    results = run(args.filter, args.repeat, args.min_time)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+    elif args.json:
+        json.dump(
+            {'meta': metadata(), 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+    elif args.csv:
+        fields = (
+            'name', 'containers', 'min_ns', 'median_ns', 'ffi_ns',
+            'overhead_ns', 'symbols', 'error'
+        )
+        writer = csv.DictWriter(sys.stdout, fields)
+        writer.writeheader()
+
+        for entry in results:
+            writer.writerow(
+                dict(entry, symbols=' '.join(entry['symbols']))
+            )
+    else:
+        print(f"{'wrapper':<52} {'containers':<10} {'ns/call':>10} "
+              f"{'ffi ns':>10} {'overhead':>10}")
+
+        for entry in results:
+            if 'error' in entry:
+                print(
+                    f"{entry['name']:<52} {entry['containers']:<10} "
+                    f"error: {entry['error']}"
+                )
+                continue
+
+            print(
+                f"{entry['name']:<52} {entry['containers']:<10} "
+                f"{entry['min_ns']:>10.1f} {entry['ffi_ns']:>10.1f} "
+                f"{entry['overhead_ns']:>10.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
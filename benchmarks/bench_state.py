@@ -0,0 +1,132 @@
+#! /usr/bin/env python3
+"""
+Measures dhd.getState() and dhd.direct.getState() against reading the same
+state with separate calls.
+
+The separate sequence is what a haptic loop does without getState():
+getPositionAndOrientationFrame(), getLinearVelocity(),
+getAngularVelocityRad(), getGripperAngleRad(), getButtonMask() and
+getStatus(). Everything runs against the no-op stub library (see
+``stub.py``), which reports a device with a wrist and a gripper, so every
+part of the state is read.
+
+Usage::
+
+    python3 benchmarks/bench_state.py [--json] [--repeat N] [--min-time S]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Callable, Dict, List
+
+# Imported first: it selects a backend the package can import without the
+# Force Dimension SDK.
+import stub  # isort: skip
+
+from bench_overhead import _time, metadata
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.direct as direct
+from forcedimension_core import containers, runtime
+
+try:
+    import forcedimension_core.containers.numpy as np_containers
+except ImportError:
+    np_containers = None  # type: ignore
+
+
+def _separate(state: Any) -> Callable[[], Any]:
+    frame = [[0.] * 3 for _ in range(3)]
+
+    def read():
+        dhd.getPositionAndOrientationFrame(state.position, frame)
+        dhd.getLinearVelocity(state.linear_velocity)
+        dhd.getAngularVelocityRad(state.angular_velocity)
+        dhd.getGripperAngleRad(state.gripper_angle)
+        state.buttons = dhd.getButtonMask()
+        dhd.getStatus(state.status)
+
+    return read
+
+
+def _separate_direct(state: Any) -> Callable[[], Any]:
+    def read():
+        direct.getPositionAndOrientationFrame(state.position, state.frame)
+        direct.getLinearVelocity(state.linear_velocity)
+        direct.getAngularVelocityRad(state.angular_velocity)
+        dhd.getGripperAngleRad(state.gripper_angle)
+        state.buttons = dhd.getButtonMask()
+        dhd.getStatus(state.status)
+
+    return read
+
+
+def run(repeat: int = 5, min_time: float = 0.05) -> List[Dict[str, Any]]:
+    previous = stub.install()
+    runtime.preload()
+
+    impls = [('array', containers)]
+    if np_containers is not None:
+        impls.append(('numpy', np_containers))
+
+    results = []
+
+    try:
+        for impl_name, impl in impls:
+            state = impl.DeviceState()
+
+            cases = (
+                ('separate calls', _separate(state)),
+                ('separate direct calls', _separate_direct(state)),
+                ('dhd.getState', lambda: dhd.getState(state)),
+                ('dhd.direct.getState', lambda: direct.getState(state)),
+            )
+
+            for name, func in cases:
+                func()
+                best, median = _time(func, [], repeat, min_time)
+
+                results.append({
+                    'name': name,
+                    'containers': impl_name,
+                    'min_ns': round(best * 1e9, 1),
+                    'median_ns': round(median * 1e9, 1),
+                })
+    finally:
+        runtime.install(previous)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--min-time', type=float, default=0.05,
+        help='minimum duration of one timing run in seconds'
+    )
+    parser.add_argument('--json', action='store_true')
+
+    args = parser.parse_args()
+    results = run(args.repeat, args.min_time)
+
+    if args.json:
+        json.dump(
+            {'meta': metadata(), 'results': results},
+            sys.stdout, indent=2, sort_keys=True
+        )
+        print()
+        return
+
+    print(f"{'read':<24} {'containers':<10} {'ns/read':>10} {'median':>10}")
+
+    for entry in results:
+        print(
+            f"{entry['name']:<24} {entry['containers']:<10} "
+            f"{entry['min_ns']:>10.1f} {entry['median_ns']:>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Builds a no-op stand-in for libdrd.
+
+Every ``dhd*``/``drd*`` symbol declared by the bindings is exported by a
+tiny C library whose functions do nothing but return success. Calls into it
+cost only the foreign function interface itself, so timing the wrappers
+against it isolates the overhead added by the Python side of the bindings.
+
+The source is generated from the prototypes registered with
+:mod:`forcedimension_core.runtime`, so the stub always matches the bindings
+it is benchmarking. Building it requires a C compiler (``cc`` by default,
+override with ``$CC``).
+
+Usage from a benchmark::
+
+    import stub
+
+    stub.install()  # builds if needed, then runtime.install()s the stub
+"""
+
+import ctypes as ct
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The package loads a library at import. Make that the virtual backend so
+# the stub can be built on machines without the Force Dimension SDK.
+os.environ.setdefault('FORCEDIM_BACKEND', 'virtual')
+
+import forcedimension_core.dhd  # noqa: E402
+import forcedimension_core.dhd.direct  # noqa: E402
+import forcedimension_core.dhd.expert  # noqa: E402
+import forcedimension_core.dhd.expert.direct  # noqa: E402
+import forcedimension_core.drd  # noqa: E402
+import forcedimension_core.drd.direct  # noqa: E402
+from forcedimension_core import runtime  # noqa: E402
+from forcedimension_core.runtime import _c_type  # noqa: E402
+
+# Bodies that must do more than return zero for the stub to be usable.
+# The stub reports a device with every feature, so that code checking for
+# them takes its longest path.
+_BODIES: Dict[str, str] = {
+    'dhdGetSDKVersion': (
+        '*a0 = {}; *a1 = {}; *a2 = {}; *a3 = {};'.format(
+            *runtime.VERSION_TARGET
+        )
+    ),
+    'dhdHasWrist': 'return true;',
+    'dhdHasActiveWrist': 'return true;',
+    'dhdHasGripper': 'return true;',
+    'dhdHasActiveGripper': 'return true;',
+}
+
+_LIB_NAMES = {
+    'win32': 'drd_stub.dll',
+    'cygwin': 'drd_stub.dll',
+    'darwin': 'libdrd_stub.dylib',
+}
+
+
+def _return(restype: Any) -> str:
+    if restype is None:
+        return ''
+
+    if restype is ct.c_char_p:
+        return 'return (char *)"stub";'
+
+    return f'return ({_c_type(restype)})0;'
+
+
+def prototypes() -> Dict[str, Tuple[List[Any], Any]]:
+    """
+    Get every prototype declared by the bindings, keyed by symbol name.
+    """
+
+    return dict(runtime._libdrd._prototypes)
+
+
+def generate_source() -> str:
+    """
+    Generate the C source of the stub library.
+    """
+
+    export = (
+        '__declspec(dllexport)' if sys.platform in ('win32', 'cygwin')
+        else '__attribute__((visibility("default")))'
+    )
+
+    lines = [
+        '/* Generated by benchmarks/stub.py. Do not edit. */',
+        '#include <stdbool.h>',
+        '#include <stddef.h>',
+        '',
+    ]
+
+    for name, (argtypes, restype) in sorted(prototypes().items()):
+        params = ', '.join(
+            f'{_c_type(argtype)} a{i}' for i, argtype in enumerate(argtypes)
+        ) or 'void'
+
+        body = _BODIES.get(name, '')
+
+        if 'return' not in body:
+            body = ' '.join(filter(None, (body, _return(restype))))
+
+        lines.append(
+            f'{export} {_c_type(restype)} {name}({params}) {{ {body} }}'
+        )
+
+    return '\n'.join(lines) + '\n'
+
+
+def default_build_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), 'forcedimension_core_stub')
+
+
+def build(build_dir: Optional[str] = None, force: bool = False) -> str:
+    """
+    Compile the stub library.
+
+    :param Optional[str] build_dir:
+        Directory to build in. Defaults to a directory in the system
+        temporary directory.
+
+    :param bool force:
+        Rebuild even if the source did not change since the last build.
+
+    :raises RuntimeError:
+        If no C compiler is available.
+
+    :raises subprocess.CalledProcessError:
+        If compilation fails.
+
+    :returns:
+        The path of the built library.
+    """
+
+    build_dir = default_build_dir() if build_dir is None else build_dir
+    os.makedirs(build_dir, exist_ok=True)
+
+    src_path = os.path.join(build_dir, 'drd_stub.c')
+    lib_path = os.path.join(
+        build_dir, _LIB_NAMES.get(sys.platform, 'libdrd_stub.so')
+    )
+
+    source = generate_source()
+
+    if not force and os.path.isfile(lib_path):
+        try:
+            with open(src_path) as f:
+                if f.read() == source:
+                    return lib_path
+        except OSError:
+            pass
+
+    with open(src_path, 'w') as f:
+        f.write(source)
+
+    if (cc := os.environ.get('CC') or shutil.which('cc')) is None:
+        raise RuntimeError(
+            "A C compiler is required to build the stub library. "
+            "Set $CC to its path."
+        )
+
+    subprocess.run(
+        [cc, '-O2', '-shared', '-fPIC', '-o', lib_path, src_path],
+        check=True
+    )
+
+    return lib_path
+
+
+def load(build_dir: Optional[str] = None) -> Any:
+    """
+    Build the stub library and load it through
+    :func:`forcedimension_core.runtime.load()`.
+
+    :raises RuntimeError:
+        If the stub could not be loaded.
+    """
+
+    lib_path = build(build_dir)
+
+    if (lib := runtime.load(search_dirs=[lib_path], backend='native')) is None:
+        raise RuntimeError(f"Could not load the stub library at {lib_path}")
+
+    return lib
+
+
+def install(build_dir: Optional[str] = None) -> Any:
+    """
+    Build and load the stub library, then make the bindings call into it.
+
+    :returns:
+        The previously installed library.
+    """
+
+    return runtime.install(load(build_dir))
+
+
+if __name__ == '__main__':
+    print(build(force='--force' in sys.argv))
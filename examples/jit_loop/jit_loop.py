@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+"""
+The spring-mass-damper of ``spring_mass_damper.py`` with the whole haptic
+loop compiled by Numba. The loop calls libdhd through the addresses of
+:func:`forcedimension_core.runtime.symbol_addresses()`, so no Python code
+runs until it returns.
+
+With cffi instead, declare the functions with
+``ffi.cdef(runtime.cdef(SYMBOLS))`` and call
+``ffi.cast(sym.pointer_type, sym.address)`` for each symbol.
+"""
+
+import sys
+
+import numba
+import numpy as np
+
+from forcedimension_core import containers, dhd, runtime
+
+b = 5  # damping coefficient in [N][s]/[m]
+k = 150  # spring constant in [N]/[m]
+
+SYMBOLS = (
+    'dhdGetPosition', 'dhdGetLinearVelocity', 'dhdSetForce', 'dhdGetButton'
+)
+
+if (ID := dhd.open()) == -1:
+    print(f"Error: {dhd.errorGetLastStr()}")
+    sys.exit(1)
+
+symbols = runtime.symbol_addresses(SYMBOLS)
+
+getPosition = symbols['dhdGetPosition'].to_ctypes()
+getLinearVelocity = symbols['dhdGetLinearVelocity'].to_ctypes()
+setForce = symbols['dhdSetForce'].to_ctypes()
+getButton = symbols['dhdGetButton'].to_ctypes()
+
+
+@numba.njit
+def run(pos, v, ID):
+    """
+    Run until button 0 is pressed.
+
+    :returns:
+        0 once the button is pressed, -1 if a call failed.
+    """
+
+    while True:
+        if getPosition(
+            pos[0:].ctypes, pos[1:].ctypes, pos[2:].ctypes, ID
+        ) == -1:
+            return -1
+
+        if getLinearVelocity(
+            v[0:].ctypes, v[1:].ctypes, v[2:].ctypes, ID
+        ) == -1:
+            return -1
+
+        if setForce(
+            -k * pos[0] - b * v[0],
+            -k * pos[1] - b * v[1],
+            -k * pos[2] - b * v[2],
+            ID
+        ) == -1:
+            return -1
+
+        btn_state = getButton(0, ID)
+
+        if btn_state == -1:
+            return -1
+
+        if btn_state == 1:
+            return 0
+
+
+# The loop writes straight into the memory of the containers.
+pos = containers.numpy.Vec3()
+v = containers.numpy.Vec3()
+
+try:
+    if run(pos.view(np.ndarray), v.view(np.ndarray), ID) == -1:
+        print(f"Error: {dhd.errorGetLastStr()}")
+finally:
+    dhd.close(ID)
@@ -1,3 +1,4 @@
+import importlib as _importlib
 from enum import IntEnum
 from typing import Dict
 from typing import cast as _cast
@@ -5,8 +6,20 @@ from typing import cast as _cast
 import forcedimension_core.constants as constants
 import forcedimension_core.containers as containers
 import forcedimension_core.deprecated as deprecated
-import forcedimension_core.dhd as dhd
-import forcedimension_core.drd as drd
-import forcedimension_core.util as util
 
 __version__ = '1.0.0rc2'
+
+# Submodules imported on first use. Most of them load libdrd, raising
+# ImportError if it is missing, which the package itself (e.g.
+# `python -m forcedimension_core cache`) doesn't need.
+_LAZY = (
+    'aio', 'device', 'dhd', 'drd', 'loop', 'poller', 'runtime', 'telemetry',
+    'trajectory', 'util'
+)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        return _importlib.import_module(f'{__name__}.{name}')
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
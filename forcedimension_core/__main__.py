@@ -0,0 +1,11 @@
+import sys
+
+from forcedimension_core import discovery
+
+_USAGE = "usage: python3 -m forcedimension_core cache [show|clear|path]\n"
+
+if len(sys.argv) < 2 or sys.argv[1] != 'cache':
+    sys.stderr.write(_USAGE)
+    sys.exit(2)
+
+sys.exit(discovery.main(sys.argv[2:]))
@@ -0,0 +1,170 @@
+"""
+Generates the functions of :mod:`forcedimension_core.dhd.checked` and
+:mod:`forcedimension_core.drd.checked`.
+
+A checked function takes the same arguments as the function it checks and
+returns the same value, but raises the :class:`DHDError` matching
+:func:`forcedimension_core.dhd.errorGetLast()` where the function would
+return -1. Any other value, including
+:data:`forcedimension_core.constants.TIMEGUARD`, is returned as is.
+
+Most functions of the bindings are a single ``return`` of a call into the
+library. The checked version of those evaluates the same expression in
+the globals of the original module, so it still calls the symbol the
+runtime currently binds, and a successful call costs the same single
+Python frame as the unchecked function plus one comparison. Other
+functions are called from the checked function.
+"""
+
+import ast
+import inspect
+import textwrap
+import types
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+def raise_last_error(op: str, ID: Optional[int] = None):
+    """
+    Raise the :class:`DHDError` matching the last error of the calling
+    thread.
+
+    :param str op:
+        The name of the operation that failed.
+
+    :param Optional[int] ID:
+        The ID of the device the operation failed on.
+    """
+
+    from forcedimension_core import dhd, util
+
+    if (exc_type := util.errno_to_exception(dhd.errorGetLast())) is None:
+        raise dhd.DHDError(f"{op} failed.")
+
+    raise exc_type(op=op, ID=ID)
+
+
+def _returned(func: Callable[..., Any]) -> Optional[Tuple[str, ast.expr]]:
+    """
+    Get the source of ``func`` and the expression it returns if its body is
+    a single ``return`` statement (after the docstring), ``None`` otherwise.
+    """
+
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError):
+        return None
+
+    body = ast.parse(source).body[0].body  # type: ignore
+
+    if body and isinstance(body[0], ast.Expr) and isinstance(
+        body[0].value, ast.Constant
+    ):
+        body = body[1:]
+
+    if len(body) != 1 or not isinstance(body[0], ast.Return):
+        return None
+
+    return source, body[0].value
+
+
+def _converted(node: ast.expr) -> Optional[ast.Call]:
+    """
+    Get the call whose result ``node`` converts, e.g. the
+    ``_dhdGetSystemType(ID)`` of ``DeviceType(_dhdGetSystemType(ID))``,
+    ``None`` if it is not such a conversion.
+    """
+
+    if not isinstance(node, ast.Call) or len(node.args) != 1:
+        return None
+
+    if not isinstance(inner := node.args[0], ast.Call):
+        return None
+
+    return inner
+
+
+def _checked(module: Any, name: str, func: Callable[..., Any]):
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+    op = f'{module.__name__}.{name}'
+
+    if any(p.kind is not p.POSITIONAL_OR_KEYWORD for p in params):
+        def checked(*args, **kwargs):
+            if (result := func(*args, **kwargs)) == -1:
+                bound = sig.bind(*args, **kwargs)
+                bound.apply_defaults()
+                raise_last_error(op, bound.arguments.get('ID'))
+
+            return result
+
+        checked.__wrapped__ = func  # type: ignore
+
+        return checked
+
+    decl = ', '.join(
+        p.name if p.default is p.empty else f'{p.name}=None' for p in params
+    )
+    ID = 'ID' if 'ID' in sig.parameters else 'None'
+    result = '_result'
+
+    if (returned := _returned(func)) is None:
+        args = ', '.join(p.name for p in params)
+        expr = f'_func({args})'
+    else:
+        # ast.unparse() needs Python 3.9, so the source text is used.
+        body, node = returned
+
+        if (inner := _converted(node)) is not None:
+            # -1 is checked before it is converted.
+            expr = ast.get_source_segment(body, inner)
+            func_src = ast.get_source_segment(body, node.func)  # type: ignore
+            result = f'{func_src}(_result)'
+        else:
+            expr = ast.get_source_segment(body, node)
+
+    source = (
+        f"def _factory(_func, _raise_last_error, _op):\n"
+        f"    def {name}({decl}):\n"
+        f"        if (_result := {expr}) == -1:\n"
+        f"            _raise_last_error(_op, {ID})\n"
+        f"        return {result}\n"
+        f"    return {name}\n"
+    )
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f'<checked {op}>', 'exec'), namespace)
+
+    # Run in the globals of the original module, so the bound symbols are
+    # looked up where the runtime rebinds them.
+    factory = types.FunctionType(namespace['_factory'].__code__, vars(module))
+    checked = factory(func, raise_last_error, op)
+    checked.__defaults__ = func.__defaults__
+    checked.__doc__ = (
+        f"Checked version of :func:`{op}()`.\n\n"
+        f":raises DHDError:\n    Where :func:`{op}()` would return -1.\n"
+    )
+    checked.__annotations__ = dict(func.__annotations__)
+    checked.__wrapped__ = func  # type: ignore
+
+    return checked
+
+
+def check_module(
+    module: Any, names: Iterable[str]
+) -> Dict[str, Callable[..., Any]]:
+    """
+    Generate the checked versions of functions of ``module``.
+
+    :param Any module:
+        The module of the functions to check.
+
+    :param Iterable[str] names:
+        The functions to check: those that report failure by returning -1.
+
+    :returns:
+        The checked functions by name.
+    """
+
+    return {
+        name: _checked(module, name, getattr(module, name)) for name in names
+    }
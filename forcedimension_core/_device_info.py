@@ -0,0 +1,32 @@
+"""
+What each open device is, as last queried by
+:func:`forcedimension_core.dhd.getDeviceInfo()`.
+
+The type, serial number and parts of a device do not change while it is
+open, so they are queried from the library once and served from memory
+afterwards. An entry is dropped whenever its ID is opened or closed through
+:mod:`forcedimension_core.dhd` or :mod:`forcedimension_core.drd`, and every
+entry is dropped when another library is installed.
+"""
+
+from typing import Dict
+
+from forcedimension_core.containers import DeviceInfo
+
+cache: Dict[int, DeviceInfo] = {}
+
+
+def invalidate(ID: int):
+    """
+    Drop the entry of device ``ID``, or every entry if ``ID`` is -1 (the
+    default device, which may be any of them).
+    """
+
+    if ID < 0:
+        cache.clear()
+    else:
+        cache.pop(ID, None)
+
+
+def clear():
+    cache.clear()
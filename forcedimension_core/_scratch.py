@@ -0,0 +1,85 @@
+"""
+Per-thread scratch buffers for the wrappers in :mod:`forcedimension_core.dhd`
+and :mod:`forcedimension_core.drd`.
+
+Wrappers that copy their results into user provided containers need ctypes
+objects for the library to write into. Creating those objects on every call
+costs an allocation per value, which adds up at control loop rates. The
+wrappers instead borrow the buffers of the calling thread for the duration
+of the call. A wrapper never calls another wrapper while it holds a buffer,
+so a buffer is never shared between two calls in progress.
+"""
+
+import threading
+from ctypes import c_double, c_int, c_ubyte, c_uint, c_ushort
+from typing import Any
+
+from forcedimension_core.constants import MAX_DOF
+
+
+class _Buffers(threading.local):
+    def __init__(self):
+        doubles = tuple(c_double() for _ in range(6))
+        ints = tuple(c_int() for _ in range(4))
+        ushorts = tuple(c_ushort() for _ in range(3))
+
+        self.double = doubles[0]
+        self.double3 = doubles[:3]
+        self.double6 = doubles
+
+        self.int2 = ints[:2]
+        self.int3 = ints[:3]
+        self.int4 = ints
+
+        self.ushort = ushorts[0]
+        self.ushort3 = ushorts
+
+        self.uint = c_uint()
+        self.ubyte = c_ubyte()
+
+        self.enc4 = (c_int * 4)()
+
+        self.dof_int = (c_int * MAX_DOF)()
+        self.dof_int2 = (c_int * MAX_DOF)()
+        self.dof_ushort = (c_ushort * MAX_DOF)()
+        self.dof_double = (c_double * MAX_DOF)()
+        self.dof_double2 = (c_double * MAX_DOF)()
+
+        # Matrices are stored row-major in flat arrays. Indexing a nested
+        # ctypes array creates a new object for every row.
+        self.mat3x3 = (c_double * 9)()
+        self.mat6x6 = (c_double * 36)()
+
+
+#: The scratch buffers of the calling thread.
+buffers = _Buffers()
+
+
+def copy(dst: Any, src: Any, n: int) -> None:
+    """
+    Copy the first ``n`` elements of ``src`` into ``dst``.
+    """
+
+    # A while loop, unlike iterating over range(n), allocates nothing.
+    i = 0
+    while i < n:
+        dst[i] = src[i]
+        i += 1
+
+
+def copy_matrix(dst: Any, src: Any, n: int) -> None:
+    """
+    Copy the row-major ``n`` by ``n`` matrix in ``src`` into the nested
+    container ``dst``.
+    """
+
+    i = 0
+    while i < n:
+        row = dst[i]
+
+        j = 0
+        while j < n:
+            row[j] = src[n * i + j]
+            j += 1
+
+        i += 1
@@ -0,0 +1,475 @@
+"""
+The prototypes of every libdhd/libdrd symbol the bindings call.
+
+This table is the one place where foreign prototypes are declared. The
+runtime records all of them at once when it loads the library (see
+:meth:`forcedimension_core.runtime._LazyLibrary.declare_all()`), and the
+wrapper modules only bind the symbols they call. A symbol is still typed
+lazily, the first time it is called.
+
+Each entry maps a symbol to its ``(argtypes, restype)``.
+"""
+
+from ctypes import (
+    c_bool, c_byte, c_char_p, c_double, c_int, c_size_t, c_ubyte, c_uint,
+    c_uint32, c_ushort
+)
+from typing import Any, Dict, List, Tuple
+
+from forcedimension_core.typing import (
+    c_double_ptr, c_int_ptr, c_ubyte_ptr, c_uint_ptr, c_ushort_ptr
+)
+
+PROTOTYPES: Dict[str, Tuple[List[Any], Any]] = {
+    # forcedimension_core.dhd
+    'dhdErrorGetLast': ([], c_int),
+    'dhdErrorGetLastStr': ([], c_char_p),
+    'dhdErrorGetStr': ([c_int], c_char_p),
+    'dhdEnableSimulator': ([c_bool], None),
+    'dhdGetDeviceCount': ([], c_int),
+    'dhdGetAvailableCount': ([], c_int),
+    'dhdSetDevice': ([c_byte], c_int),
+    'dhdGetDeviceID': ([], c_int),
+    'dhdGetSerialNumber': ([c_ushort_ptr, c_byte], c_int),
+    'dhdOpen': ([], c_int),
+    'dhdOpenType': ([c_int], c_int),
+    'dhdOpenSerial': ([c_int], c_int),
+    'dhdOpenID': ([c_byte], c_int),
+    'dhdClose': ([c_byte], c_int),
+    'dhdCheckControllerMemory': ([c_byte], c_int),
+    'dhdStop': ([c_byte], c_int),
+    'dhdGetComMode': ([c_byte], c_int),
+    'dhdEnableForce': ([c_bool, c_byte], c_int),
+    'dhdEnableGripperForce': ([c_bool, c_byte], c_int),
+    'dhdGetSystemType': ([c_byte], c_int),
+    'dhdGetSystemRev': ([c_byte], c_int),
+    'dhdGetSystemName': ([c_byte], c_char_p),
+    'dhdGetVersion': ([c_double_ptr, c_byte], c_int),
+    'dhdGetSDKVersion': ([c_int_ptr, c_int_ptr, c_int_ptr, c_int_ptr], None),
+    'dhdGetComponentVersionStr': (
+        [c_uint32, c_char_p, c_size_t, c_byte], c_int
+    ),
+    'dhdGetStatus': ([c_int_ptr, c_byte], c_int),
+    'dhdGetDeviceAngleRad': ([c_double_ptr, c_byte], c_int),
+    'dhdGetDeviceAngleDeg': ([c_double_ptr, c_byte], c_int),
+    'dhdGetEffectorMass': ([c_double_ptr, c_byte], c_int),
+    'dhdGetButton': ([c_int, c_byte], c_int),
+    'dhdGetButtonMask': ([c_byte], c_uint),
+    'dhdSetOutput': ([c_uint, c_byte], c_int),
+    'dhdIsLeftHanded': ([c_byte], c_bool),
+    'dhdHasBase': ([c_byte], c_bool),
+    'dhdHasWrist': ([c_byte], c_bool),
+    'dhdHasActiveWrist': ([c_byte], c_bool),
+    'dhdHasGripper': ([c_byte], c_bool),
+    'dhdHasActiveGripper': ([c_byte], c_bool),
+    'dhdReset': ([c_byte], c_int),
+    'dhdWaitForReset': ([c_int, c_byte], c_int),
+    'dhdSetStandardGravity': ([c_double, c_byte], c_int),
+    'dhdSetGravityCompensation': ([c_bool, c_byte], c_int),
+    'dhdSetBrakes': ([c_bool, c_byte], c_int),
+    'dhdSetDeviceAngleRad': ([c_double, c_byte], c_int),
+    'dhdSetDeviceAngleDeg': ([c_double, c_byte], c_int),
+    'dhdSetEffectorMass': ([c_double, c_byte], c_int),
+    'dhdGetPosition': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetForce': ([c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int),
+    'dhdSetForce': ([c_double, c_double, c_double, c_byte], c_int),
+    'dhdGetOrientationRad': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetOrientationDeg': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetPositionAndOrientationRad': (
+        [
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdGetPositionAndOrientationDeg': (
+        [
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdGetPositionAndOrientationFrame': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetForceAndTorque': (
+        [
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdSetForceAndTorque': (
+        [
+            c_double, c_double, c_double, c_double, c_double, c_double,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdGetOrientationFrame': ([c_double_ptr, c_byte], c_int),
+    'dhdGetGripperAngleDeg': ([c_double_ptr, c_byte], c_int),
+    'dhdGetGripperAngleRad': ([c_double_ptr, c_byte], c_int),
+    'dhdGetGripperGap': ([c_double_ptr, c_byte], c_int),
+    'dhdGetGripperThumbPos': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetGripperFingerPos': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetComFreq': ([c_byte], c_double),
+    'dhdSetForceAndGripperForce': (
+        [c_double, c_double, c_double, c_double, c_byte], c_int
+    ),
+    'dhdSetForceAndTorqueAndGripperForce': (
+        [
+            c_double, c_double, c_double, c_double, c_double, c_double,
+            c_double, c_byte,
+        ],
+        c_int
+    ),
+    'dhdGetForceAndTorqueAndGripperForce': (
+        [
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdConfigLinearVelocity': ([c_int, c_int, c_byte], c_int),
+    'dhdGetLinearVelocity': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdConfigAngularVelocity': ([c_int, c_int, c_byte], c_int),
+    'dhdGetAngularVelocityRad': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetAngularVelocityDeg': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdConfigGripperVelocity': ([c_int, c_int, c_byte], c_int),
+    'dhdGetGripperLinearVelocity': ([c_double_ptr, c_byte], c_int),
+    'dhdGetGripperAngularVelocityRad': ([c_double_ptr, c_byte], c_int),
+    'dhdGetGripperAngularVelocityDeg': ([c_double_ptr, c_byte], c_int),
+    'dhdEmulateButton': ([c_bool, c_byte], c_int),
+    'dhdGetBaseAngleXRad': ([c_double_ptr, c_byte], c_int),
+    'dhdGetBaseAngleXDeg': ([c_double_ptr, c_byte], c_int),
+    'dhdSetBaseAngleXRad': ([c_double, c_byte], c_int),
+    'dhdSetBaseAngleXDeg': ([c_double, c_byte], c_int),
+    'dhdGetBaseAngleZRad': ([c_double_ptr, c_byte], c_int),
+    'dhdGetBaseAngleZDeg': ([c_double_ptr, c_byte], c_int),
+    'dhdSetBaseAngleZRad': ([c_double, c_byte], c_int),
+    'dhdSetBaseAngleZDeg': ([c_double, c_byte], c_int),
+    'dhdSetVibration': ([c_double, c_double, c_int, c_byte], c_int),
+    'dhdSetMaxForce': ([c_double, c_byte], c_int),
+    'dhdSetMaxTorque': ([c_double, c_byte], c_int),
+    'dhdSetMaxGripperForce': ([c_double, c_byte], c_int),
+    'dhdGetMaxForce': ([c_byte], c_double),
+    'dhdGetMaxTorque': ([c_byte], c_double),
+    'dhdGetMaxGripperForce': ([c_byte], c_double),
+
+    # forcedimension_core.dhd.os_independent
+    'dhdKbHit': ([], c_bool),
+    'dhdKbGet': ([], c_byte),
+    'dhdGetTime': ([], c_double),
+    'dhdSleep': ([c_double], None),
+
+    # forcedimension_core.dhd.expert
+    'dhdEnableExpertMode': ([], c_int),
+    'dhdDisableExpertMode': ([], c_int),
+    'dhdPreset': ([c_int_ptr, c_ubyte, c_byte], c_int),
+    'dhdSetTimeGuard': ([c_int, c_byte], c_int),
+    'dhdSetVelocityThreshold': ([c_uint, c_byte], c_int),
+    'dhdGetVelocityThreshold': ([c_uint_ptr, c_byte], c_int),
+    'dhdUpdateEncoders': ([c_byte], c_int),
+    'dhdGetDeltaEncoders': ([c_int_ptr, c_int_ptr, c_int_ptr, c_byte], c_int),
+    'dhdGetWristEncoders': ([c_int_ptr, c_int_ptr, c_int_ptr, c_byte], c_int),
+    'dhdGetGripperEncoder': ([c_int_ptr, c_byte], c_int),
+    'dhdGetEncoder': ([c_int, c_byte], c_int),
+    'dhdSetMotor': ([c_int, c_ushort, c_byte], c_int),
+    'dhdSetDeltaMotor': ([c_ushort, c_ushort, c_ushort, c_byte], c_int),
+    'dhdSetWristMotor': ([c_ushort, c_ushort, c_ushort, c_byte], c_int),
+    'dhdSetGripperMotor': ([c_ushort, c_byte], c_int),
+    'dhdDeltaEncoderToPosition': (
+        [
+            c_int, c_int, c_int, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdDeltaPositionToEncoder': (
+        [
+            c_double, c_double, c_double, c_int_ptr, c_int_ptr, c_int_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdDeltaMotorToForce': (
+        [
+            c_ushort, c_ushort, c_ushort, c_int, c_int, c_int, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdDeltaForceToMotor': (
+        [
+            c_double, c_double, c_double, c_int, c_int, c_int, c_ushort_ptr,
+            c_ushort_ptr, c_ushort_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristEncoderToOrientation': (
+        [
+            c_int, c_int, c_int, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristOrientationToEncoder': (
+        [
+            c_double, c_double, c_double, c_int_ptr, c_int_ptr, c_int_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristMotorToTorque': (
+        [
+            c_ushort, c_ushort, c_ushort, c_int, c_int, c_int, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristTorqueToMotor': (
+        [
+            c_double, c_double, c_double, c_int, c_int, c_int, c_ushort_ptr,
+            c_ushort_ptr, c_ushort_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdGripperEncoderToAngleRad': ([c_int, c_double_ptr, c_byte], c_int),
+    'dhdGripperEncoderToGap': ([c_int, c_double_ptr, c_byte], c_int),
+    'dhdGripperAngleRadToEncoder': ([c_double, c_int_ptr, c_byte], c_int),
+    'dhdGripperGapToEncoder': ([c_double, c_int_ptr, c_byte], c_int),
+    'dhdGripperMotorToForce': (
+        [c_ushort, c_double_ptr, c_int_ptr, c_byte], c_int
+    ),
+    'dhdGripperForceToMotor': (
+        [c_double, c_ushort_ptr, c_int_ptr, c_byte], c_int
+    ),
+    'dhdSetMot': ([c_ushort_ptr, c_ubyte, c_byte], c_int),
+    'dhdSetJointTorques': ([c_double_ptr, c_ubyte, c_byte], c_int),
+    'dhdPreloadMot': ([c_ushort_ptr, c_ubyte, c_byte], c_int),
+    'dhdGetEnc': ([c_int_ptr, c_ubyte, c_byte], c_int),
+    'dhdSetBrk': ([c_ubyte, c_byte], c_int),
+    'dhdGetDeltaJointAngles': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetDeltaJacobian': ([c_double_ptr, c_byte], c_int),
+    'dhdDeltaJointAnglesToJacobian': (
+        [c_double, c_double, c_double, c_double_ptr, c_byte], c_int
+    ),
+    'dhdDeltaJointTorquesExtrema': (
+        [
+            c_double, c_double, c_double, c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdSetDeltaJointTorques': ([c_double, c_double, c_double, c_byte], c_int),
+    'dhdDeltaEncodersToJointAngles': (
+        [
+            c_int, c_int, c_int, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdDeltaJointAnglesToEncoders': (
+        [
+            c_double, c_double, c_double, c_int_ptr, c_int_ptr, c_int_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdGetWristJointAngles': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdGetWristJacobian': ([c_double_ptr, c_byte], c_int),
+    'dhdWristJointAnglesToJacobian': (
+        [c_double, c_double, c_double, c_double_ptr, c_byte], c_int
+    ),
+    'dhdWristJointTorquesExtrema': (
+        [
+            c_double, c_double, c_double, c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdSetWristJointTorques': ([c_double, c_double, c_double, c_byte], c_int),
+    'dhdSetForceAndWristJointTorques': (
+        [
+            c_double, c_double, c_double, c_double, c_double, c_double,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdSetForceAndWristJointTorquesAndGripperForce': (
+        [
+            c_double, c_double, c_double, c_double, c_double, c_double,
+            c_double, c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristEncodersToJointAngles': (
+        [
+            c_int, c_int, c_int, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristJointAnglesToEncoders': (
+        [
+            c_double, c_double, c_double, c_int_ptr, c_int_ptr, c_int_ptr,
+            c_byte,
+        ],
+        c_int
+    ),
+    'dhdGetJointAngles': ([c_double_ptr, c_byte], c_int),
+    'dhdGetJointVelocities': ([c_double_ptr, c_byte], c_int),
+    'dhdGetEncVelocities': ([c_double_ptr, c_byte], c_int),
+    'dhdJointAnglesToInertiaMatrix': (
+        [c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'dhdJointAnglesToGravityJointTorques': (
+        [c_double_ptr, c_double_ptr, c_ubyte, c_byte], c_int
+    ),
+    'dhdSetComMode': ([c_int, c_byte], c_int),
+    'dhdSetWatchdog': ([c_ubyte, c_byte], c_int),
+    'dhdGetWatchdog': ([c_ubyte_ptr, c_byte], c_int),
+    'dhdGetEncRange': ([c_int_ptr, c_int_ptr, c_byte], c_int),
+    'dhdGetJointAngleRange': ([c_double_ptr, c_double_ptr, c_byte], c_int),
+    'dhdControllerSetDevice': ([c_int, c_byte], c_int),
+    'dhdReadConfigFromFile': ([c_char_p, c_byte], c_int),
+    'dhdDeltaGravityJointTorques': (
+        [
+            c_double, c_double, c_double, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'dhdWristGravityJointTorques': (
+        [
+            c_double, c_double, c_double, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+
+    # forcedimension_core.drd
+    'drdOpen': ([], c_int),
+    'drdOpenID': ([c_byte], c_int),
+    'drdSetDevice': ([c_byte], c_int),
+    'drdGetDeviceID': ([], c_int),
+    'drdClose': ([c_byte], c_int),
+    'drdIsSupported': ([c_byte], c_bool),
+    'drdIsRunning': ([c_byte], c_bool),
+    'drdIsFiltering': ([c_byte], c_bool),
+    'drdIsInitialized': ([c_byte], c_bool),
+    'drdIsMoving': ([c_byte], c_bool),
+    'drdAutoInit': ([c_byte], c_int),
+    'drdCheckInit': ([c_byte], c_int),
+    'drdPrecisionInit': ([c_byte], c_int),
+    'drdGetCtrlFreq': ([c_byte], c_double),
+    'drdStart': ([c_byte], c_int),
+    'drdRegulatePos': ([c_bool, c_byte], c_int),
+    'drdRegulateRot': ([c_bool, c_byte], c_int),
+    'drdRegulateGrip': ([c_bool, c_byte], c_int),
+    'drdSetForceAndTorqueAndGripperForce': (
+        [
+            c_double, c_double, c_double, c_double, c_double, c_double,
+            c_double, c_byte,
+        ],
+        c_int
+    ),
+    'drdSetForceAndWristJointTorquesAndGripperForce': (
+        [
+            c_double, c_double, c_double, c_double, c_double, c_double,
+            c_double, c_byte,
+        ],
+        c_int
+    ),
+    'drdGetPositionAndOrientation': (
+        [
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'drdGetVelocity': (
+        [
+            c_double_ptr, c_double_ptr, c_double_ptr, c_double_ptr,
+            c_double_ptr, c_double_ptr, c_double_ptr, c_byte,
+        ],
+        c_int
+    ),
+    'drdEnableFilter': ([c_bool, c_byte], c_int),
+    'drdMoveToPos': ([c_double, c_double, c_double, c_bool, c_byte], c_int),
+    'drdMoveToRot': ([c_double, c_double, c_double, c_bool, c_byte], c_int),
+    'drdMoveToGrip': ([c_double, c_bool, c_byte], c_int),
+    'drdMoveTo': ([c_double_ptr, c_bool, c_byte], c_int),
+    'drdMoveToEnc': ([c_int, c_int, c_int, c_bool, c_byte], c_int),
+    'drdMoveToAllEnc': ([c_int_ptr, c_bool, c_byte], c_int),
+    'drdHold': ([c_byte], c_int),
+    'drdLock': ([c_bool, c_bool, c_byte], c_int),
+    'drdStop': ([c_bool, c_byte], c_int),
+    'drdGetPriorities': ([c_int_ptr, c_int_ptr, c_byte], c_int),
+    'drdSetPriorities': ([c_int, c_int, c_byte], c_int),
+    'drdSetEncPGain': ([c_double, c_byte], c_int),
+    'drdGetEncPGain': ([c_byte], c_double),
+    'drdSetEncIGain': ([c_double, c_byte], c_int),
+    'drdGetEncIGain': ([c_byte], c_double),
+    'drdSetEncDGain': ([c_double, c_byte], c_int),
+    'drdGetEncDGain': ([c_byte], c_double),
+    'drdTrackPos': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdTrackRot': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdTrackGrip': ([c_double, c_byte], c_int),
+    'drdTrack': ([c_double_ptr, c_byte], c_int),
+    'drdTrackEnc': ([c_int, c_int, c_int, c_byte], c_int),
+    'drdTrackAllEnc': ([c_int_ptr, c_byte], c_int),
+    'drdSetMotRatioMax': ([c_double, c_byte], c_int),
+    'drdGetMotRatioMax': ([c_byte], c_double),
+    'drdSetEncMoveParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetEncTrackParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetPosMoveParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetPosTrackParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetRotMoveParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetRotTrackParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetGripMoveParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdSetGripTrackParam': ([c_double, c_double, c_double, c_byte], c_int),
+    'drdGetEncMoveParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetEncTrackParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetPosMoveParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetPosTrackParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetRotMoveParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetRotTrackParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetGripMoveParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdGetGripTrackParam': (
+        [c_double_ptr, c_double_ptr, c_double_ptr, c_byte], c_int
+    ),
+    'drdWaitForTick': ([c_byte], None),
+}
@@ -0,0 +1,368 @@
+"""
+Awaitable versions of the blocking operations of the SDK, for programs
+built on :mod:`asyncio`.
+
+Initialising, calibrating and moving a device block for up to seconds.
+The coroutines of this module run those calls on an executor with a single
+thread per device (see :func:`executor()`), so the event loop keeps
+running and every call to a device is made from the same thread. Motions
+are started without blocking and awaited by polling
+:func:`forcedimension_core.drd.isMoving()`, so any number of devices can
+be initialised and moved concurrently:
+
+.. code-block:: python
+
+    async def home(ID):
+        await aio.autoInit(ID)
+        drd.start(ID)
+        await aio.moveToPos((0., 0., 0.), ID)
+
+    async def main():
+        IDs = [await aio.openID(i) for i in range(dhd.getDeviceCount())]
+        await asyncio.gather(*(home(ID) for ID in IDs))
+
+Devices should be referred to by ID rather than as the default device,
+which changes whenever another device is opened.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.drd as drd
+from forcedimension_core.constants import DeviceType
+from forcedimension_core.typing import Array
+
+#: How often motions are polled for completion by default (in [s]).
+POLL_INTERVAL = 1e-3
+
+_executors: Dict[Optional[int], ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def executor(ID: Optional[int] = -1) -> ThreadPoolExecutor:
+    """
+    Get the single-thread executor the coroutines of this module call into
+    device ``ID`` from, creating it on first use. ``None`` is the executor
+    devices are opened from: :func:`open()`, :func:`openID()`,
+    :func:`openType()` and :func:`openSerial()` all run on its one thread,
+    so devices are opened one at a time, however many are awaited at once.
+    None of the coroutines use the default executor of the event loop.
+
+    :param Optional[int] ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+    """
+
+    with _executors_lock:
+        if (pool := _executors.get(ID)) is None:
+            name = 'open' if ID is None else str(ID)
+            pool = _executors[ID] = ThreadPoolExecutor(
+                1, thread_name_prefix=f'forcedimension-aio-{name}'
+            )
+
+        return pool
+
+
+def shutdown(wait: bool = True):
+    """
+    Shut every executor down. They are created again on next use.
+
+    :param bool wait:
+        Whether to wait for the calls pending on them to finish.
+    """
+
+    with _executors_lock:
+        pools = list(_executors.values())
+        _executors.clear()
+
+    for pool in pools:
+        pool.shutdown(wait)
+
+
+async def run(ID: Optional[int], func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call ``func(*args)`` from the thread of device ``ID`` (see
+    :func:`executor()`) without blocking the event loop.
+
+    :param Optional[int] ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param Callable[..., Any] func:
+        The function to call.
+
+    :returns:
+        What ``func`` returns.
+    """
+
+    return await asyncio.get_running_loop().run_in_executor(
+        executor(ID), func, *args
+    )
+
+
+async def open() -> int:
+    """
+    Open a connection to the first available device (see
+    :func:`forcedimension_core.drd.open()`). Devices are opened one at a
+    time, from the thread of ``executor(None)`` (see :func:`executor()`).
+
+    :returns:
+        The ID of the device on success, -1 otherwise.
+    """
+
+    return await run(None, drd.open)
+
+
+async def openID(index: int) -> int:
+    """
+    Open a connection to the device at ``index`` (see
+    :func:`forcedimension_core.drd.openID()`).
+
+    :returns:
+        The ID of the device on success, -1 otherwise.
+    """
+
+    return await run(None, drd.openID, index)
+
+
+async def openType(device_type: DeviceType) -> int:
+    """
+    Open a connection to the first device of a given type (see
+    :func:`forcedimension_core.dhd.openType()`).
+
+    :returns:
+        The ID of the device on success, -1 otherwise.
+    """
+
+    return await run(None, dhd.openType, device_type)
+
+
+async def openSerial(serial: int) -> int:
+    """
+    Open a connection to the device with a given serial number (see
+    :func:`forcedimension_core.dhd.openSerial()`).
+
+    :returns:
+        The ID of the device on success, -1 otherwise.
+    """
+
+    return await run(None, dhd.openSerial, serial)
+
+
+async def close(ID: int = -1) -> int:
+    """
+    Close the connection to a device (see
+    :func:`forcedimension_core.drd.close()`) and shut its executor down.
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    result = await run(ID, drd.close, ID)
+
+    with _executors_lock:
+        pool = _executors.pop(ID, None)
+
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+    return result
+
+
+async def autoInit(ID: int = -1) -> int:
+    """
+    Initialise a device by moving it to a known position (see
+    :func:`forcedimension_core.drd.autoInit()`).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await run(ID, drd.autoInit, ID)
+
+
+async def precisionInit(ID: int = -1) -> int:
+    """
+    Initialise a device by moving each axis to a known position (see
+    :func:`forcedimension_core.drd.precisionInit()`).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await run(ID, drd.precisionInit, ID)
+
+
+async def waitForReset(timeout: Optional[int] = None, ID: int = -1) -> int:
+    """
+    Put a device in RESET mode and wait for the user to calibrate it (see
+    :func:`forcedimension_core.dhd.waitForReset()`).
+
+    :param Optional[int] timeout:
+        Maximum time to wait for calibration (in [ms]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await run(ID, dhd.waitForReset, timeout, ID)
+
+
+async def waitForMotion(ID: int = -1, interval: float = POLL_INTERVAL):
+    """
+    Wait until a device stops moving (see
+    :func:`forcedimension_core.drd.isMoving()`).
+
+    :param float interval:
+        How often to poll the device (in [s]).
+    """
+
+    while await run(ID, drd.isMoving, ID):
+        await asyncio.sleep(interval)
+
+
+async def _move(
+    func: Callable[..., int], target: Any, ID: int, interval: float
+) -> int:
+    if (result := await run(ID, func, target, False, ID)) < 0:
+        return result
+
+    try:
+        await waitForMotion(ID, interval)
+    except asyncio.CancelledError:
+        await run(ID, drd.hold, ID)
+        raise
+
+    return result
+
+
+async def moveToPos(
+    pos: Array[int, float], ID: int = -1, interval: float = POLL_INTERVAL
+) -> int:
+    """
+    Move the end-effector to a Cartesian position and wait for it to
+    arrive (see :func:`forcedimension_core.drd.moveToPos()`). If the
+    coroutine is cancelled, the device holds where it is (see
+    :func:`forcedimension_core.drd.hold()`).
+
+    :param Array[int, float] pos:
+        The target position about the X, Y and Z axes (in [m]).
+
+    :param float interval:
+        How often to poll the device for completion (in [s]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await _move(drd.moveToPos, tuple(pos), ID, interval)
+
+
+async def moveToRot(
+    orientation: Array[int, float],
+    ID: int = -1,
+    interval: float = POLL_INTERVAL
+) -> int:
+    """
+    Move the end-effector to a Cartesian orientation and wait for it to
+    arrive (see :func:`forcedimension_core.drd.moveToRot()`). If the
+    coroutine is cancelled, the device holds where it is.
+
+    :param Array[int, float] orientation:
+        The target orientation about the first, second and third joints
+        (in [rad]).
+
+    :param float interval:
+        How often to poll the device for completion (in [s]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await _move(drd.moveToRot, tuple(orientation), ID, interval)
+
+
+async def moveToGrip(
+    pg: float, ID: int = -1, interval: float = POLL_INTERVAL
+) -> int:
+    """
+    Move the gripper to an opening distance and wait for it to arrive (see
+    :func:`forcedimension_core.drd.moveToGrip()`). If the coroutine is
+    cancelled, the device holds where it is.
+
+    :param float pg:
+        The target opening distance of the gripper (in [m]).
+
+    :param float interval:
+        How often to poll the device for completion (in [s]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await _move(drd.moveToGrip, pg, ID, interval)
+
+
+async def moveTo(
+    pos: Array[int, float], ID: int = -1, interval: float = POLL_INTERVAL
+) -> int:
+    """
+    Move the end-effector to a Cartesian 7-DOF configuration and wait for
+    it to arrive (see :func:`forcedimension_core.drd.moveTo()`). If the
+    coroutine is cancelled, the device holds where it is.
+
+    :param Array[int, float] pos:
+        The target configuration for each DOF.
+
+    :param float interval:
+        How often to poll the device for completion (in [s]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await _move(drd.moveTo, tuple(pos), ID, interval)
+
+
+async def moveToEnc(
+    enc: Array[int, int], ID: int = -1, interval: float = POLL_INTERVAL
+) -> int:
+    """
+    Move the end-effector to an encoder position of the first three axes
+    and wait for it to arrive (see
+    :func:`forcedimension_core.drd.moveToEnc()`). If the coroutine is
+    cancelled, the device holds where it is.
+
+    :param Array[int, int] enc:
+        The target encoder positions on axes 0, 1 and 2.
+
+    :param float interval:
+        How often to poll the device for completion (in [s]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await _move(drd.moveToEnc, tuple(enc), ID, interval)
+
+
+async def moveToAllEnc(
+    enc: Array[int, int], ID: int = -1, interval: float = POLL_INTERVAL
+) -> int:
+    """
+    Move the end-effector to an encoder position and wait for it to arrive
+    (see :func:`forcedimension_core.drd.moveToAllEnc()`). If the coroutine
+    is cancelled, the device holds where it is.
+
+    :param Array[int, int] enc:
+        The target encoder positions.
+
+    :param float interval:
+        How often to poll the device for completion (in [s]).
+
+    :returns:
+        0 on success, -1 otherwise.
+    """
+
+    return await _move(drd.moveToAllEnc, tuple(enc), ID, interval)
@@ -4,14 +4,17 @@ import ctypes as ct
 from array import array
 from ctypes import c_int
 import os
-from typing import Any, Iterable, NamedTuple, Tuple
+from typing import Any, Iterable, NamedTuple, Optional, Tuple
 from typing_extensions import overload
 
 import pydantic as pyd
 import pydantic_core as pyd_core
 from pydantic_core import core_schema as _core_schema
 
-from forcedimension_core.constants import MAX_DOF, MAX_STATUS
+import forcedimension_core.containers._state as _state
+from forcedimension_core.constants import (
+    MAX_DOF, MAX_STATUS, DeviceType, Handedness
+)
 from forcedimension_core.typing import (
     CBoolLike, Pointer, c_double_ptr, c_int_ptr, c_ushort_ptr
 )
@@ -40,6 +43,39 @@ class VersionTuple(NamedTuple):
         return f"{self.major}.{self.minor}.{self.release}-{self.revision}"
 
 
+class Capabilities(NamedTuple):
+    """
+    The parts of a device, as reported by the SDK.
+    """
+
+    base: bool
+    wrist: bool
+    active_wrist: bool
+    gripper: bool
+    active_gripper: bool
+    left_handed: bool
+
+
+class DeviceInfo(NamedTuple):
+    """
+    What a device is (see :func:`forcedimension_core.dhd.getDeviceInfo()`).
+    """
+
+    devtype: DeviceType
+    name: Optional[str]
+    serial: int
+    capabilities: Capabilities
+
+    #: The number of degrees of freedom of the device type.
+    dof: int = 0
+
+    #: The handedness of the device type.
+    handedness: Handedness = Handedness.NONE
+
+    #: The name of the device type, e.g. ``'omega.7 right'``.
+    type_str: str = 'none'
+
+
 class Status(ct.Structure):
     """
     Adapts the status array returned by
@@ -778,3 +814,62 @@ class Mat6x6(array):
         """
 
         return self._ptr
+
+
+class DeviceState(_state.DeviceStateBase):
+    """
+    The state of a device read in a single call by
+    :func:`forcedimension_core.dhd.getState()` and
+    :func:`forcedimension_core.dhd.direct.getState()`.
+
+    The whole state lives in one contiguous buffer (:attr:`data`). The
+    vectors, matrix and per-degree-of-freedom arrays are ctypes arrays
+    viewing that buffer, with the same ``ptr``/``ptrs`` as :class:`Vec3`,
+    :class:`Mat3x3`, :class:`DOFFloat` and :class:`DOFInt`, and the scalars
+    are :class:`ctypes.c_double` aliasing it.
+
+    Whether the device has a wrist and a gripper is queried the first time
+    the state is read for a device and remembered afterwards (see
+    :attr:`has_wrist` and :attr:`has_gripper`). Parts of the state the
+    device lacks are left untouched.
+
+    :param Optional[Any] buffer:
+        A writable buffer (e.g. the ``buf`` of a
+        :class:`multiprocessing.shared_memory.SharedMemory`) to lay the
+        state out in instead of a new one. It is used as is.
+
+    :param int offset:
+        Where the state starts in ``buffer`` (in bytes).
+    """
+
+    def __init__(self, buffer: Optional[Any] = None, offset: int = 0):
+        super().__init__(buffer, offset)
+
+        data = self.data
+
+        #: Position of the end-effector (in [m]).
+        self.position = _state.Vec3View.over(data, 'position')
+
+        #: Orientation frame of the end-effector. The identity for devices
+        #: without a wrist.
+        self.frame = _state.Mat3x3View.over(data, 'frame')
+
+        #: Linear velocity of the end-effector (in [m/s]).
+        self.linear_velocity = _state.Vec3View.over(data, 'linear_velocity')
+
+        #: Angular velocity of the end-effector (in [rad/s]).
+        self.angular_velocity = _state.Vec3View.over(
+            data, 'angular_velocity'
+        )
+
+        #: Force applied to the end-effector (in [N]).
+        self.force = _state.Vec3View.over(data, 'force')
+
+        #: Torque applied to the end-effector (in [Nm]).
+        self.torque = _state.Vec3View.over(data, 'torque')
+
+        #: Joint angles (in [rad]).
+        self.joint_angles = _state.DOFFloatView.over(data, 'joint_angles')
+
+        #: Encoder values of every degree-of-freedom.
+        self.encoders = _state.DOFIntView.over(data, 'encoders')
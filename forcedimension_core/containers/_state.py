@@ -0,0 +1,269 @@
+"""
+The contiguous buffer behind :class:`forcedimension_core.containers.DeviceState`
+and :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+Every part of the state lives in a single :class:`DeviceStateData`
+structure. The containers exposed by a state are views over that structure,
+and the arguments passed to the library for each of them are created once,
+when the state is.
+
+Those arguments are ctypes scalars and arrays aliasing the structure rather
+than pointer objects: ctypes passes them by reference at a fraction of the
+cost of converting a pointer object, and the library still writes straight
+into the structure.
+"""
+
+import ctypes as ct
+from ctypes import c_double, c_int, c_uint
+from typing import Any, Optional, Tuple
+
+from forcedimension_core.constants import MAX_DOF
+
+
+class DeviceStateData(ct.Structure):
+    """
+    The memory layout of a device state.
+    """
+
+    _fields_ = (
+        ('position', c_double * 3),
+        ('frame', c_double * 9),
+        ('linear_velocity', c_double * 3),
+        ('angular_velocity', c_double * 3),
+        ('force', c_double * 3),
+        ('torque', c_double * 3),
+        ('joint_angles', c_double * MAX_DOF),
+        ('gripper_angle', c_double),
+        ('gripper_gap', c_double),
+        ('gripper_angular_velocity', c_double),
+        ('gripper_linear_velocity', c_double),
+        ('gripper_force', c_double),
+        ('encoders', c_int * MAX_DOF),
+        ('buttons', c_uint),
+
+        # Laid out as forcedimension_core.containers.Status
+        ('status', c_int * 32),
+    )
+
+
+def aliases(data: DeviceStateData, name: str, n: int) -> Tuple[Any, ...]:
+    """
+    Get a ctypes scalar aliasing each of the first ``n`` elements of the
+    field ``name`` of ``data``.
+    """
+
+    return _aliases(
+        data, getattr(DeviceStateData, name).offset,
+        getattr(data, name)._type_, n
+    )
+
+
+def _aliases(buffer: Any, offset: int, ctype: Any, n: int) -> Tuple[Any, ...]:
+    size = ct.sizeof(ctype)
+
+    return tuple(
+        ctype.from_buffer(buffer, offset + i * size) for i in range(n)
+    )
+
+
+def scalar(data: DeviceStateData, name: str, ctype: Any) -> Any:
+    """
+    Get a ctypes scalar aliasing the scalar field ``name`` of ``data``.
+    """
+
+    return ctype.from_buffer(data, getattr(DeviceStateData, name).offset)
+
+
+class _View:
+    """
+    Gives a ctypes array aliasing part of a :class:`DeviceStateData` the
+    ``ptr`` and ``ptrs`` of the matching container, so it can be passed to
+    the functions of :mod:`forcedimension_core.dhd.direct` as is.
+    """
+
+    _ptrs: Tuple[Any, ...]
+
+    @classmethod
+    def over(cls, data: DeviceStateData, name: str) -> Any:
+        return cls.at(data, getattr(DeviceStateData, name).offset)
+
+    @classmethod
+    def at(cls, buffer: Any, offset: int = 0) -> Any:
+        """
+        Create a view over the writable ``buffer`` starting ``offset``
+        bytes in.
+        """
+
+        view = cls.from_buffer(buffer, offset)  # type: ignore
+        view._ptrs = _aliases(buffer, offset, view._type_, len(view))
+
+        return view
+
+    @property
+    def ptr(self) -> Any:
+        """
+        The view itself, which ctypes passes as a pointer to its front.
+        """
+
+        return self
+
+    @property
+    def ptrs(self) -> Tuple[Any, ...]:
+        """
+        A tuple of ctypes scalars aliasing each element in order.
+        """
+
+        return self._ptrs
+
+    def tolist(self) -> list:
+        return self[:]  # type: ignore
+
+
+class Vec3View(_View, c_double * 3):
+    """
+    A view over a vector of three floats in a device state. Has the "x",
+    "y" and "z" properties of :class:`forcedimension_core.containers.Vec3`.
+    """
+
+    @property
+    def x(self) -> float:
+        return self[0]
+
+    @x.setter
+    def x(self, value: float):
+        self[0] = value
+
+    @property
+    def y(self) -> float:
+        return self[1]
+
+    @y.setter
+    def y(self, value: float):
+        self[1] = value
+
+    @property
+    def z(self) -> float:
+        return self[2]
+
+    @z.setter
+    def z(self, value: float):
+        self[2] = value
+
+
+class Mat3x3View(_View, c_double * 9):
+    """
+    A view over a row-major 3x3 matrix of floats in a device state. Like
+    :class:`forcedimension_core.containers.Mat3x3`, it is indexed with
+    ``view[i, j]``.
+    """
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            i, j = index
+            index = 3 * i + j
+
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple):
+            i, j = index
+            index = 3 * i + j
+
+        super().__setitem__(index, value)
+
+
+class DOFFloatView(_View, c_double * MAX_DOF):
+    """
+    A view over one float per degree-of-freedom in a device state.
+    """
+
+
+class DOFIntView(_View, c_int * MAX_DOF):
+    """
+    A view over one int per degree-of-freedom in a device state.
+    """
+
+
+class DeviceStateBase:
+    """
+    The parts common to both flavours of device state. Subclasses create
+    the container views.
+    """
+
+    def __init__(self, buffer: Optional[Any] = None, offset: int = 0):
+        # Imported here since the containers import this module.
+        from forcedimension_core.containers import Status
+
+        if buffer is None:
+            data = DeviceStateData()
+            data.frame[0] = data.frame[4] = data.frame[8] = 1.
+        else:
+            data = DeviceStateData.from_buffer(buffer, offset)
+
+        #: The structure holding the whole state.
+        self.data = data
+
+        #: Gripper opening angle (in [rad]).
+        self.gripper_angle = scalar(data, 'gripper_angle', c_double)
+
+        #: Gripper opening distance (in [m]).
+        self.gripper_gap = scalar(data, 'gripper_gap', c_double)
+
+        #: Gripper angular velocity (in [rad/s]).
+        self.gripper_angular_velocity = scalar(
+            data, 'gripper_angular_velocity', c_double
+        )
+
+        #: Gripper linear velocity (in [m/s]).
+        self.gripper_linear_velocity = scalar(
+            data, 'gripper_linear_velocity', c_double
+        )
+
+        #: Force applied by the gripper (in [N]).
+        self.gripper_force = scalar(data, 'gripper_force', c_double)
+
+        #: Status of the device.
+        self.status = Status.from_buffer(
+            data, DeviceStateData.status.offset  # type: ignore
+        )
+        self.status._ptr = data.status
+
+        self._capabilities: Optional[Tuple[int, bool, bool]] = None
+
+    @property
+    def buttons(self) -> int:
+        """
+        Bit mask of the pressed buttons.
+        """
+
+        return self.data.buttons
+
+    @buttons.setter
+    def buttons(self, value: int):
+        self.data.buttons = value
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the buffer holding the state.
+        """
+
+        return ct.sizeof(self.data)
+
+    @property
+    def has_wrist(self) -> Optional[bool]:
+        """
+        ``True`` if the device the state was last read from has a wrist,
+        ``None`` if the state was never read.
+        """
+
+        return None if self._capabilities is None else self._capabilities[1]
+
+    @property
+    def has_gripper(self) -> Optional[bool]:
+        """
+        ``True`` if the device the state was last read from has a gripper,
+        ``None`` if the state was never read.
+        """
+
+        return None if self._capabilities is None else self._capabilities[2]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import ctypes
 from ctypes import c_double, c_int, c_ushort
 import os
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 try:
     if os.environ.get('__fdsdk__unittest_opt_has_numpy__', 'True') == 'False':
@@ -21,6 +21,7 @@ import pydantic as pyd
 import pydantic_core as pyd_core
 from pydantic_core import core_schema as _core_schema
 
+import forcedimension_core.containers._state as _state
 from forcedimension_core.constants import MAX_DOF
 from forcedimension_core.typing import (
     Array, c_double_ptr, c_int_ptr, c_ushort_ptr
@@ -537,3 +538,270 @@ class Mat6x6(np.ndarray):
         """
 
         return self._ptr
+
+
+class DeviceState(_state.DeviceStateBase):
+    """
+    The state of a device read in a single call by
+    :func:`forcedimension_core.dhd.getState()` and
+    :func:`forcedimension_core.dhd.direct.getState()`, backed by NumPy
+    containers.
+
+    The whole state lives in one contiguous buffer (:attr:`data`) and the
+    containers are views over it, so reading the state into them copies
+    nothing. Their ``ptr``/``ptrs`` are ctypes objects aliasing the buffer,
+    created once with the state.
+
+    Whether the device has a wrist and a gripper is queried the first time
+    the state is read for a device and remembered afterwards (see
+    :attr:`has_wrist` and :attr:`has_gripper`). Parts of the state the
+    device lacks are left untouched.
+
+    :param Optional[Any] buffer:
+        A writable buffer (e.g. the ``buf`` of a
+        :class:`multiprocessing.shared_memory.SharedMemory`) to lay the
+        state out in instead of a new one. It is used as is.
+
+    :param int offset:
+        Where the state starts in ``buffer`` (in bytes).
+    """
+
+    def __init__(self, buffer: Optional[Any] = None, offset: int = 0):
+        super().__init__(buffer, offset)
+
+        data = self.data
+
+        #: Position of the end-effector (in [m]).
+        self.position = _vec3_view(data, 'position')
+
+        #: Orientation frame of the end-effector. The identity for devices
+        #: without a wrist.
+        self.frame = Mat3x3(np.ctypeslib.as_array(data.frame))
+        self.frame._ptr = data.frame
+
+        #: Linear velocity of the end-effector (in [m/s]).
+        self.linear_velocity = _vec3_view(data, 'linear_velocity')
+
+        #: Angular velocity of the end-effector (in [rad/s]).
+        self.angular_velocity = _vec3_view(data, 'angular_velocity')
+
+        #: Force applied to the end-effector (in [N]).
+        self.force = _vec3_view(data, 'force')
+
+        #: Torque applied to the end-effector (in [Nm]).
+        self.torque = _vec3_view(data, 'torque')
+
+        #: Joint angles (in [rad]).
+        self.joint_angles = _dof_view(DOFFloat, data, 'joint_angles')
+
+        #: Encoder values of every degree-of-freedom.
+        self.encoders = _dof_view(DOFInt, data, 'encoders')
+
+
+def _vec3_view(data: Any, name: str) -> Vec3:
+    view = Vec3(np.ctypeslib.as_array(getattr(data, name)))
+    view._ptrs = _state.aliases(data, name, 3)
+
+    return view
+
+
+def _dof_view(cls: Any, data: Any, name: str) -> Any:
+    field = getattr(data, name)
+    view = cls(np.ctypeslib.as_array(field))
+    view._ptr = field
+
+    # The sub-views the container creates are views of the container
+    # itself, a reference cycle NumPy never collects. That would keep a
+    # state in shared memory exported forever, so view the state instead.
+    def sub_view(sub_cls: Any, start: int, n: int) -> Any:
+        return sub_cls(np.frombuffer(
+            data, dtype=view.dtype, count=n,
+            offset=getattr(type(data), name).offset + start * view.itemsize
+        ))
+
+    vec3 = Vec3 if cls is DOFFloat else Enc3
+    view._delta = sub_view(vec3, 0, 3)
+    view._wrist = sub_view(vec3, 3, 3)
+
+    if cls is DOFInt:
+        view._wrist_grip = sub_view(Enc4, 3, 4)
+
+    return view
+
+
+class History:
+    """
+    A fixed-capacity ring buffer of samples, such as the last ``capacity``
+    positions or forces of a device, stored as the rows of a single
+    ``(capacity, k)`` :class:`numpy.ndarray` of floats.
+
+    The row the next sample goes into (:attr:`slot`) is a container view
+    with the pointers of ``container``, so it can be passed as is to the
+    functions of :mod:`forcedimension_core.dhd.direct`. A view is created
+    for every row up front, so recording a sample allocates nothing.
+
+    .. code-block:: python
+
+        history = containers.numpy.History(1000)
+
+        while running:
+            dhd.direct.getPosition(history.slot)
+            history.advance()
+
+        older, newer = history.segments(100)
+
+    :param int capacity:
+        The number of samples kept.
+
+    :param type container:
+        The type of a sample: :class:`Vec3` (the default),
+        :class:`Mat3x3` or :class:`DOFFloat`.
+
+    :raises ValueError:
+        If ``capacity`` is not positive or ``container`` is not one of the
+        supported containers.
+    """
+
+    def __init__(self, capacity: int, container: type = Vec3):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+
+        if container is Vec3:
+            width = 3
+        elif container is Mat3x3:
+            width = 9
+        elif container is DOFFloat:
+            width = MAX_DOF
+        else:
+            raise ValueError(
+                f"Unsupported container {container.__name__}. Use Vec3, "
+                "Mat3x3 or DOFFloat."
+            )
+
+        self._data = np.zeros((capacity, width), dtype=c_double)
+        self._slots = tuple(container(row) for row in self._data)
+        self._capacity = capacity
+        self._cursor = 0
+        self._len = 0
+
+    @property
+    def data(self) -> npt.NDArray[np.float64]:
+        """
+        The underlying ``(capacity, k)`` array. Rows are in the order they
+        were written in, not the order the samples were recorded in.
+        """
+
+        return self._data
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of samples kept.
+        """
+
+        return self._capacity
+
+    @property
+    def cursor(self) -> int:
+        """
+        The index of the row the next sample is written to.
+        """
+
+        return self._cursor
+
+    @property
+    def slot(self) -> Any:
+        """
+        The row the next sample is written to, as a container view with
+        ``ptr``/``ptrs`` over it. The sample only becomes part of the
+        history once :meth:`advance()` is called.
+        """
+
+        return self._slots[self._cursor]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def advance(self):
+        """
+        Commit the sample written to :attr:`slot` and move on to the next
+        row, overwriting the oldest sample once the history is full.
+        """
+
+        cursor = self._cursor + 1
+        self._cursor = 0 if cursor == self._capacity else cursor
+
+        if self._len < self._capacity:
+            self._len += 1
+
+    def append(self, sample: npt.ArrayLike):
+        """
+        Copy ``sample`` into :attr:`slot` and commit it.
+
+        :param npt.ArrayLike sample:
+            The sample to record. Must be broadcastable to a row.
+        """
+
+        self._data[self._cursor] = sample
+        self.advance()
+
+    def clear(self):
+        """
+        Forget every sample. The contents of :attr:`data` are kept.
+        """
+
+        self._cursor = 0
+        self._len = 0
+
+    def segments(
+        self, n: Optional[int] = None
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Get the ``n`` most recent samples, oldest first, as two views over
+        :attr:`data`. The samples are the rows of the first view followed
+        by the rows of the second, which is empty unless the window wraps
+        around the end of the buffer. Nothing is copied.
+
+        :param Optional[int] n:
+            The number of samples. Defaults to all the samples recorded.
+
+        :raises ValueError:
+            If ``n`` is negative or greater than the number of samples
+            recorded.
+        """
+
+        if n is None:
+            n = self._len
+        elif not 0 <= n <= self._len:
+            raise ValueError(
+                f"Cannot get {n} samples out of {self._len} recorded."
+            )
+
+        start = self._cursor - n
+
+        if start >= 0:
+            return self._data[start:self._cursor], self._data[:0]
+
+        return self._data[start:], self._data[:self._cursor]
+
+    def window(self, n: Optional[int] = None) -> npt.NDArray[np.float64]:
+        """
+        Get the ``n`` most recent samples, oldest first, as a single
+        ``(n, k)`` array. It is a view over :attr:`data` when the window
+        does not wrap around the end of the buffer and a copy otherwise.
+        Use :meth:`segments()` to never copy.
+
+        :param Optional[int] n:
+            The number of samples. Defaults to all the samples recorded.
+
+        :raises ValueError:
+            If ``n`` is negative or greater than the number of samples
+            recorded.
+        """
+
+        older, newer = self.segments(n)
+
+        if len(newer) == 0:
+            return older
+
+        return np.concatenate((older, newer))
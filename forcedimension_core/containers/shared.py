@@ -0,0 +1,457 @@
+"""
+Containers in shared memory, for pipelines that run the haptic loop in its
+own process.
+
+:func:`view()` lays a container out in any writable buffer, such as the
+``buf`` of a :class:`multiprocessing.shared_memory.SharedMemory`, with
+``ptr``/``ptrs`` aliasing it so the functions of
+:mod:`forcedimension_core.dhd.direct` write straight into it.
+
+:class:`StatePublisher` and :class:`StateSubscriber` move whole device
+states between processes. The publisher owns a shared memory segment
+holding two :class:`forcedimension_core.containers.DeviceState` buffers and
+a sequence number, the same seqlock as
+:class:`forcedimension_core.poller.Poller`: the device is read straight
+into the buffer subscribers are not reading, which is then published by
+bumping the sequence number. Nothing is pickled.
+
+The seqlock issues no memory barriers: it relies on stores becoming
+visible to other processes in the order they were made. That holds on
+x86 and x86-64, which never reorder stores with other stores or loads
+with other loads. On weakly ordered CPUs such as ARM, a subscriber may
+return a state mixing two samples, so constructing a publisher or a
+subscriber raises :class:`RuntimeError` anywhere but on x86.
+"""
+
+import ctypes as ct
+import gc
+import platform
+from ctypes import c_double, c_int, c_uint64, c_ushort
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Optional, Tuple, Type
+
+import forcedimension_core.containers as containers
+from forcedimension_core.constants import MAX_DOF
+from forcedimension_core.containers import _state
+from forcedimension_core.dhd import os_independent
+from forcedimension_core.poller import Snapshot
+
+
+# platform.machine() of the CPUs the seqlock is safe on
+_X86 = frozenset(('x86_64', 'amd64', 'i386', 'i486', 'i586', 'i686', 'x86'))
+
+
+def _check_platform():
+    if (machine := platform.machine()).lower() not in _X86:
+        raise RuntimeError(
+            "Sharing device states between processes is only supported on "
+            f"x86, not on {machine or 'this machine'}."
+        )
+
+
+def _views() -> Dict[type, Any]:
+    return {
+        containers.Vec3: _state.Vec3View,
+        containers.Mat3x3: _state.Mat3x3View,
+        containers.DOFFloat: _state.DOFFloatView,
+        containers.DOFInt: _state.DOFIntView,
+    }
+
+
+def _ndarray_layouts() -> Dict[type, Tuple[Any, int]]:
+    # Imported here since NumPy is optional.
+    import forcedimension_core.containers.numpy as np_containers
+
+    return {
+        np_containers.Vec3: (c_double, 3),
+        np_containers.Enc3: (c_int, 3),
+        np_containers.Mot3: (c_ushort, 3),
+        np_containers.Enc4: (c_int, 4),
+        np_containers.DOFInt: (c_int, MAX_DOF),
+        np_containers.DOFMotor: (c_ushort, MAX_DOF),
+        np_containers.DOFFloat: (c_double, MAX_DOF),
+        np_containers.Mat3x3: (c_double, 9),
+        np_containers.Mat6x6: (c_double, 36),
+    }
+
+
+def sizeof(container: type) -> int:
+    """
+    Get the number of bytes a container takes in a buffer.
+
+    :param type container:
+        :class:`forcedimension_core.containers.Vec3`,
+        :class:`forcedimension_core.containers.Mat3x3`,
+        :class:`forcedimension_core.containers.DOFFloat`,
+        :class:`forcedimension_core.containers.DOFInt` or any of the
+        containers of :mod:`forcedimension_core.containers.numpy` but
+        :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+    :raises ValueError:
+        If ``container`` is not supported.
+    """
+
+    if (view := _views().get(container)) is not None:
+        return ct.sizeof(view)
+
+    if (layout := _ndarray_layouts().get(container)) is None:
+        raise ValueError(f"Unsupported container {container.__name__}.")
+
+    ctype, n = layout
+
+    return ct.sizeof(ctype) * n
+
+
+def view(container: type, buffer: Any, offset: int = 0) -> Any:
+    """
+    Lay a container out in ``buffer``, starting ``offset`` bytes in. The
+    contents of the buffer are kept.
+
+    Basic containers become ctypes arrays with the same ``ptr``/``ptrs``
+    (and for :class:`forcedimension_core.containers.Vec3` the same "x", "y"
+    and "z" properties), since :class:`array.array` cannot view external
+    memory. NumPy containers become instances of their own type.
+
+    The container keeps ``buffer`` exported until it is garbage collected,
+    so a :class:`multiprocessing.shared_memory.SharedMemory` cannot be
+    closed before.
+
+    :param type container:
+        The type of container (see :func:`sizeof()`).
+
+    :param Any buffer:
+        A writable buffer.
+
+    :param int offset:
+        Where the container starts in ``buffer`` (in bytes).
+
+    :raises ValueError:
+        If ``container`` is not supported or does not fit in ``buffer``.
+    """
+
+    if (view_type := _views().get(container)) is not None:
+        return view_type.at(buffer, offset)
+
+    # Imported here since NumPy is optional.
+    import numpy as np
+
+    if (layout := _ndarray_layouts().get(container)) is None:
+        raise ValueError(f"Unsupported container {container.__name__}.")
+
+    ctype, n = layout
+
+    return container(
+        np.frombuffer(buffer, dtype=ctype, count=n, offset=offset)
+    )
+
+
+class _Header(ct.Structure):
+    _fields_ = (
+        ('begun', c_uint64),
+        ('sequence', c_uint64),
+        ('times', c_double * 2),
+    )
+
+
+class _Layout(ct.Structure):
+    _fields_ = (
+        ('header', _Header),
+        ('states', _state.DeviceStateData * 2),
+    )
+
+
+def _close(shm: shared_memory.SharedMemory):
+    try:
+        shm.close()
+    except BufferError:
+        # Views over the segment may only be referenced by cycles, e.g.
+        # NumPy containers and their sub-views.
+        gc.collect()
+        shm.close()
+
+
+def _states(buffer: Any, state_type: type) -> Tuple[Any, Any]:
+    offset = _Layout.states.offset  # type: ignore
+    size = ct.sizeof(_state.DeviceStateData)
+
+    return (state_type(buffer, offset), state_type(buffer, offset + size))
+
+
+class StatePublisher:
+    """
+    Publishes device states to other processes through a new shared memory
+    segment.
+
+    .. code-block:: python
+
+        with StatePublisher('omega') as publisher:
+            while running:
+                direct.getState(publisher.begin(), ID)
+                publisher.publish()
+
+    :param Optional[str] name:
+        The name of the segment. A unique name is generated if ``None``.
+
+    :param type state_type:
+        The type of the states returned by :meth:`begin()`, either
+        :class:`forcedimension_core.containers.DeviceState` or
+        :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+    :raises FileExistsError:
+        If a segment named ``name`` already exists.
+
+    :raises RuntimeError:
+        If the CPU is not x86.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        state_type: Type[Any] = containers.DeviceState
+    ):
+        _check_platform()
+
+        self._shm = shared_memory.SharedMemory(
+            name, create=True, size=ct.sizeof(_Layout)
+        )
+        self._header = _Header.from_buffer(self._shm.buf)
+        self._states = _states(self._shm.buf, state_type)
+
+        for state in self._states:
+            frame = state.data.frame
+            frame[0] = frame[4] = frame[8] = 1.
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the segment, to pass to :class:`StateSubscriber`.
+        """
+
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """
+        The number of states published.
+        """
+
+        return self._header.sequence
+
+    def begin(self) -> Any:
+        """
+        Get the buffer to write the next state into. It is in shared memory,
+        so reading the device into it copies nothing. Call
+        :meth:`publish()` once it is written.
+        """
+
+        header = self._header
+        header.begun = begun = header.sequence + 1
+
+        return self._states[begun & 1]
+
+    def publish(self, time: Optional[float] = None):
+        """
+        Publish the state written into the buffer returned by
+        :meth:`begin()`.
+
+        :param Optional[float] time:
+            When the state was read (in [s]). Defaults to now (see
+            :func:`forcedimension_core.dhd.os_independent.getTime()`).
+        """
+
+        header = self._header
+        begun = header.begun
+
+        if time is None:
+            time = os_independent.getTime()
+
+        header.times[begun & 1] = time
+        header.sequence = begun
+
+    def write(self, state: Any, time: Optional[float] = None):
+        """
+        Copy ``state`` into shared memory and publish it.
+
+        :param DeviceState state:
+            The state to publish.
+
+        :param Optional[float] time:
+            When the state was read (in [s]). Defaults to now.
+        """
+
+        ct.memmove(
+            ct.addressof(self.begin().data), ct.addressof(state.data),
+            ct.sizeof(_state.DeviceStateData)
+        )
+        self.publish(time)
+
+    def close(self):
+        """
+        Close and destroy the segment. Subscribers attached to it keep it
+        alive until they close.
+
+        :raises BufferError:
+            If states returned by :meth:`begin()` are still referenced.
+        """
+
+        self._header = None  # type: ignore
+        self._states = ()  # type: ignore
+        _close(self._shm)
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StateSubscriber:
+    """
+    Reads the device states of a :class:`StatePublisher`, usually in
+    another process. Never blocks the publisher. Only supported on x86
+    (see :mod:`forcedimension_core.containers.shared`).
+
+    Attaching never makes this process own the segment: it is not
+    destroyed when the subscriber exits.
+
+    :param str name:
+        The name of the segment of the publisher.
+
+    :param type state_type:
+        The type of the states returned by :meth:`view()`, either
+        :class:`forcedimension_core.containers.DeviceState` or
+        :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+    :raises FileNotFoundError:
+        If there is no segment named ``name``.
+
+    :raises RuntimeError:
+        If the CPU is not x86.
+    """
+
+    def __init__(
+        self, name: str, state_type: Type[Any] = containers.DeviceState
+    ):
+        _check_platform()
+
+        try:
+            # The publisher owns the segment. Since Python 3.13 attaching
+            # can opt out of the resource tracker, which otherwise
+            # destroys the segment when this process exits.
+            self._shm = shared_memory.SharedMemory(
+                name, track=False  # type: ignore
+            )
+        except TypeError:
+            self._shm = shared_memory.SharedMemory(name)
+
+            if shared_memory._USE_POSIX:  # type: ignore
+                resource_tracker.unregister(
+                    self._shm._name, 'shared_memory'  # type: ignore
+                )
+
+        self._header = _Header.from_buffer(self._shm.buf)
+        self._states = _states(self._shm.buf, state_type)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """
+        The number of states published.
+        """
+
+        return self._header.sequence
+
+    def read(self, out: Any) -> Snapshot:
+        """
+        Copy the latest published state into ``out``.
+
+        :param DeviceState out:
+            The state to copy into.
+
+        :raises RuntimeError:
+            If no state was published yet.
+
+        :returns:
+            Which state was copied and when it was read.
+        """
+
+        header = self._header
+        states = self._states
+        size = ct.sizeof(_state.DeviceStateData)
+        dst = ct.addressof(out.data)
+
+        while True:
+            if (sequence := header.sequence) == 0:
+                raise RuntimeError("No state was published yet.")
+
+            i = sequence & 1
+            ct.memmove(dst, ct.addressof(states[i].data), size)
+            time = header.times[i]
+
+            # The buffer is only rewritten from the second state begun
+            # after it was published.
+            if header.begun - sequence < 2:
+                return Snapshot(sequence, time)
+
+    def view(self) -> Tuple[Any, Snapshot]:
+        """
+        Get the latest published state in shared memory, without copying
+        it. The publisher overwrites it once it begins the state after the
+        next one, so check that it is still :meth:`valid()` after using it.
+
+        :raises RuntimeError:
+            If no state was published yet.
+        """
+
+        header = self._header
+
+        if (sequence := header.sequence) == 0:
+            raise RuntimeError("No state was published yet.")
+
+        i = sequence & 1
+
+        return self._states[i], Snapshot(sequence, header.times[i])
+
+    def valid(self, snapshot: Snapshot) -> bool:
+        """
+        Whether the state :meth:`view()` returned with ``snapshot`` was
+        not overwritten yet.
+        """
+
+        return self._header.begun - snapshot.sequence < 2
+
+    def age(self, snapshot: Snapshot) -> float:
+        """
+        How long ago the state of ``snapshot`` was read (in [s]).
+        """
+
+        return os_independent.getTime() - snapshot.time
+
+    def behind(self, snapshot: Snapshot) -> int:
+        """
+        How many states were published after the one of ``snapshot``.
+        """
+
+        return self._header.sequence - snapshot.sequence
+
+    def close(self):
+        """
+        Detach from the segment.
+
+        :raises BufferError:
+            If states returned by :meth:`view()` are still referenced.
+        """
+
+        self._header = None  # type: ignore
+        self._states = ()  # type: ignore
+        _close(self._shm)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,622 @@
+"""
+A handle to an open device with its ID bound into every call.
+
+Multi-device code otherwise passes ``ID=ID`` to every function of
+:mod:`forcedimension_core.dhd` and :mod:`forcedimension_core.drd`.
+A :class:`Device` exposes those functions with the ID already applied, and
+implements the most frequent state reads and force commands itself. Those
+call the library directly with a preconverted ID and write into containers
+owned by the device.
+
+:func:`open_all()` opens every connected device at once, one thread per
+device, and queries what each one is.
+"""
+
+import functools
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import c_byte, c_double
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import forcedimension_core.containers as containers
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.direct as dhd_direct
+import forcedimension_core.dhd.expert as expert
+import forcedimension_core.drd as drd
+import forcedimension_core.runtime as _runtime
+from forcedimension_core._checked import raise_last_error as _raise_last_error
+from forcedimension_core.constants import DeviceType
+from forcedimension_core.containers import DeviceInfo
+from forcedimension_core.typing import Array
+
+_dhdGetPosition = _runtime._libdhd.bind(globals(), 'dhdGetPosition')
+_dhdGetOrientationRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationRad'
+)
+_dhdGetPositionAndOrientationRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationRad'
+)
+_dhdGetLinearVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdGetLinearVelocity'
+)
+_dhdGetAngularVelocityRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetAngularVelocityRad'
+)
+_dhdGetForce = _runtime._libdhd.bind(globals(), 'dhdGetForce')
+_dhdGetForceAndTorque = _runtime._libdhd.bind(
+    globals(), 'dhdGetForceAndTorque'
+)
+_dhdGetGripperAngleRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperAngleRad'
+)
+_dhdGetButtonMask = _runtime._libdhd.bind(globals(), 'dhdGetButtonMask')
+_dhdSetForce = _runtime._libdhd.bind(globals(), 'dhdSetForce')
+_dhdSetForceAndTorque = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndTorque'
+)
+_dhdSetForceAndTorqueAndGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndTorqueAndGripperForce'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _binder(func: Callable[..., Any]) -> Callable[..., Callable[..., Any]]:
+    """
+    Compile a factory that returns ``func`` with its trailing ``ID``
+    parameter bound. The bound function keeps the signature of ``func``
+    (minus ``ID``) and passes the ID positionally, so a call costs one
+    extra frame and no keyword handling.
+    """
+
+    sig = inspect.signature(func)
+    params = [p for p in sig.parameters.values() if p.name != 'ID']
+
+    if any(p.kind is not p.POSITIONAL_OR_KEYWORD for p in params):
+        return lambda ID: functools.partial(func, ID=ID)
+
+    decl = []
+    defaults = []
+
+    for param in params:
+        if param.default is param.empty:
+            decl.append(param.name)
+        else:
+            decl.append(f'{param.name}=_d{len(defaults)}')
+            defaults.append(f'_d{len(defaults)}')
+
+    args = ''.join(f'{param.name}, ' for param in params)
+
+    source = (
+        f"def _factory(_func, _ID, {''.join(d + ', ' for d in defaults)}):\n"
+        f"    def {func.__name__}({', '.join(decl)}):\n"
+        f"        return _func({args}_ID)\n"
+        f"    return {func.__name__}\n"
+    )
+
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    factory = namespace['_factory']
+    default_values = [p.default for p in params if p.default is not p.empty]
+
+    # What functools.update_wrapper() would copy, computed once
+    attrs = {
+        **func.__dict__,
+        '__wrapped__': func,
+        '__signature__': sig.replace(parameters=params)
+    }
+    qualname = func.__qualname__
+    doc = func.__doc__
+    module = func.__module__
+
+    def bind(ID: int) -> Callable[..., Any]:
+        bound = factory(func, ID, *default_values)
+        bound.__dict__.update(attrs)
+        bound.__qualname__ = qualname
+        bound.__doc__ = doc
+        bound.__module__ = module
+
+        return bound
+
+    return bind
+
+
+@functools.lru_cache(maxsize=None)
+def _module_binders(
+    module: Any
+) -> Tuple[Tuple[str, Callable[..., Callable[..., Any]]], ...]:
+    """
+    The binders of the public functions of ``module`` that take an ``ID``,
+    by name. Computed once per module, so a new :class:`Device` only binds
+    its ID.
+    """
+
+    binders = []
+
+    for name, func in vars(module).items():
+        if name.startswith('_') or not inspect.isfunction(func):
+            continue
+
+        if func.__module__ != module.__name__:
+            continue
+
+        if 'ID' in inspect.signature(func).parameters:
+            binders.append((name, _binder(func)))
+
+    return tuple(binders)
+
+
+def _bind_module(module: Any, ID: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        **{name: bind(ID) for name, bind in _module_binders(module)}
+    )
+
+
+def _store(out: Any, x: c_double, y: c_double, z: c_double) -> None:
+    out[0] = x.value
+    out[1] = y.value
+    out[2] = z.value
+
+
+class Device:
+    """
+    A device opened through :mod:`forcedimension_core.dhd` or
+    :mod:`forcedimension_core.drd`, with its ID bound into every call.
+
+    The functions of :mod:`forcedimension_core.dhd`,
+    :mod:`forcedimension_core.dhd.direct`,
+    :mod:`forcedimension_core.dhd.expert` and
+    :mod:`forcedimension_core.drd` that take an ``ID`` are available on the
+    :attr:`dhd`, :attr:`direct`, :attr:`expert` and :attr:`drd` attributes
+    with the same signature minus ``ID``, e.g.
+    ``device.dhd.getPosition(out)`` or ``device.drd.moveToPos(pos, True)``.
+
+    The methods of the device itself cover the usual haptic loop. They write
+    into containers owned by the device (:attr:`position`,
+    :attr:`orientation`, :attr:`linear_velocity`, :attr:`angular_velocity`,
+    :attr:`force`, :attr:`torque` and :attr:`gripper_angle`) and return 0
+    on success and -1 otherwise, like the functions they mirror.
+
+    Devices can be used as a context manager, which closes the device on
+    exit.
+    """
+
+    def __init__(self, ID: int, robotic: bool = False):
+        """
+        Wrap a device that is already open.
+
+        :param int ID:
+            The ID of the device.
+
+        :param bool robotic:
+            ``True`` if the device was opened with
+            :mod:`forcedimension_core.drd`, in which case :meth:`close()`
+            closes it with :func:`forcedimension_core.drd.close()`.
+        """
+
+        self.ID = ID
+        self.robotic = robotic
+
+        #: What the device is, once :meth:`query()` was called.
+        self.info: Optional[DeviceInfo] = None
+
+        self.dhd = _bind_module(dhd, ID)
+        self.direct = _bind_module(dhd_direct, ID)
+        self.expert = _bind_module(expert, ID)
+        self.drd = _bind_module(drd, ID)
+
+        self.position = containers.Vec3()
+        self.orientation = containers.Vec3()
+        self.linear_velocity = containers.Vec3()
+        self.angular_velocity = containers.Vec3()
+        self.force = containers.Vec3()
+        self.torque = containers.Vec3()
+        self.gripper_angle = c_double()
+
+        # The library writes into c_doubles, which are copied into the
+        # containers. Passing a c_double by reference is considerably
+        # cheaper for ctypes than passing a pointer object.
+        self._ID = c_byte(ID)
+        self._c_position = (c_double(), c_double(), c_double())
+        self._c_orientation = (c_double(), c_double(), c_double())
+        self._c_linear_velocity = (c_double(), c_double(), c_double())
+        self._c_angular_velocity = (c_double(), c_double(), c_double())
+        self._c_force = (c_double(), c_double(), c_double())
+        self._c_torque = (c_double(), c_double(), c_double())
+
+    @classmethod
+    def open(cls, robotic: bool = False) -> 'Device':
+        """
+        Open the first available device, with
+        :func:`forcedimension_core.drd.open()` if ``robotic`` is ``True``
+        and :func:`forcedimension_core.dhd.open()` otherwise.
+
+        :raises DHDError:
+            If the device could not be opened. The exact subclass depends
+            on the last error reported by the SDK.
+        """
+
+        if (ID := (drd.open() if robotic else dhd.open())) == -1:
+            _raise_last_error('open()')
+
+        return cls(ID, robotic)
+
+    @classmethod
+    def openType(cls, device_type: DeviceType) -> 'Device':
+        """
+        Open the first available device of the given type with
+        :func:`forcedimension_core.dhd.openType()`.
+
+        :raises DHDError:
+            If the device could not be opened.
+        """
+
+        if (ID := dhd.openType(device_type)) == -1:
+            _raise_last_error(f'openType({device_type!r})')
+
+        return cls(ID)
+
+    @classmethod
+    def openSerial(cls, serial: int) -> 'Device':
+        """
+        Open the device with the given serial number with
+        :func:`forcedimension_core.dhd.openSerial()`.
+
+        :raises DHDError:
+            If the device could not be opened.
+        """
+
+        if (ID := dhd.openSerial(serial)) == -1:
+            _raise_last_error(f'openSerial({serial})')
+
+        return cls(ID)
+
+    @classmethod
+    def openID(cls, index: int, robotic: bool = False) -> 'Device':
+        """
+        Open the device at the given index, with
+        :func:`forcedimension_core.drd.openID()` if ``robotic`` is ``True``
+        and :func:`forcedimension_core.dhd.openID()` otherwise.
+
+        :raises DHDError:
+            If the device could not be opened.
+        """
+
+        if (ID := (drd.openID(index) if robotic else dhd.openID(index))) == -1:
+            _raise_last_error(f'openID({index})')
+
+        return cls(ID, robotic)
+
+    def query(self) -> DeviceInfo:
+        """
+        Get the type, name, serial number and capabilities of the device
+        (see :func:`forcedimension_core.dhd.getDeviceInfo()`) and store
+        them in :attr:`info`.
+
+        :raises DHDError:
+            If the device could not be queried.
+        """
+
+        if (info := dhd.getDeviceInfo(self.ID)) is None:
+            _raise_last_error('getDeviceInfo()', self.ID)
+
+        self.info = info
+
+        return info
+
+    def close(self) -> int:
+        """
+        Close the device.
+
+        :returns:
+            0 on success, -1 otherwise.
+        """
+
+        if self.robotic:
+            return drd.close(self.ID)
+
+        return dhd.close(self.ID)
+
+    def __enter__(self) -> 'Device':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(ID={self.ID}, robotic={self.robotic})'
+
+    def getPosition(self) -> int:
+        """
+        Update :attr:`position` (in [m]). See
+        :func:`forcedimension_core.dhd.getPosition()`.
+        """
+
+        x, y, z = self._c_position
+        err = _dhdGetPosition(x, y, z, self._ID)
+        _store(self.position, x, y, z)
+
+        return err
+
+    def getOrientationRad(self) -> int:
+        """
+        Update :attr:`orientation` (in [rad]). See
+        :func:`forcedimension_core.dhd.getOrientationRad()`.
+        """
+
+        oa, ob, og = self._c_orientation
+        err = _dhdGetOrientationRad(oa, ob, og, self._ID)
+        _store(self.orientation, oa, ob, og)
+
+        return err
+
+    def getPositionAndOrientationRad(self) -> int:
+        """
+        Update :attr:`position` and :attr:`orientation` in a single call.
+        See :func:`forcedimension_core.dhd.getPositionAndOrientationRad()`.
+        """
+
+        x, y, z = self._c_position
+        oa, ob, og = self._c_orientation
+        err = _dhdGetPositionAndOrientationRad(x, y, z, oa, ob, og, self._ID)
+        _store(self.position, x, y, z)
+        _store(self.orientation, oa, ob, og)
+
+        return err
+
+    def getLinearVelocity(self) -> int:
+        """
+        Update :attr:`linear_velocity` (in [m/s]). See
+        :func:`forcedimension_core.dhd.getLinearVelocity()`.
+        """
+
+        vx, vy, vz = self._c_linear_velocity
+        err = _dhdGetLinearVelocity(vx, vy, vz, self._ID)
+        _store(self.linear_velocity, vx, vy, vz)
+
+        return err
+
+    def getAngularVelocityRad(self) -> int:
+        """
+        Update :attr:`angular_velocity` (in [rad/s]). See
+        :func:`forcedimension_core.dhd.getAngularVelocityRad()`.
+        """
+
+        wx, wy, wz = self._c_angular_velocity
+        err = _dhdGetAngularVelocityRad(wx, wy, wz, self._ID)
+        _store(self.angular_velocity, wx, wy, wz)
+
+        return err
+
+    def getForce(self) -> int:
+        """
+        Update :attr:`force` (in [N]). See
+        :func:`forcedimension_core.dhd.getForce()`.
+        """
+
+        fx, fy, fz = self._c_force
+        err = _dhdGetForce(fx, fy, fz, self._ID)
+        _store(self.force, fx, fy, fz)
+
+        return err
+
+    def getForceAndTorque(self) -> int:
+        """
+        Update :attr:`force` (in [N]) and :attr:`torque` (in [Nm]). See
+        :func:`forcedimension_core.dhd.getForceAndTorque()`.
+        """
+
+        fx, fy, fz = self._c_force
+        tx, ty, tz = self._c_torque
+        err = _dhdGetForceAndTorque(fx, fy, fz, tx, ty, tz, self._ID)
+        _store(self.force, fx, fy, fz)
+        _store(self.torque, tx, ty, tz)
+
+        return err
+
+    def getGripperAngleRad(self) -> int:
+        """
+        Update :attr:`gripper_angle` (in [rad]). See
+        :func:`forcedimension_core.dhd.getGripperAngleRad()`.
+        """
+
+        return _dhdGetGripperAngleRad(self.gripper_angle, self._ID)
+
+    def getButtonMask(self) -> int:
+        """
+        Get the status of all buttons as a bit mask. See
+        :func:`forcedimension_core.dhd.getButtonMask()`.
+        """
+
+        return _dhdGetButtonMask(self._ID)
+
+    def setForce(self, f: Array[int, float]) -> int:
+        """
+        Set the force (in [N]) applied to the end-effector. See
+        :func:`forcedimension_core.dhd.setForce()`.
+        """
+
+        return _dhdSetForce(f[0], f[1], f[2], self._ID)
+
+    def setForceAndTorque(
+        self, f: Array[int, float], t: Array[int, float]
+    ) -> int:
+        """
+        Set the force (in [N]) and torque (in [Nm]) applied to the
+        end-effector. See :func:`forcedimension_core.dhd.setForceAndTorque()`.
+        """
+
+        return _dhdSetForceAndTorque(
+            f[0], f[1], f[2], t[0], t[1], t[2], self._ID
+        )
+
+    def setForceAndTorqueAndGripperForce(
+        self, f: Array[int, float], t: Array[int, float], fg: float
+    ) -> int:
+        """
+        Set the force (in [N]) and torque (in [Nm]) applied to the
+        end-effector and the force (in [N]) applied to the gripper. See
+        :func:`forcedimension_core.dhd.setForceAndTorqueAndGripperForce()`.
+        """
+
+        return _dhdSetForceAndTorqueAndGripperForce(
+            f[0], f[1], f[2], t[0], t[1], t[2], fg, self._ID
+        )
+
+
+class OpenTimes(NamedTuple):
+    """
+    How long each phase of opening a device took in :func:`open_all()`
+    (in [s]).
+    """
+
+    #: The index the device was opened at.
+    index: int
+
+    #: Opening the device.
+    open: float
+
+    #: Querying what the device is (see :meth:`Device.query()`).
+    query: float
+
+    #: Initialising the device, 0 if it was not.
+    init: float
+
+    @property
+    def total(self) -> float:
+        return self.open + self.query + self.init
+
+
+class OpenReport(NamedTuple):
+    """
+    How long :func:`open_all()` took (in [s]).
+    """
+
+    #: Counting the devices.
+    enumerate: float
+
+    #: The phases of each device, in the order of their index.
+    devices: Tuple[OpenTimes, ...]
+
+    #: The whole call.
+    total: float
+
+    def __str__(self) -> str:
+        lines = [
+            f"enumerate: {1000 * self.enumerate:.1f} ms",
+            "index     open    query     init    total",
+        ]
+
+        lines.extend(
+            f"{t.index:>5} {1000 * t.open:>6.1f}ms {1000 * t.query:>6.1f}ms "
+            f"{1000 * t.init:>6.1f}ms {1000 * t.total:>6.1f}ms"
+            for t in self.devices
+        )
+        lines.append(f"total: {1000 * self.total:.1f} ms")
+
+        return '\n'.join(lines)
+
+
+def _open_one(
+    index: int, robotic: bool, init: bool
+) -> Tuple[Device, OpenTimes]:
+    # Runs in a thread of its own, so the errors reported by the SDK and
+    # the device selected by the open call belong to this device.
+    t0 = time.perf_counter()
+    dev = Device.openID(index, robotic)
+
+    try:
+        t1 = time.perf_counter()
+        dev.query()
+        t2 = t3 = time.perf_counter()
+
+        if init:
+            if not drd.isInitialized(dev.ID) and drd.autoInit(dev.ID) == -1:
+                _raise_last_error('autoInit()', dev.ID)
+
+            t3 = time.perf_counter()
+    except BaseException:
+        dev.close()
+        raise
+
+    return dev, OpenTimes(index, t1 - t0, t2 - t1, t3 - t2)
+
+
+def open_all(
+    robotic: bool = True, init: bool = True
+) -> Tuple[List[Device], OpenReport]:
+    """
+    Open, query and optionally initialise every connected device in
+    parallel, with one thread per device.
+
+    .. code-block:: python
+
+        devices, report = open_all()
+        print(report)
+
+        for dev in devices:
+            print(dev.ID, dev.info.devtype, dev.info.serial)
+
+    :param bool robotic:
+        Open the devices with :func:`forcedimension_core.drd.openID()` if
+        ``True`` and :func:`forcedimension_core.dhd.openID()` otherwise.
+
+    :param bool init:
+        Initialise the devices that are not yet with
+        :func:`forcedimension_core.drd.autoInit()`. Requires ``robotic``.
+
+    :raises ValueError:
+        If ``init`` is ``True`` but ``robotic`` is not.
+
+    :raises DHDError:
+        If the devices could not be counted, or a device could not be
+        opened, queried or initialised. The devices that were opened are
+        closed again.
+
+    :returns:
+        The devices, queried (see :meth:`Device.query()`), in the order of
+        their index, and how long each phase took.
+    """
+
+    if init and not robotic:
+        raise ValueError("Devices can only be initialised if robotic.")
+
+    start = time.perf_counter()
+    count = dhd.getDeviceCount()
+    enumerated = time.perf_counter()
+
+    if count < 0:
+        _raise_last_error('getDeviceCount()')
+
+    if count == 0:
+        return [], OpenReport(enumerated - start, (), enumerated - start)
+
+    with ThreadPoolExecutor(count, thread_name_prefix='open_all') as pool:
+        futures = [
+            pool.submit(_open_one, index, robotic, init)
+            for index in range(count)
+        ]
+
+    devices = []
+    times = []
+    error: Optional[BaseException] = None
+
+    for future in futures:
+        if (ex := future.exception()) is not None:
+            error = error or ex
+            continue
+
+        dev, dev_times = future.result()
+        devices.append(dev)
+        times.append(dev_times)
+
+    if error is not None:
+        for dev in devices:
+            dev.close()
+
+        raise error
+
+    return devices, OpenReport(
+        enumerated - start, tuple(times), time.perf_counter() - start
+    )
@@ -1,18 +1,19 @@
 import ctypes as ct
-from ctypes import (c_bool, c_byte, c_char_p, c_double, c_int, c_size_t,
-                    c_uint, c_uint32, c_ushort)
+from ctypes import c_double
 from typing import Optional, Union
 
+import forcedimension_core._device_info as _device_info
 import forcedimension_core.containers as containers
 import forcedimension_core.runtime as _runtime
+from forcedimension_core._scratch import buffers as _scratch
+from forcedimension_core._scratch import copy_matrix as _copy_matrix
 from forcedimension_core.constants import (
     DEFAULT_VELOCITY_WINDOW,
     ComMode, DeviceType, ErrorNum, VelocityEstimatorMode
 )
+from forcedimension_core.containers import Capabilities, DeviceInfo
 from forcedimension_core.runtime import VersionTuple
-from forcedimension_core.typing import (
-    Array, MutableArray, c_double_ptr, c_int_ptr, c_ushort_ptr
-)
+from forcedimension_core.typing import Array, MutableArray
 
 from . import direct as direct
 from . import expert, os_independent
@@ -42,8 +43,7 @@ from .adaptors import (
     DHDErrorNoRegulation
 )
 
-_runtime._libdhd.dhdErrorGetLast.argtypes = []
-_runtime._libdhd.dhdErrorGetLast.restype = c_int
+_dhdErrorGetLast = _runtime._libdhd.bind(globals(), 'dhdErrorGetLast')
 
 
 def errorGetLast() -> ErrorNum:
@@ -63,11 +63,10 @@ def errorGetLast() -> ErrorNum:
     | :func:`forcedimension_core.dhd.errorGetLastStr()`
     """
 
-    return ErrorNum(_runtime._libdhd.dhdErrorGetLast())
+    return ErrorNum(_dhdErrorGetLast())
 
 
-_runtime._libdhd.dhdErrorGetLastStr.argtypes = []
-_runtime._libdhd.dhdErrorGetLastStr.restype = c_char_p
+_dhdErrorGetLastStr = _runtime._libdhd.bind(globals(), 'dhdErrorGetLastStr')
 
 
 def errorGetLastStr() -> str:
@@ -85,11 +84,10 @@ def errorGetLastStr() -> str:
     | :func:`forcedimension_core.dhd.errorGetStr()`
     """
 
-    return _runtime._libdhd.dhdErrorGetLastStr().decode('utf-8')
+    return _dhdErrorGetLastStr().decode('utf-8')
 
 
-_runtime._libdhd.dhdErrorGetStr.argtypes = [c_int]
-_runtime._libdhd.dhdErrorGetStr.restype = c_char_p
+_dhdErrorGetStr = _runtime._libdhd.bind(globals(), 'dhdErrorGetStr')
 
 
 def errorGetStr(error: ErrorNum) -> str:
@@ -109,11 +107,10 @@ def errorGetStr(error: ErrorNum) -> str:
     | :func:`forcedimension_core.dhd.errorGetLastStr()`
     """
 
-    return _runtime._libdhd.dhdErrorGetStr(error).decode('utf-8')
+    return _dhdErrorGetStr(error).decode('utf-8')
 
 
-_runtime._libdhd.dhdEnableSimulator.argtypes = [c_bool]
-_runtime._libdhd.dhdEnableSimulator.restype = None
+_dhdEnableSimulator = _runtime._libdhd.bind(globals(), 'dhdEnableSimulator')
 
 
 def enableSimulator(enable: bool) -> None:
@@ -124,11 +121,10 @@ def enableSimulator(enable: bool) -> None:
     :param enable:
         ``True`` to enable, ``False`` to disable
     """
-    _runtime._libdhd.dhdEnableSimulator(enable)
+    _dhdEnableSimulator(enable)
 
 
-_runtime._libdhd.dhdGetDeviceCount.argtypes = []
-_runtime._libdhd.dhdGetDeviceCount.restype = c_int
+_dhdGetDeviceCount = _runtime._libdhd.bind(globals(), 'dhdGetDeviceCount')
 
 
 def getDeviceCount() -> int:
@@ -147,11 +143,12 @@ def getDeviceCount() -> int:
     | :func:`forcedimension_core.dhd.getAvailableCount()`
     """
 
-    return _runtime._libdhd.dhdGetDeviceCount()
+    return _dhdGetDeviceCount()
 
 
-_runtime._libdhd.dhdGetAvailableCount.argtypes = []
-_runtime._libdhd.dhdGetAvailableCount.restype = c_int
+_dhdGetAvailableCount = _runtime._libdhd.bind(
+    globals(), 'dhdGetAvailableCount'
+)
 
 
 def getAvailableCount() -> int:
@@ -169,11 +166,10 @@ def getAvailableCount() -> int:
     --------
     | :func:`forcedimension_core.dhd.getDeviceCount()`
     """
-    return _runtime._libdhd.dhdGetAvailableCount()
+    return _dhdGetAvailableCount()
 
 
-_runtime._libdhd.dhdSetDevice.argtypes = [c_byte]
-_runtime._libdhd.dhdSetDevice.restype = c_int
+_dhdSetDevice = _runtime._libdhd.bind(globals(), 'dhdSetDevice')
 
 
 def setDevice(ID: int = -1) -> int:
@@ -201,11 +197,10 @@ def setDevice(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getDeviceID()`
     """
 
-    return _runtime._libdhd.dhdSetDevice(ID)
+    return _dhdSetDevice(ID)
 
 
-_runtime._libdhd.dhdGetDeviceID.argtypes = []
-_runtime._libdhd.dhdGetDeviceID.restype = c_int
+_dhdGetDeviceID = _runtime._libdhd.bind(globals(), 'dhdGetDeviceID')
 
 
 def getDeviceID() -> int:
@@ -221,11 +216,10 @@ def getDeviceID() -> int:
     | :func:`forcedimension_core.dhd.setDevice()`
     """
 
-    return _runtime._libdhd.dhdGetDeviceID()
+    return _dhdGetDeviceID()
 
 
-_runtime._libdhd.dhdGetSerialNumber.argtypes = [c_ushort_ptr, c_byte]
-_runtime._libdhd.dhdGetSerialNumber.restype = c_int
+_dhdGetSerialNumber = _runtime._libdhd.bind(globals(), 'dhdGetSerialNumber')
 
 
 def getSerialNumber(ID: int = -1) -> int:
@@ -244,16 +238,15 @@ def getSerialNumber(ID: int = -1) -> int:
         are non-negative).
     """
 
-    sn = c_ushort()
+    sn = _scratch.ushort
 
-    if _runtime._libdhd.dhdGetSerialNumber(sn, ID):
+    if _dhdGetSerialNumber(sn, ID):
         return -1
 
     return sn.value
 
 
-_runtime._libdhd.dhdOpen.argtypes = []
-_runtime._libdhd.dhdOpen.restype = c_int
+_dhdOpen = _runtime._libdhd.bind(globals(), 'dhdOpen')
 
 
 def open() -> int:
@@ -278,11 +271,13 @@ def open() -> int:
     | :func:`forcedimension_core.dhd.close()`
     """
 
-    return _runtime._libdhd.dhdOpen()
+    if (ID := _dhdOpen()) >= 0:
+        _device_info.invalidate(ID)
 
+    return ID
 
-_runtime._libdhd.dhdOpenType.argtypes = [c_int]
-_runtime._libdhd.dhdOpenType.restype = c_int
+
+_dhdOpenType = _runtime._libdhd.bind(globals(), 'dhdOpenType')
 
 
 def openType(device_type: DeviceType) -> int:
@@ -310,11 +305,13 @@ def openType(device_type: DeviceType) -> int:
     | :func:`forcedimension_core.dhd.close()`
     """
 
-    return _runtime._libdhd.dhdOpenType(device_type)
+    if (ID := _dhdOpenType(device_type)) >= 0:
+        _device_info.invalidate(ID)
+
+    return ID
 
 
-_runtime._libdhd.dhdOpenSerial.argtypes = [c_int]
-_runtime._libdhd.dhdOpenSerial.restype = c_int
+_dhdOpenSerial = _runtime._libdhd.bind(globals(), 'dhdOpenSerial')
 
 
 def openSerial(serial: int) -> int:
@@ -341,11 +338,13 @@ def openSerial(serial: int) -> int:
     | :func:`forcedimension_core.dhd.close()`
     """
 
-    return _runtime._libdhd.dhdOpenSerial(serial)
+    if (ID := _dhdOpenSerial(serial)) >= 0:
+        _device_info.invalidate(ID)
 
+    return ID
 
-_runtime._libdhd.dhdOpenID.argtypes = [c_byte]
-_runtime._libdhd.dhdOpenID.restype = c_int
+
+_dhdOpenID = _runtime._libdhd.bind(globals(), 'dhdOpenID')
 
 
 def openID(index: int) -> int:
@@ -379,11 +378,13 @@ def openID(index: int) -> int:
     | :func:`forcedimension_core.dhd.close()`
     """
 
-    return _runtime._libdhd.dhdOpenID(index)
+    if (ID := _dhdOpenID(index)) >= 0:
+        _device_info.invalidate(ID)
+
+    return ID
 
 
-_runtime._libdhd.dhdClose.argtypes = [c_byte]
-_runtime._libdhd.dhdClose.restype = c_int
+_dhdClose = _runtime._libdhd.bind(globals(), 'dhdClose')
 
 
 def close(ID: int = -1) -> int:
@@ -408,11 +409,14 @@ def close(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.openType()`
     | :func:`forcedimension_core.dhd.openSerial()`
     """
-    return _runtime._libdhd.dhdClose(ID)
+    _device_info.invalidate(ID)
+
+    return _dhdClose(ID)
 
 
-_runtime._libdhd.dhdCheckControllerMemory.argtypes = [c_byte]
-_runtime._libdhd.dhdCheckControllerMemory.restype = c_int
+_dhdCheckControllerMemory = _runtime._libdhd.bind(
+    globals(), 'dhdCheckControllerMemory'
+)
 
 
 def checkControllerMemory(ID: int = -1) -> int:
@@ -435,11 +439,10 @@ def checkControllerMemory(ID: int = -1) -> int:
         failed.
     """
 
-    return _runtime._libdhd.dhdCheckControllerMemory(ID)
+    return _dhdCheckControllerMemory(ID)
 
 
-_runtime._libdhd.dhdStop.argtypes = [c_byte]
-_runtime._libdhd.dhdStop.restype = c_int
+_dhdStop = _runtime._libdhd.bind(globals(), 'dhdStop')
 
 
 def stop(ID: int = -1) -> int:
@@ -463,11 +466,10 @@ def stop(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.enableGripperForce()`
     | :func:`forcedimension_core.dhd.setBrakes()`
     """
-    return _runtime._libdhd.dhdStop(ID)
+    return _dhdStop(ID)
 
 
-_runtime._libdhd.dhdGetComMode.argtypes = [c_byte]
-_runtime._libdhd.dhdGetComMode.restype = c_int
+_dhdGetComMode = _runtime._libdhd.bind(globals(), 'dhdGetComMode')
 
 
 def getComMode(ID: int = -1) -> ComMode:
@@ -489,11 +491,10 @@ def getComMode(ID: int = -1) -> ComMode:
     | :func:`forcedimension_core.dhd.expert.setComMode()`
     """
 
-    return ComMode(_runtime._libdhd.dhdGetComMode(ID))
+    return ComMode(_dhdGetComMode(ID))
 
 
-_runtime._libdhd.dhdEnableForce.argtypes = [c_bool, c_byte]
-_runtime._libdhd.dhdEnableForce.restype = c_int
+_dhdEnableForce = _runtime._libdhd.bind(globals(), 'dhdEnableForce')
 
 
 def enableForce(enable: bool, ID: int = -1) -> int:
@@ -523,11 +524,12 @@ def enableForce(enable: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setBrakes()`
     """
 
-    return _runtime._libdhd.dhdEnableForce(enable, ID)
+    return _dhdEnableForce(enable, ID)
 
 
-_runtime._libdhd.dhdEnableGripperForce.argtypes = [c_bool, c_byte]
-_runtime._libdhd.dhdEnableGripperForce.restype = c_int
+_dhdEnableGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdEnableGripperForce'
+)
 
 
 def enableGripperForce(enable: bool, ID: int = -1) -> int:
@@ -563,11 +565,10 @@ def enableGripperForce(enable: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setBrakes()`
     """
 
-    return _runtime._libdhd.dhdEnableGripperForce(enable, ID)
+    return _dhdEnableGripperForce(enable, ID)
 
 
-_runtime._libdhd.dhdGetSystemType.argtypes = [c_byte]
-_runtime._libdhd.dhdGetSystemType.restype = c_int
+_dhdGetSystemType = _runtime._libdhd.bind(globals(), 'dhdGetSystemType')
 
 
 def getSystemType(ID: int = -1) -> DeviceType:
@@ -595,11 +596,10 @@ def getSystemType(ID: int = -1) -> DeviceType:
 
     """
 
-    return DeviceType(_runtime._libdhd.dhdGetSystemType(ID))
+    return DeviceType(_dhdGetSystemType(ID))
 
 
-_runtime._libdhd.dhdGetSystemRev.argtypes = [c_byte]
-_runtime._libdhd.dhdGetSystemRev.restype = c_int
+_dhdGetSystemRev = _runtime._libdhd.bind(globals(), 'dhdGetSystemRev')
 
 
 def getSystemRev(ID: int = -1) -> int:
@@ -628,11 +628,10 @@ def getSystemRev(ID: int = -1) -> int:
 
     """
 
-    return _runtime._libdhd.dhdGetSystemRev(ID)
+    return _dhdGetSystemRev(ID)
 
 
-_runtime._libdhd.dhdGetSystemName.argtypes = [c_byte]
-_runtime._libdhd.dhdGetSystemName.restype = c_char_p
+_dhdGetSystemName = _runtime._libdhd.bind(globals(), 'dhdGetSystemName')
 
 
 def getSystemName(ID: int = -1) -> Union[str, None]:
@@ -659,15 +658,14 @@ def getSystemName(ID: int = -1) -> Union[str, None]:
     | :func:`forcedimension_core.dhd.getVersion()`
     """
 
-    ret = _runtime._libdhd.dhdGetSystemName(ID)
+    ret = _dhdGetSystemName(ID)
     if (ret is not None):
         return ret.decode("utf-8")  # python using decode bytes as unicode str
     else:
         return None
 
 
-_runtime._libdhd.dhdGetVersion.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetVersion.restype = c_int
+_dhdGetVersion = _runtime._libdhd.bind(globals(), 'dhdGetVersion')
 
 
 def getVersion(ID: int = -1) -> float:
@@ -689,21 +687,15 @@ def getVersion(ID: int = -1) -> float:
         non-negative).
     """
 
-    ver = c_double()
+    ver = _scratch.double
 
-    if _runtime._libdhd.dhdGetVersion(ver, ID):
+    if _dhdGetVersion(ver, ID):
         return -1.0
 
     return ver.value
 
 
-_runtime._libdhd.dhdGetSDKVersion.argtypes = [
-    c_int_ptr,
-    c_int_ptr,
-    c_int_ptr,
-    c_int_ptr
-]
-_runtime._libdhd.dhdGetSDKVersion.restype = None
+_dhdGetSDKVersion = _runtime._libdhd.bind(globals(), 'dhdGetSDKVersion')
 
 
 def getSDKVersion() -> containers.VersionTuple:
@@ -720,12 +712,9 @@ def getSDKVersion() -> containers.VersionTuple:
     --------
     | :class:`forcedimension_core._runtime.VersionTuple`
     """
-    major = c_int()
-    minor = c_int()
-    release = c_int()
-    revision = c_int()
+    major, minor, release, revision = _scratch.int4
 
-    _runtime._libdhd.dhdGetSDKVersion(major, minor, release, revision)
+    _dhdGetSDKVersion(major, minor, release, revision)
 
     return VersionTuple(
         major.value,
@@ -735,10 +724,9 @@ def getSDKVersion() -> containers.VersionTuple:
     )
 
 
-_runtime._libdhd.dhdGetComponentVersionStr.argtypes = [
-    c_uint32, c_char_p, c_size_t, c_byte
-]
-_runtime._libdhd.dhdGetComponentVersionStr.restype = c_int
+_dhdGetComponentVersionStr = _runtime._libdhd.bind(
+    globals(), 'dhdGetComponentVersionStr'
+)
 
 
 def getComponentVersionStr(
@@ -782,14 +770,13 @@ def getComponentVersionStr(
 
     buffer = ct.create_string_buffer(N)
 
-    if _runtime._libdhd.dhdGetComponentVersionStr(component, buffer, N, ID):
+    if _dhdGetComponentVersionStr(component, buffer, N, ID):
         return ""
 
     return bytes(buffer).split(b'\x00')[0].decode('utf-8')
 
 
-_runtime._libdhd.dhdGetStatus.argtypes = [c_int_ptr, c_byte]
-_runtime._libdhd.dhdGetStatus.restype = c_int
+_dhdGetStatus = _runtime._libdhd.bind(globals(), 'dhdGetStatus')
 
 
 def getStatus(out: containers.Status, ID: int = -1) -> int:
@@ -808,11 +795,12 @@ def getStatus(out: containers.Status, ID: int = -1) -> int:
         0 on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdGetStatus(out.ptr, ID)
+    return _dhdGetStatus(out.ptr, ID)
 
 
-_runtime._libdhd.dhdGetDeviceAngleRad.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetDeviceAngleRad.restype = c_int
+_dhdGetDeviceAngleRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetDeviceAngleRad'
+)
 
 
 def getDeviceAngleRad(out: c_double, ID: int = -1) -> int:
@@ -842,11 +830,12 @@ def getDeviceAngleRad(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getBaseAngleZDeg()`
     """
 
-    return _runtime._libdhd.dhdGetDeviceAngleRad(out, ID)
+    return _dhdGetDeviceAngleRad(out, ID)
 
 
-_runtime._libdhd.dhdGetDeviceAngleDeg.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetDeviceAngleDeg.restype = c_int
+_dhdGetDeviceAngleDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetDeviceAngleDeg'
+)
 
 
 def getDeviceAngleDeg(out: c_double, ID: int = -1) -> int:
@@ -876,11 +865,10 @@ def getDeviceAngleDeg(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getBaseAngleZDeg()`
     """
 
-    return _runtime._libdhd.dhdGetDeviceAngleDeg(out, ID)
+    return _dhdGetDeviceAngleDeg(out, ID)
 
 
-_runtime._libdhd.dhdGetEffectorMass.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetEffectorMass.restype = c_int
+_dhdGetEffectorMass = _runtime._libdhd.bind(globals(), 'dhdGetEffectorMass')
 
 
 def getEffectorMass(ID: int = -1) -> float:
@@ -906,15 +894,14 @@ def getEffectorMass(ID: int = -1) -> float:
     | :func:`forcedimension_core.dhd.setGravityCompensation()`
     """
 
-    mass = c_double()
-    if _runtime._libdhd.dhdGetEffectorMass(mass, ID):
+    mass = _scratch.double
+    if _dhdGetEffectorMass(mass, ID):
         return -1.0
 
     return mass.value
 
 
-_runtime._libdhd.dhdGetButton.argtypes = [c_int, c_byte]
-_runtime._libdhd.dhdGetButton.restype = c_int
+_dhdGetButton = _runtime._libdhd.bind(globals(), 'dhdGetButton')
 
 
 def getButton(index: int, ID: int = -1) -> int:
@@ -940,11 +927,10 @@ def getButton(index: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getButtonMask()`
     """
 
-    return _runtime._libdhd.dhdGetButton(index, ID)
+    return _dhdGetButton(index, ID)
 
 
-_runtime._libdhd.dhdGetButtonMask.argtypes = [c_byte]
-_runtime._libdhd.dhdGetButtonMask.restype = c_uint
+_dhdGetButtonMask = _runtime._libdhd.bind(globals(), 'dhdGetButtonMask')
 
 
 def getButtonMask(ID: int = -1) -> int:
@@ -969,11 +955,10 @@ def getButtonMask(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getButton()`
     """
 
-    return _runtime._libdhd.dhdGetButtonMask(ID)
+    return _dhdGetButtonMask(ID)
 
 
-_runtime._libdhd.dhdSetOutput.argtypes = [c_uint, c_byte]
-_runtime._libdhd.dhdSetOutput.restype = c_int
+_dhdSetOutput = _runtime._libdhd.bind(globals(), 'dhdSetOutput')
 
 
 def setOutput(output: int, ID: int = -1) -> int:
@@ -1004,11 +989,19 @@ def setOutput(output: int, ID: int = -1) -> int:
         0 on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdSetOutput(output, ID)
+    return _dhdSetOutput(output, ID)
+
+
+def _cached_capabilities(ID: int) -> Optional[Capabilities]:
+    # The capabilities cached by getDeviceInfo(), if any. The default device
+    # is not resolved, since that takes a library call of its own.
+    if ID >= 0 and (info := _device_info.cache.get(ID)) is not None:
+        return info.capabilities
 
+    return None
 
-_runtime._libdhd.dhdIsLeftHanded.argtypes = [c_byte]
-_runtime._libdhd.dhdIsLeftHanded.restype = c_bool
+
+_dhdIsLeftHanded = _runtime._libdhd.bind(globals(), 'dhdIsLeftHanded')
 
 
 def isLeftHanded(ID: int = -1) -> bool:
@@ -1043,11 +1036,13 @@ def isLeftHanded(ID: int = -1) -> bool:
     | :func:`forcedimension_core.dhd.hasActiveGripper()`
     """
 
-    return _runtime._libdhd.dhdIsLeftHanded(ID)
+    if (capabilities := _cached_capabilities(ID)) is not None:
+        return capabilities.left_handed
+
+    return _dhdIsLeftHanded(ID)
 
 
-_runtime._libdhd.dhdHasBase.argtypes = [c_byte]
-_runtime._libdhd.dhdHasBase.restype = c_bool
+_dhdHasBase = _runtime._libdhd.bind(globals(), 'dhdHasBase')
 
 
 def hasBase(ID: int = -1) -> bool:
@@ -1080,11 +1075,13 @@ def hasBase(ID: int = -1) -> bool:
     | :func:`forcedimension_core.dhd.hasActiveGripper()`
     """
 
-    return _runtime._libdhd.dhdHasBase(ID)
+    if (capabilities := _cached_capabilities(ID)) is not None:
+        return capabilities.base
 
+    return _dhdHasBase(ID)
 
-_runtime._libdhd.dhdHasWrist.argtypes = [c_byte]
-_runtime._libdhd.dhdHasWrist.restype = c_bool
+
+_dhdHasWrist = _runtime._libdhd.bind(globals(), 'dhdHasWrist')
 
 
 def hasWrist(ID: int = -1) -> bool:
@@ -1117,11 +1114,13 @@ def hasWrist(ID: int = -1) -> bool:
     | :func:`forcedimension_core.dhd.hasActiveGripper()`
     """
 
-    return _runtime._libdhd.dhdHasWrist(ID)
+    if (capabilities := _cached_capabilities(ID)) is not None:
+        return capabilities.wrist
+
+    return _dhdHasWrist(ID)
 
 
-_runtime._libdhd.dhdHasActiveWrist.argtypes = [c_byte]
-_runtime._libdhd.dhdHasActiveWrist.restype = c_bool
+_dhdHasActiveWrist = _runtime._libdhd.bind(globals(), 'dhdHasActiveWrist')
 
 
 def hasActiveWrist(ID: int = -1) -> bool:
@@ -1155,11 +1154,13 @@ def hasActiveWrist(ID: int = -1) -> bool:
     | :func:`forcedimension_core.dhd.hasActiveGripper()`
     """
 
-    return _runtime._libdhd.dhdHasActiveWrist(ID)
+    if (capabilities := _cached_capabilities(ID)) is not None:
+        return capabilities.active_wrist
 
+    return _dhdHasActiveWrist(ID)
 
-_runtime._libdhd.dhdHasGripper.argtypes = [c_byte]
-_runtime._libdhd.dhdHasGripper.restype = c_bool
+
+_dhdHasGripper = _runtime._libdhd.bind(globals(), 'dhdHasGripper')
 
 
 def hasGripper(ID: int = -1) -> bool:
@@ -1192,11 +1193,13 @@ def hasGripper(ID: int = -1) -> bool:
     | :func:`forcedimension_core.dhd.hasActiveGripper()`
     """
 
-    return _runtime._libdhd.dhdHasGripper(ID)
+    if (capabilities := _cached_capabilities(ID)) is not None:
+        return capabilities.gripper
+
+    return _dhdHasGripper(ID)
 
 
-_runtime._libdhd.dhdHasActiveGripper.argtypes = [c_byte]
-_runtime._libdhd.dhdHasActiveGripper.restype = c_bool
+_dhdHasActiveGripper = _runtime._libdhd.bind(globals(), 'dhdHasActiveGripper')
 
 
 def hasActiveGripper(ID: int = -1) -> bool:
@@ -1229,11 +1232,75 @@ def hasActiveGripper(ID: int = -1) -> bool:
     | :func:`forcedimension_core.dhd.hasGripper()`
     """
 
-    return _runtime._libdhd.dhdHasActiveGripper(ID)
+    if (capabilities := _cached_capabilities(ID)) is not None:
+        return capabilities.active_gripper
 
+    return _dhdHasActiveGripper(ID)
 
-_runtime._libdhd.dhdReset.argtypes = [c_byte]
-_runtime._libdhd.dhdReset.restype = c_int
+
+def getDeviceInfo(ID: int = -1) -> Optional[DeviceInfo]:
+    """
+    Get the type, name, serial number and capabilities of a device. They
+    are queried from the device the first time and served from memory
+    until the device is opened or closed again, so this is cheap enough to
+    call from a control loop. While they are cached,
+    :func:`forcedimension_core.dhd.hasWrist()` and the other capability
+    queries are answered from memory when given the device ID.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for
+        details).
+
+    :raises ctypes.ArgumentError:
+        If ``ID`` is not implicitly convertible to C char.
+
+    :returns:
+        The device information on success, ``None`` otherwise.
+
+    See Also
+    --------
+    | :func:`forcedimension_core.dhd.getSystemType()`
+    | :func:`forcedimension_core.dhd.getSerialNumber()`
+    | :func:`forcedimension_core.util.num_dof()`
+    | :func:`forcedimension_core.util.handedness()`
+    """
+
+    if ID < 0:
+        ID = _dhdGetDeviceID()
+
+    if (info := _device_info.cache.get(ID)) is not None:
+        return info
+
+    if (devtype := _dhdGetSystemType(ID)) < 0:
+        return None
+
+    if (serial := getSerialNumber(ID)) < 0:
+        return None
+
+    from forcedimension_core import util
+
+    devtype = DeviceType(devtype)
+    info = _device_info.cache[ID] = DeviceInfo(
+        devtype,
+        getSystemName(ID),
+        serial,
+        Capabilities(
+            bool(_dhdHasBase(ID)),
+            bool(_dhdHasWrist(ID)),
+            bool(_dhdHasActiveWrist(ID)),
+            bool(_dhdHasGripper(ID)),
+            bool(_dhdHasActiveGripper(ID)),
+            bool(_dhdIsLeftHanded(ID))
+        ),
+        util.num_dof(devtype),
+        util.handedness(devtype),
+        util.devtype_str(devtype)
+    )
+
+    return info
+
+
+_dhdReset = _runtime._libdhd.bind(globals(), 'dhdReset')
 
 
 def reset(ID: int = -1) -> int:
@@ -1255,11 +1322,10 @@ def reset(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.waitForReset()`
     """
 
-    return _runtime._libdhd.dhdReset(ID)
+    return _dhdReset(ID)
 
 
-_runtime._libdhd.dhdWaitForReset.argtypes = [c_int, c_byte]
-_runtime._libdhd.dhdWaitForReset.restype = c_int
+_dhdWaitForReset = _runtime._libdhd.bind(globals(), 'dhdWaitForReset')
 
 
 def waitForReset(timeout: Optional[int] = None, ID: int = -1) -> int:
@@ -1296,16 +1362,17 @@ def waitForReset(timeout: Optional[int] = None, ID: int = -1) -> int:
     """
 
     if timeout is None:
-        return _runtime._libdhd.dhdWaitForReset(0, ID)
+        return _dhdWaitForReset(0, ID)
 
     if timeout <= 0:
         raise ValueError("timeout must be greater than 0 if specified.")
 
-    return _runtime._libdhd.dhdWaitForReset(timeout, ID)
+    return _dhdWaitForReset(timeout, ID)
 
 
-_runtime._libdhd.dhdSetStandardGravity.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetStandardGravity.restype = c_int
+_dhdSetStandardGravity = _runtime._libdhd.bind(
+    globals(), 'dhdSetStandardGravity'
+)
 
 
 def setStandardGravity(g: float, ID: int = -1) -> int:
@@ -1336,11 +1403,12 @@ def setStandardGravity(g: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setGravityCompensation()`
     """
 
-    return _runtime._libdhd.dhdSetStandardGravity(g, ID)
+    return _dhdSetStandardGravity(g, ID)
 
 
-_runtime._libdhd.dhdSetGravityCompensation.argtypes = [c_bool, c_byte]
-_runtime._libdhd.dhdSetGravityCompensation.restype = c_int
+_dhdSetGravityCompensation = _runtime._libdhd.bind(
+    globals(), 'dhdSetGravityCompensation'
+)
 
 
 def setGravityCompensation(enable: bool, ID: int = -1) -> int:
@@ -1370,11 +1438,10 @@ def setGravityCompensation(enable: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setStandardGravity()`
     """
 
-    return _runtime._libdhd.dhdSetGravityCompensation(enable, ID)
+    return _dhdSetGravityCompensation(enable, ID)
 
 
-_runtime._libdhd.dhdSetBrakes.argtypes = [c_bool, c_byte]
-_runtime._libdhd.dhdSetBrakes.restype = c_int
+_dhdSetBrakes = _runtime._libdhd.bind(globals(), 'dhdSetBrakes')
 
 
 def setBrakes(enable: bool, ID: int = -1) -> int:
@@ -1405,11 +1472,12 @@ def setBrakes(enable: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.stop()`
     """
 
-    return _runtime._libdhd.dhdSetBrakes(enable, ID)
+    return _dhdSetBrakes(enable, ID)
 
 
-_runtime._libdhd.dhdSetDeviceAngleRad.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetDeviceAngleRad.restype = c_int
+_dhdSetDeviceAngleRad = _runtime._libdhd.bind(
+    globals(), 'dhdSetDeviceAngleRad'
+)
 
 
 def setDeviceAngleRad(angle: float, ID: int = -1) -> int:
@@ -1444,11 +1512,12 @@ def setDeviceAngleRad(angle: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getDeviceAngleRad()`
     """
 
-    return _runtime._libdhd.dhdSetDeviceAngleRad(angle, ID)
+    return _dhdSetDeviceAngleRad(angle, ID)
 
 
-_runtime._libdhd.dhdSetDeviceAngleDeg.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetDeviceAngleDeg.restype = c_int
+_dhdSetDeviceAngleDeg = _runtime._libdhd.bind(
+    globals(), 'dhdSetDeviceAngleDeg'
+)
 
 
 def setDeviceAngleDeg(angle: float, ID: int = -1) -> int:
@@ -1483,11 +1552,10 @@ def setDeviceAngleDeg(angle: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getDeviceAngleRad()`
     """
 
-    return _runtime._libdhd.dhdSetDeviceAngleDeg(angle, ID)
+    return _dhdSetDeviceAngleDeg(angle, ID)
 
 
-_runtime._libdhd.dhdSetEffectorMass.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetEffectorMass.restype = c_int
+_dhdSetEffectorMass = _runtime._libdhd.bind(globals(), 'dhdSetEffectorMass')
 
 
 def setEffectorMass(mass: float, ID: int = -1) -> int:
@@ -1519,16 +1587,10 @@ def setEffectorMass(mass: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setGravityCompensation()`
     """
 
-    return _runtime._libdhd.dhdSetEffectorMass(mass, ID)
+    return _dhdSetEffectorMass(mass, ID)
 
 
-_runtime._libdhd.dhdGetPosition.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetPosition.restype = c_int
+_dhdGetPosition = _runtime._libdhd.bind(globals(), 'dhdGetPosition')
 
 
 def getPosition(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -1567,11 +1629,9 @@ def getPosition(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getPositionAndOrientationFrame()`
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetPosition(px, py, pz, ID)
+    err = _dhdGetPosition(px, py, pz, ID)
 
     out[0] = px.value
     out[1] = py.value
@@ -1580,13 +1640,7 @@ def getPosition(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetForce.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetForce.restype = c_int
+_dhdGetForce = _runtime._libdhd.bind(globals(), 'dhdGetForce')
 
 
 def getForce(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -1630,11 +1684,9 @@ def getForce(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getForceAndTorqueAndGripperForce()`
     """
 
-    fx = c_double()
-    fy = c_double()
-    fz = c_double()
+    fx, fy, fz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetForce(fx, fy, fz, ID)
+    err = _dhdGetForce(fx, fy, fz, ID)
 
     out[0] = fx.value
     out[1] = fy.value
@@ -1643,8 +1695,7 @@ def getForce(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdSetForce.argtypes = [c_double, c_double, c_double, c_byte]
-_runtime._libdhd.dhdSetForce.restype = c_int
+_dhdSetForce = _runtime._libdhd.bind(globals(), 'dhdSetForce')
 
 
 def setForce(f: Array[int, float], ID: int = -1) -> int:
@@ -1686,16 +1737,12 @@ def setForce(f: Array[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.getForceAndTorqueAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdSetForce(f[0], f[1], f[2], ID)
+    return _dhdSetForce(f[0], f[1], f[2], ID)
 
 
-_runtime._libdhd.dhdGetOrientationRad.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetOrientationRad.restype = c_int
+_dhdGetOrientationRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationRad'
+)
 
 
 def getOrientationRad(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -1751,11 +1798,9 @@ def getOrientationRad(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getPositionAndOrientationFrame()`
     """
 
-    oa = c_double()
-    ob = c_double()
-    og = c_double()
+    oa, ob, og = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetOrientationRad(oa, ob, og, ID)
+    err = _dhdGetOrientationRad(oa, ob, og, ID)
 
     out[0] = oa.value
     out[1] = ob.value
@@ -1764,13 +1809,9 @@ def getOrientationRad(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetOrientationDeg.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetOrientationDeg.restype = c_int
+_dhdGetOrientationDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationDeg'
+)
 
 
 def getOrientationDeg(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -1827,11 +1868,9 @@ def getOrientationDeg(out: MutableArray[int, float], ID: int = -1) -> int:
 
     """
 
-    oa = c_double()
-    ob = c_double()
-    og = c_double()
+    oa, ob, og = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetOrientationDeg(oa, ob, og, ID)
+    err = _dhdGetOrientationDeg(oa, ob, og, ID)
 
     out[0] = oa.value
     out[1] = ob.value
@@ -1840,16 +1879,9 @@ def getOrientationDeg(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetPositionAndOrientationRad.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetPositionAndOrientationRad.restype = c_int
+_dhdGetPositionAndOrientationRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationRad'
+)
 
 
 def getPositionAndOrientationRad(
@@ -1922,15 +1954,9 @@ def getPositionAndOrientationRad(
 
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
-
-    oa = c_double()
-    ob = c_double()
-    og = c_double()
+    px, py, pz, oa, ob, og = _scratch.double6
 
-    err = _runtime._libdhd.dhdGetPositionAndOrientationRad(
+    err = _dhdGetPositionAndOrientationRad(
         px, py, pz, oa, ob, og, ID)
 
     p_out[0] = px.value
@@ -1944,16 +1970,9 @@ def getPositionAndOrientationRad(
     return err
 
 
-_runtime._libdhd.dhdGetPositionAndOrientationDeg.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetPositionAndOrientationDeg.restype = c_int
+_dhdGetPositionAndOrientationDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationDeg'
+)
 
 
 def getPositionAndOrientationDeg(
@@ -2025,15 +2044,9 @@ def getPositionAndOrientationDeg(
     | :func:`forcedimension_core.dhd.getPositionAndOrientationFrame()`
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
-
-    oa = c_double()
-    ob = c_double()
-    og = c_double()
+    px, py, pz, oa, ob, og = _scratch.double6
 
-    err = _runtime._libdhd.dhdGetPositionAndOrientationDeg(
+    err = _dhdGetPositionAndOrientationDeg(
         px, py, pz, oa, ob, og, ID
     )
 
@@ -2048,14 +2061,9 @@ def getPositionAndOrientationDeg(
     return err
 
 
-_runtime._libdhd.dhdGetPositionAndOrientationFrame.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetPositionAndOrientationFrame.restype = c_int
+_dhdGetPositionAndOrientationFrame = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationFrame'
+)
 
 
 def getPositionAndOrientationFrame(
@@ -2122,15 +2130,13 @@ def getPositionAndOrientationFrame(
     | :func:`forcedimension_core.dhd.getPositionAndOrientationDeg()`
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz = _scratch.double3
 
-    matrix = ((c_double * 3) * 3)()
+    matrix = _scratch.mat3x3
 
-    err = _runtime._libdhd.dhdGetPositionAndOrientationFrame(
+    err = _dhdGetPositionAndOrientationFrame(
         px, py, pz,
-        ct.cast(matrix, c_double_ptr),
+        matrix,
         ID
     )
 
@@ -2138,23 +2144,14 @@ def getPositionAndOrientationFrame(
     p_out[1] = py.value
     p_out[2] = pz.value
 
-    for i in range(3):
-        for j in range(3):
-            matrix_out[i][j] = matrix[i][j]
+    _copy_matrix(matrix_out, matrix, 3)
 
     return err
 
 
-_runtime._libdhd.dhdGetForceAndTorque.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetForceAndTorque.restype = c_int
+_dhdGetForceAndTorque = _runtime._libdhd.bind(
+    globals(), 'dhdGetForceAndTorque'
+)
 
 
 def getForceAndTorque(
@@ -2193,15 +2190,9 @@ def getForceAndTorque(
     | :func:`forcedimension_core.dhd.getForceAndTorqueAndGripperForce()`
     """
 
-    fx = c_double()
-    fy = c_double()
-    fz = c_double()
-
-    tx = c_double()
-    ty = c_double()
-    tz = c_double()
+    fx, fy, fz, tx, ty, tz = _scratch.double6
 
-    err = _runtime._libdhd.dhdGetForceAndTorque(
+    err = _dhdGetForceAndTorque(
         fx, fy, fz,
         tx, ty, tz,
         ID
@@ -2218,16 +2209,9 @@ def getForceAndTorque(
     return err
 
 
-_runtime._libdhd.dhdSetForceAndTorque.argtypes = [
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_byte
-]
-_runtime._libdhd.dhdSetForceAndTorque.restype = c_int
+_dhdSetForceAndTorque = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndTorque'
+)
 
 
 def setForceAndTorque(
@@ -2299,16 +2283,14 @@ def setForceAndTorque(
     | :func:`forcedimension_core.dhd.getForceAndTorqueAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdSetForceAndTorque(
+    return _dhdSetForceAndTorque(
         f[0], f[1], f[2], t[0], t[1], t[2], ID
     )
 
 
-_runtime._libdhd.dhdGetOrientationFrame.argtypes = [
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetOrientationFrame.restype = c_int
+_dhdGetOrientationFrame = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationFrame'
+)
 
 
 def getOrientationFrame(
@@ -2347,21 +2329,20 @@ def getOrientationFrame(
     | :func:`forcedimension_core.dhd.getPositionAndOrientationFrame()`
     """
 
-    matrix = ((c_double * 3) * 3)()
+    matrix = _scratch.mat3x3
 
-    err = _runtime._libdhd.dhdGetOrientationFrame(
-        ct.cast(matrix, c_double_ptr), ID
+    err = _dhdGetOrientationFrame(
+        matrix, ID
     )
 
-    for i in range(3):
-        for j in range(3):
-            out[i][j] = matrix[i][j]
+    _copy_matrix(out, matrix, 3)
 
     return err
 
 
-_runtime._libdhd.dhdGetGripperAngleDeg.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetGripperAngleDeg.restype = c_int
+_dhdGetGripperAngleDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperAngleDeg'
+)
 
 
 def getGripperAngleDeg(out: c_double, ID: int = -1) -> int:
@@ -2395,11 +2376,12 @@ def getGripperAngleDeg(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.getGripperGap()`
     """
 
-    return _runtime._libdhd.dhdGetGripperAngleDeg(out, ID)
+    return _dhdGetGripperAngleDeg(out, ID)
 
 
-_runtime._libdhd.dhdGetGripperAngleRad.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetGripperAngleRad.restype = c_int
+_dhdGetGripperAngleRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperAngleRad'
+)
 
 
 def getGripperAngleRad(out: c_double, ID: int = -1) -> int:
@@ -2434,11 +2416,10 @@ def getGripperAngleRad(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.getGripperGap()`
     """
 
-    return _runtime._libdhd.dhdGetGripperAngleRad(out, ID)
+    return _dhdGetGripperAngleRad(out, ID)
 
 
-_runtime._libdhd.dhdGetGripperGap.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetGripperGap.restype = c_int
+_dhdGetGripperGap = _runtime._libdhd.bind(globals(), 'dhdGetGripperGap')
 
 
 def getGripperGap(out: c_double, ID: int = -1) -> int:
@@ -2472,16 +2453,12 @@ def getGripperGap(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getGripperAngleRad()`
     """
 
-    return _runtime._libdhd.dhdGetGripperGap(out, ID)
+    return _dhdGetGripperGap(out, ID)
 
 
-_runtime._libdhd.dhdGetGripperThumbPos.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetGripperThumbPos.restype = c_int
+_dhdGetGripperThumbPos = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperThumbPos'
+)
 
 
 def getGripperThumbPos(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -2515,11 +2492,9 @@ def getGripperThumbPos(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getGripperFingerPos()`
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetGripperThumbPos(px, py, pz, ID)
+    err = _dhdGetGripperThumbPos(px, py, pz, ID)
 
     out[0] = px.value
     out[1] = py.value
@@ -2528,13 +2503,9 @@ def getGripperThumbPos(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetGripperFingerPos.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetGripperFingerPos.restype = c_int
+_dhdGetGripperFingerPos = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperFingerPos'
+)
 
 
 def getGripperFingerPos(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -2577,11 +2548,9 @@ def getGripperFingerPos(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getGripperFingerPos()`
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetGripperFingerPos(px, py, pz, ID)
+    err = _dhdGetGripperFingerPos(px, py, pz, ID)
 
     out[0] = px.value
     out[1] = py.value
@@ -2590,12 +2559,7 @@ def getGripperFingerPos(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetComFreq.argtypes = [c_byte]
-_runtime._libdhd.dhdGetComFreq.restype = c_double
-
-
-_runtime._libdhd.dhdGetComFreq.argtypes = [c_byte]
-_runtime._libdhd.dhdGetComFreq.restype = c_double
+_dhdGetComFreq = _runtime._libdhd.bind(globals(), 'dhdGetComFreq')
 
 
 def getComFreq(ID: int = -1) -> float:
@@ -2616,17 +2580,12 @@ def getComFreq(ID: int = -1) -> float:
         The refresh rate (in [kHz]), ``0.0`` otherwise.
     """
 
-    return _runtime._libdhd.dhdGetComFreq(ID)
+    return _dhdGetComFreq(ID)
 
 
-_runtime._libdhd.dhdSetForceAndGripperForce.argtypes = [
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_byte
-]
-_runtime._libdhd.dhdSetForceAndGripperForce.restype = c_int
+_dhdSetForceAndGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndGripperForce'
+)
 
 
 def setForceAndGripperForce(
@@ -2685,22 +2644,14 @@ def setForceAndGripperForce(
     | :func:`forcedimension_core.dhd.getForceAndTorqueAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdSetForceAndGripperForce(
+    return _dhdSetForceAndGripperForce(
         f[0], f[1], f[2], fg, ID
     )
 
 
-_runtime._libdhd.dhdSetForceAndTorqueAndGripperForce.argtypes = [
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_byte
-]
-_runtime._libdhd.dhdSetForceAndTorqueAndGripperForce.restype = c_int
+_dhdSetForceAndTorqueAndGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndTorqueAndGripperForce'
+)
 
 
 def setForceAndTorqueAndGripperForce(
@@ -2778,7 +2729,7 @@ def setForceAndTorqueAndGripperForce(
     | :func:`forcedimension_core.dhd.getForceAndTorqueAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdSetForceAndTorqueAndGripperForce(
+    return _dhdSetForceAndTorqueAndGripperForce(
         f[0],
         f[1],
         f[2],
@@ -2790,17 +2741,9 @@ def setForceAndTorqueAndGripperForce(
     )
 
 
-_runtime._libdhd.dhdGetForceAndTorqueAndGripperForce.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetForceAndTorqueAndGripperForce.restype = c_int
+_dhdGetForceAndTorqueAndGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdGetForceAndTorqueAndGripperForce'
+)
 
 
 def getForceAndTorqueAndGripperForce(
@@ -2845,15 +2788,9 @@ def getForceAndTorqueAndGripperForce(
     | :func:`forcedimension_core.dhd.getForceAndTorqueAndGripperForce()`
     """
 
-    fx = c_double()
-    fy = c_double()
-    fz = c_double()
-
-    tx = c_double()
-    ty = c_double()
-    tz = c_double()
+    fx, fy, fz, tx, ty, tz = _scratch.double6
 
-    err = _runtime._libdhd.dhdGetForceAndTorqueAndGripperForce(
+    err = _dhdGetForceAndTorqueAndGripperForce(
         fx, fy, fz,
         tx, ty, tz,
         fg_out,
@@ -2871,8 +2808,9 @@ def getForceAndTorqueAndGripperForce(
     return err
 
 
-_runtime._libdhd.dhdConfigLinearVelocity.argtypes = [c_int, c_int, c_byte]
-_runtime._libdhd.dhdConfigLinearVelocity.restype = c_int
+_dhdConfigLinearVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdConfigLinearVelocity'
+)
 
 
 def configLinearVelocity(
@@ -2914,16 +2852,12 @@ def configLinearVelocity(
     | :func:`forcedimension_core.dhd.configGripperVelocity()`
     """
 
-    return _runtime._libdhd.dhdConfigLinearVelocity(ms, mode, ID)
+    return _dhdConfigLinearVelocity(ms, mode, ID)
 
 
-_runtime._libdhd.dhdGetLinearVelocity.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetLinearVelocity.restype = c_int
+_dhdGetLinearVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdGetLinearVelocity'
+)
 
 
 def getLinearVelocity(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -2969,11 +2903,9 @@ def getLinearVelocity(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.configLinearVelocity()`
     """
 
-    vx = c_double()
-    vy = c_double()
-    vz = c_double()
+    vx, vy, vz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetLinearVelocity(vx, vy, vz, ID)
+    err = _dhdGetLinearVelocity(vx, vy, vz, ID)
 
     out[0] = vx.value
     out[1] = vy.value
@@ -2982,8 +2914,9 @@ def getLinearVelocity(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdConfigAngularVelocity.argtypes = [c_int, c_int, c_byte]
-_runtime._libdhd.dhdConfigAngularVelocity.restype = c_int
+_dhdConfigAngularVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdConfigAngularVelocity'
+)
 
 
 def configAngularVelocity(
@@ -3025,16 +2958,12 @@ def configAngularVelocity(
     | :func:`forcedimension_core.dhd.getAngularVelocityRad()`
     """
 
-    return _runtime._libdhd.dhdConfigAngularVelocity(ms, mode, ID)
+    return _dhdConfigAngularVelocity(ms, mode, ID)
 
 
-_runtime._libdhd.dhdGetAngularVelocityRad.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetAngularVelocityRad.restype = c_int
+_dhdGetAngularVelocityRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetAngularVelocityRad'
+)
 
 
 def getAngularVelocityRad(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -3082,11 +3011,9 @@ def getAngularVelocityRad(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getAngularVelocityDeg()`
     """
 
-    wx = c_double()
-    wy = c_double()
-    wz = c_double()
+    wx, wy, wz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetAngularVelocityRad(wx, wy, wz, ID)
+    err = _dhdGetAngularVelocityRad(wx, wy, wz, ID)
 
     out[0] = wx.value
     out[1] = wy.value
@@ -3095,13 +3022,9 @@ def getAngularVelocityRad(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetAngularVelocityDeg.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetAngularVelocityDeg.restype = c_int
+_dhdGetAngularVelocityDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetAngularVelocityDeg'
+)
 
 
 def getAngularVelocityDeg(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -3147,11 +3070,9 @@ def getAngularVelocityDeg(out: MutableArray[int, float], ID: int = -1) -> int:
 
     """
 
-    wx = c_double()
-    wy = c_double()
-    wz = c_double()
+    wx, wy, wz = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetAngularVelocityDeg(wx, wy, wz, ID)
+    err = _dhdGetAngularVelocityDeg(wx, wy, wz, ID)
 
     out[0] = wx.value
     out[1] = wy.value
@@ -3160,8 +3081,9 @@ def getAngularVelocityDeg(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdConfigGripperVelocity.argtypes = [c_int, c_int, c_byte]
-_runtime._libdhd.dhdConfigGripperVelocity.restype = c_int
+_dhdConfigGripperVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdConfigGripperVelocity'
+)
 
 
 def configGripperVelocity(
@@ -3203,11 +3125,12 @@ def configGripperVelocity(
     | :func:`forcedimension_core.dhd.getGripperAngularVelocityDeg()`
     """
 
-    return _runtime._libdhd.dhdConfigGripperVelocity(ms, mode, ID)
+    return _dhdConfigGripperVelocity(ms, mode, ID)
 
 
-_runtime._libdhd.dhdGetGripperLinearVelocity.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetGripperLinearVelocity.restype = c_int
+_dhdGetGripperLinearVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperLinearVelocity'
+)
 
 
 def getGripperLinearVelocity(out: c_double, ID: int = -1) -> int:
@@ -3247,12 +3170,12 @@ def getGripperLinearVelocity(out: c_double, ID: int = -1) -> int:
     | :data:`forcedimension_core.dhd.configGripperVelocity()`
     """
 
-    return _runtime._libdhd.dhdGetGripperLinearVelocity(out, ID)
+    return _dhdGetGripperLinearVelocity(out, ID)
 
 
-_runtime._libdhd.dhdGetGripperAngularVelocityRad.argtypes = [
-    c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetGripperAngularVelocityRad.restype = c_int
+_dhdGetGripperAngularVelocityRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperAngularVelocityRad'
+)
 
 
 def getGripperAngularVelocityRad(out: c_double, ID: int = -1) -> int:
@@ -3294,13 +3217,12 @@ def getGripperAngularVelocityRad(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getGripperAngularVelocityDeg()`
     """
 
-    return _runtime._libdhd.dhdGetGripperAngularVelocityRad(out, ID)
+    return _dhdGetGripperAngularVelocityRad(out, ID)
 
 
-_runtime._libdhd.dhdGetGripperAngularVelocityDeg.argtypes = [
-    c_double_ptr, c_byte
-]
-_runtime._libdhd.dhdGetGripperAngularVelocityDeg.restype = c_int
+_dhdGetGripperAngularVelocityDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperAngularVelocityDeg'
+)
 
 
 def getGripperAngularVelocityDeg(out: c_double, ID: int = -1) -> int:
@@ -3340,11 +3262,10 @@ def getGripperAngularVelocityDeg(out: c_double, ID: int = -1) -> int:
 
     """
 
-    return _runtime._libdhd.dhdGetGripperAngularVelocityDeg(out, ID)
+    return _dhdGetGripperAngularVelocityDeg(out, ID)
 
 
-_runtime._libdhd.dhdEmulateButton.argtypes = [c_bool, c_byte]
-_runtime._libdhd.dhdEmulateButton.restype = c_int
+_dhdEmulateButton = _runtime._libdhd.bind(globals(), 'dhdEmulateButton')
 
 
 def emulateButton(enable: bool, ID: int = -1) -> int:
@@ -3378,11 +3299,10 @@ def emulateButton(enable: bool, ID: int = -1) -> int:
         0 on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdEmulateButton(enable, ID)
+    return _dhdEmulateButton(enable, ID)
 
 
-_runtime._libdhd.dhdGetBaseAngleXRad.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetBaseAngleXRad.restype = c_int
+_dhdGetBaseAngleXRad = _runtime._libdhd.bind(globals(), 'dhdGetBaseAngleXRad')
 
 
 def getBaseAngleXRad(out: c_double, ID: int = -1) -> int:
@@ -3411,11 +3331,10 @@ def getBaseAngleXRad(out: c_double, ID: int = -1) -> int:
 
     """
 
-    return _runtime._libdhd.dhdGetBaseAngleXRad(out, ID)
+    return _dhdGetBaseAngleXRad(out, ID)
 
 
-_runtime._libdhd.dhdGetBaseAngleXDeg.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetBaseAngleXDeg.restype = c_int
+_dhdGetBaseAngleXDeg = _runtime._libdhd.bind(globals(), 'dhdGetBaseAngleXDeg')
 
 
 def getBaseAngleXDeg(out: c_double, ID: int = -1) -> int:
@@ -3444,11 +3363,10 @@ def getBaseAngleXDeg(out: c_double, ID: int = -1) -> int:
 
     """
 
-    return _runtime._libdhd.dhdGetBaseAngleXDeg(out, ID)
+    return _dhdGetBaseAngleXDeg(out, ID)
 
 
-_runtime._libdhd.dhdSetBaseAngleXRad.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetBaseAngleXRad.restype = c_int
+_dhdSetBaseAngleXRad = _runtime._libdhd.bind(globals(), 'dhdSetBaseAngleXRad')
 
 
 def setBaseAngleXRad(angle: float, ID: int = -1) -> int:
@@ -3478,11 +3396,10 @@ def setBaseAngleXRad(angle: float, ID: int = -1) -> int:
 
     """
 
-    return _runtime._libdhd.dhdSetBaseAngleXRad(angle, ID)
+    return _dhdSetBaseAngleXRad(angle, ID)
 
 
-_runtime._libdhd.dhdSetBaseAngleXDeg.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetBaseAngleXDeg.restype = c_int
+_dhdSetBaseAngleXDeg = _runtime._libdhd.bind(globals(), 'dhdSetBaseAngleXDeg')
 
 
 def setBaseAngleXDeg(angle: float, ID: int = -1) -> int:
@@ -3511,11 +3428,10 @@ def setBaseAngleXDeg(angle: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getBaseAngleXDeg()`
     """
 
-    return _runtime._libdhd.dhdSetBaseAngleXDeg(angle, ID)
+    return _dhdSetBaseAngleXDeg(angle, ID)
 
 
-_runtime._libdhd.dhdGetBaseAngleZRad.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetBaseAngleZRad.restype = c_int
+_dhdGetBaseAngleZRad = _runtime._libdhd.bind(globals(), 'dhdGetBaseAngleZRad')
 
 
 def getBaseAngleZRad(out: c_double, ID: int = -1) -> int:
@@ -3543,11 +3459,10 @@ def getBaseAngleZRad(out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setBaseAngleZDeg()`
     """
 
-    return _runtime._libdhd.dhdGetBaseAngleZRad(out, ID)
+    return _dhdGetBaseAngleZRad(out, ID)
 
 
-_runtime._libdhd.dhdGetBaseAngleZDeg.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetBaseAngleZDeg.restype = c_int
+_dhdGetBaseAngleZDeg = _runtime._libdhd.bind(globals(), 'dhdGetBaseAngleZDeg')
 
 
 def getBaseAngleZDeg(out: c_double, ID: int = -1) -> float:
@@ -3575,11 +3490,10 @@ def getBaseAngleZDeg(out: c_double, ID: int = -1) -> float:
     | :func:`forcedimension_core.dhd.setBaseAngleZDeg()`
     """
 
-    return _runtime._libdhd.dhdGetBaseAngleZDeg(out, ID)
+    return _dhdGetBaseAngleZDeg(out, ID)
 
 
-_runtime._libdhd.dhdSetBaseAngleZRad.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetBaseAngleZRad.restype = c_int
+_dhdSetBaseAngleZRad = _runtime._libdhd.bind(globals(), 'dhdSetBaseAngleZRad')
 
 
 def setBaseAngleZRad(angle: float, ID: int = -1) -> int:
@@ -3608,11 +3522,10 @@ def setBaseAngleZRad(angle: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getBaseAngleZDeg()`
     """
 
-    return _runtime._libdhd.dhdSetBaseAngleZRad(angle, ID)
+    return _dhdSetBaseAngleZRad(angle, ID)
 
 
-_runtime._libdhd.dhdSetBaseAngleZDeg.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetBaseAngleZDeg.restype = c_int
+_dhdSetBaseAngleZDeg = _runtime._libdhd.bind(globals(), 'dhdSetBaseAngleZDeg')
 
 
 def setBaseAngleZDeg(angle: float, ID: int = -1) -> int:
@@ -3644,11 +3557,10 @@ def setBaseAngleZDeg(angle: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.getBaseAngleZDeg()`
     """
 
-    return _runtime._libdhd.dhdSetBaseAngleZDeg(angle, ID)
+    return _dhdSetBaseAngleZDeg(angle, ID)
 
 
-_runtime._libdhd.dhdSetVibration.argtypes = [c_double, c_double, c_int, c_byte]
-_runtime._libdhd.dhdSetVibration.restype = c_int
+_dhdSetVibration = _runtime._libdhd.bind(globals(), 'dhdSetVibration')
 
 
 def setVibration(f: float, A: float, profile: int = 0, ID: int = -1) -> int:
@@ -3690,11 +3602,10 @@ def setVibration(f: float, A: float, profile: int = 0, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setForce()`
     """
 
-    return _runtime._libdhd.dhdSetVibration(f, A, profile, ID)
+    return _dhdSetVibration(f, A, profile, ID)
 
 
-_runtime._libdhd.dhdSetMaxForce.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetMaxForce.restype = c_int
+_dhdSetMaxForce = _runtime._libdhd.bind(globals(), 'dhdSetMaxForce')
 
 
 def setMaxForce(limit: float, ID: int = -1) -> int:
@@ -3739,11 +3650,10 @@ def setMaxForce(limit: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setMaxUsablePower()`
     """
 
-    return _runtime._libdhd.dhdSetMaxForce(limit, ID)
+    return _dhdSetMaxForce(limit, ID)
 
 
-_runtime._libdhd.dhdSetMaxTorque.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetMaxTorque.restype = c_int
+_dhdSetMaxTorque = _runtime._libdhd.bind(globals(), 'dhdSetMaxTorque')
 
 
 def setMaxTorque(limit: float, ID: int = -1) -> int:
@@ -3790,11 +3700,12 @@ def setMaxTorque(limit: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setMaxUsablePower()`
     """
 
-    return _runtime._libdhd.dhdSetMaxTorque(limit, ID)
+    return _dhdSetMaxTorque(limit, ID)
 
 
-_runtime._libdhd.dhdSetMaxGripperForce.argtypes = [c_double, c_byte]
-_runtime._libdhd.dhdSetMaxGripperForce.restype = c_int
+_dhdSetMaxGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdSetMaxGripperForce'
+)
 
 
 def setMaxGripperForce(limit: float, ID: int = -1) -> int:
@@ -3841,11 +3752,10 @@ def setMaxGripperForce(limit: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setMaxUsablePower()`
     """
 
-    return _runtime._libdhd.dhdSetMaxGripperForce(limit, ID)
+    return _dhdSetMaxGripperForce(limit, ID)
 
 
-_runtime._libdhd.dhdGetMaxForce.argtypes = [c_byte]
-_runtime._libdhd.dhdGetMaxForce.restype = c_double
+_dhdGetMaxForce = _runtime._libdhd.bind(globals(), 'dhdGetMaxForce')
 
 
 def getMaxForce(ID: int = -1) -> float:
@@ -3873,11 +3783,10 @@ def getMaxForce(ID: int = -1) -> float:
     | :func:`forcedimension_core.dhd.getMaxGripperForce()`
     """
 
-    return _runtime._libdhd.dhdGetMaxForce(ID)
+    return _dhdGetMaxForce(ID)
 
 
-_runtime._libdhd.dhdGetMaxTorque.argtypes = [c_byte]
-_runtime._libdhd.dhdGetMaxTorque.restype = c_double
+_dhdGetMaxTorque = _runtime._libdhd.bind(globals(), 'dhdGetMaxTorque')
 
 
 def getMaxTorque(ID: int = -1) -> float:
@@ -3905,11 +3814,12 @@ def getMaxTorque(ID: int = -1) -> float:
     | :func:`forcedimension_core.dhd.getMaxGripperForce()`
     """
 
-    return _runtime._libdhd.dhdGetMaxTorque(ID)
+    return _dhdGetMaxTorque(ID)
 
 
-_runtime._libdhd.dhdGetMaxGripperForce.argtypes = [c_byte]
-_runtime._libdhd.dhdGetMaxGripperForce.restype = c_double
+_dhdGetMaxGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdGetMaxGripperForce'
+)
 
 
 def getMaxGripperForce(ID: int = -1) -> float:
@@ -3938,4 +3848,59 @@ def getMaxGripperForce(ID: int = -1) -> float:
 
     """
 
-    return _runtime._libdhd.dhdGetMaxGripperForce(ID)
+    return _dhdGetMaxGripperForce(ID)
+
+
+def getState(out: containers.DeviceState, ID: int = -1) -> int:
+    """
+    Read the position, orientation frame, linear and angular velocity,
+    gripper angle, buttons and status of the device into ``out`` in a
+    single call, instead of calling
+    :func:`forcedimension_core.dhd.getPositionAndOrientationFrame()`,
+    :func:`forcedimension_core.dhd.getLinearVelocity()`,
+    :func:`forcedimension_core.dhd.getAngularVelocityRad()`,
+    :func:`forcedimension_core.dhd.getGripperAngleRad()`,
+    :func:`forcedimension_core.dhd.getButtonMask()` and
+    :func:`forcedimension_core.dhd.getStatus()` one after the other.
+
+    Whether the device has a wrist and a gripper is queried once per
+    state and device ID. The orientation frame and angular velocity are
+    only read from devices with a wrist, and the gripper angle from devices
+    with a gripper. If the device the default ID refers to changes (see
+    :func:`forcedimension_core.dhd.setDevice()`), pass explicit IDs or use
+    a new state.
+
+    :param DeviceState out:
+        The state to update, either a
+        :class:`forcedimension_core.containers.DeviceState` or a
+        :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :raises ctypes.ArgumentError:
+        If ``ID`` is not implicitly convertible to C char.
+
+    :returns:
+        0 or :data:`forcedimension_core.constants.TIMEGUARD` on success,
+        -1 otherwise.
+
+    See Also
+    --------
+    | :func:`forcedimension_core.dhd.direct.getState()`
+    """
+
+    # The containers of a state are views over its buffer with aliases of
+    # it as pointers, so the direct reads are the fastest ones.
+    return direct.getState(out, ID)
+
+
+def __getattr__(name: str):
+    # Generating the checked functions takes a while, so it is only done
+    # on first use.
+    if name == 'checked':
+        import forcedimension_core.dhd.checked as checked
+
+        return checked
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
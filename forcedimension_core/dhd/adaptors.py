@@ -1,278 +1,328 @@
-from typing import Any, Callable, Optional
+from typing import Any, ClassVar, Optional, Tuple
+
+from forcedimension_core.constants import ErrorNum
+
+_UNSET: Any = object()
 
 
 class DHDError(Exception):
+    """
+    An error reported by DHD.
+
+    Raising and catching the error is part of normal retry logic in control
+    loops, so constructing one only stores the operation that failed and
+    the device it failed on. The message is formatted when the error is
+    converted to a string.
+
+    A loop can also raise the same instance every time (see
+    :meth:`reset()`).
+    """
+
+    #: The error number DHD reports for this error.
+    errnum: ClassVar[ErrorNum] = ErrorNum.ERROR
+
     def __init__(
         self, msg: Optional[str] = "An undocumented error has occured.",
+        *args,
+        op: Any = None,
+        ID: Optional[int] = None,
         **kwargs
     ):
-        if msg is not None:
-            return super().__init__(msg)
-        else:
-            return super().__init__()
+        #: The message given at construction, if any.
+        self.msg = msg
+
+        #: The operation that failed, if known.
+        self.op = op
+
+        #: The ID of the device the operation failed on, if known.
+        self.ID = ID
+
+    def __str__(self) -> str:
+        return '' if self.msg is None else self.msg
+
+    @property  # type: ignore[override]
+    def args(self) -> Tuple[Any, ...]:
+        # The message, formatted on access like str(), unless args were
+        # assigned.
+        if (args := self.__dict__.get('_args')) is not None:
+            return args
+
+        return (msg,) if (msg := str(self)) else ()
+
+    @args.setter
+    def args(self, args: Tuple[Any, ...]):
+        self._args = tuple(args)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self):
+        return type(self), (), self.__dict__
+
+    def reset(self, *, op: Any = _UNSET, ID: Optional[int] = _UNSET):
+        """
+        Prepare the error to be raised again, e.g. from a retry loop that
+        raises a preallocated instance instead of constructing a new one.
+        The traceback and chained exceptions of the previous raise are
+        dropped.
+
+        :param Any op:
+            The operation that failed, if it changed.
+
+        :param Optional[int] ID:
+            The ID of the device the operation failed on, if it changed.
+
+        :returns:
+            The error itself, so it can be raised with
+            ``raise error.reset()``.
+        """
+
+        if op is not _UNSET:
+            self.op = op
+
+        if ID is not _UNSET:
+            self.ID = ID
+
+        self.__traceback__ = None
+        self.__context__ = None
+        self.__cause__ = None
+
+        return self
 
 
 class DHDFeatureError(DHDError):
+    #: Why the operation is not available.
+    reason: str = "it is not available"
+
     def __init__(
         self,
-        *,
-        reason: str,
+        *args,
+        reason: Optional[str] = None,
         ID: Optional[int] = None,
-        op: Optional[Callable[[Any], Any]],
+        op: Any = None,
         **kwargs
     ):
+        self.msg = None
+        self.op = op
+        self.ID = ID
+
+        if reason is not None:
+            self.reason = reason
+
+    def __str__(self) -> str:
         op_seg = (
-            "A op" if op is None else str(op)
+            "A op" if self.op is None else str(self.op)
         )
-        id_seg = "" if ID is None else f" on device {ID} "
+        id_seg = "" if self.ID is None else f" on device {self.ID} "
 
-        return super().__init__(
-            f"{op_seg} is not available{id_seg}because {reason}."
-        )
+        return f"{op_seg} is not available{id_seg}because {self.reason}."
 
 
 class DHDErrorExpertModeDisabled(DHDFeatureError):
-    def __init__(
-        self,
-        *args,
-        op: Optional[Callable[[Any], Any]] = None,
-        **kwargs
-    ):
-        if 'ID' in kwargs:
-            kwargs.pop('ID')
-
-        return super().__init__(
-            reason="expert mode is disabled",
-            ID=None,
-            op=op,
-            **kwargs
-        )
+    errnum = ErrorNum.EXPERT_MODE_DISABLED
+    reason = "expert mode is disabled"
 
+    def __init__(self, *args, op: Any = None, **kwargs):
+        # Expert mode is disabled for every device at once.
+        super().__init__(op=op, ID=None)
 
-class DHDErrorFeatureNotAvailable(DHDFeatureError):
-    def __init__(
-        self,
-        *args,
-        op: Optional[Callable[[Any], Any]],
-        ID: Optional[int] = None,
-        **kwargs
-    ):
 
-        return super().__init__(
-            reason="it is not supported on this device",
-            ID=ID,
-            op=op,
-            **kwargs
-        )
+class DHDErrorFeatureNotAvailable(DHDFeatureError):
+    errnum = ErrorNum.NOT_AVAILABLE
+    reason = "it is not supported on this device"
 
 
 class DHDErrorFeatureNotEnabled(DHDFeatureError):
-    def __init__(
-        self,
-        *args,
-        op: Optional[Callable[[Any], Any]] = None,
-        ID: Optional[int] = None,
-        **kwargs
-    ):
-
-        return super().__init__(
-            reason="it was previously disabled for this device",
-            ID=ID,
-            op=op,
-            **kwargs
-        )
+    errnum = ErrorNum.NOT_ENABLED
+    reason = "it was previously disabled for this device"
 
 
 class DHDErrorDeviceNotReady(DHDFeatureError):
-    def __init__(
-        self,
-        *args,
-        op: Optional[Callable[[Any], Any]],
-        ID: Optional[int] = None,
-        **kwargs
-    ):
-        return super().__init__(
-            reason="the device isn't ready to proccess a new command",
-            op=op,
-            ID=ID,
-            **kwargs
-        )
+    errnum = ErrorNum.DEVICE_NOT_READY
+    reason = "the device isn't ready to proccess a new command"
 
 
 class DHDErrorRedundantFail(DHDError):
-    def __init__(self, *, ID: Optional[int] = None, **kwargs):
-        if ID is not None:
-            spec = f" on device ID {ID}"
+    errnum = ErrorNum.REDUNDANT_FAIL
+
+    def __str__(self) -> str:
+        if self.ID is not None:
+            spec = f" on device ID {self.ID}"
         else:
             spec = ""
 
-        super().__init__(
-            f"The redundant encoder integrity test failed{spec}",
-            **kwargs
-        )
+        return f"The redundant encoder integrity test failed{spec}"
 
 
 class DHDIOError(DHDError, OSError):
+    #: What went wrong.
+    err: str = "An input/output error"
+
     def __init__(
         self,
         *args,
-        err: str,
+        err: Optional[str] = None,
         ID: Optional[int] = None,
-        op: Optional[str] = None,
+        op: Any = None,
         **kwargs
     ):
-        op_seg = "" if op is None else f"{op} failed. "
-        id_seg = "" if ID is None else f" occured on device {ID}"
+        self.msg = None
+        self.op = op
+        self.ID = ID
 
-        return super().__init__(f"{op_seg}{err}{id_seg}")
+        if err is not None:
+            self.err = err
 
+    def __str__(self) -> str:
+        op_seg = "" if self.op is None else f"{self.op} failed. "
+        id_seg = "" if self.ID is None else f" occured on device {self.ID}"
 
-class DHDErrorTimeout(DHDIOError):
-    def __init__(
-        self,
-        *args,
-        op: Optional[str] = None,
-        ID: Optional[int] = None,
-        **kwargs
-    ):
+        return f"{op_seg}{self.err}{id_seg}"
 
-        return super().__init__(
-            err="timeout",
-            ID=ID,
-            op=op,
-            **kwargs
-        )
+
+class DHDErrorTimeout(DHDIOError):
+    errnum = ErrorNum.TIMEOUT
+    err = "timeout"
 
 
 class DHDErrorCom(DHDIOError):
-    def __init__(
-        self,
-        *args,
-        ID: Optional[int] = None,
-        **kwargs
-    ):
-        return super().__init__(
-            err="A communication error between the host and the HapticDevice",
-            ID=ID,
-            **kwargs
-        )
+    errnum = ErrorNum.COM
+    err = "A communication error between the host and the HapticDevice"
 
 
 class DHDErrorDHCBusy(DHDIOError):
-    def __init__(self, *, ID: Optional[int] = None, **kwargs):
-        return super().__init__(
-            err="The device controller is busy.",
-            ID=ID,
-            **kwargs
-        )
+    errnum = ErrorNum.DHC_BUSY
+    err = "The device controller is busy."
 
 
 class DHDErrorNoDeviceFound(DHDIOError):
-    def __init__(self, **kwargs):
-        return super().__init__(
-            err="No compatible Force Dimension devices found",
-            **kwargs
-        )
+    errnum = ErrorNum.NO_DEVICE_FOUND
+    err = "No compatible Force Dimension devices found"
 
 
 class DHDErrorDeviceInUse(DHDIOError):
-    def __init__(self, *, ID: Optional[int] = None, **kwargs):
-        super().__init__(
-            err="Open error (because the device is already in use)",
-            ID=ID,
-            **kwargs
-        )
+    errnum = ErrorNum.DEVICE_IN_USE
+    err = "Open error (because the device is already in use)"
 
 
 class DHDErrorNoDriverFound(DHDIOError):
-    def __init__(self, *, ID: Optional[int] = None, **kwargs):
-        return super().__init__(
-            err="A required driver is not installed (see device manual for"
-                "details)",
-            ID=ID,
-            **kwargs
-        )
+    errnum = ErrorNum.NO_DRIVER_FOUND
+    err = (
+        "A required driver is not installed (see device manual for"
+        "details)"
+    )
 
 
 class DHDErrorConfiguration(DHDIOError):
-    def __init__(self, *, ID: Optional[int] = None, **kwargs):
-        super().__init__(
-            err="The firmware or internal configuration health check failed",
-            ID=ID,
-            **kwargs
-        )
+    errnum = ErrorNum.CONFIGURATION
+    err = "The firmware or internal configuration health check failed"
 
 
 class DHDErrorGeometry(DHDError):
-    def __init__(self, ID: Optional[int] = None, *args, **kwargs):
+    errnum = ErrorNum.GEOMETRY
 
-        if (ID is not None):
-            spec = f"device ID {ID}'s"
+    def __init__(
+        self, ID: Optional[int] = None, *args, op: Any = None, **kwargs
+    ):
+        super().__init__(None, op=op, ID=ID)
+
+    def __str__(self) -> str:
+        if (self.ID is not None):
+            spec = f"device ID {self.ID}'s"
         else:
             spec = "the device's"
 
-        return super().__init__(
-            f"An error has occured within {spec} geometric model"
-        )
+        return f"An error has occured within {spec} geometric model"
 
 
 class DHDErrorMemory(DHDError, MemoryError):
-    def __init__(self, *args, **kwargs):
-        return super().__init__(
-            "DHD ran out of memory."
-        )
+    errnum = ErrorNum.OUT_OF_MEMORY
+
+    def __str__(self) -> str:
+        return "DHD ran out of memory."
 
 
 class DHDErrorNotImplemented(DHDError, NotImplementedError):
-    def __init__(self, *args, **kwargs):
-        return super().__init__(
-            "The command or op is currently not implemented."
-        )
+    errnum = ErrorNum.NOT_IMPLEMENTED
+
+    def __str__(self) -> str:
+        return "The command or op is currently not implemented."
 
 
 class DHDErrorFileNotFound(DHDError, FileNotFoundError):
-    def __init__(self, *args, **kwargs):
-        return super().__init__()
+    errnum = ErrorNum.FILE_NOT_FOUND
+
+    def __str__(self) -> str:
+        return "An undocumented error has occured."
 
 
 class DHDErrorDeprecated(DHDError):
-    def __init__(self, *args, **kwargs):
-        super().__init__(
+    errnum = ErrorNum.DEPRECATED
+
+    def __str__(self) -> str:
+        return (
             "This op, function, or current device is marked as "
             "deprecated."
         )
 
 
 class DHDErrorInvalidIndex(DHDError, IndexError):
-    def __init__(self, *args, **kwargs):
-        super().__init__(
+    errnum = ErrorNum.INVALID_INDEX
+
+    def __str__(self) -> str:
+        return (
             "An index passed to the function is outside the expected valid "
             "range. "
         )
 
 
 class DHDErrorArgument(DHDError, ValueError):
-    def __init__(self, null: bool = False, *args, **kwargs):
-        if not null:
-            super().__init__(
+    errnum = ErrorNum.INVALID
+
+    #: Whether the argument was an unexpected null pointer.
+    null: bool = False
+
+    def __init__(
+        self,
+        null: bool = False,
+        *args,
+        op: Any = None,
+        ID: Optional[int] = None,
+        **kwargs
+    ):
+        super().__init__(None, op=op, ID=ID)
+
+        if null:
+            self.null = null
+
+    def __str__(self) -> str:
+        if not self.null:
+            return (
                 "The function producing this error was passed an invalid or "
                 "argument."
             )
-        else:
-            super().__init__(
-                "The function producing this error was passed an unexpected "
-                "null pointer argument."
-            )
+
+        return (
+            "The function producing this error was passed an unexpected "
+            "null pointer argument."
+        )
 
 
 class DHDErrorNullArgument(DHDErrorArgument):
-    def __init__(self, *args, **kwargs):
-        super().__init__(null=True)
+    errnum = ErrorNum.NULL_ARGUMENT
+    null = True
+
+    def __init__(
+        self, *args, op: Any = None, ID: Optional[int] = None, **kwargs
+    ):
+        super().__init__(True, op=op, ID=ID)
 
 
 class DHDErrorNoRegulation(DHDError):
-    def __init__(self, *args, **kwargs):
-        super().__init__(
+    errnum = ErrorNum.NO_REGULATION
+
+    def __str__(self) -> str:
+        return (
             "The robotic regulation thread is not running. This only applies "
             "to functions from the robotic SDK (DRD)."
         )
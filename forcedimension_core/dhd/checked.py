@@ -0,0 +1,105 @@
+"""
+The functions of :mod:`forcedimension_core.dhd` that report failure by
+returning -1, raising the matching
+:class:`forcedimension_core.dhd.adaptors.DHDError` instead.
+
+.. code-block:: python
+
+    from forcedimension_core.dhd import checked
+
+    ID = checked.open()
+
+    while running:
+        checked.getPosition(pos, ID)  # raises e.g. DHDErrorTimeout
+        checked.setForce(f, ID)
+
+Every other value, including
+:data:`forcedimension_core.constants.TIMEGUARD`, is returned as is. A
+successful call costs the same as the unchecked function (see
+:mod:`forcedimension_core._checked`).
+
+The functions are generated when the module is first imported, e.g. by
+accessing ``forcedimension_core.dhd.checked``, so importing
+:mod:`forcedimension_core.dhd` does not pay for them.
+"""
+
+import forcedimension_core.dhd as _dhd
+from forcedimension_core._checked import check_module as _check_module
+
+# The functions returning -1 on failure.
+NAMES = (
+    'close',
+    'configAngularVelocity',
+    'configGripperVelocity',
+    'configLinearVelocity',
+    'emulateButton',
+    'enableForce',
+    'enableGripperForce',
+    'getAngularVelocityDeg',
+    'getAngularVelocityRad',
+    'getAvailableCount',
+    'getBaseAngleXDeg',
+    'getBaseAngleXRad',
+    'getBaseAngleZDeg',
+    'getBaseAngleZRad',
+    'getButton',
+    'getComMode',
+    'getDeviceAngleDeg',
+    'getDeviceAngleRad',
+    'getDeviceCount',
+    'getEffectorMass',
+    'getForce',
+    'getForceAndTorque',
+    'getForceAndTorqueAndGripperForce',
+    'getGripperAngleDeg',
+    'getGripperAngleRad',
+    'getGripperAngularVelocityDeg',
+    'getGripperAngularVelocityRad',
+    'getGripperFingerPos',
+    'getGripperGap',
+    'getGripperLinearVelocity',
+    'getGripperThumbPos',
+    'getLinearVelocity',
+    'getOrientationDeg',
+    'getOrientationFrame',
+    'getOrientationRad',
+    'getPosition',
+    'getPositionAndOrientationDeg',
+    'getPositionAndOrientationFrame',
+    'getPositionAndOrientationRad',
+    'getSerialNumber',
+    'getState',
+    'getStatus',
+    'getSystemRev',
+    'getSystemType',
+    'getVersion',
+    'open',
+    'openID',
+    'openSerial',
+    'openType',
+    'reset',
+    'setBaseAngleXDeg',
+    'setBaseAngleXRad',
+    'setBaseAngleZDeg',
+    'setBaseAngleZRad',
+    'setBrakes',
+    'setDevice',
+    'setDeviceAngleDeg',
+    'setDeviceAngleRad',
+    'setEffectorMass',
+    'setForce',
+    'setForceAndGripperForce',
+    'setForceAndTorque',
+    'setForceAndTorqueAndGripperForce',
+    'setGravityCompensation',
+    'setMaxForce',
+    'setMaxGripperForce',
+    'setMaxTorque',
+    'setOutput',
+    'setStandardGravity',
+    'setVibration',
+    'stop',
+    'waitForReset',
+)
+
+globals().update(_check_module(_dhd, NAMES))
@@ -1,4 +1,5 @@
 from ctypes import c_double
+from typing import Any, Tuple
 
 import forcedimension_core.runtime as _runtime
 from forcedimension_core.typing import (
@@ -6,6 +7,56 @@ from forcedimension_core.typing import (
 )
 
 
+_dhdGetPosition = _runtime._libdhd.bind(globals(), 'dhdGetPosition')
+_dhdGetForce = _runtime._libdhd.bind(globals(), 'dhdGetForce')
+_dhdGetOrientationRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationRad'
+)
+_dhdGetOrientationDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationDeg'
+)
+_dhdGetPositionAndOrientationRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationRad'
+)
+_dhdGetPositionAndOrientationDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationDeg'
+)
+_dhdGetPositionAndOrientationFrame = _runtime._libdhd.bind(
+    globals(), 'dhdGetPositionAndOrientationFrame'
+)
+_dhdGetForceAndTorque = _runtime._libdhd.bind(
+    globals(), 'dhdGetForceAndTorque'
+)
+_dhdGetOrientationFrame = _runtime._libdhd.bind(
+    globals(), 'dhdGetOrientationFrame'
+)
+_dhdGetGripperThumbPos = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperThumbPos'
+)
+_dhdGetGripperFingerPos = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperFingerPos'
+)
+_dhdGetForceAndTorqueAndGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdGetForceAndTorqueAndGripperForce'
+)
+_dhdGetGripperAngleRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperAngleRad'
+)
+_dhdGetButtonMask = _runtime._libdhd.bind(globals(), 'dhdGetButtonMask')
+_dhdGetStatus = _runtime._libdhd.bind(globals(), 'dhdGetStatus')
+_dhdHasWrist = _runtime._libdhd.bind(globals(), 'dhdHasWrist')
+_dhdHasGripper = _runtime._libdhd.bind(globals(), 'dhdHasGripper')
+_dhdGetLinearVelocity = _runtime._libdhd.bind(
+    globals(), 'dhdGetLinearVelocity'
+)
+_dhdGetAngularVelocityRad = _runtime._libdhd.bind(
+    globals(), 'dhdGetAngularVelocityRad'
+)
+_dhdGetAngularVelocityDeg = _runtime._libdhd.bind(
+    globals(), 'dhdGetAngularVelocityDeg'
+)
+
+
 def getPosition(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
     """
     Retrieve the position of the end-effector about the X, Y, and
@@ -46,7 +97,7 @@ def getPosition(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationFrame()`
     """
 
-    return _runtime._libdhd.dhdGetPosition(*out.ptrs, ID)
+    return _dhdGetPosition(*out.ptrs, ID)
 
 
 def getForce(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
@@ -94,7 +145,7 @@ def getForce(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.getForceAndTorqueAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdGetForce(*out.ptrs, ID)
+    return _dhdGetForce(*out.ptrs, ID)
 
 
 def getOrientationRad(
@@ -159,7 +210,7 @@ def getOrientationRad(
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationDeg()`
     """
 
-    return _runtime._libdhd.dhdGetOrientationRad(*out.ptrs, ID)
+    return _dhdGetOrientationRad(*out.ptrs, ID)
 
 
 def getOrientationDeg(
@@ -224,7 +275,7 @@ def getOrientationDeg(
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationDeg()`
     """
 
-    return _runtime._libdhd.dhdGetOrientationDeg(*out.ptrs, ID)
+    return _dhdGetOrientationDeg(*out.ptrs, ID)
 
 
 def getPositionAndOrientationRad(
@@ -305,7 +356,7 @@ def getPositionAndOrientationRad(
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationDeg()`
     """
 
-    return _runtime._libdhd.dhdGetPositionAndOrientationRad(
+    return _dhdGetPositionAndOrientationRad(
         *p_out.ptrs, *o_out.ptrs, ID
     )
 
@@ -389,7 +440,7 @@ def getPositionAndOrientationDeg(
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationRad()`
     """
 
-    return _runtime._libdhd.dhdGetPositionAndOrientationDeg(
+    return _dhdGetPositionAndOrientationDeg(
         *p_out.ptrs, *o_out.ptrs, ID
     )
 
@@ -460,7 +511,7 @@ def getPositionAndOrientationFrame(
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationDeg()`
     """
 
-    return _runtime._libdhd.dhdGetPositionAndOrientationFrame(
+    return _dhdGetPositionAndOrientationFrame(
         *p_out.ptrs, matrix_out.ptr, ID
     )
 
@@ -526,7 +577,7 @@ def getForceAndTorque(
     | :func:`forcedimension_core.dhd.direct.getForceAndTorqueAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdGetForceAndTorque(*f_out.ptrs, *t_out.ptrs, ID)
+    return _dhdGetForceAndTorque(*f_out.ptrs, *t_out.ptrs, ID)
 
 
 def getOrientationFrame(out: SupportsPtr[c_double], ID: int = -1) -> int:
@@ -562,7 +613,7 @@ def getOrientationFrame(out: SupportsPtr[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.getPositionAndOrientationFrame()`
     """
 
-    return _runtime._libdhd.dhdGetOrientationFrame(out.ptr, ID)
+    return _dhdGetOrientationFrame(out.ptr, ID)
 
 
 def getGripperThumbPos(
@@ -610,7 +661,7 @@ def getGripperThumbPos(
     | :func:`forcedimension_core.dhd.direct.getGripperFingerPos()`
     """
 
-    return _runtime._libdhd.dhdGetGripperThumbPos(*out.ptrs, ID)
+    return _dhdGetGripperThumbPos(*out.ptrs, ID)
 
 
 def getGripperFingerPos(
@@ -658,7 +709,7 @@ def getGripperFingerPos(
     | :func:`forcedimension_core.dhd.direct.getGripperFingerPos()`
     """
 
-    return _runtime._libdhd.dhdGetGripperFingerPos(*out.ptrs, ID)
+    return _dhdGetGripperFingerPos(*out.ptrs, ID)
 
 
 def getForceAndTorqueAndGripperForce(
@@ -724,7 +775,7 @@ def getForceAndTorqueAndGripperForce(
     | :func:`forcedimension_core.dhd.direct.getForceAndTorque()`
     """
 
-    err = _runtime._libdhd.dhdGetForceAndTorqueAndGripperForce(
+    err = _dhdGetForceAndTorqueAndGripperForce(
         *f_out.ptrs, *t_out.ptrs, fg_out, ID
     )
     return err
@@ -777,7 +828,7 @@ def getLinearVelocity(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.direct.configLinearVelocity()`
     """
 
-    return _runtime._libdhd.dhdGetLinearVelocity(*out.ptrs, ID)
+    return _dhdGetLinearVelocity(*out.ptrs, ID)
 
 
 def getAngularVelocityRad(
@@ -832,7 +883,7 @@ def getAngularVelocityRad(
     | :func:`forcedimension_core.dhd.direct.getAngularVelocityDeg()`
     """
 
-    return _runtime._libdhd.dhdGetAngularVelocityRad(*out.ptrs, ID)
+    return _dhdGetAngularVelocityRad(*out.ptrs, ID)
 
 
 def getAngularVelocityDeg(
@@ -885,4 +936,83 @@ def getAngularVelocityDeg(
     | :func:`forcedimension_core.dhd.direct.getAngularVelocityRad()`
     """
 
-    return _runtime._libdhd.dhdGetAngularVelocityDeg(*out.ptrs, ID)
+    return _dhdGetAngularVelocityDeg(*out.ptrs, ID)
+
+
+def _capabilities(state: Any, ID: int) -> Tuple[int, bool, bool]:
+    """
+    Get whether the device ``ID`` has a wrist and a gripper, querying the
+    device only the first time ``state`` is read for that ID.
+    """
+
+    if (capabilities := state._capabilities) is None or capabilities[0] != ID:
+        capabilities = state._capabilities = (
+            ID, bool(_dhdHasWrist(ID)), bool(_dhdHasGripper(ID))
+        )
+
+    return capabilities
+
+
+def getState(out: Any, ID: int = -1) -> int:
+    """
+    Read the position, orientation frame, linear and angular velocity,
+    gripper angle, buttons and status of the device into ``out`` in a
+    single call. The library writes directly into the containers of
+    ``out``.
+
+    Whether the device has a wrist and a gripper is queried once per
+    state and device ID. The orientation frame and angular velocity are
+    only read from devices with a wrist, and the gripper angle from devices
+    with a gripper. If the device the default ID refers to changes (see
+    :func:`forcedimension_core.dhd.setDevice()`), pass explicit IDs or use
+    a new state.
+
+    :param DeviceState out:
+        The state to update.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :raises ctypes.ArgumentError:
+        If ``ID`` is not implicitly convertible to C char.
+
+    :returns:
+        0 or :data:`forcedimension_core.constants.TIMEGUARD` on success,
+        -1 otherwise.
+
+    See Also
+    --------
+    | :class:`forcedimension_core.containers.DeviceState`
+    | :class:`forcedimension_core.containers.numpy.DeviceState`
+    | :func:`forcedimension_core.dhd.getState()`
+    """
+
+    _, has_wrist, has_gripper = _capabilities(out, ID)
+
+    if has_wrist:
+        err = _dhdGetPositionAndOrientationFrame(
+            *out.position.ptrs, out.frame.ptr, ID
+        )
+    else:
+        err = _dhdGetPosition(*out.position.ptrs, ID)
+
+    if err < 0:
+        return err
+
+    if _dhdGetLinearVelocity(*out.linear_velocity.ptrs, ID):
+        return -1
+
+    if has_wrist and _dhdGetAngularVelocityRad(
+        *out.angular_velocity.ptrs, ID
+    ):
+        return -1
+
+    if has_gripper and _dhdGetGripperAngleRad(out.gripper_angle, ID):
+        return -1
+
+    out.buttons = _dhdGetButtonMask(ID)
+
+    if _dhdGetStatus(out.status.ptr, ID):
+        return -1
+
+    return err
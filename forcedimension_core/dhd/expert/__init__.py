@@ -1,20 +1,19 @@
-import ctypes as ct
-from ctypes import c_byte, c_char_p, c_double, c_int, c_ubyte, c_uint, c_ushort
+from ctypes import c_double, c_int, c_ushort
 from typing import Tuple
 
 import typing_extensions
 
 import forcedimension_core.runtime as _runtime
+from forcedimension_core._scratch import buffers as _scratch
+from forcedimension_core._scratch import copy as _copy
+from forcedimension_core._scratch import copy_matrix as _copy_matrix
 from forcedimension_core.constants import MAX_DOF, ComMode, DeviceType
-from forcedimension_core.typing import (
-    Array, FloatDOFTuple, MutableArray,
-    c_double_ptr, c_int_ptr, c_ubyte_ptr, c_uint_ptr, c_ushort_ptr
-)
+from forcedimension_core.typing import Array, FloatDOFTuple, MutableArray
 
+from . import batch as batch
 from . import direct as direct
 
-_runtime._libdhd.dhdEnableExpertMode.argtypes = []
-_runtime._libdhd.dhdEnableExpertMode.restype = c_int
+_dhdEnableExpertMode = _runtime._libdhd.bind(globals(), 'dhdEnableExpertMode')
 
 
 def enableExpertMode() -> int:
@@ -28,11 +27,12 @@ def enableExpertMode() -> int:
     | :func:`forcedimension_core.dhd.expert.disableExpertMode()`
     """
 
-    return _runtime._libdhd.dhdEnableExpertMode()
+    return _dhdEnableExpertMode()
 
 
-_runtime._libdhd.dhdDisableExpertMode.argtypes = []
-_runtime._libdhd.dhdDisableExpertMode.restype = c_int
+_dhdDisableExpertMode = _runtime._libdhd.bind(
+    globals(), 'dhdDisableExpertMode'
+)
 
 
 def disableExpertMode() -> int:
@@ -46,11 +46,10 @@ def disableExpertMode() -> int:
     | :func:`forcedimension_core.dhd.expert.disableExpertMode()`
     """
 
-    return _runtime._libdhd.dhdDisableExpertMode()
+    return _dhdDisableExpertMode()
 
 
-_runtime._libdhd.dhdPreset.argtypes = [c_int_ptr, c_ubyte, c_byte]
-_runtime._libdhd.dhdPreset.restype = c_int
+_dhdPreset = _runtime._libdhd.bind(globals(), 'dhdPreset')
 
 
 def preset(val: Array[int, int], mask: int = 0xff, ID: int = -1) -> int:
@@ -87,19 +86,17 @@ def preset(val: Array[int, int], mask: int = 0xff, ID: int = -1) -> int:
     :returns: 0 on success, -1 otherwise
     """
 
-    vals = (c_int * MAX_DOF)(
-        val[0], val[1], val[2], val[3], val[4], val[5], val[6], val[7]
-    )
+    vals = _scratch.dof_int
+    _copy(vals, val, MAX_DOF)
 
-    return _runtime._libdhd.dhdPreset(
-        ct.cast(vals, c_int_ptr),
+    return _dhdPreset(
+        vals,
         mask,
         ID
     )
 
 
-_runtime._libdhd.dhdSetTimeGuard.argtypes = [c_int, c_byte]
-_runtime._libdhd.dhdSetTimeGuard.restype = c_int
+_dhdSetTimeGuard = _runtime._libdhd.bind(globals(), 'dhdSetTimeGuard')
 
 
 def setTimeGuard(min_period: int, ID: int = -1) -> int:
@@ -124,11 +121,12 @@ def setTimeGuard(min_period: int, ID: int = -1) -> int:
     :returns: 0 on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdSetTimeGuard(min_period, ID)
+    return _dhdSetTimeGuard(min_period, ID)
 
 
-_runtime._libdhd.dhdSetVelocityThreshold.argtypes = [c_uint, c_byte]
-_runtime._libdhd.dhdSetVelocityThreshold.restype = c_int
+_dhdSetVelocityThreshold = _runtime._libdhd.bind(
+    globals(), 'dhdSetVelocityThreshold'
+)
 
 
 def setVelocityThreshold(thresh: int, ID: int = -1) -> int:
@@ -164,11 +162,12 @@ def setVelocityThreshold(thresh: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.getVelocityThreshold()`
     """
 
-    return _runtime._libdhd.dhdSetVelocityThreshold(thresh, ID)
+    return _dhdSetVelocityThreshold(thresh, ID)
 
 
-_runtime._libdhd.dhdGetVelocityThreshold.argtypes = [c_uint_ptr, c_byte]
-_runtime._libdhd.dhdGetVelocityThreshold.restype = c_int
+_dhdGetVelocityThreshold = _runtime._libdhd.bind(
+    globals(), 'dhdGetVelocityThreshold'
+)
 
 
 def getVelocityThreshold(ID: int = -1) -> int:
@@ -193,16 +192,15 @@ def getVelocityThreshold(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setVelocityThreshold()`
     """
 
-    thresh = c_uint()
+    thresh = _scratch.uint
 
-    if _runtime._libdhd.dhdGetVelocityThreshold(thresh, ID):
+    if _dhdGetVelocityThreshold(thresh, ID):
         return -1
 
     return thresh.value
 
 
-_runtime._libdhd.dhdUpdateEncoders.argtypes = [c_byte]
-_runtime._libdhd.dhdUpdateEncoders.restype = c_int
+_dhdUpdateEncoders = _runtime._libdhd.bind(globals(), 'dhdUpdateEncoders')
 
 
 def updateEncoders(ID: int = -1) -> int:
@@ -224,14 +222,10 @@ def updateEncoders(ID: int = -1) -> int:
     --------
     | :func:`forcedimension_core.dhd.expert.getEnc()`
     """
-    return _runtime._libdhd.dhdUpdateEncoders(ID)
+    return _dhdUpdateEncoders(ID)
 
 
-_runtime._libdhd.dhdGetDeltaEncoders.argtypes = [
-    c_int_ptr, c_int_ptr, c_int_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetDeltaEncoders.restype = c_int
+_dhdGetDeltaEncoders = _runtime._libdhd.bind(globals(), 'dhdGetDeltaEncoders')
 
 
 def getDeltaEncoders(out: MutableArray[int, int], ID: int = -1) -> int:
@@ -269,11 +263,9 @@ def getDeltaEncoders(out: MutableArray[int, int], ID: int = -1) -> int:
 
     """
 
-    enc0 = c_int()
-    enc1 = c_int()
-    enc2 = c_int()
+    enc0, enc1, enc2 = _scratch.int3
 
-    err = _runtime._libdhd.dhdGetDeltaEncoders(enc0, enc1, enc2, ID)
+    err = _dhdGetDeltaEncoders(enc0, enc1, enc2, ID)
 
     out[0] = enc0.value
     out[1] = enc1.value
@@ -282,11 +274,7 @@ def getDeltaEncoders(out: MutableArray[int, int], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetWristEncoders.argtypes = [
-    c_int_ptr, c_int_ptr, c_int_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetWristEncoders.restype = c_int
+_dhdGetWristEncoders = _runtime._libdhd.bind(globals(), 'dhdGetWristEncoders')
 
 
 def getWristEncoders(out: MutableArray[int, int], ID: int = -1) -> int:
@@ -329,11 +317,9 @@ def getWristEncoders(out: MutableArray[int, int], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.wristOrientationToEncoder()`
     """
 
-    enc0 = c_int()
-    enc1 = c_int()
-    enc2 = c_int()
+    enc0, enc1, enc2 = _scratch.int3
 
-    err = _runtime._libdhd.dhdGetWristEncoders(
+    err = _dhdGetWristEncoders(
         enc0,
         enc1,
         enc2,
@@ -347,8 +333,9 @@ def getWristEncoders(out: MutableArray[int, int], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetGripperEncoder.argtypes = [c_int_ptr, c_byte]
-_runtime._libdhd.dhdGetGripperEncoder.restype = c_int
+_dhdGetGripperEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdGetGripperEncoder'
+)
 
 
 def getGripperEncoder(out: c_int, ID: int = -1) -> int:
@@ -375,11 +362,10 @@ def getGripperEncoder(out: c_int, ID: int = -1) -> int:
         on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdGetGripperEncoder(out, ID)
+    return _dhdGetGripperEncoder(out, ID)
 
 
-_runtime._libdhd.dhdGetEncoder.argtypes = [c_int, c_byte]
-_runtime._libdhd.dhdGetEncoder.restype = c_int
+_dhdGetEncoder = _runtime._libdhd.bind(globals(), 'dhdGetEncoder')
 
 
 def getEncoder(index: int, ID: int = -1) -> int:
@@ -406,11 +392,10 @@ def getEncoder(index: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.getEnc()`
     """
 
-    return _runtime._libdhd.dhdGetEncoder(index, ID)
+    return _dhdGetEncoder(index, ID)
 
 
-_runtime._libdhd.dhdSetMotor.argtypes = [c_int, c_ushort, c_byte]
-_runtime._libdhd.dhdSetMotor.restype = c_int
+_dhdSetMotor = _runtime._libdhd.bind(globals(), 'dhdSetMotor')
 
 
 def setMotor(index: int, output: int, ID: int = -1) -> int:
@@ -445,12 +430,10 @@ def setMotor(index: int, output: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setWristMotor()`
     """
 
-    return _runtime._libdhd.dhdSetMotor(index, output, ID)
+    return _dhdSetMotor(index, output, ID)
 
 
-_runtime._libdhd.dhdSetDeltaMotor.argtypes = [
-    c_ushort, c_ushort, c_ushort, c_byte]
-_runtime._libdhd.dhdSetDeltaMotor.restype = c_int
+_dhdSetDeltaMotor = _runtime._libdhd.bind(globals(), 'dhdSetDeltaMotor')
 
 
 def setDeltaMotor(mot: Array[int, int], ID: int = -1) -> int:
@@ -486,14 +469,10 @@ def setDeltaMotor(mot: Array[int, int], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setMotor()`
     | :func:`forcedimension_core.dhd.expert.setWristMotor()`
     """
-    return _runtime._libdhd.dhdSetDeltaMotor(mot[0], mot[1], mot[2], ID)
+    return _dhdSetDeltaMotor(mot[0], mot[1], mot[2], ID)
 
 
-_runtime._libdhd.dhdSetWristMotor.argtypes = [
-    c_ushort, c_ushort, c_ushort,
-    c_byte
-]
-_runtime._libdhd.dhdSetWristMotor.restype = c_int
+_dhdSetWristMotor = _runtime._libdhd.bind(globals(), 'dhdSetWristMotor')
 
 
 def setWristMotor(output: Array[int, int], ID: int = -1) -> int:
@@ -538,11 +517,10 @@ def setWristMotor(output: Array[int, int], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setDeltaMotor()`
     | :func:`forcedimension_core.dhd.setGripperMotor()`
     """
-    return _runtime._libdhd.dhdSetWristMotor(output[0], output[1], output[2], ID)
+    return _dhdSetWristMotor(output[0], output[1], output[2], ID)
 
 
-_runtime._libdhd.dhdSetGripperMotor.argtypes = [c_ushort, c_byte]
-_runtime._libdhd.dhdSetGripperMotor.restype = c_int
+_dhdSetGripperMotor = _runtime._libdhd.bind(globals(), 'dhdSetGripperMotor')
 
 
 def setGripperMotor(output: int, ID: int = -1) -> int:
@@ -571,15 +549,12 @@ def setGripperMotor(output: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.setDeltaMotor()`
     | :func:`forcedimension_core.dhd.setWristMotor()`
     """
-    return _runtime._libdhd.dhdSetGripperMotor(output, ID)
+    return _dhdSetGripperMotor(output, ID)
 
 
-_runtime._libdhd.dhdDeltaEncoderToPosition.argtypes = [
-    c_int, c_int, c_int,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaEncoderToPosition.restype = c_int
+_dhdDeltaEncoderToPosition = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaEncoderToPosition'
+)
 
 
 def deltaEncoderToPosition(
@@ -635,11 +610,9 @@ def deltaEncoderToPosition(
     | :func:`forcedimension_core.dhd.expert.deltaEncodersToJointAngles()`
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz = _scratch.double3
 
-    err = _runtime._libdhd.dhdDeltaEncoderToPosition(
+    err = _dhdDeltaEncoderToPosition(
         enc[0], enc[1], enc[2],
         px, py, pz,
         ID
@@ -652,12 +625,9 @@ def deltaEncoderToPosition(
     return err
 
 
-_runtime._libdhd.dhdDeltaPositionToEncoder.argtypes = [
-    c_double, c_double, c_double,
-    c_int_ptr, c_int_ptr, c_int_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaPositionToEncoder.restype = c_int
+_dhdDeltaPositionToEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaPositionToEncoder'
+)
 
 
 def deltaPositionToEncoder(
@@ -713,11 +683,9 @@ def deltaPositionToEncoder(
     | :func:`forcedimension_core.dhd.expert.deltaEncodersToJointAngles()`
     """
 
-    enc0 = c_int()
-    enc1 = c_int()
-    enc2 = c_int()
+    enc0, enc1, enc2 = _scratch.int3
 
-    err = _runtime._libdhd.dhdDeltaPositionToEncoder(
+    err = _dhdDeltaPositionToEncoder(
         pos[0], pos[1], pos[2],
         enc0, enc1, enc2,
         ID
@@ -730,13 +698,9 @@ def deltaPositionToEncoder(
     return err
 
 
-_runtime._libdhd.dhdDeltaMotorToForce.argtypes = [
-    c_ushort, c_ushort, c_ushort,
-    c_int, c_int, c_int,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaMotorToForce.restype = c_int
+_dhdDeltaMotorToForce = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaMotorToForce'
+)
 
 
 def deltaMotorToForce(
@@ -808,11 +772,9 @@ def deltaMotorToForce(
     | :func:`forcedimension_core.dhd.expert.deltaForceToMotor()`
     """
 
-    fx = c_double()
-    fy = c_double()
-    fz = c_double()
+    fx, fy, fz = _scratch.double3
 
-    err = _runtime._libdhd.dhdDeltaMotorToForce(
+    err = _dhdDeltaMotorToForce(
         mot[0], mot[1], mot[2],
         enc[0], enc[1], enc[2],
         fx, fy, fz,
@@ -826,13 +788,9 @@ def deltaMotorToForce(
     return err
 
 
-_runtime._libdhd.dhdDeltaForceToMotor.argtypes = [
-    c_double, c_double, c_double,
-    c_int, c_int, c_int,
-    c_ushort_ptr, c_ushort_ptr, c_ushort_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaForceToMotor.restype = c_int
+_dhdDeltaForceToMotor = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaForceToMotor'
+)
 
 
 def deltaForceToMotor(
@@ -895,11 +853,9 @@ def deltaForceToMotor(
     | :func:`forcedimension_core.dhd.expert.deltaMotorToForce()`
     """
 
-    output0 = c_ushort()
-    output1 = c_ushort()
-    output2 = c_ushort()
+    output0, output1, output2 = _scratch.ushort3
 
-    err = _runtime._libdhd.dhdDeltaForceToMotor(
+    err = _dhdDeltaForceToMotor(
         f[0], f[1], f[2],
         enc[0], enc[1], enc[2],
         output0, output1, output2,
@@ -913,12 +869,9 @@ def deltaForceToMotor(
     return err
 
 
-_runtime._libdhd.dhdWristEncoderToOrientation.argtypes = [
-    c_int, c_int, c_int,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristEncoderToOrientation.restype = c_int
+_dhdWristEncoderToOrientation = _runtime._libdhd.bind(
+    globals(), 'dhdWristEncoderToOrientation'
+)
 
 
 def wristEncoderToOrientation(
@@ -989,11 +942,9 @@ def wristEncoderToOrientation(
     | :func:`forcedimension_core.dhd.expert.wristOrientationToEncoder()`
     | :func:`forcedimension_core.dhd.expert.wristJointAnglesToEncoders()`
     """
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz = _scratch.double3
 
-    err = _runtime._libdhd.dhdWristEncoderToOrientation(
+    err = _dhdWristEncoderToOrientation(
         enc[0], enc[1], enc[2],
         px, py, pz,
         ID
@@ -1006,12 +957,9 @@ def wristEncoderToOrientation(
     return err
 
 
-_runtime._libdhd.dhdWristOrientationToEncoder.argtypes = [
-    c_double, c_double, c_double,
-    c_int_ptr, c_int_ptr, c_int_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristOrientationToEncoder.restype = c_int
+_dhdWristOrientationToEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdWristOrientationToEncoder'
+)
 
 
 def wristOrientationToEncoder(
@@ -1085,11 +1033,9 @@ def wristOrientationToEncoder(
 
     """
 
-    enc0 = c_int()
-    enc1 = c_int()
-    enc2 = c_int()
+    enc0, enc1, enc2 = _scratch.int3
 
-    err = _runtime._libdhd.dhdWristOrientationToEncoder(
+    err = _dhdWristOrientationToEncoder(
         orientation[0], orientation[1], orientation[2],
         enc0, enc1, enc2,
         ID
@@ -1102,13 +1048,9 @@ def wristOrientationToEncoder(
     return err
 
 
-_runtime._libdhd.dhdWristMotorToTorque.argtypes = [
-    c_ushort, c_ushort, c_ushort,
-    c_int, c_int, c_int,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristMotorToTorque.restype = c_int
+_dhdWristMotorToTorque = _runtime._libdhd.bind(
+    globals(), 'dhdWristMotorToTorque'
+)
 
 
 def wristMotorToTorque(
@@ -1185,11 +1127,9 @@ def wristMotorToTorque(
     | :func:`forcedimension_core.dhd.expert.wristJointTorquesExtrema()`
     """
 
-    tx = c_double()
-    ty = c_double()
-    tz = c_double()
+    tx, ty, tz = _scratch.double3
 
-    err = _runtime._libdhd.dhdWristMotorToTorque(
+    err = _dhdWristMotorToTorque(
         output[0], output[1], output[2],
         enc[0], enc[1], enc[2],
         tx, ty, tz,
@@ -1203,13 +1143,9 @@ def wristMotorToTorque(
     return err
 
 
-_runtime._libdhd.dhdWristTorqueToMotor.argtypes = [
-    c_double, c_double, c_double,
-    c_int, c_int, c_int,
-    c_ushort_ptr, c_ushort_ptr, c_ushort_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristTorqueToMotor.restype = c_int
+_dhdWristTorqueToMotor = _runtime._libdhd.bind(
+    globals(), 'dhdWristTorqueToMotor'
+)
 
 
 def wristTorqueToMotor(
@@ -1285,11 +1221,9 @@ def wristTorqueToMotor(
     | :func:`forcedimension_core.dhd.expert.wristTorqueToMotor()`
     """
 
-    output0 = c_ushort()
-    output1 = c_ushort()
-    output2 = c_ushort()
+    output0, output1, output2 = _scratch.ushort3
 
-    err = _runtime._libdhd.dhdWristTorqueToMotor(
+    err = _dhdWristTorqueToMotor(
         t[0], t[1], t[2],
         enc[0], enc[1], enc[2],
         output0, output1, output2,
@@ -1303,12 +1237,9 @@ def wristTorqueToMotor(
     return err
 
 
-_runtime._libdhd.dhdGripperEncoderToAngleRad.argtypes = [
-    c_int,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGripperEncoderToAngleRad.restype = c_int
+_dhdGripperEncoderToAngleRad = _runtime._libdhd.bind(
+    globals(), 'dhdGripperEncoderToAngleRad'
+)
 
 
 def gripperEncoderToAngleRad(enc: int, out: c_double, ID: int = -1) -> int:
@@ -1349,13 +1280,12 @@ def gripperEncoderToAngleRad(enc: int, out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.gripperEncoderToGap()`
     """
 
-    return _runtime._libdhd.dhdGripperEncoderToAngleRad(enc, out, ID)
+    return _dhdGripperEncoderToAngleRad(enc, out, ID)
 
 
-_runtime._libdhd.dhdGripperEncoderToGap.argtypes = [
-    c_int, c_double_ptr, c_byte
-]
-_runtime._libdhd.dhdGripperEncoderToGap.restype = c_int
+_dhdGripperEncoderToGap = _runtime._libdhd.bind(
+    globals(), 'dhdGripperEncoderToGap'
+)
 
 
 def gripperEncoderToGap(enc: int, out: c_double, ID: int = -1) -> int:
@@ -1393,13 +1323,12 @@ def gripperEncoderToGap(enc: int, out: c_double, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.gripperEncoderToAngleRad()`
     """
 
-    return _runtime._libdhd.dhdGripperEncoderToGap(enc, out, ID)
+    return _dhdGripperEncoderToGap(enc, out, ID)
 
 
-_runtime._libdhd.dhdGripperAngleRadToEncoder.argtypes = [
-    c_double, c_int_ptr, c_byte
-]
-_runtime._libdhd.dhdGripperAngleRadToEncoder.restype = c_int
+_dhdGripperAngleRadToEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdGripperAngleRadToEncoder'
+)
 
 
 def gripperAngleRadToEncoder(angle: float, out: c_int, ID: int = -1) -> int:
@@ -1434,13 +1363,12 @@ def gripperAngleRadToEncoder(angle: float, out: c_int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.gripperEncoderToGap()`
     """
 
-    return _runtime._libdhd.dhdGripperAngleRadToEncoder(angle, out, ID)
+    return _dhdGripperAngleRadToEncoder(angle, out, ID)
 
 
-_runtime._libdhd.dhdGripperGapToEncoder.argtypes = [
-    c_double, c_int_ptr, c_byte
-]
-_runtime._libdhd.dhdGripperGapToEncoder.restype = c_int
+_dhdGripperGapToEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdGripperGapToEncoder'
+)
 
 
 def gripperGapToEncoder(gap: float, out: c_int, ID: int = -1) -> int:
@@ -1478,13 +1406,12 @@ def gripperGapToEncoder(gap: float, out: c_int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.gripperEncoderToGap()`
     """
 
-    return _runtime._libdhd.dhdGripperGapToEncoder(gap, out, ID)
+    return _dhdGripperGapToEncoder(gap, out, ID)
 
 
-_runtime._libdhd.dhdGripperMotorToForce.argtypes = [
-    c_ushort, c_double_ptr, c_int_ptr, c_byte
-]
-_runtime._libdhd.dhdGripperMotorToForce.restype = c_int
+_dhdGripperMotorToForce = _runtime._libdhd.bind(
+    globals(), 'dhdGripperMotorToForce'
+)
 
 
 def gripperMotorToForce(
@@ -1550,14 +1477,17 @@ def gripperMotorToForce(
     | :func:`forcedimension_core.dhd.expert.gripperForceToMotor()`
     """
 
-    enc = (c_int * 4)(enc_wrist[0], enc_wrist[1], enc_wrist[2], enc_gripper)
-    return _runtime._libdhd.dhdGripperMotorToForce(cmd, out, enc, ID)
+    enc = _scratch.enc4
+    enc[0] = enc_wrist[0]
+    enc[1] = enc_wrist[1]
+    enc[2] = enc_wrist[2]
+    enc[3] = enc_gripper
+    return _dhdGripperMotorToForce(cmd, out, enc, ID)
 
 
-_runtime._libdhd.dhdGripperForceToMotor.argtypes = [
-    c_double, c_ushort_ptr, c_int_ptr, c_byte
-]
-_runtime._libdhd.dhdGripperForceToMotor.restype = c_int
+_dhdGripperForceToMotor = _runtime._libdhd.bind(
+    globals(), 'dhdGripperForceToMotor'
+)
 
 
 def gripperForceToMotor(
@@ -1617,13 +1547,16 @@ def gripperForceToMotor(
     | :func:`forcedimension_core.dhd.expert.gripperForceToMotor()`
     """
 
-    enc = (c_int * 4)(enc_wrist[0], enc_wrist[1], enc_wrist[2], enc_gripper)
+    enc = _scratch.enc4
+    enc[0] = enc_wrist[0]
+    enc[1] = enc_wrist[1]
+    enc[2] = enc_wrist[2]
+    enc[3] = enc_gripper
 
-    return _runtime._libdhd.dhdGripperForceToMotor(f, out, enc, ID)
+    return _dhdGripperForceToMotor(f, out, enc, ID)
 
 
-_runtime._libdhd.dhdSetMot.argtypes = [c_ushort_ptr, c_ubyte, c_byte]
-_runtime._libdhd.dhdSetMot.restype = c_int
+_dhdSetMot = _runtime._libdhd.bind(globals(), 'dhdSetMot')
 
 
 def setMot(cmds: Array[int, int], mask: int = 0xff, ID: int = -1) -> int:
@@ -1667,28 +1600,17 @@ def setMot(cmds: Array[int, int], mask: int = 0xff, ID: int = -1) -> int:
     | :data:`forcedimension_core.dhd.expert.setGripperMotor()`
 
     """
-    cmd_arr = (c_ushort * MAX_DOF)(
-        cmds[0],
-        cmds[1],
-        cmds[2],
-        cmds[3],
-        cmds[4],
-        cmds[5],
-        cmds[6],
-        cmds[7]
-    )
+    cmd_arr = _scratch.dof_ushort
+    _copy(cmd_arr, cmds, MAX_DOF)
 
-    return _runtime._libdhd.dhdSetMot(
-        ct.cast(cmd_arr, c_ushort_ptr),
+    return _dhdSetMot(
+        cmd_arr,
         mask,
         ID
     )
 
 
-_runtime._libdhd.dhdSetJointTorques.argtypes = [
-    c_double_ptr, c_ubyte, c_byte
-]
-_runtime._libdhd.dhdSetJointTorques.restype = c_int
+_dhdSetJointTorques = _runtime._libdhd.bind(globals(), 'dhdSetJointTorques')
 
 
 def setJointTorques(q: Array[int, float], mask: int = 0xff, ID: int = -1):
@@ -1731,17 +1653,15 @@ def setJointTorques(q: Array[int, float], mask: int = 0xff, ID: int = -1):
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorquesAndGripperForce()`
     """
 
-    cmd_arr = (c_double * MAX_DOF)(
-        q[0], q[1], q[2], q[3], q[4], q[5], q[6], q[7]
-    )
+    cmd_arr = _scratch.dof_double
+    _copy(cmd_arr, q, MAX_DOF)
 
-    return _runtime._libdhd.dhdSetJointTorques(
-        ct.cast(cmd_arr, c_double_ptr), mask, ID
+    return _dhdSetJointTorques(
+        cmd_arr, mask, ID
     )
 
 
-_runtime._libdhd.dhdPreloadMot.argtypes = [c_ushort_ptr, c_ubyte, c_byte]
-_runtime._libdhd.dhdPreloadMot.restype = c_int
+_dhdPreloadMot = _runtime._libdhd.bind(globals(), 'dhdPreloadMot')
 
 
 def preloadMot(cmds: Array[int, int], mask: int = 0xff, ID: int = -1) -> int:
@@ -1784,26 +1704,17 @@ def preloadMot(cmds: Array[int, int], mask: int = 0xff, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setMot()`
     """
 
-    cmd_arr = (c_ushort * MAX_DOF)(
-        cmds[0],
-        cmds[1],
-        cmds[2],
-        cmds[3],
-        cmds[4],
-        cmds[5],
-        cmds[6],
-        cmds[7]
-    )
+    cmd_arr = _scratch.dof_ushort
+    _copy(cmd_arr, cmds, MAX_DOF)
 
-    return _runtime._libdhd.dhdPreloadMot(
-        ct.cast(cmd_arr, c_ushort_ptr),
+    return _dhdPreloadMot(
+        cmd_arr,
         mask,
         ID
     )
 
 
-_runtime._libdhd.dhdGetEnc.argtypes = [c_int_ptr, c_ubyte, c_byte]
-_runtime._libdhd.dhdGetEnc.restype = c_int
+_dhdGetEnc = _runtime._libdhd.bind(globals(), 'dhdGetEnc')
 
 
 def getEnc(out: MutableArray[int, int], mask: int = 0xff, ID: int = -1) -> int:
@@ -1843,18 +1754,16 @@ def getEnc(out: MutableArray[int, int], mask: int = 0xff, ID: int = -1) -> int:
     | :data:`forcedimension_core.dhd.expert.getEncoder()`
     | :data:`forcedimension_core.dhd.expert.getEncVelocities()`
     """
-    enc = (c_int * MAX_DOF)()
+    enc = _scratch.dof_int
 
-    err = _runtime._libdhd.dhdGetEnc(ct.cast(enc, c_int_ptr), mask, ID)
+    err = _dhdGetEnc(enc, mask, ID)
 
-    for i in range(MAX_DOF):
-        out[i] = enc[i]
+    _copy(out, enc, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdSetBrk.argtypes = [c_ubyte, c_byte]
-_runtime._libdhd.dhdSetBrk.restype = c_int
+_dhdSetBrk = _runtime._libdhd.bind(globals(), 'dhdSetBrk')
 
 
 def setBrk(mask: int = 0xff, ID: int = -1) -> int:
@@ -1892,13 +1801,12 @@ def setBrk(mask: int = 0xff, ID: int = -1) -> int:
     :returns: 0 on success, -1 otherwise
     """
 
-    return _runtime._libdhd.dhdSetBrk(mask, ID)
+    return _dhdSetBrk(mask, ID)
 
 
-_runtime._libdhd.dhdGetDeltaJointAngles.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdhd.dhdGetDeltaJointAngles.restype = c_int
+_dhdGetDeltaJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdGetDeltaJointAngles'
+)
 
 
 def getDeltaJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -1932,11 +1840,9 @@ def getDeltaJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.deltaJointAnglesToJacobian()`
     """
 
-    j0 = c_double()
-    j1 = c_double()
-    j2 = c_double()
+    j0, j1, j2 = _scratch.double3
 
-    err = _runtime._libdhd.dhdGetDeltaJointAngles(
+    err = _dhdGetDeltaJointAngles(
         j0, j1, j2, ID
     )
 
@@ -1947,8 +1853,7 @@ def getDeltaJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetDeltaJacobian.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetDeltaJacobian.restype = c_int
+_dhdGetDeltaJacobian = _runtime._libdhd.bind(globals(), 'dhdGetDeltaJacobian')
 
 
 def getDeltaJacobian(
@@ -1986,22 +1891,17 @@ def getDeltaJacobian(
     | :func:`forcedimension_core.dhd.expert.deltaJointAnglesToJacobian()`
     """
 
-    J = ((c_double * 3) * 3)()
-    err = _runtime._libdhd.dhdGetDeltaJacobian(ct.cast(J, c_double_ptr), ID)
+    J = _scratch.mat3x3
+    err = _dhdGetDeltaJacobian(J, ID)
 
-    for i in range(3):
-        for j in range(3):
-            out[i][j] = J[i][j]
+    _copy_matrix(out, J, 3)
 
     return err
 
 
-_runtime._libdhd.dhdDeltaJointAnglesToJacobian.argtypes = [
-    c_double, c_double, c_double,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaJointAnglesToJacobian.restype = c_int
+_dhdDeltaJointAnglesToJacobian = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaJointAnglesToJacobian'
+)
 
 
 def deltaJointAnglesToJacobian(
@@ -2056,27 +1956,22 @@ def deltaJointAnglesToJacobian(
     | :func:`forcedimension_core.dhd.expert.getDeltaJacobian()`
     """
 
-    J = ((c_double * 3) * 3)()
+    J = _scratch.mat3x3
 
-    err = _runtime._libdhd.dhdDeltaJointAnglesToJacobian(
+    err = _dhdDeltaJointAnglesToJacobian(
         joint_angles[0], joint_angles[1], joint_angles[2],
-        ct.cast(J, c_double_ptr),
+        J,
         ID
     )
 
-    for i in range(3):
-        for j in range(3):
-            out[i][j] = J[i][j]
+    _copy_matrix(out, J, 3)
 
     return err
 
 
-_runtime._libdhd.dhdDeltaJointTorquesExtrema.argtypes = [
-    c_double, c_double, c_double,
-    c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaJointTorquesExtrema.restype = c_int
+_dhdDeltaJointTorquesExtrema = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaJointTorquesExtrema'
+)
 
 
 def deltaJointTorquesExtrema(
@@ -2142,12 +2037,12 @@ def deltaJointTorquesExtrema(
     | :func:`forcedimension_core.dhd.expert.getJointAngles()`
     """
 
-    minq = (c_double * 3)()
-    maxq = (c_double * 3)()
+    minq = _scratch.dof_double
+    maxq = _scratch.dof_double2
 
-    err = _runtime._libdhd.dhdDeltaJointTorquesExtrema(
+    err = _dhdDeltaJointTorquesExtrema(
         joint_angles[0], joint_angles[1], joint_angles[2],
-        ct.cast(minq, c_double_ptr), ct.cast(maxq, c_double_ptr),
+        minq, maxq,
         ID
     )
 
@@ -2162,10 +2057,9 @@ def deltaJointTorquesExtrema(
     return err
 
 
-_runtime._libdhd.dhdSetDeltaJointTorques.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdhd.dhdSetDeltaJointTorques.restype = c_int
+_dhdSetDeltaJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdSetDeltaJointTorques'
+)
 
 
 def setDeltaJointTorques(
@@ -2202,15 +2096,12 @@ def setDeltaJointTorques(
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorques()`
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorquesAndGripperForce()`
     """
-    return _runtime._libdhd.dhdSetDeltaJointTorques(q[0], q[1], q[2], ID)
+    return _dhdSetDeltaJointTorques(q[0], q[1], q[2], ID)
 
 
-_runtime._libdhd.dhdDeltaEncodersToJointAngles.argtypes = [
-    c_int, c_int, c_int,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaEncodersToJointAngles.restype = c_int
+_dhdDeltaEncodersToJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaEncodersToJointAngles'
+)
 
 
 def deltaEncodersToJointAngles(
@@ -2262,11 +2153,9 @@ def deltaEncodersToJointAngles(
     | :func:`forcedimension_core.dhd.expert.deltaJointAnglesToEncoders()`
     """
 
-    j0 = c_double()
-    j1 = c_double()
-    j2 = c_double()
+    j0, j1, j2 = _scratch.double3
 
-    err = _runtime._libdhd.dhdDeltaEncodersToJointAngles(
+    err = _dhdDeltaEncodersToJointAngles(
         enc[0], enc[1], enc[2],
         j0, j1, j2,
         ID
@@ -2279,12 +2168,9 @@ def deltaEncodersToJointAngles(
     return err
 
 
-_runtime._libdhd.dhdDeltaJointAnglesToEncoders.argtypes = [
-    c_double, c_double, c_double,
-    c_int_ptr, c_int_ptr, c_int_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaJointAnglesToEncoders.restype = c_int
+_dhdDeltaJointAnglesToEncoders = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaJointAnglesToEncoders'
+)
 
 
 def deltaJointAnglesToEncoders(
@@ -2337,11 +2223,9 @@ def deltaJointAnglesToEncoders(
     | :func:`forcedimension_core.dhd.expert.deltaEncodersToJointAngles()`
     """
 
-    enc0 = c_int()
-    enc1 = c_int()
-    enc2 = c_int()
+    enc0, enc1, enc2 = _scratch.int3
 
-    err = _runtime._libdhd.dhdDeltaJointAnglesToEncoders(
+    err = _dhdDeltaJointAnglesToEncoders(
         joint_angles[0], joint_angles[1], joint_angles[2],
         enc0, enc1, enc2,
         ID
@@ -2354,11 +2238,9 @@ def deltaJointAnglesToEncoders(
     return err
 
 
-_runtime._libdhd.dhdGetWristJointAngles.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdGetWristJointAngles.restype = c_int
+_dhdGetWristJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdGetWristJointAngles'
+)
 
 
 def getWristJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -2393,10 +2275,8 @@ def getWristJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.wristEncodersToJointAngles()`
     """
 
-    j0 = c_double()
-    j1 = c_double()
-    j2 = c_double()
-    err = _runtime._libdhd.dhdGetWristJointAngles(
+    j0, j1, j2 = _scratch.double3
+    err = _dhdGetWristJointAngles(
         j0, j1, j2, ID
     )
 
@@ -2407,8 +2287,7 @@ def getWristJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
     return err
 
 
-_runtime._libdhd.dhdGetWristJacobian.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetWristJacobian.restype = c_int
+_dhdGetWristJacobian = _runtime._libdhd.bind(globals(), 'dhdGetWristJacobian')
 
 
 def getWristJacobian(
@@ -2446,23 +2325,18 @@ def getWristJacobian(
     | :func:`forcedimension_core.dhd.expert.wristJointAnglesToJacobian()`
     """
 
-    J = ((c_double * 3) * 3)()
+    J = _scratch.mat3x3
 
-    err = _runtime._libdhd.dhdGetWristJacobian(ct.cast(J, c_double_ptr), ID)
+    err = _dhdGetWristJacobian(J, ID)
 
-    for i in range(3):
-        for j in range(3):
-            out[i][j] = J[i][j]
+    _copy_matrix(out, J, 3)
 
     return err
 
 
-_runtime._libdhd.dhdWristJointAnglesToJacobian.argtypes = [
-    c_double, c_double, c_double,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristJointAnglesToJacobian.restype = c_int
+_dhdWristJointAnglesToJacobian = _runtime._libdhd.bind(
+    globals(), 'dhdWristJointAnglesToJacobian'
+)
 
 
 def wristJointAnglesToJacobian(
@@ -2516,27 +2390,22 @@ def wristJointAnglesToJacobian(
     | :func:`forcedimension_core.dhd.getWristJointAngles()`
     """
 
-    J = ((c_double * 3) * 3)()
+    J = _scratch.mat3x3
 
-    err = _runtime._libdhd.dhdWristJointAnglesToJacobian(
+    err = _dhdWristJointAnglesToJacobian(
         joint_angles[0], joint_angles[1], joint_angles[2],
-        ct.cast(J, c_double_ptr),
+        J,
         ID
     )
 
-    for i in range(3):
-        for j in range(3):
-            out[i][j] = J[i][j]
+    _copy_matrix(out, J, 3)
 
     return err
 
 
-_runtime._libdhd.dhdWristJointTorquesExtrema.argtypes = [
-    c_double, c_double, c_double,
-    c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristJointTorquesExtrema.restype = c_int
+_dhdWristJointTorquesExtrema = _runtime._libdhd.bind(
+    globals(), 'dhdWristJointTorquesExtrema'
+)
 
 
 def wristJointTorquesExtrema(
@@ -2604,12 +2473,12 @@ def wristJointTorquesExtrema(
     | :func:`forcedimension_core.dhd.expert.wristJointAnglesToEncoders()`
     """
 
-    minq = (c_double * 3)()
-    maxq = (c_double * 3)()
+    minq = _scratch.dof_double
+    maxq = _scratch.dof_double2
 
-    err = _runtime._libdhd.dhdWristJointTorquesExtrema(
+    err = _dhdWristJointTorquesExtrema(
         joint_angles[0], joint_angles[1], joint_angles[2],
-        ct.cast(minq, c_double_ptr), ct.cast(maxq, c_double_ptr),
+        minq, maxq,
         ID
     )
 
@@ -2624,10 +2493,9 @@ def wristJointTorquesExtrema(
     return err
 
 
-_runtime._libdhd.dhdSetWristJointTorques.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdhd.dhdSetWristJointTorques.restype = c_int
+_dhdSetWristJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdSetWristJointTorques'
+)
 
 
 def setWristJointTorques(
@@ -2665,15 +2533,12 @@ def setWristJointTorques(
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorques()`
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorquesAndGripperForce()`
     """
-    return _runtime._libdhd.dhdSetWristJointTorques(t[0], t[1], t[2], ID)
+    return _dhdSetWristJointTorques(t[0], t[1], t[2], ID)
 
 
-_runtime._libdhd.dhdSetForceAndWristJointTorques.argtypes = [
-    c_double, c_double, c_double,
-    c_double, c_double, c_double,
-    c_byte
-]
-_runtime._libdhd.dhdSetForceAndWristJointTorques.restype = c_int
+_dhdSetForceAndWristJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndWristJointTorques'
+)
 
 
 def setForceAndWristJointTorques(
@@ -2730,18 +2595,14 @@ def setForceAndWristJointTorques(
     | :func:`forcedimension_core.dhd.expert.setWristJointTorques()`
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorquesAndGripperForce()`
     """
-    return _runtime._libdhd.dhdSetForceAndWristJointTorques(
+    return _dhdSetForceAndWristJointTorques(
         f[0], f[1], f[2], t[0], t[1], t[2], ID
     )
 
 
-_runtime._libdhd.dhdSetForceAndWristJointTorquesAndGripperForce.argtypes = [
-    c_double, c_double, c_double,
-    c_double, c_double, c_double,
-    c_double,
-    c_byte
-]
-_runtime._libdhd.dhdSetForceAndWristJointTorquesAndGripperForce.restype = c_int
+_dhdSetForceAndWristJointTorquesAndGripperForce = _runtime._libdhd.bind(
+    globals(), 'dhdSetForceAndWristJointTorquesAndGripperForce'
+)
 
 
 def setForceAndWristJointTorquesAndGripperForce(
@@ -2805,17 +2666,14 @@ def setForceAndWristJointTorquesAndGripperForce(
     | :func:`forcedimension_core.dhd.expert.setWristJointTorques()`
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorques()`
     """
-    return _runtime._libdhd.dhdSetForceAndWristJointTorquesAndGripperForce(
+    return _dhdSetForceAndWristJointTorquesAndGripperForce(
         f[0], f[1], f[2], t[0], t[1], t[2], fg, ID
     )
 
 
-_runtime._libdhd.dhdWristEncodersToJointAngles.argtypes = [
-    c_int, c_int, c_int,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristEncodersToJointAngles.restype = c_int
+_dhdWristEncodersToJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdWristEncodersToJointAngles'
+)
 
 
 def wristEncodersToJointAngles(
@@ -2861,11 +2719,9 @@ def wristEncodersToJointAngles(
     | :func:`forcedimension_core.dhd.expert.wristJointAnglesToEncoders()`
     """
 
-    j0 = c_double()
-    j1 = c_double()
-    j2 = c_double()
+    j0, j1, j2 = _scratch.double3
 
-    err = _runtime._libdhd.dhdWristEncodersToJointAngles(
+    err = _dhdWristEncodersToJointAngles(
         enc[0], enc[1], enc[2],
         j0, j1, j2,
         ID
@@ -2878,12 +2734,9 @@ def wristEncodersToJointAngles(
     return err
 
 
-_runtime._libdhd.dhdWristJointAnglesToEncoders.argtypes = [
-    c_double, c_double, c_double,
-    c_int_ptr, c_int_ptr, c_int_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristJointAnglesToEncoders.restype = c_int
+_dhdWristJointAnglesToEncoders = _runtime._libdhd.bind(
+    globals(), 'dhdWristJointAnglesToEncoders'
+)
 
 
 def wristJointAnglesToEncoders(
@@ -2935,11 +2788,9 @@ def wristJointAnglesToEncoders(
     | :func:`forcedimension_core.dhd.expert.wristEncodersToJointAngles()`
     """
 
-    enc0 = c_int()
-    enc1 = c_int()
-    enc2 = c_int()
+    enc0, enc1, enc2 = _scratch.int3
 
-    err = _runtime._libdhd.dhdWristJointAnglesToEncoders(
+    err = _dhdWristJointAnglesToEncoders(
         joint_angles[0], joint_angles[1], joint_angles[2],
         enc0, enc1, enc2,
         ID
@@ -2952,8 +2803,7 @@ def wristJointAnglesToEncoders(
     return err
 
 
-_runtime._libdhd.dhdGetJointAngles.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetJointAngles.restype = c_int
+_dhdGetJointAngles = _runtime._libdhd.bind(globals(), 'dhdGetJointAngles')
 
 
 def getJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -2996,19 +2846,19 @@ def getJointAngles(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.getJointVelocities()`
     """
 
-    joint_angles = (c_double * MAX_DOF)()
+    joint_angles = _scratch.dof_double
 
-    err = _runtime._libdhd.dhdGetJointAngles(
-        ct.cast(joint_angles, c_double_ptr), ID)
+    err = _dhdGetJointAngles(
+        joint_angles, ID)
 
-    for i in range(MAX_DOF):
-        out[i] = joint_angles[i]
+    _copy(out, joint_angles, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdGetJointVelocities.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetJointVelocities.restype = c_int
+_dhdGetJointVelocities = _runtime._libdhd.bind(
+    globals(), 'dhdGetJointVelocities'
+)
 
 
 def getJointVelocities(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -3043,18 +2893,16 @@ def getJointVelocities(out: MutableArray[int, float], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.getWristJacobian()`
     """
 
-    w = (c_double * MAX_DOF)()
+    w = _scratch.dof_double
 
-    err = _runtime._libdhd.dhdGetJointVelocities(ct.cast(w, c_double_ptr), ID)
+    err = _dhdGetJointVelocities(w, ID)
 
-    for i in range(MAX_DOF):
-        out[i] = w[i]
+    _copy(out, w, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdGetEncVelocities.argtypes = [c_double_ptr, c_byte]
-_runtime._libdhd.dhdGetEncVelocities.restype = c_int
+_dhdGetEncVelocities = _runtime._libdhd.bind(globals(), 'dhdGetEncVelocities')
 
 
 def getEncVelocities(out: MutableArray[int, float], ID: int = -1) -> int:
@@ -3088,22 +2936,18 @@ def getEncVelocities(out: MutableArray[int, float], ID: int = -1) -> int:
     | :data:`forcedimension_core.dhd.expert.getEnc()`
     """
 
-    v = (c_double * MAX_DOF)()
+    v = _scratch.dof_double
 
-    err = _runtime._libdhd.dhdGetEncVelocities(ct.cast(v, c_double_ptr), ID)
+    err = _dhdGetEncVelocities(v, ID)
 
-    for i in range(MAX_DOF):
-        out[i] = v[i]
+    _copy(out, v, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdJointAnglesToInertiaMatrix.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdJointAnglesToInertiaMatrix.restype = c_int
+_dhdJointAnglesToInertiaMatrix = _runtime._libdhd.bind(
+    globals(), 'dhdJointAnglesToInertiaMatrix'
+)
 
 
 def jointAnglesToIntertiaMatrix(
@@ -3150,38 +2994,24 @@ def jointAnglesToIntertiaMatrix(
     | :func:`forcedimension_core.dhd.expert.getJointAngles()`
     """
 
-    inertia = ((c_double * 6) * 6)()
-    joint_angles_arr = (c_double * MAX_DOF)(
-        joint_angles[0],
-        joint_angles[1],
-        joint_angles[2],
-        joint_angles[3],
-        joint_angles[4],
-        joint_angles[5],
-        joint_angles[6],
-        joint_angles[7]
-    )
+    inertia = _scratch.mat6x6
+    joint_angles_arr = _scratch.dof_double
+    _copy(joint_angles_arr, joint_angles, MAX_DOF)
 
-    err = _runtime._libdhd.dhdJointAnglesToInertiaMatrix(
-        ct.cast(joint_angles_arr, c_double_ptr),
-        ct.cast(inertia, c_double_ptr),
+    err = _dhdJointAnglesToInertiaMatrix(
+        joint_angles_arr,
+        inertia,
         ID
     )
 
-    for i in range(6):
-        for j in range(6):
-            out[i][j] = inertia[i][j]
+    _copy_matrix(out, inertia, 6)
 
     return err
 
 
-_runtime._libdhd.dhdJointAnglesToGravityJointTorques.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_ubyte,
-    c_byte
-]
-_runtime._libdhd.dhdJointAnglesToGravityJointTorques.restype = c_int
+_dhdJointAnglesToGravityJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdJointAnglesToGravityJointTorques'
+)
 
 
 def jointAnglesToGravityJointTorques(
@@ -3238,33 +3068,23 @@ def jointAnglesToGravityJointTorques(
     |  :func:`forcedimension_core.dhd.expert.getJointAngles()`
     """
 
-    q = (c_double * MAX_DOF)()
-    joint_angles_arr = (c_double * MAX_DOF)(
-        joint_angles[0],
-        joint_angles[1],
-        joint_angles[2],
-        joint_angles[3],
-        joint_angles[4],
-        joint_angles[5],
-        joint_angles[6],
-        joint_angles[7]
-    )
+    q = _scratch.dof_double
+    joint_angles_arr = _scratch.dof_double2
+    _copy(joint_angles_arr, joint_angles, MAX_DOF)
 
-    err = _runtime._libdhd.dhdJointAnglesToGravityJointTorques(
-        ct.cast(joint_angles_arr, c_double_ptr),
-        ct.cast(q, c_double_ptr),
+    err = _dhdJointAnglesToGravityJointTorques(
+        joint_angles_arr,
+        q,
         mask,
         ID
     )
 
-    for i in range(MAX_DOF):
-        out[i] = q[i]
+    _copy(out, q, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdSetComMode.argtypes = [c_int, c_byte]
-_runtime._libdhd.dhdSetComMode.restype = c_int
+_dhdSetComMode = _runtime._libdhd.bind(globals(), 'dhdSetComMode')
 
 
 def setComMode(mode: ComMode, ID: int = -1) -> int:
@@ -3290,11 +3110,10 @@ def setComMode(mode: ComMode, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setComModePriority`
     """
 
-    return _runtime._libdhd.dhdSetComMode(mode, ID)
+    return _dhdSetComMode(mode, ID)
 
 
-_runtime._libdhd.dhdSetWatchdog.argtypes = [c_ubyte, c_byte]
-_runtime._libdhd.dhdSetWatchdog.restype = c_int
+_dhdSetWatchdog = _runtime._libdhd.bind(globals(), 'dhdSetWatchdog')
 
 
 def setWatchdog(duration: int, ID: int = -1) -> int:
@@ -3324,11 +3143,10 @@ def setWatchdog(duration: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.getWatchdog()`
     """
 
-    return _runtime._libdhd.dhdSetWatchdog(duration, ID)
+    return _dhdSetWatchdog(duration, ID)
 
 
-_runtime._libdhd.dhdGetWatchdog.argtypes = [c_ubyte_ptr, c_byte]
-_runtime._libdhd.dhdGetWatchdog.restype = c_int
+_dhdGetWatchdog = _runtime._libdhd.bind(globals(), 'dhdGetWatchdog')
 
 
 def getWatchdog(ID: int = -1) -> int:
@@ -3350,16 +3168,15 @@ def getWatchdog(ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.setWatchdog()`
     """
 
-    duration = c_ubyte()
+    duration = _scratch.ubyte
 
-    if _runtime._libdhd.dhdGetWatchdog(duration, ID):
+    if _dhdGetWatchdog(duration, ID):
         return -1
 
     return duration.value
 
 
-_runtime._libdhd.dhdGetEncRange.argtypes = [c_int_ptr, c_int_ptr, c_byte]
-_runtime._libdhd.dhdGetEncRange.restype = c_int
+_dhdGetEncRange = _runtime._libdhd.bind(globals(), 'dhdGetEncRange')
 
 
 def getEncRange(
@@ -3398,22 +3215,20 @@ def getEncRange(
         0 on success, -1 otherwise.
     """
 
-    enc_min = (c_int * MAX_DOF)()
-    enc_max = (c_int * MAX_DOF)()
+    enc_min = _scratch.dof_int
+    enc_max = _scratch.dof_int2
 
-    err = _runtime._libdhd.dhdGetEncRange(enc_min, enc_max, ID)
+    err = _dhdGetEncRange(enc_min, enc_max, ID)
 
-    for i in range(MAX_DOF):
-        enc_min_out[i] = enc_min[i]
-        enc_max_out[i] = enc_max[i]
+    _copy(enc_min_out, enc_min, MAX_DOF)
+    _copy(enc_max_out, enc_max, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdGetJointAngleRange.argtypes = [
-    c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdhd.dhdGetJointAngleRange.restype = c_int
+_dhdGetJointAngleRange = _runtime._libdhd.bind(
+    globals(), 'dhdGetJointAngleRange'
+)
 
 
 def getJointAngleRange(
@@ -3455,22 +3270,22 @@ def getJointAngleRange(
         0 on success and -1 otherwise.
     """
 
-    jmin = (c_double * MAX_DOF)()
-    jmax = (c_double * MAX_DOF)()
+    jmin = _scratch.dof_double
+    jmax = _scratch.dof_double2
 
-    err = _runtime._libdhd.dhdGetJointAngleRange(
-        ct.cast(jmin, c_double_ptr), ct.cast(jmax, c_double_ptr), ID
+    err = _dhdGetJointAngleRange(
+        jmin, jmax, ID
     )
 
-    for i in range(MAX_DOF):
-        jmin_out[i] = jmin[i]
-        jmax_out[i] = jmax[i]
+    _copy(jmin_out, jmin, MAX_DOF)
+    _copy(jmax_out, jmax, MAX_DOF)
 
     return err
 
 
-_runtime._libdhd.dhdControllerSetDevice.argtypes = [c_int, c_byte]
-_runtime._libdhd.dhdControllerSetDevice.restype = c_int
+_dhdControllerSetDevice = _runtime._libdhd.bind(
+    globals(), 'dhdControllerSetDevice'
+)
 
 
 def controllerSetDevice(devtype: DeviceType, ID: int = -1) -> int:
@@ -3503,11 +3318,12 @@ def controllerSetDevice(devtype: DeviceType, ID: int = -1) -> int:
         0 on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdControllerSetDevice(devtype, ID)
+    return _dhdControllerSetDevice(devtype, ID)
 
 
-_runtime._libdhd.dhdReadConfigFromFile.argtypes = [c_char_p, c_byte]
-_runtime._libdhd.dhdReadConfigFromFile.restype = c_int
+_dhdReadConfigFromFile = _runtime._libdhd.bind(
+    globals(), 'dhdReadConfigFromFile'
+)
 
 
 def readConfigFromFile(filename: str, ID: int = -1):
@@ -3532,15 +3348,12 @@ def readConfigFromFile(filename: str, ID: int = -1):
         0 on success, -1 otherwise.
     """
 
-    return _runtime._libdhd.dhdReadConfigFromFile(filename.encode('utf-8'), ID)
+    return _dhdReadConfigFromFile(filename.encode('utf-8'), ID)
 
 
-_runtime._libdhd.dhdDeltaGravityJointTorques.argtypes = [
-    c_double, c_double, c_double,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdDeltaGravityJointTorques.restype = c_int
+_dhdDeltaGravityJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaGravityJointTorques'
+)
 
 
 @typing_extensions.deprecated(
@@ -3600,11 +3413,9 @@ def deltaGravityJointTorques(
         0 on success, -1 otherwise.
     """
 
-    q0 = c_double()
-    q1 = c_double()
-    q2 = c_double()
+    q0, q1, q2 = _scratch.double3
 
-    err = _runtime._libdhd.dhdDeltaGravityJointTorques(
+    err = _dhdDeltaGravityJointTorques(
         joint_angles[0], joint_angles[1], joint_angles[2],
         q0, q1, q2,
         ID
@@ -3617,12 +3428,9 @@ def deltaGravityJointTorques(
     return err
 
 
-_runtime._libdhd.dhdWristGravityJointTorques.argtypes = [
-    c_double, c_double, c_double,
-    c_double_ptr, c_double_ptr, c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristGravityJointTorques.restype = c_int
+_dhdWristGravityJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdWristGravityJointTorques'
+)
 
 
 @typing_extensions.deprecated(
@@ -3682,11 +3490,9 @@ def wristGravityJointTorques(
         0 on success, -1 otherwise
     """
 
-    q0 = c_double()
-    q1 = c_double()
-    q2 = c_double()
+    q0, q1, q2 = _scratch.double3
 
-    err = _runtime._libdhd.dhdWristGravityJointTorques(
+    err = _dhdWristGravityJointTorques(
         joint_angles[0], joint_angles[1], joint_angles[2],
         q0, q1, q2,
         ID
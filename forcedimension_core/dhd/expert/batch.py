@@ -0,0 +1,291 @@
+"""
+Batched versions of the kinematic conversions of
+:mod:`forcedimension_core.dhd.expert`, for post-processing recorded
+encoder values or positions offline.
+
+Each function converts an ``(N, 3)`` array into a preallocated ``(N, 3)``
+array, e.g. NumPy arrays or any other C-contiguous buffer of the right
+item type. The library is called through its address (see
+:func:`forcedimension_core.runtime.symbol_addresses()`) with pointers
+straight into the output array, so converting a sample creates no ctypes
+objects. The SDK only converts one sample per call, though, so the loop
+still runs in Python and makes one foreign call per row, reading each input
+value into a Python number.
+
+That call is most of the cost of a row, so on one thread these functions
+are barely faster than calling the per-sample functions in a Python loop:
+``benchmarks/bench_batch.py`` measures about 435-450k rows/s against about
+410k rows/s with the stub library. They save allocating the output
+containers, not the per-row overhead. The foreign calls release the GIL,
+so the work can be split across a pool of threads with ``workers``, which
+only helps when the library spends longer in a conversion than Python
+spends calling it.
+
+.. code-block:: python
+
+    enc = np.array(log, dtype=np.int32)
+    pos = np.empty(enc.shape)
+
+    batch.deltaEncoderToPosition(enc, pos, ID, workers=4)
+
+Calls through these functions are not profiled (see
+:func:`forcedimension_core.runtime.enable_profiling()`).
+"""
+
+import ctypes as ct
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import c_double, c_int
+from typing import Any, Callable
+
+import forcedimension_core.runtime as _runtime
+from forcedimension_core import _checked
+
+# Codes of the buffer formats accepted for each item type.
+_FORMATS = {c_int: ('i', 'l'), c_double: ('d',)}
+
+
+def _view(array: Any, ctype: Any, name: str, writable: bool = False):
+    view = memoryview(array)
+
+    if view.ndim != 2 or view.shape[1] != 3 or not view.c_contiguous:
+        raise ValueError(f"{name} must be a C-contiguous (N, 3) array.")
+
+    fmt = view.format.lstrip('@=<')
+
+    if fmt not in _FORMATS[ctype] or view.itemsize != ct.sizeof(ctype):
+        raise TypeError(
+            f"{name} must be an array of {ct.sizeof(ctype) * 8}-bit "
+            f"{'integers' if ctype is c_int else 'floats'}."
+        )
+
+    if writable and view.readonly:
+        raise TypeError(f"{name} must be writable.")
+
+    return view
+
+
+def _function(symbol: str) -> Callable[..., int]:
+    # The same function, taking its output pointers as addresses.
+    sym = _runtime.symbol_addresses([symbol])[symbol]
+    argtypes = [
+        ct.c_void_p if issubclass(argtype, ct._Pointer) else argtype
+        for argtype in sym.argtypes
+    ]
+
+    return ct.CFUNCTYPE(sym.restype, *argtypes)(sym.address)
+
+
+def _convert(
+    name: str,
+    src: Any, src_type: Any,
+    out: Any, out_type: Any,
+    ID: int, workers: int
+) -> None:
+    if workers < 1:
+        raise ValueError("workers must be positive.")
+
+    values = _view(src, src_type, 'The input')
+    results = _view(out, out_type, 'out', writable=True)
+
+    if (count := len(values)) != len(results):
+        raise ValueError("out must have as many rows as the input.")
+
+    if count == 0:
+        return
+
+    # Flat views, indexed by item
+    values = values.cast('B').cast(_FORMATS[src_type][0])
+    results = results.cast('B').cast(_FORMATS[out_type][0])
+
+    func = _function('dhd' + name[0].upper() + name[1:])
+    op = f'{__name__}.{name}'
+
+    size = ct.sizeof(out_type)
+    row = 3 * size
+    base = ct.addressof((ct.c_char * results.nbytes).from_buffer(results))
+
+    def run(start: int, stop: int):
+        it = iter(values[3 * start:3 * stop])
+        px, py, pz = (
+            range(base + i + start * row, base + i + stop * row, row)
+            for i in (0, size, 2 * size)
+        )
+
+        for (a, b, c), x, y, z in zip(zip(it, it, it), px, py, pz):
+            if func(a, b, c, x, y, z, ID) == -1:
+                _checked.raise_last_error(f'{op}[{(x - base) // row}]', ID)
+
+    if workers == 1 or count == 1:
+        run(0, count)
+        return
+
+    chunk = -(-count // workers)
+
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(run, start, min(start + chunk, count))
+            for start in range(0, count, chunk)
+        ]
+
+        for future in futures:
+            future.result()
+
+
+def deltaEncoderToPosition(
+    enc: Any, out: Any, ID: int = -1, workers: int = 1
+) -> None:
+    """
+    Compute the positions of the end-effector (in [m]) for rows of raw
+    encoder values (see
+    :func:`forcedimension_core.dhd.expert.deltaEncoderToPosition()`).
+
+    :param Any enc:
+        ``(N, 3)`` array of 32-bit integers, each row holding the raw
+        encoder values of axis 0, 1, and 2.
+
+    :param Any out:
+        Writable ``(N, 3)`` array of 64-bit floats to store the positions
+        in.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param int workers:
+        The number of threads to split the rows across.
+
+    :raises ValueError:
+        If ``enc`` or ``out`` is not a C-contiguous ``(N, 3)`` array, or
+        they differ in length.
+
+    :raises TypeError:
+        If ``enc`` or ``out`` has the wrong item type, or ``out`` is
+        read-only.
+
+    :raises DHDError:
+        If converting a row fails. The operation of the error ends with the
+        index of the row.
+    """
+
+    _convert(
+        'deltaEncoderToPosition', enc, c_int, out, c_double, ID, workers
+    )
+
+
+def deltaPositionToEncoder(
+    pos: Any, out: Any, ID: int = -1, workers: int = 1
+) -> None:
+    """
+    Compute the raw encoder values for rows of end-effector positions
+    (see :func:`forcedimension_core.dhd.expert.deltaPositionToEncoder()`).
+
+    :param Any pos:
+        ``(N, 3)`` array of 64-bit floats, each row holding a position on
+        the X, Y, and Z axes (in [m]).
+
+    :param Any out:
+        Writable ``(N, 3)`` array of 32-bit integers to store the encoder
+        values in.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param int workers:
+        The number of threads to split the rows across.
+
+    :raises ValueError:
+        If ``pos`` or ``out`` is not a C-contiguous ``(N, 3)`` array, or
+        they differ in length.
+
+    :raises TypeError:
+        If ``pos`` or ``out`` has the wrong item type, or ``out`` is
+        read-only.
+
+    :raises DHDError:
+        If converting a row fails. The operation of the error ends with the
+        index of the row.
+    """
+
+    _convert(
+        'deltaPositionToEncoder', pos, c_double, out, c_int, ID, workers
+    )
+
+
+def wristEncoderToOrientation(
+    enc: Any, out: Any, ID: int = -1, workers: int = 1
+) -> None:
+    """
+    Compute the wrist orientations (in [rad]) for rows of raw wrist
+    encoder values (see
+    :func:`forcedimension_core.dhd.expert.wristEncoderToOrientation()`).
+
+    :param Any enc:
+        ``(N, 3)`` array of 32-bit integers, each row holding the raw
+        encoder values of wrist axis 0, 1, and 2.
+
+    :param Any out:
+        Writable ``(N, 3)`` array of 64-bit floats to store the
+        orientations in.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param int workers:
+        The number of threads to split the rows across.
+
+    :raises ValueError:
+        If ``enc`` or ``out`` is not a C-contiguous ``(N, 3)`` array, or
+        they differ in length.
+
+    :raises TypeError:
+        If ``enc`` or ``out`` has the wrong item type, or ``out`` is
+        read-only.
+
+    :raises DHDError:
+        If converting a row fails. The operation of the error ends with the
+        index of the row.
+    """
+
+    _convert(
+        'wristEncoderToOrientation', enc, c_int, out, c_double, ID, workers
+    )
+
+
+def wristOrientationToEncoder(
+    orientation: Any, out: Any, ID: int = -1, workers: int = 1
+) -> None:
+    """
+    Compute the raw wrist encoder values for rows of wrist orientations
+    (see
+    :func:`forcedimension_core.dhd.expert.wristOrientationToEncoder()`).
+
+    :param Any orientation:
+        ``(N, 3)`` array of 64-bit floats, each row holding the wrist
+        orientation about its first, second, and third joint (in [rad]).
+
+    :param Any out:
+        Writable ``(N, 3)`` array of 32-bit integers to store the encoder
+        values in.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param int workers:
+        The number of threads to split the rows across.
+
+    :raises ValueError:
+        If ``orientation`` or ``out`` is not a C-contiguous ``(N, 3)``
+        array, or they differ in length.
+
+    :raises TypeError:
+        If ``orientation`` or ``out`` has the wrong item type, or ``out``
+        is read-only.
+
+    :raises DHDError:
+        If converting a row fails. The operation of the error ends with the
+        index of the row.
+    """
+
+    _convert(
+        'wristOrientationToEncoder', orientation, c_double, out, c_int, ID,
+        workers
+    )
@@ -1,9 +1,85 @@
-from ctypes import c_byte, c_double, c_int, c_ushort
+from ctypes import c_double, c_int, c_ushort
 from typing import Tuple
 
 import forcedimension_core.runtime as _runtime
-from forcedimension_core.typing import (
-    Array, SupportsPtr, SupportsPtrs3, c_double_ptr
+from forcedimension_core.typing import Array, SupportsPtr, SupportsPtrs3
+
+
+_dhdGetDeltaEncoders = _runtime._libdhd.bind(globals(), 'dhdGetDeltaEncoders')
+_dhdGetWristEncoders = _runtime._libdhd.bind(globals(), 'dhdGetWristEncoders')
+_dhdDeltaEncoderToPosition = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaEncoderToPosition'
+)
+_dhdDeltaPositionToEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaPositionToEncoder'
+)
+_dhdDeltaMotorToForce = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaMotorToForce'
+)
+_dhdDeltaForceToMotor = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaForceToMotor'
+)
+_dhdWristEncoderToOrientation = _runtime._libdhd.bind(
+    globals(), 'dhdWristEncoderToOrientation'
+)
+_dhdWristOrientationToEncoder = _runtime._libdhd.bind(
+    globals(), 'dhdWristOrientationToEncoder'
+)
+_dhdWristMotorToTorque = _runtime._libdhd.bind(
+    globals(), 'dhdWristMotorToTorque'
+)
+_dhdWristTorqueToMotor = _runtime._libdhd.bind(
+    globals(), 'dhdWristTorqueToMotor'
+)
+_dhdGripperMotorToForce = _runtime._libdhd.bind(
+    globals(), 'dhdGripperMotorToForce'
+)
+_dhdSetMot = _runtime._libdhd.bind(globals(), 'dhdSetMot')
+_dhdSetJointTorques = _runtime._libdhd.bind(globals(), 'dhdSetJointTorques')
+_dhdPreloadMot = _runtime._libdhd.bind(globals(), 'dhdPreloadMot')
+_dhdGripperForceToMotor = _runtime._libdhd.bind(
+    globals(), 'dhdGripperForceToMotor'
+)
+_dhdGetEnc = _runtime._libdhd.bind(globals(), 'dhdGetEnc')
+_dhdGetDeltaJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdGetDeltaJointAngles'
+)
+_dhdGetDeltaJacobian = _runtime._libdhd.bind(globals(), 'dhdGetDeltaJacobian')
+_dhdDeltaJointAnglesToJacobian = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaJointAnglesToJacobian'
+)
+_dhdDeltaJointTorquesExtrema = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaJointTorquesExtrema'
+)
+_dhdDeltaEncodersToJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaEncodersToJointAngles'
+)
+_dhdDeltaJointAnglesToEncoders = _runtime._libdhd.bind(
+    globals(), 'dhdDeltaJointAnglesToEncoders'
+)
+_dhdGetWristJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdGetWristJointAngles'
+)
+_dhdGetWristJacobian = _runtime._libdhd.bind(globals(), 'dhdGetWristJacobian')
+_dhdWristJointAnglesToJacobian = _runtime._libdhd.bind(
+    globals(), 'dhdWristJointAnglesToJacobian'
+)
+_dhdWristJointTorquesExtrema = _runtime._libdhd.bind(
+    globals(), 'dhdWristJointTorquesExtrema'
+)
+_dhdWristJointAnglesToEncoders = _runtime._libdhd.bind(
+    globals(), 'dhdWristJointAnglesToEncoders'
+)
+_dhdGetJointAngles = _runtime._libdhd.bind(globals(), 'dhdGetJointAngles')
+_dhdGetJointVelocities = _runtime._libdhd.bind(
+    globals(), 'dhdGetJointVelocities'
+)
+_dhdGetEncVelocities = _runtime._libdhd.bind(globals(), 'dhdGetEncVelocities')
+_dhdJointAnglesToInertiaMatrix = _runtime._libdhd.bind(
+    globals(), 'dhdJointAnglesToInertiaMatrix'
+)
+_dhdJointAnglesToGravityJointTorques = _runtime._libdhd.bind(
+    globals(), 'dhdJointAnglesToGravityJointTorques'
 )
 
 
@@ -45,7 +121,7 @@ def getDeltaEncoders(out: SupportsPtrs3[c_int], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.deltaEncoderToPosition()`
     """
 
-    return _runtime._libdhd.dhdGetDeltaEncoders(*out.ptrs, ID)
+    return _dhdGetDeltaEncoders(*out.ptrs, ID)
 
 
 def getWristEncoders(out: SupportsPtrs3[c_int], ID: int = -1) -> int:
@@ -91,7 +167,7 @@ def getWristEncoders(out: SupportsPtrs3[c_int], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.wristOrientationToEncoder()`
     """
 
-    return _runtime._libdhd.dhdGetWristEncoders(*out.ptrs, ID)
+    return _dhdGetWristEncoders(*out.ptrs, ID)
 
 
 def deltaEncoderToPosition(
@@ -149,7 +225,7 @@ def deltaEncoderToPosition(
     | :func:`forcedimension_core.dhd.expert.direct.deltaEncodersToJointAngles()`
     """
 
-    return _runtime._libdhd.dhdDeltaEncoderToPosition(
+    return _dhdDeltaEncoderToPosition(
         enc[0], enc[1], enc[2], *out.ptrs, ID
     )
 
@@ -208,7 +284,7 @@ def deltaPositionToEncoder(
     | :func:`forcedimension_core.dhd.expert.direct.deltaEncodersToJointAngles()`
     """
 
-    return _runtime._libdhd.dhdDeltaPositionToEncoder(
+    return _dhdDeltaPositionToEncoder(
         pos[0], pos[1], pos[2], *out.ptrs, ID
     )
 
@@ -280,7 +356,7 @@ def deltaMotorToForce(
     | :func:`forcedimension_core.dhd.expert.direct.deltaForceToMotor()`
     """
 
-    return _runtime._libdhd.dhdDeltaMotorToForce(
+    return _dhdDeltaMotorToForce(
         mot[0], mot[1], mot[2],
         enc[0], enc[1], enc[2],
         *out.ptrs,
@@ -356,7 +432,7 @@ def deltaForceToMotor(
     | :func:`forcedimension_core.dhd.expert.direct.deltaMotorToForce()`
     """
 
-    return _runtime._libdhd.dhdDeltaForceToMotor(
+    return _dhdDeltaForceToMotor(
         f[0], f[1], f[2],
         enc[0], enc[1], enc[2],
         *out.ptrs,
@@ -428,7 +504,7 @@ def wristEncoderToOrientation(
     | :func:`forcedimension_core.dhd.expert.direct.wristOrientationToEncoder()`
     | :func:`forcedimension_core.dhd.expert.direct.wristJointAnglesToEncoders()`
     """
-    return _runtime._libdhd.dhdWristEncoderToOrientation(
+    return _dhdWristEncoderToOrientation(
         enc[0], enc[1], enc[2],
         *out.ptrs,
         ID
@@ -508,7 +584,7 @@ def wristOrientationToEncoder(
     | :func:`forcedimension_core.dhd.expert.direct.wristJointAnglesToEncoders()`
     """
 
-    return _runtime._libdhd.dhdWristOrientationToEncoder(
+    return _dhdWristOrientationToEncoder(
         orientation[0], orientation[1], orientation[2],
         *out.ptrs,
         ID
@@ -590,7 +666,7 @@ def wristMotorToTorque(
     | :func:`forcedimension_core.dhd.expert.direct.wristJointTorquesExtrema()`
     """
 
-    return _runtime._libdhd.dhdWristMotorToTorque(
+    return _dhdWristMotorToTorque(
         output[0], output[1], output[2],
         enc[0], enc[1], enc[2],
         *out.ptrs,
@@ -673,7 +749,7 @@ def wristTorqueToMotor(
     | :func:`forcedimension_core.dhd.expert.direct.wristTorqueToMotor()`
     """
 
-    return _runtime._libdhd.dhdWristTorqueToMotor(
+    return _dhdWristTorqueToMotor(
         t[0], t[1], t[2],
         enc[0], enc[1], enc[2],
         *out.ptrs,
@@ -733,7 +809,7 @@ def gripperMotorToForce(
     | :func:`forcedimension_core.dhd.expert.direct.gripperForceToMotor()`
     """
 
-    return _runtime._libdhd.dhdGripperMotorToForce(
+    return _dhdGripperMotorToForce(
         cmd, out, enc_wrist_grip.ptr, ID
     )
 
@@ -778,7 +854,7 @@ def setMot(cmds: SupportsPtr[c_ushort], mask: int = 0xff, ID: int = -1) -> int:
 
     """
 
-    return _runtime._libdhd.dhdSetMot(cmds.ptr, mask, ID)
+    return _dhdSetMot(cmds.ptr, mask, ID)
 
 
 def setJointTorques(q: SupportsPtr[c_double], mask: int = 0xff, ID: int = -1):
@@ -821,7 +897,7 @@ def setJointTorques(q: SupportsPtr[c_double], mask: int = 0xff, ID: int = -1):
     | :func:`forcedimension_core.dhd.expert.setForceAndWristJointTorquesAndGripperForce()`
     """
 
-    return _runtime._libdhd.dhdSetJointTorques(q.ptr, mask, ID)
+    return _dhdSetJointTorques(q.ptr, mask, ID)
 
 
 def preloadMot(
@@ -867,7 +943,7 @@ def preloadMot(
     | :func:`forcedimension_core.dhd.expert.direct.setMot()`
     """
 
-    return _runtime._libdhd.dhdPreloadMot(cmds.ptr, mask, ID)
+    return _dhdPreloadMot(cmds.ptr, mask, ID)
 
 
 def gripperForceToMotor(
@@ -921,7 +997,7 @@ def gripperForceToMotor(
     | :func:`forcedimension_core.dhd.expert.direct.gripperForceToMotor()`
     """
 
-    return _runtime._libdhd.dhdGripperForceToMotor(f, out, enc_wrist_grip.ptr, ID)
+    return _dhdGripperForceToMotor(f, out, enc_wrist_grip.ptr, ID)
 
 
 def getEnc(out: SupportsPtr[c_int], mask: int = 0xff, ID: int = -1) -> int:
@@ -961,7 +1037,7 @@ def getEnc(out: SupportsPtr[c_int], mask: int = 0xff, ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.getEncVelocities()`
     """
 
-    return _runtime._libdhd.dhdGetEnc(out.ptr, mask, ID)
+    return _dhdGetEnc(out.ptr, mask, ID)
 
 
 def getDeltaJointAngles(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
@@ -1001,7 +1077,7 @@ def getDeltaJointAngles(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.deltaJointAnglesToJacobian()`
     """
 
-    return _runtime._libdhd.dhdGetDeltaJointAngles(*out.ptrs, ID)
+    return _dhdGetDeltaJointAngles(*out.ptrs, ID)
 
 
 def getDeltaJacobian(out: SupportsPtr[c_double], ID: int = -1) -> int:
@@ -1036,7 +1112,7 @@ def getDeltaJacobian(out: SupportsPtr[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.deltaJointAnglesToJacobian()`
     """
 
-    return _runtime._libdhd.dhdGetDeltaJacobian(out.ptr, ID)
+    return _dhdGetDeltaJacobian(out.ptr, ID)
 
 
 def deltaJointAnglesToJacobian(
@@ -1090,7 +1166,7 @@ def deltaJointAnglesToJacobian(
     | :func:`forcedimension_core.dhd.expert.direct.getDeltaJacobian()`
     """
 
-    return _runtime._libdhd.dhdDeltaJointAnglesToJacobian(
+    return _dhdDeltaJointAnglesToJacobian(
         joint_angles[0], joint_angles[1], joint_angles[2],
         out.ptr,
         ID
@@ -1166,7 +1242,7 @@ def deltaJointTorquesExtrema(
     | :func:`forcedimension_core.dhd.expert.direct.getJointAngles()`
     """
 
-    return _runtime._libdhd.dhdDeltaJointTorquesExtrema(
+    return _dhdDeltaJointTorquesExtrema(
         joint_angles[0],
         joint_angles[1],
         joint_angles[2],
@@ -1228,7 +1304,7 @@ def deltaEncodersToJointAngles(
     | :func:`forcedimension_core.dhd.expert.direct.deltaJointAnglesToEncoders()`
     """
 
-    return _runtime._libdhd.dhdDeltaEncodersToJointAngles(
+    return _dhdDeltaEncodersToJointAngles(
         enc[0],
         enc[1],
         enc[2],
@@ -1280,7 +1356,7 @@ def deltaJointAnglesToEncoders(
     | :func:`forcedimension_core.dhd.expert.direct.deltaEncodersToJointAngles()`
     """
 
-    return _runtime._libdhd.dhdDeltaJointAnglesToEncoders(
+    return _dhdDeltaJointAnglesToEncoders(
         joint_angles[0],
         joint_angles[1],
         joint_angles[2],
@@ -1326,7 +1402,7 @@ def getWristJointAngles(out: SupportsPtrs3[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.wristEncodersToJointAngles()`
     """
 
-    return _runtime._libdhd.dhdGetWristJointAngles(*out.ptrs, ID)
+    return _dhdGetWristJointAngles(*out.ptrs, ID)
 
 
 def getWristJacobian(out: SupportsPtr[c_double], ID: int = -1) -> int:
@@ -1361,7 +1437,7 @@ def getWristJacobian(out: SupportsPtr[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.wristJointAnglesToJacobian()`
     """
 
-    return _runtime._libdhd.dhdGetWristJacobian(out.ptr, ID)
+    return _dhdGetWristJacobian(out.ptr, ID)
 
 
 def wristJointAnglesToJacobian(
@@ -1414,7 +1490,7 @@ def wristJointAnglesToJacobian(
     | :func:`forcedimension_core.dhd.expert.direct.getWristJointAngles()`
     """
 
-    return _runtime._libdhd.dhdWristJointAnglesToJacobian(
+    return _dhdWristJointAnglesToJacobian(
         joint_angles[0],
         joint_angles[1],
         joint_angles[2],
@@ -1496,7 +1572,7 @@ def wristJointTorquesExtrema(
     | :func:`forcedimension_core.dhd.expert.direct.wristJointAnglesToEncoders()`
     """
 
-    return _runtime._libdhd.dhdWristJointTorquesExtrema(
+    return _dhdWristJointTorquesExtrema(
         joint_angles[0],
         joint_angles[1],
         joint_angles[2],
@@ -1506,16 +1582,9 @@ def wristJointTorquesExtrema(
     )
 
 
-_runtime._libdhd.dhdWristEncodersToJointAngles.argtypes = [
-    c_int,
-    c_int,
-    c_int,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdhd.dhdWristEncodersToJointAngles.restype = c_int
+_dhdWristEncodersToJointAngles = _runtime._libdhd.bind(
+    globals(), 'dhdWristEncodersToJointAngles'
+)
 
 
 def wristEncodersToJointAngles(
@@ -1572,7 +1641,7 @@ def wristEncodersToJointAngles(
     | :func:`forcedimension_core.dhd.expert.direct.wristJointAnglesToEncoders()`
     """
 
-    return _runtime._libdhd.dhdWristEncodersToJointAngles(
+    return _dhdWristEncodersToJointAngles(
         enc[0], enc[1], enc[2], *out.ptrs, ID
     )
 
@@ -1630,7 +1699,7 @@ def wristJointAnglesToEncoders(
     | :func:`forcedimension_core.dhd.expert.direct.wristEncodersToJointAngles()`
     """
 
-    return _runtime._libdhd.dhdWristJointAnglesToEncoders(
+    return _dhdWristJointAnglesToEncoders(
         joint_angles[0],
         joint_angles[1],
         joint_angles[2],
@@ -1686,7 +1755,7 @@ def getJointAngles(out: SupportsPtr[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.getJointVelocities()`
     """
 
-    return _runtime._libdhd.dhdGetJointAngles(out.ptr, ID)
+    return _dhdGetJointAngles(out.ptr, ID)
 
 
 def getJointVelocities(out: SupportsPtr[c_double], ID: int = -1) -> int:
@@ -1726,7 +1795,7 @@ def getJointVelocities(out: SupportsPtr[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.getWristJacobian()`
     """
 
-    return _runtime._libdhd.dhdGetJointVelocities(out.ptr, ID)
+    return _dhdGetJointVelocities(out.ptr, ID)
 
 
 def getEncVelocities(out: SupportsPtr[c_double], ID: int = -1) -> int:
@@ -1766,7 +1835,7 @@ def getEncVelocities(out: SupportsPtr[c_double], ID: int = -1) -> int:
     | :func:`forcedimension_core.dhd.expert.direct.getEnc()`
     """
 
-    return _runtime._libdhd.dhdGetEncVelocities(out.ptr, ID)
+    return _dhdGetEncVelocities(out.ptr, ID)
 
 
 def jointAnglesToIntertiaMatrix(
@@ -1817,7 +1886,7 @@ def jointAnglesToIntertiaMatrix(
     | :func:`forcedimension_core.dhd.expert.direct.getJointAngles()`
     """
 
-    return _runtime._libdhd.dhdJointAnglesToInertiaMatrix(
+    return _dhdJointAnglesToInertiaMatrix(
         joint_angles.ptr, out.ptr, ID
     )
 
@@ -1875,7 +1944,7 @@ def jointAnglesToGravityJointTorques(
     | :func:`forcedimension_core.dhd.expert.direct.getJointAngles()`
     """
 
-    return _runtime._libdhd.dhdJointAnglesToGravityJointTorques(
+    return _dhdJointAnglesToGravityJointTorques(
         joint_angles.ptr,
         out.ptr,
         mask,
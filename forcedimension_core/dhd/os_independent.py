@@ -1,9 +1,7 @@
-from ctypes import c_bool, c_byte, c_double
 from forcedimension_core import runtime as _runtime
 
 
-_runtime._libdhd.dhdKbHit.argtypes = []
-_runtime._libdhd.dhdKbHit.restype = c_bool
+_dhdKbHit = _runtime._libdhd.bind(globals(), 'dhdKbHit')
 
 
 def kbHit() -> bool:
@@ -15,11 +13,10 @@ def kbHit() -> bool:
         `True` if a key on the keyboard was hit, and `False`
         otherwise.
     """
-    return _runtime._libdhd.dhdKbHit()
+    return _dhdKbHit()
 
 
-_runtime._libdhd.dhdKbGet.argtypes = []
-_runtime._libdhd.dhdKbGet.restype = c_byte
+_dhdKbGet = _runtime._libdhd.bind(globals(), 'dhdKbGet')
 
 
 def kbGet() -> str:
@@ -30,11 +27,10 @@ def kbGet() -> str:
     :returns:
         The character hit on the keyboard.
     """
-    return chr(_runtime._libdhd.dhdKbGet())
+    return chr(_dhdKbGet())
 
 
-_runtime._libdhd.dhdGetTime.argtypes = []
-_runtime._libdhd.dhdGetTime.restype = c_double
+_dhdGetTime = _runtime._libdhd.bind(globals(), 'dhdGetTime')
 
 
 def getTime() -> float:
@@ -49,11 +45,10 @@ def getTime() -> float:
         The current monotonic time in [s] from the
         high-resolution system counter.
     """
-    return _runtime._libdhd.dhdGetTime()
+    return _dhdGetTime()
 
 
-_runtime._libdhd.dhdSleep.argtypes = [c_double]
-_runtime._libdhd.dhdSleep.restype = None
+_dhdSleep = _runtime._libdhd.bind(globals(), 'dhdSleep')
 
 
 def sleep(sec: float) -> None:
@@ -61,4 +56,4 @@ def sleep(sec: float) -> None:
     Sleep for a given period of time in [s]. This function is OS
     independent.
     """
-    _runtime._libdhd.dhdSleep(sec)
+    _dhdSleep(sec)
@@ -0,0 +1,223 @@
+"""
+Persistent cache of the libdrd location found by
+:func:`forcedimension_core.runtime.load()`.
+
+Searching for libdrd globs several SDK directories and checks every
+candidate, which is slow on network-mounted home directories. After a
+successful search the path of the library that was loaded is stored along
+with the modification times of the library and of every directory that the
+search looks in. The next :func:`forcedimension_core.runtime.load()` with
+the same key tries the cached path first and only falls back to a full
+search when the entry is stale.
+
+The cache lives in ``$FORCEDIM_CACHE_DIR`` if set, and otherwise in the
+platform cache directory. It can be inspected and cleared from the command
+line::
+
+    python3 -m forcedimension_core cache show
+    python3 -m forcedimension_core cache clear
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+CACHE_VERSION = 1
+CACHE_FILE_NAME = 'discovery.json'
+
+
+def cache_dir() -> str:
+    """
+    Get the directory the discovery cache is stored in.
+    """
+
+    if (path := os.environ.get('FORCEDIM_CACHE_DIR')):
+        return path
+
+    if sys.platform == 'win32' or sys.platform == 'cygwin':
+        root = os.environ.get('LOCALAPPDATA') or os.path.join(
+            os.path.expanduser('~'), 'AppData', 'Local'
+        )
+    elif sys.platform == 'darwin':
+        root = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        root = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache'
+        )
+
+    return os.path.join(root, 'forcedimension_core')
+
+
+def cache_file() -> str:
+    """
+    Get the path of the discovery cache file.
+    """
+
+    return os.path.join(cache_dir(), CACHE_FILE_NAME)
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read() -> Dict[str, dict]:
+    try:
+        with open(cache_file(), 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+
+    entries = data.get('entries')
+
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write(entries: Dict[str, dict]) -> None:
+    path = cache_file()
+    tmp = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(tmp, 'w') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': entries}, f)
+
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def is_stale(entry: dict) -> bool:
+    """
+    Check whether a cache entry no longer reflects the file system.
+
+    An entry is stale if the cached library was modified or removed, or if
+    any of the directories searched for libdrd changed (e.g. because a new
+    SDK was installed).
+    """
+
+    try:
+        if _mtime(entry['path']) != entry['mtime']:
+            return True
+
+        for directory, mtime in entry['watch'].items():
+            if _mtime(directory) != mtime:
+                return True
+    except (KeyError, TypeError, AttributeError):
+        return True
+
+    return False
+
+
+def lookup(key: str) -> Optional[str]:
+    """
+    Get the cached library path for ``key``.
+
+    :param str key:
+        The discovery key, which identifies the environment the search
+        ran in.
+
+    :returns:
+        The cached path, or ``None`` if there is no entry for ``key`` or it
+        is stale.
+    """
+
+    if (entry := _read().get(key)) is None or is_stale(entry):
+        return None
+
+    return entry['path']
+
+
+def store(key: str, path: str, watch: Iterable[str] = ()) -> None:
+    """
+    Cache ``path`` as the library found for ``key``. Failing to write the
+    cache is not an error.
+
+    :param str key:
+        The discovery key.
+
+    :param str path:
+        The path of the library that was loaded.
+
+    :param Iterable[str] watch:
+        Directories whose modification invalidates the entry.
+    """
+
+    if (mtime := _mtime(path)) is None:
+        return
+
+    entries = _read()
+    entries[key] = {
+        'path': path,
+        'mtime': mtime,
+        'watch': {directory: _mtime(directory) for directory in watch}
+    }
+
+    _write(entries)
+
+
+def entries() -> Dict[str, dict]:
+    """
+    Get every cache entry, keyed by discovery key.
+    """
+
+    return _read()
+
+
+def clear() -> bool:
+    """
+    Remove the discovery cache.
+
+    :returns:
+        ``True`` if a cache file was removed, ``False`` otherwise.
+    """
+
+    try:
+        os.remove(cache_file())
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python3 -m forcedimension_core cache',
+        description='Inspect or clear the libdrd discovery cache.'
+    )
+    parser.add_argument(
+        'command', choices=('show', 'clear', 'path'), nargs='?',
+        default='show'
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='print entries as JSON'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'path':
+        print(cache_file())
+    elif args.command == 'clear':
+        print("Cache cleared." if clear() else "Cache was already empty.")
+    elif args.json:
+        print(json.dumps(entries(), indent=2))
+    else:
+        if not (cached := entries()):
+            print(f"No entries in {cache_file()}")
+
+        for key, entry in cached.items():
+            state = 'stale' if is_stale(entry) else 'valid'
+            print(f"{key}\n    {entry.get('path')} ({state})")
+
+    return 0
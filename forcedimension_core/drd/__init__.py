@@ -1,9 +1,12 @@
-import ctypes as ct
-from ctypes import c_bool, c_byte, c_double, c_int
+from ctypes import c_double
 from typing import Tuple
 
 import forcedimension_core.runtime as _runtime
 import forcedimension_core.runtime as runtime
+import forcedimension_core._device_info as _device_info
+from forcedimension_core._scratch import buffers as _scratch
+from forcedimension_core._scratch import copy as _copy
+from forcedimension_core._scratch import copy_matrix as _copy_matrix
 from forcedimension_core.constants import (
     MAX_DOF
 )
@@ -19,14 +22,11 @@ from forcedimension_core.drd.adaptors import (
     TrajectoryGenParams
 )
 
-from forcedimension_core.typing import (
-    Array, MutableArray, c_double_ptr, c_int_ptr
-)
+from forcedimension_core.typing import Array, MutableArray
 
 from . import direct
 
-_runtime._libdrd.drdOpen.argtypes = []
-_runtime._libdrd.drdOpen.restype = c_int
+_drdOpen = _runtime._libdrd.bind(globals(), 'drdOpen')
 
 
 def open() -> int:
@@ -48,11 +48,13 @@ def open() -> int:
     | :func:`forcedimension_core.drd.close()`
     """
 
-    return _runtime._libdrd.drdOpen()
+    if (ID := _drdOpen()) >= 0:
+        _device_info.invalidate(ID)
+
+    return ID
 
 
-_runtime._libdrd.drdOpenID.argtypes = [c_byte]
-_runtime._libdrd.drdOpenID.restype = c_int
+_drdOpenID = _runtime._libdrd.bind(globals(), 'drdOpenID')
 
 
 def openID(ID: int) -> int:
@@ -82,11 +84,13 @@ def openID(ID: int) -> int:
     | :func:`forcedimension_core.drd.close()`
     """
 
-    return _runtime._libdrd.drdOpenID(ID)
+    if (opened := _drdOpenID(ID)) >= 0:
+        _device_info.invalidate(opened)
+
+    return opened
 
 
-_runtime._libdrd.drdSetDevice.argtypes = [c_byte]
-_runtime._libdrd.drdSetDevice.restype = c_int
+_drdSetDevice = _runtime._libdrd.bind(globals(), 'drdSetDevice')
 
 
 def setDevice(ID: int) -> int:
@@ -112,11 +116,10 @@ def setDevice(ID: int) -> int:
     | :func:`forcedimension_core.drd.getDeviceID()`
     """
 
-    return _runtime._libdrd.drdSetDevice(ID)
+    return _drdSetDevice(ID)
 
 
-_runtime._libdrd.drdGetDeviceID.argtypes = []
-_runtime._libdrd.drdGetDeviceID.restype = c_int
+_drdGetDeviceID = _runtime._libdrd.bind(globals(), 'drdGetDeviceID')
 
 
 def getDeviceID() -> int:
@@ -131,11 +134,10 @@ def getDeviceID() -> int:
     | :func:`forcedimension_core.drd.setDevice()`
     """
 
-    return _runtime._libdrd.drdGetDeviceID()
+    return _drdGetDeviceID()
 
 
-_runtime._libdrd.drdClose.argtypes = [c_byte]
-_runtime._libdrd.drdClose.restype = c_int
+_drdClose = _runtime._libdrd.bind(globals(), 'drdClose')
 
 
 def close(ID: int = -1) -> int:
@@ -153,11 +155,12 @@ def close(ID: int = -1) -> int:
         0 on success, and -1 otherwise.
     """
 
-    return _runtime._libdrd.drdClose(ID)
+    _device_info.invalidate(ID)
 
+    return _drdClose(ID)
 
-_runtime._libdrd.drdIsSupported.argtypes = [c_byte]
-_runtime._libdrd.drdIsSupported.restype = c_bool
+
+_drdIsSupported = _runtime._libdrd.bind(globals(), 'drdIsSupported')
 
 
 def isSupported(ID: int = -1) -> bool:
@@ -187,11 +190,10 @@ def isSupported(ID: int = -1) -> bool:
         ``True`` if the device is supported, ``False`` otherwise.
 
     """
-    return _runtime._libdrd.drdIsSupported(ID)
+    return _drdIsSupported(ID)
 
 
-_runtime._libdrd.drdIsRunning.argtypes = [c_byte]
-_runtime._libdrd.drdIsRunning.restype = c_bool
+_drdIsRunning = _runtime._libdrd.bind(globals(), 'drdIsRunning')
 
 
 def isRunning(ID: int = -1) -> bool:
@@ -211,11 +213,10 @@ def isRunning(ID: int = -1) -> bool:
         otherwise.
     """
 
-    return _runtime._libdrd.drdIsRunning(ID)
+    return _drdIsRunning(ID)
 
 
-_runtime._libdrd.drdIsFiltering.argtypes = [c_byte]
-_runtime._libdrd.drdIsFiltering.restype = c_bool
+_drdIsFiltering = _runtime._libdrd.bind(globals(), 'drdIsFiltering')
 
 
 def isFiltering(ID: int = -1) -> bool:
@@ -241,11 +242,10 @@ def isFiltering(ID: int = -1) -> bool:
     | :func:`forcedimension_core.drd.isMoving()`
     """
 
-    return _runtime._libdrd.drdIsFiltering(ID)
+    return _drdIsFiltering(ID)
 
 
-_runtime._libdrd.drdIsInitialized.argtypes = [c_byte]
-_runtime._libdrd.drdIsInitialized.restype = c_bool
+_drdIsInitialized = _runtime._libdrd.bind(globals(), 'drdIsInitialized')
 
 
 def isInitialized(ID: int = -1) -> bool:
@@ -271,11 +271,10 @@ def isInitialized(ID: int = -1) -> bool:
     | :func:`forcedimension_core.drd.checkInit()`.
     """
 
-    return _runtime._libdrd.drdIsInitialized(ID)
+    return _drdIsInitialized(ID)
 
 
-_runtime._libdrd.drdIsMoving.argtypes = [c_byte]
-_runtime._libdrd.drdIsMoving.restype = c_bool
+_drdIsMoving = _runtime._libdrd.bind(globals(), 'drdIsMoving')
 
 
 def isMoving(ID: int = -1) -> bool:
@@ -304,11 +303,10 @@ def isMoving(ID: int = -1) -> bool:
     | :func:`forcedimension_core.drd.isFiltering()`
     """
 
-    return _runtime._libdrd.drdIsMoving(ID)
+    return _drdIsMoving(ID)
 
 
-_runtime._libdrd.drdAutoInit.argtypes = [c_byte]
-_runtime._libdrd.drdAutoInit.restype = c_int
+_drdAutoInit = _runtime._libdrd.bind(globals(), 'drdAutoInit')
 
 
 def autoInit(ID: int = -1) -> int:
@@ -334,11 +332,10 @@ def autoInit(ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.isInitialized()`
     """
 
-    return _runtime._libdrd.drdAutoInit(ID)
+    return _drdAutoInit(ID)
 
 
-_runtime._libdrd.drdCheckInit.argtypes = [c_byte]
-_runtime._libdrd.drdCheckInit.restype = c_int
+_drdCheckInit = _runtime._libdrd.bind(globals(), 'drdCheckInit')
 
 
 def checkInit(ID: int = -1) -> int:
@@ -368,11 +365,10 @@ def checkInit(ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.isInitialized()`
     """
 
-    return _runtime._libdrd.drdCheckInit(ID)
+    return _drdCheckInit(ID)
 
 
-_runtime._libdrd.drdPrecisionInit.argtypes = [c_byte]
-_runtime._libdrd.drdPrecisionInit.restype = c_int
+_drdPrecisionInit = _runtime._libdrd.bind(globals(), 'drdPrecisionInit')
 
 
 def precisionInit(ID: int = -1) -> int:
@@ -403,23 +399,10 @@ def precisionInit(ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.isInitialized()`
     """
 
-    return _runtime._libdrd.drdPrecisionInit(ID)
-
-
-_runtime._libdrd.drdGetVelocity.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdrd.drdGetVelocity.restype = c_int
+    return _drdPrecisionInit(ID)
 
 
-_runtime._libdrd.drdGetCtrlFreq.argtypes = [c_byte]
-_runtime._libdrd.drdGetCtrlFreq.restype = c_double
+_drdGetCtrlFreq = _runtime._libdrd.bind(globals(), 'drdGetCtrlFreq')
 
 
 def getCtrlFreq(ID: int = -1) -> float:
@@ -438,11 +421,10 @@ def getCtrlFreq(ID: int = -1) -> float:
         The control frequency on success, and -1.0 otherwise.
     """
 
-    return _runtime._libdrd.drdGetCtrlFreq(ID)
+    return _drdGetCtrlFreq(ID)
 
 
-_runtime._libdrd.drdStart.argtypes = [c_byte]
-_runtime._libdrd.drdStart.restype = c_int
+_drdStart = _runtime._libdrd.bind(globals(), 'drdStart')
 
 
 def start(ID: int = -1) -> int:
@@ -473,11 +455,10 @@ def start(ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.stop()`
     """
 
-    return _runtime._libdrd.drdStart(ID)
+    return _drdStart(ID)
 
 
-_runtime._libdrd.drdRegulatePos.argtypes = [c_bool, c_byte]
-_runtime._libdrd.drdRegulatePos.restype = c_int
+_drdRegulatePos = _runtime._libdrd.bind(globals(), 'drdRegulatePos')
 
 
 def regulatePos(enable: bool, ID: int = -1) -> int:
@@ -512,11 +493,10 @@ def regulatePos(enable: bool, ID: int = -1) -> int:
         0 on success, and -1 otherwise.
     """
 
-    return _runtime._libdrd.drdRegulatePos(enable, ID)
+    return _drdRegulatePos(enable, ID)
 
 
-_runtime._libdrd.drdRegulateRot.argtypes = [c_bool, c_byte]
-_runtime._libdrd.drdRegulateRot.restype = c_int
+_drdRegulateRot = _runtime._libdrd.bind(globals(), 'drdRegulateRot')
 
 
 def regulateRot(enable: bool, ID: int = -1) -> int:
@@ -551,11 +531,10 @@ def regulateRot(enable: bool, ID: int = -1) -> int:
         0 on success, and -1 otherwise.
     """
 
-    return _runtime._libdrd.drdRegulateRot(enable, ID)
+    return _drdRegulateRot(enable, ID)
 
 
-_runtime._libdrd.drdRegulateGrip.argtypes = [c_bool, c_byte]
-_runtime._libdrd.drdRegulateGrip.restype = c_int
+_drdRegulateGrip = _runtime._libdrd.bind(globals(), 'drdRegulateGrip')
 
 
 def regulateGrip(enable: bool, ID: int = -1) -> int:
@@ -590,20 +569,12 @@ def regulateGrip(enable: bool, ID: int = -1) -> int:
         0 on success, and -1 otherwise.
     """
 
-    return _runtime._libdrd.drdRegulateGrip(enable, ID)
+    return _drdRegulateGrip(enable, ID)
 
 
-_runtime._libdrd.drdSetForceAndTorqueAndGripperForce.argtypes = [
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_byte
-]
-_runtime._libdrd.drdSetForceAndTorqueAndGripperForce.restype = c_int
+_drdSetForceAndTorqueAndGripperForce = _runtime._libdrd.bind(
+    globals(), 'drdSetForceAndTorqueAndGripperForce'
+)
 
 
 def setForceAndTorqueAndGripperForce(
@@ -682,22 +653,14 @@ def setForceAndTorqueAndGripperForce(
         on success, and -1 otherwise.
     """
 
-    return _runtime._libdrd.drdSetForceAndTorqueAndGripperForce(
+    return _drdSetForceAndTorqueAndGripperForce(
         f[0], f[1], f[2], t[0], t[1], t[2], fg, ID
     )
 
 
-_runtime._libdrd.drdSetForceAndWristJointTorquesAndGripperForce.argtypes = [
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_double,
-    c_byte
-]
-_runtime._libdrd.drdSetForceAndWristJointTorquesAndGripperForce.restype = c_int
+_drdSetForceAndWristJointTorquesAndGripperForce = _runtime._libdrd.bind(
+    globals(), 'drdSetForceAndWristJointTorquesAndGripperForce'
+)
 
 
 def setForceAndWristJointTorquesAndGripperForce(
@@ -766,7 +729,7 @@ def setForceAndWristJointTorquesAndGripperForce(
 
     :returns: 0 on success, -1 otherwise
     """
-    return _runtime._libdrd.drdSetForceAndWristJointTorquesAndGripperForce(
+    return _drdSetForceAndWristJointTorquesAndGripperForce(
         f[0],
         f[1],
         f[2],
@@ -778,18 +741,9 @@ def setForceAndWristJointTorquesAndGripperForce(
     )
 
 
-_runtime._libdrd.drdGetPositionAndOrientation.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdrd.drdGetPositionAndOrientation.restype = c_int
+_drdGetPositionAndOrientation = _runtime._libdrd.bind(
+    globals(), 'drdGetPositionAndOrientation'
+)
 
 
 def getPositionAndOrientation(
@@ -865,21 +819,15 @@ def getPositionAndOrientation(
         on success, -1 otherwise.
     """
 
-    px = c_double()
-    py = c_double()
-    pz = c_double()
+    px, py, pz, oa, ob, og = _scratch.double6
 
-    oa = c_double()
-    ob = c_double()
-    og = c_double()
+    matrix = _scratch.mat3x3
 
-    matrix = ((c_double * 3) * 3)()
-
-    err: int = _runtime._libdrd.drdGetPositionAndOrientation(
+    err: int = _drdGetPositionAndOrientation(
         px, py, pz,
         oa, ob, og,
         pg_out,
-        ct.cast(matrix, c_double_ptr),
+        matrix,
         ID
     )
 
@@ -891,24 +839,12 @@ def getPositionAndOrientation(
     o_out[1] = ob.value
     o_out[2] = og.value
 
-    for i in range(3):
-        for j in range(3):
-            matrix_out[i][j] = matrix[i][j]
+    _copy_matrix(matrix_out, matrix, 3)
 
     return err
 
 
-_runtime._libdrd.drdGetVelocity.argtypes = [
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_double_ptr,
-    c_byte
-]
-_runtime._libdrd.drdGetVelocity.restype = c_int
+_drdGetVelocity = _runtime._libdrd.bind(globals(), 'drdGetVelocity')
 
 
 def getVelocity(
@@ -966,15 +902,9 @@ def getVelocity(
         0 on success and -1 otherwise.
     """
 
-    vx = c_double()
-    vy = c_double()
-    vz = c_double()
-
-    wx = c_double()
-    wy = c_double()
-    wz = c_double()
+    vx, vy, vz, wx, wy, wz = _scratch.double6
 
-    err = _runtime._libdrd.drdGetVelocity(vx, vy, vz, wx, wy, wz, vg_out, ID)
+    err = _drdGetVelocity(vx, vy, vz, wx, wy, wz, vg_out, ID)
 
     v_out[0] = vx.value
     v_out[1] = vy.value
@@ -987,8 +917,7 @@ def getVelocity(
     return err
 
 
-_runtime._libdrd.drdEnableFilter.argtypes = [c_bool, c_byte]
-_runtime._libdrd.drdEnableFilter.restype = c_int
+_drdEnableFilter = _runtime._libdrd.bind(globals(), 'drdEnableFilter')
 
 
 def enableFilter(enabled: bool, ID: int = -1) -> int:
@@ -1014,13 +943,10 @@ def enableFilter(enabled: bool, ID: int = -1) -> int:
     :returns:
         0 on success, and -1 otherwise.
     """
-    return _runtime._libdrd.drdEnableFilter(enabled, ID)
+    return _drdEnableFilter(enabled, ID)
 
 
-_runtime._libdrd.drdMoveToPos.argtypes = [
-    c_double, c_double, c_double, c_bool, c_byte
-]
-_runtime._libdrd.drdMoveToPos.restype = c_int
+_drdMoveToPos = _runtime._libdrd.bind(globals(), 'drdMoveToPos')
 
 
 def moveToPos(pos: Array[int, float], block: bool, ID: int = -1):
@@ -1066,13 +992,10 @@ def moveToPos(pos: Array[int, float], block: bool, ID: int = -1):
     | :func:`forcedimension_core.drd.moveTo()`
     """
 
-    return _runtime._libdrd.drdMoveToPos(pos[0], pos[1], pos[2], block, ID)
+    return _drdMoveToPos(pos[0], pos[1], pos[2], block, ID)
 
 
-_runtime._libdrd.drdMoveToRot.argtypes = [
-    c_double, c_double, c_double, c_bool, c_byte
-]
-_runtime._libdrd.drdMoveToRot.restype = c_int
+_drdMoveToRot = _runtime._libdrd.bind(globals(), 'drdMoveToRot')
 
 
 def moveToRot(orientation: Array[int, float], block: bool, ID: int = -1):
@@ -1117,13 +1040,12 @@ def moveToRot(orientation: Array[int, float], block: bool, ID: int = -1):
     | :func:`forcedimension_core.drd.moveTo()`
     """
 
-    return _runtime._libdrd.drdMoveToRot(
+    return _drdMoveToRot(
         orientation[0], orientation[1], orientation[2], block, ID
     )
 
 
-_runtime._libdrd.drdMoveToGrip.argtypes = [c_double, c_bool, c_byte]
-_runtime._libdrd.drdMoveToGrip.restype = c_int
+_drdMoveToGrip = _runtime._libdrd.bind(globals(), 'drdMoveToGrip')
 
 
 def moveToGrip(pg: float, block: bool, ID: int = -1):
@@ -1165,11 +1087,10 @@ def moveToGrip(pg: float, block: bool, ID: int = -1):
     | :func:`forcedimension_core.drd.moveTo()`
     """
 
-    return _runtime._libdrd.drdMoveToGrip(pg, block, ID)
+    return _drdMoveToGrip(pg, block, ID)
 
 
-_runtime._libdrd.drdMoveTo.argtypes = [c_double_ptr, c_bool, c_byte]
-_runtime._libdrd.drdMoveTo.restype = c_int
+_drdMoveTo = _runtime._libdrd.bind(globals(), 'drdMoveTo')
 
 
 def moveTo(pos: Array[int, float], block: bool, ID: int = -1):
@@ -1225,19 +1146,17 @@ def moveTo(pos: Array[int, float], block: bool, ID: int = -1):
     | :func:`forcedimension_core.drd.moveToAllEnc()`
     """
 
-    pos_arr = (c_double * 8)(
-        pos[0], pos[1], pos[2], pos[3], pos[4], pos[5], pos[6], pos[7],
-    )
+    pos_arr = _scratch.dof_double
+    _copy(pos_arr, pos, MAX_DOF)
 
-    return _runtime._libdrd.drdMoveTo(
-        ct.cast(pos_arr, c_double_ptr),
+    return _drdMoveTo(
+        pos_arr,
         block,
         ID
     )
 
 
-_runtime._libdrd.drdMoveToEnc.argtypes = [c_int, c_int, c_int, c_bool, c_byte]
-_runtime._libdrd.drdMoveToEnc.restype = c_int
+_drdMoveToEnc = _runtime._libdrd.bind(globals(), 'drdMoveToEnc')
 
 
 def moveToEnc(enc: Array[int, int], block: bool, ID: int = -1) -> int:
@@ -1297,11 +1216,10 @@ def moveToEnc(enc: Array[int, int], block: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.moveTo()`
     """
 
-    return _runtime._libdrd.drdMoveToEnc(enc[0], enc[1], enc[2], block, ID)
+    return _drdMoveToEnc(enc[0], enc[1], enc[2], block, ID)
 
 
-_runtime._libdrd.drdMoveToAllEnc.argtypes = [c_int_ptr, c_bool, c_byte]
-_runtime._libdrd.drdMoveToAllEnc.restype = c_int
+_drdMoveToAllEnc = _runtime._libdrd.bind(globals(), 'drdMoveToAllEnc')
 
 
 def moveToAllEnc(enc: Array[int, int], block: bool, ID: int = -1):
@@ -1348,19 +1266,17 @@ def moveToAllEnc(enc: Array[int, int], block: bool, ID: int = -1):
     | :func:`forcedimension_core.drd.moveTo()`
     """
 
-    enc_arr = (c_int * MAX_DOF)(
-        enc[0], enc[1], enc[2], enc[3], enc[4], enc[5], enc[6], enc[7]
-    )
+    enc_arr = _scratch.dof_int
+    _copy(enc_arr, enc, MAX_DOF)
 
-    return _runtime._libdrd.drdMoveToAllEnc(
-        ct.cast(enc_arr, c_int_ptr),
+    return _drdMoveToAllEnc(
+        enc_arr,
         block,
         ID
     )
 
 
-_runtime._libdrd.drdHold.argtypes = [c_byte]
-_runtime._libdrd.drdHold.restype = c_int
+_drdHold = _runtime._libdrd.bind(globals(), 'drdHold')
 
 
 def hold(ID: int = -1) -> int:
@@ -1383,11 +1299,10 @@ def hold(ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.lock()`
     """
 
-    return _runtime._libdrd.drdHold(ID)
+    return _drdHold(ID)
 
 
-_runtime._libdrd.drdLock.argtypes = [c_bool, c_bool, c_byte]
-_runtime._libdrd.drdLock.restype = c_int
+_drdLock = _runtime._libdrd.bind(globals(), 'drdLock')
 
 
 def lock(enable: bool, init: bool, ID: int = -1) -> int:
@@ -1449,11 +1364,10 @@ def lock(enable: bool, init: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.autoInit()`
     """
 
-    return _runtime._libdrd.drdLock(enable, init, ID)
+    return _drdLock(enable, init, ID)
 
 
-_runtime._libdrd.drdStop.argtypes = [c_bool, c_byte]
-_runtime._libdrd.drdStop.restype = c_int
+_drdStop = _runtime._libdrd.bind(globals(), 'drdStop')
 
 
 def stop(force_on: bool, ID: int = -1) -> int:
@@ -1480,11 +1394,10 @@ def stop(force_on: bool, ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.start()`
     """
 
-    return _runtime._libdrd.drdStop(force_on, ID)
+    return _drdStop(force_on, ID)
 
 
-_runtime._libdrd.drdGetPriorities.argtypes = [c_int_ptr, c_int_ptr, c_byte]
-_runtime._libdrd.drdGetPriorities.restype = c_int
+_drdGetPriorities = _runtime._libdrd.bind(globals(), 'drdGetPriorities')
 
 
 def getPriorities(ID: int = -1) -> Tuple[int, int, int]:
@@ -1508,16 +1421,14 @@ def getPriorities(ID: int = -1) -> Tuple[int, int, int]:
     | :func:`forcedimension_core.drd.setPriorities()`
     """
 
-    prio = c_int()
-    ctrlprio = c_int()
+    prio, ctrlprio = _scratch.int2
 
-    err: int = _runtime._libdrd.drdGetPriorities(prio, ctrlprio, ID)
+    err: int = _drdGetPriorities(prio, ctrlprio, ID)
 
     return (prio.value, ctrlprio.value, err)
 
 
-_runtime._libdrd.drdSetPriorities.argtypes = [c_int, c_int, c_byte]
-_runtime._libdrd.drdSetPriorities.restype = c_int
+_drdSetPriorities = _runtime._libdrd.bind(globals(), 'drdSetPriorities')
 
 
 def setPriorities(prio: int, ctrlprio: int, ID: int = -1) -> int:
@@ -1564,11 +1475,10 @@ def setPriorities(prio: int, ctrlprio: int, ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.setPriorities()`
     """
 
-    return _runtime._libdrd.drdSetPriorities(prio, ctrlprio, ID)
+    return _drdSetPriorities(prio, ctrlprio, ID)
 
 
-_runtime._libdrd.drdSetEncPGain.argtypes = [c_double, c_byte]
-_runtime._libdrd.drdSetEncPGain.restype = c_int
+_drdSetEncPGain = _runtime._libdrd.bind(globals(), 'drdSetEncPGain')
 
 
 def setEncPGain(gain: float, ID: int = -1) -> int:
@@ -1598,11 +1508,10 @@ def setEncPGain(gain: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.setEncPGain()`
     """
 
-    return _runtime._libdrd.drdSetEncPGain(gain, ID)
+    return _drdSetEncPGain(gain, ID)
 
 
-_runtime._libdrd.drdGetEncPGain.argtypes = [c_byte]
-_runtime._libdrd.drdGetEncPGain.restype = c_double
+_drdGetEncPGain = _runtime._libdrd.bind(globals(), 'drdGetEncPGain')
 
 
 def getEncPGain(ID: int = -1) -> float:
@@ -1626,11 +1535,10 @@ def getEncPGain(ID: int = -1) -> float:
     | :func:`forcedimension_core.getEncPGain()`
     """
 
-    return _runtime._libdrd.drdGetEncPGain(ID)
+    return _drdGetEncPGain(ID)
 
 
-_runtime._libdrd.drdSetEncIGain.argtypes = [c_double, c_byte]
-_runtime._libdrd.drdSetEncIGain.restype = c_int
+_drdSetEncIGain = _runtime._libdrd.bind(globals(), 'drdSetEncIGain')
 
 
 def setEncIGain(gain: float, ID: int = -1) -> int:
@@ -1660,11 +1568,10 @@ def setEncIGain(gain: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.getEncIGain()`
     """
 
-    return _runtime._libdrd.drdSetEncIGain(gain, ID)
+    return _drdSetEncIGain(gain, ID)
 
 
-_runtime._libdrd.drdGetEncIGain.argtypes = [c_byte]
-_runtime._libdrd.drdGetEncIGain.restype = c_double
+_drdGetEncIGain = _runtime._libdrd.bind(globals(), 'drdGetEncIGain')
 
 
 def getEncIGain(ID: int = -1) -> float:
@@ -1688,11 +1595,10 @@ def getEncIGain(ID: int = -1) -> float:
     | :func:`forcedimension_core.setEncIGain()`
     """
 
-    return _runtime._libdrd.drdGetEncIGain(ID)
+    return _drdGetEncIGain(ID)
 
 
-_runtime._libdrd.drdSetEncDGain.argtypes = [c_double, c_byte]
-_runtime._libdrd.drdSetEncDGain.restype = c_int
+_drdSetEncDGain = _runtime._libdrd.bind(globals(), 'drdSetEncDGain')
 
 
 def setEncDGain(gain: float, ID: int = -1) -> int:
@@ -1722,11 +1628,10 @@ def setEncDGain(gain: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.getEncDGain()`
     """
 
-    return _runtime._libdrd.drdSetEncDGain(gain, ID)
+    return _drdSetEncDGain(gain, ID)
 
 
-_runtime._libdrd.drdGetEncDGain.argtypes = [c_byte]
-_runtime._libdrd.drdGetEncDGain.restype = c_double
+_drdGetEncDGain = _runtime._libdrd.bind(globals(), 'drdGetEncDGain')
 
 
 def getEncDGain(ID: int = -1) -> float:
@@ -1750,11 +1655,10 @@ def getEncDGain(ID: int = -1) -> float:
     | :func:`forcedimension_core.setEncDGain()`
     """
 
-    return _runtime._libdrd.drdGetEncDGain(ID)
+    return _drdGetEncDGain(ID)
 
 
-_runtime._libdrd.drdTrackPos.argtypes = [c_double, c_double, c_double, c_byte]
-_runtime._libdrd.drdTrackPos.restype = c_int
+_drdTrackPos = _runtime._libdrd.bind(globals(), 'drdTrackPos')
 
 
 def trackPos(pos: Array[int, float], ID: int = -1):
@@ -1780,11 +1684,10 @@ def trackPos(pos: Array[int, float], ID: int = -1):
     :returns:
         0 on success, and -1 otherwise.
     """
-    return _runtime._libdrd.drdTrackPos(pos[0], pos[1], pos[2], ID)
+    return _drdTrackPos(pos[0], pos[1], pos[2], ID)
 
 
-_runtime._libdrd.drdTrackRot.argtypes = [c_double, c_double, c_double, c_byte]
-_runtime._libdrd.drdTrackRot.restype = c_int
+_drdTrackRot = _runtime._libdrd.bind(globals(), 'drdTrackRot')
 
 
 def trackRot(orientation: Array[int, float], ID: int = -1):
@@ -1811,13 +1714,12 @@ def trackRot(orientation: Array[int, float], ID: int = -1):
         0 on success, and -1 otherwise.
 
     """
-    return _runtime._libdrd.drdTrackRot(
+    return _drdTrackRot(
         orientation[0], orientation[1], orientation[2], ID
     )
 
 
-_runtime._libdrd.drdTrackGrip.argtypes = [c_double, c_byte]
-_runtime._libdrd.drdTrackGrip.restype = c_int
+_drdTrackGrip = _runtime._libdrd.bind(globals(), 'drdTrackGrip')
 
 
 def trackGrip(pg: float, ID: int = -1):
@@ -1842,11 +1744,10 @@ def trackGrip(pg: float, ID: int = -1):
         0 on success, and -1 otherwise.
 
     """
-    return _runtime._libdrd.drdTrackGrip(pg, ID)
+    return _drdTrackGrip(pg, ID)
 
 
-_runtime._libdrd.drdTrack.argtypes = [c_double_ptr, c_byte]
-_runtime._libdrd.drdTrack.restype = c_int
+_drdTrack = _runtime._libdrd.bind(globals(), 'drdTrack')
 
 
 def track(pos: Array[int, float], ID: int = -1):
@@ -1893,15 +1794,13 @@ def track(pos: Array[int, float], ID: int = -1):
     | :func:`forcedimension_core.drd.trackAllEnc()`
     """
 
-    pos_arr = (c_double * 8)(
-        pos[0], pos[1], pos[2], pos[3], pos[4], pos[5], pos[6], pos[7]
-    )
+    pos_arr = _scratch.dof_double
+    _copy(pos_arr, pos, MAX_DOF)
 
-    return _runtime._libdrd.drdTrack(ct.cast(pos_arr, c_double_ptr), ID)
+    return _drdTrack(pos_arr, ID)
 
 
-_runtime._libdrd.drdTrackEnc.argtypes = [c_int, c_int, c_int, c_byte]
-_runtime._libdrd.drdTrackEnc.restype = c_int
+_drdTrackEnc = _runtime._libdrd.bind(globals(), 'drdTrackEnc')
 
 
 def trackEnc(enc: Array[int, int], ID: int = -1) -> int:
@@ -1951,11 +1850,10 @@ def trackEnc(enc: Array[int, int], ID: int = -1) -> int:
     | :func:`forcedimension_core.drd.track()`
     """
 
-    return _runtime._libdrd.drdTrackEnc(enc[0], enc[1], enc[2], ID)
+    return _drdTrackEnc(enc[0], enc[1], enc[2], ID)
 
 
-_runtime._libdrd.drdTrackAllEnc.argtypes = [c_int_ptr, c_byte]
-_runtime._libdrd.drdTrackAllEnc.restype = c_int
+_drdTrackAllEnc = _runtime._libdrd.bind(globals(), 'drdTrackAllEnc')
 
 
 def trackAllEnc(enc: Array[int, int], ID: int = -1):
@@ -2003,15 +1901,13 @@ def trackAllEnc(enc: Array[int, int], ID: int = -1):
     | :func:`forcedimension_core.drd.track()`
     """
 
-    enc_arr = (c_int * MAX_DOF)(
-        enc[0], enc[1], enc[2], enc[3], enc[4], enc[5], enc[6], enc[7]
-    )
+    enc_arr = _scratch.dof_int
+    _copy(enc_arr, enc, MAX_DOF)
 
-    return _runtime._libdrd.drdTrackAllEnc(ct.cast(enc_arr, c_int_ptr), ID)
+    return _drdTrackAllEnc(enc_arr, ID)
 
 
-_runtime._libdrd.drdSetMotRatioMax.argtypes = [c_double, c_byte]
-_runtime._libdrd.drdSetMotRatioMax.restype = c_int
+_drdSetMotRatioMax = _runtime._libdrd.bind(globals(), 'drdSetMotRatioMax')
 
 
 def setMotRatioMax(scale: float, ID: int = -1) -> int:
@@ -2046,11 +1942,10 @@ def setMotRatioMax(scale: float, ID: int = -1) -> int:
     | :func:`forcedimension_core.getMotRatioMax()`
     """
 
-    return _runtime._libdrd.drdSetMotRatioMax(scale, ID)
+    return _drdSetMotRatioMax(scale, ID)
 
 
-_runtime._libdrd.drdGetMotRatioMax.argtypes = [c_byte]
-_runtime._libdrd.drdGetMotRatioMax.restype = c_double
+_drdGetMotRatioMax = _runtime._libdrd.bind(globals(), 'drdGetMotRatioMax')
 
 
 def getMotRatioMax(ID: int = -1) -> float:
@@ -2075,13 +1970,10 @@ def getMotRatioMax(ID: int = -1) -> float:
     | :func:`forcedimension_core.setMotRatioMax()`
     """
 
-    return _runtime._libdrd.drdGetMotRatioMax(ID)
+    return _drdGetMotRatioMax(ID)
 
 
-_runtime._libdrd.drdSetEncMoveParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetEncMoveParam.restype = c_int
+_drdSetEncMoveParam = _runtime._libdrd.bind(globals(), 'drdSetEncMoveParam')
 
 
 def setEncMoveParam(
@@ -2126,13 +2018,10 @@ def setEncMoveParam(
     | :func:`forcedimension_core.setEncTrackParam()`
     """
 
-    return _runtime._libdrd.drdSetEncMoveParam(amax, vmax, jerk, ID)
+    return _drdSetEncMoveParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetEncTrackParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetEncTrackParam.restype = c_int
+_drdSetEncTrackParam = _runtime._libdrd.bind(globals(), 'drdSetEncTrackParam')
 
 
 def setEncTrackParam(
@@ -2176,13 +2065,10 @@ def setEncTrackParam(
     | :func:`forcedimension_core.setEncMoveParam()`
     """
 
-    return _runtime._libdrd.drdSetEncTrackParam(amax, vmax, jerk, ID)
+    return _drdSetEncTrackParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetPosMoveParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetPosMoveParam.restype = c_int
+_drdSetPosMoveParam = _runtime._libdrd.bind(globals(), 'drdSetPosMoveParam')
 
 
 def setPosMoveParam(
@@ -2227,13 +2113,10 @@ def setPosMoveParam(
     | :func:`forcedimension_core.setPosTrackParam()`
     """
 
-    return _runtime._libdrd.drdSetPosMoveParam(amax, vmax, jerk, ID)
+    return _drdSetPosMoveParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetPosTrackParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetPosTrackParam.restype = c_int
+_drdSetPosTrackParam = _runtime._libdrd.bind(globals(), 'drdSetPosTrackParam')
 
 
 def setPosTrackParam(
@@ -2278,13 +2161,10 @@ def setPosTrackParam(
     | :func:`forcedimension_core.setPosMoveParam()`
     """
 
-    return _runtime._libdrd.drdSetPosTrackParam(amax, vmax, jerk, ID)
+    return _drdSetPosTrackParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetRotMoveParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetRotMoveParam.restype = c_int
+_drdSetRotMoveParam = _runtime._libdrd.bind(globals(), 'drdSetRotMoveParam')
 
 
 def setRotMoveParam(
@@ -2329,13 +2209,10 @@ def setRotMoveParam(
     | :func:`forcedimension_core.setRotTrackParam()`
     """
 
-    return _runtime._libdrd.drdSetRotMoveParam(amax, vmax, jerk, ID)
+    return _drdSetRotMoveParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetRotTrackParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetRotTrackParam.restype = c_int
+_drdSetRotTrackParam = _runtime._libdrd.bind(globals(), 'drdSetRotTrackParam')
 
 
 def setRotTrackParam(
@@ -2380,13 +2257,10 @@ def setRotTrackParam(
     | :func:`forcedimension_core.setRotMoveParam()`
     """
 
-    return _runtime._libdrd.drdSetRotTrackParam(amax, vmax, jerk, ID)
+    return _drdSetRotTrackParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetGripMoveParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetGripMoveParam.restype = c_int
+_drdSetGripMoveParam = _runtime._libdrd.bind(globals(), 'drdSetGripMoveParam')
 
 
 def setGripMoveParam(
@@ -2430,13 +2304,12 @@ def setGripMoveParam(
     | :func:`forcedimension_core.setGripTrackParam()`
     """
 
-    return _runtime._libdrd.drdSetGripMoveParam(amax, vmax, jerk, ID)
+    return _drdSetGripMoveParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdSetGripTrackParam.argtypes = [
-    c_double, c_double, c_double, c_byte
-]
-_runtime._libdrd.drdSetGripTrackParam.restype = c_int
+_drdSetGripTrackParam = _runtime._libdrd.bind(
+    globals(), 'drdSetGripTrackParam'
+)
 
 
 def setGripTrackParam(
@@ -2480,13 +2353,10 @@ def setGripTrackParam(
     | :func:`forcedimension_core.setGripMoveParam()`
     """
 
-    return _runtime._libdrd.drdSetGripTrackParam(amax, vmax, jerk, ID)
+    return _drdSetGripTrackParam(amax, vmax, jerk, ID)
 
 
-_runtime._libdrd.drdGetEncMoveParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetEncMoveParam.restype = c_int
+_drdGetEncMoveParam = _runtime._libdrd.bind(globals(), 'drdGetEncMoveParam')
 
 
 def getEncMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2513,19 +2383,14 @@ def getEncMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.setEncTrackParam()`
     | :func:`forcedimension_core.getEncTrackParam()`
     """
-    a_max = c_double()
-    v_max = c_double()
-    jerk_max = c_double()
+    a_max, v_max, jerk_max = _scratch.double3
 
-    err = _runtime._libdrd.drdGetEncMoveParam(a_max, v_max, jerk_max, ID)
+    err = _drdGetEncMoveParam(a_max, v_max, jerk_max, ID)
 
     return v_max.value, a_max.value, jerk_max.value, err
 
 
-_runtime._libdrd.drdGetEncTrackParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetEncTrackParam.restype = c_int
+_drdGetEncTrackParam = _runtime._libdrd.bind(globals(), 'drdGetEncTrackParam')
 
 
 def getEncTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2552,19 +2417,14 @@ def getEncTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getEncMoveParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetEncTrackParam(amax, vmax, jerk, ID)
+    err = _drdGetEncTrackParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdGetPosMoveParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetPosMoveParam.restype = c_int
+_drdGetPosMoveParam = _runtime._libdrd.bind(globals(), 'drdGetPosMoveParam')
 
 
 def getPosMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2592,19 +2452,14 @@ def getPosMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getPosTrackParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetPosMoveParam(amax, vmax, jerk, ID)
+    err = _drdGetPosMoveParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdGetPosTrackParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetPosTrackParam.restype = c_int
+_drdGetPosTrackParam = _runtime._libdrd.bind(globals(), 'drdGetPosTrackParam')
 
 
 def getPosTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2632,19 +2487,14 @@ def getPosTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getPosMoveParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetPosTrackParam(amax, vmax, jerk, ID)
+    err = _drdGetPosTrackParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdGetRotMoveParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetRotMoveParam.restype = c_int
+_drdGetRotMoveParam = _runtime._libdrd.bind(globals(), 'drdGetRotMoveParam')
 
 
 def getRotMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2672,19 +2522,14 @@ def getRotMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getRotTrackParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetRotMoveParam(amax, vmax, jerk, ID)
+    err = _drdGetRotMoveParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdGetRotTrackParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetRotTrackParam.restype = c_int
+_drdGetRotTrackParam = _runtime._libdrd.bind(globals(), 'drdGetRotTrackParam')
 
 
 def getRotTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2712,19 +2557,14 @@ def getRotTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getRotMoveParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetRotTrackParam(amax, vmax, jerk, ID)
+    err = _drdGetRotTrackParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdGetGripMoveParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetGripMoveParam.restype = c_int
+_drdGetGripMoveParam = _runtime._libdrd.bind(globals(), 'drdGetGripMoveParam')
 
 
 def getGripMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2751,19 +2591,16 @@ def getGripMoveParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getGripTrackParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetGripMoveParam(amax, vmax, jerk, ID)
+    err = _drdGetGripMoveParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdGetGripTrackParam.argtypes = [
-    c_double_ptr, c_double_ptr, c_double_ptr, c_byte
-]
-_runtime._libdrd.drdGetGripTrackParam.restype = c_int
+_drdGetGripTrackParam = _runtime._libdrd.bind(
+    globals(), 'drdGetGripTrackParam'
+)
 
 
 def getGripTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
@@ -2790,17 +2627,14 @@ def getGripTrackParam(ID: int = -1) -> Tuple[float, float, float, int]:
     | :func:`forcedimension_core.getGripMoveParam()`
     """
 
-    amax = c_double()
-    vmax = c_double()
-    jerk = c_double()
+    amax, vmax, jerk = _scratch.double3
 
-    err = _runtime._libdrd.drdGetGripTrackParam(amax, vmax, jerk, ID)
+    err = _drdGetGripTrackParam(amax, vmax, jerk, ID)
 
     return vmax.value, amax.value, jerk.value, err
 
 
-_runtime._libdrd.drdWaitForTick.argtypes = [c_byte]
-_runtime._libdrd.drdWaitForTick.restype = None
+_drdWaitForTick = _runtime._libdrd.bind(globals(), 'drdWaitForTick')
 
 
 def waitForTick(ID: int = -1):
@@ -2815,4 +2649,15 @@ def waitForTick(ID: int = -1):
     :raises ctypes.ArgumentError:
         If ``ID`` is not convertible to a C char.
     """
-    _runtime._libdrd.drdWaitForTick(ID)
+    _drdWaitForTick(ID)
+
+
+def __getattr__(name: str):
+    # Generating the checked functions takes a while, so it is only done
+    # on first use.
+    if name == 'checked':
+        import forcedimension_core.drd.checked as checked
+
+        return checked
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
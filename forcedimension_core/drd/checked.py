@@ -0,0 +1,78 @@
+"""
+The functions of :mod:`forcedimension_core.drd` that report failure by
+returning -1, raising the matching
+:class:`forcedimension_core.dhd.adaptors.DHDError` instead.
+
+.. code-block:: python
+
+    from forcedimension_core.drd import checked
+
+    ID = checked.open()
+    checked.autoInit(ID)
+    checked.start(ID)
+    checked.moveToPos((0., 0., 0.), True, ID)  # raises e.g. DHDErrorTimeout
+
+Every other value, including
+:data:`forcedimension_core.constants.TIMEGUARD`, is returned as is. A
+successful call costs the same as the unchecked function (see
+:mod:`forcedimension_core._checked`).
+
+The functions are generated when the module is first imported, e.g. by
+accessing ``forcedimension_core.drd.checked``, so importing
+:mod:`forcedimension_core.drd` does not pay for them.
+"""
+
+import forcedimension_core.drd as _drd
+from forcedimension_core._checked import check_module as _check_module
+
+# The functions returning -1 on failure.
+NAMES = (
+    'autoInit',
+    'checkInit',
+    'close',
+    'enableFilter',
+    'getCtrlFreq',
+    'getDeviceID',
+    'getPositionAndOrientation',
+    'getVelocity',
+    'hold',
+    'lock',
+    'moveTo',
+    'moveToAllEnc',
+    'moveToEnc',
+    'moveToGrip',
+    'moveToPos',
+    'moveToRot',
+    'open',
+    'openID',
+    'precisionInit',
+    'regulateGrip',
+    'regulatePos',
+    'regulateRot',
+    'setDevice',
+    'setEncDGain',
+    'setEncIGain',
+    'setEncMoveParam',
+    'setEncPGain',
+    'setEncTrackParam',
+    'setForceAndTorqueAndGripperForce',
+    'setForceAndWristJointTorquesAndGripperForce',
+    'setGripMoveParam',
+    'setGripTrackParam',
+    'setMotRatioMax',
+    'setPosMoveParam',
+    'setPosTrackParam',
+    'setPriorities',
+    'setRotMoveParam',
+    'setRotTrackParam',
+    'start',
+    'stop',
+    'track',
+    'trackAllEnc',
+    'trackEnc',
+    'trackGrip',
+    'trackPos',
+    'trackRot',
+)
+
+globals().update(_check_module(_drd, NAMES))
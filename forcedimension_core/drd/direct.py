@@ -1,9 +1,16 @@
-from ctypes import c_byte, c_double, c_int
+from ctypes import c_double, c_int
 
 import forcedimension_core.runtime as _runtime
-from forcedimension_core.typing import (
-    SupportsPtr, SupportsPtrs3, c_int_ptr
+from forcedimension_core.typing import SupportsPtr, SupportsPtrs3
+
+
+_drdGetPositionAndOrientation = _runtime._libdrd.bind(
+    globals(), 'drdGetPositionAndOrientation'
 )
+_drdGetVelocity = _runtime._libdrd.bind(globals(), 'drdGetVelocity')
+_drdMoveTo = _runtime._libdrd.bind(globals(), 'drdMoveTo')
+_drdMoveToAllEnc = _runtime._libdrd.bind(globals(), 'drdMoveToAllEnc')
+_drdTrack = _runtime._libdrd.bind(globals(), 'drdTrack')
 
 
 def getPositionAndOrientation(
@@ -92,7 +99,7 @@ def getPositionAndOrientation(
     | :class:`forcedimension_core.containers.numpy.Mat3x3`
     """
 
-    return _runtime._libdrd.drdGetPositionAndOrientation(
+    return _drdGetPositionAndOrientation(
         *p_out.ptrs, *o_out.ptrs, pg_out, matrix_out.ptr, ID
     )
 
@@ -167,7 +174,7 @@ def getVelocity(
     | :class:`forcedimension_core.containers.numpy.Vec3`
     """
 
-    return _runtime._libdrd.drdGetVelocity(*v_out.ptrs, *w_out.ptrs, vg_out, ID)
+    return _drdGetVelocity(*v_out.ptrs, *w_out.ptrs, vg_out, ID)
 
 
 def moveTo(pos: SupportsPtr[c_double], block: bool, ID: int = -1):
@@ -224,7 +231,7 @@ def moveTo(pos: SupportsPtr[c_double], block: bool, ID: int = -1):
 
     """
 
-    return _runtime._libdrd.drdMoveTo(pos.ptr, block, ID)
+    return _drdMoveTo(pos.ptr, block, ID)
 
 
 def moveToAllEnc(enc: SupportsPtr[c_int], block: bool, ID: int = -1):
@@ -274,7 +281,7 @@ def moveToAllEnc(enc: SupportsPtr[c_int], block: bool, ID: int = -1):
     | :class:`forcedimension_core.containers.numpy.DOFInt`
     | :func:`forcedimension_core.drd.direct.moveTo()`
     """
-    return _runtime._libdrd.drdMoveToAllEnc(enc.ptr, block, ID)
+    return _drdMoveToAllEnc(enc.ptr, block, ID)
 
 
 def track(pos: SupportsPtr[c_double], ID: int = -1):
@@ -321,11 +328,10 @@ def track(pos: SupportsPtr[c_double], ID: int = -1):
     | :func:`forcedimension_core.drd.direct.trackAllEnc()`
     """
 
-    return _runtime._libdrd.drdTrack(pos.ptr, ID)
+    return _drdTrack(pos.ptr, ID)
 
 
-_runtime._libdrd.drdTrackAllEnc.argtypes = [c_int_ptr, c_byte]
-_runtime._libdrd.drdTrackAllEnc.restype = c_int
+_drdTrackAllEnc = _runtime._libdrd.bind(globals(), 'drdTrackAllEnc')
 
 
 def trackAllEnc(enc: SupportsPtr[c_int], ID: int = -1):
@@ -365,4 +371,4 @@ def trackAllEnc(enc: SupportsPtr[c_int], ID: int = -1):
     | :class:`forcedimension_core.containers.numpy.DOFInt`
     | :func:`forcedimension_core.drd.direct.track()`
     """
-    return _runtime._libdrd.drdTrackAllEnc(enc.ptr, ID)
+    return _drdTrackAllEnc(enc.ptr, ID)
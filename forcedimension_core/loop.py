@@ -0,0 +1,391 @@
+"""
+A fixed-rate scheduler for haptic loops.
+
+A :class:`Loop` calls a function at a target frequency (e.g. 1, 4 or
+8 kHz) until it returns a truthy value or :meth:`Loop.stop()` is called.
+Between ticks it either sleeps with
+:func:`forcedimension_core.dhd.os_independent.sleep()` and busy-waits on
+:func:`forcedimension_core.dhd.os_independent.getTime()` for the last part
+of the period, or, when the robotic SDK regulates the device, waits for
+the next tick of its control loop with
+:func:`forcedimension_core.drd.waitForTick()`.
+
+Every loop keeps :class:`LoopStats` with fixed-size histograms of the
+period, the jitter and the overruns. Updating them costs a few arithmetic
+operations per tick and allocates nothing.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Callable, Optional
+
+import forcedimension_core.drd as drd
+from forcedimension_core.dhd import os_independent
+
+
+class OverrunPolicy(IntEnum):
+    """
+    What a :class:`Loop` does when a tick finishes after the deadline of
+    the next one.
+    """
+
+    #: Drop the ticks that were missed and wait for the next deadline on
+    #: the original schedule. The loop stays in phase but runs fewer ticks.
+    SKIP = 0
+
+    #: Run the missed ticks back to back until the loop is on schedule
+    #: again. The loop runs every tick but bursts after an overrun.
+    CATCH_UP = 1
+
+    #: Run the next tick immediately and schedule the following ones from
+    #: there. The loop drifts in phase by the length of the overrun.
+    RESET = 2
+
+
+class LoopStats:
+    """
+    Timing statistics of a :class:`Loop`.
+
+    The histograms are :class:`array.array` of counts. Bin ``i`` of
+    :attr:`period_hist` and :attr:`jitter_hist` counts the ticks whose
+    value was in ``[i * resolution, (i + 1) * resolution)`` (in [s]). Bin
+    ``i`` of :attr:`overrun_hist` counts the overruns that missed ``i + 1``
+    deadlines. The last bin of each histogram also counts every value past
+    it.
+
+    :param float resolution:
+        The width of the bins of the period and jitter histograms (in
+        [s]).
+
+    :param int bins:
+        The number of bins of each histogram.
+    """
+
+    def __init__(self, resolution: float, bins: int):
+        if resolution <= 0.:
+            raise ValueError("resolution must be positive.")
+
+        if bins <= 0:
+            raise ValueError("bins must be positive.")
+
+        self._resolution = resolution
+        self._bins = bins
+
+        #: Histogram of the time between the start of consecutive ticks.
+        self.period_hist = array('Q', bytes(8 * bins))
+
+        #: Histogram of the absolute difference between the time between
+        #: the start of consecutive ticks and the target period.
+        self.jitter_hist = array('Q', bytes(8 * bins))
+
+        #: Histogram of the number of deadlines missed by each overrun.
+        self.overrun_hist = array('Q', bytes(8 * bins))
+
+        self.reset()
+
+    @property
+    def resolution(self) -> float:
+        """
+        The width of the bins of the period and jitter histograms (in
+        [s]).
+        """
+
+        return self._resolution
+
+    @property
+    def bins(self) -> int:
+        """
+        The number of bins of each histogram.
+        """
+
+        return self._bins
+
+    def reset(self):
+        """
+        Clear the statistics.
+        """
+
+        #: The number of ticks run.
+        self.ticks = 0
+
+        #: The number of ticks that finished after the next deadline.
+        self.overruns = 0
+
+        #: The number of deadlines missed by all the overruns.
+        self.missed = 0
+
+        #: The shortest time between the start of consecutive ticks (in
+        #: [s]).
+        self.min_period = float('inf')
+
+        #: The longest time between the start of consecutive ticks (in
+        #: [s]).
+        self.max_period = 0.
+
+        #: The largest jitter (in [s]).
+        self.max_jitter = 0.
+
+        self._period_sum = 0.
+        self._jitter_sum = 0.
+
+        for hist in (self.period_hist, self.jitter_hist, self.overrun_hist):
+            for i in range(self._bins):
+                hist[i] = 0
+
+    @property
+    def mean_period(self) -> float:
+        """
+        The mean time between the start of consecutive ticks (in [s]), or
+        NaN if fewer than two ticks were run.
+        """
+
+        if self.ticks < 2:
+            return float('nan')
+
+        return self._period_sum / (self.ticks - 1)
+
+    @property
+    def mean_jitter(self) -> float:
+        """
+        The mean jitter (in [s]), or NaN if fewer than two ticks were run.
+        """
+
+        if self.ticks < 2:
+            return float('nan')
+
+        return self._jitter_sum / (self.ticks - 1)
+
+    def _record_period(self, period: float, jitter: float):
+        last = self._bins - 1
+
+        self._period_sum += period
+        self._jitter_sum += jitter
+
+        if period < self.min_period:
+            self.min_period = period
+
+        if period > self.max_period:
+            self.max_period = period
+
+        if jitter > self.max_jitter:
+            self.max_jitter = jitter
+
+        self.period_hist[min(int(period / self._resolution), last)] += 1
+        self.jitter_hist[min(int(jitter / self._resolution), last)] += 1
+
+    def _record_overrun(self, missed: int):
+        self.overruns += 1
+        self.missed += missed
+        self.overrun_hist[min(missed, self._bins) - 1] += 1
+
+
+class Loop:
+    """
+    Calls ``func`` at ``frequency`` until it returns a truthy value or
+    :meth:`stop()` is called.
+
+    .. code-block:: python
+
+        def tick():
+            dhd.direct.getPosition(pos, ID)
+            ...
+            dhd.setForce(f, ID)
+
+            return dhd.getButton(0, ID)
+
+        loop = Loop(tick, 4000.)
+        loop.run()
+
+        print(loop.stats.mean_period, loop.stats.max_jitter)
+
+    :param Callable[[], Any] func:
+        The function to call every tick.
+
+    :param float frequency:
+        The target frequency (in [Hz]).
+
+    :param OverrunPolicy policy:
+        What to do when a tick finishes after the deadline of the next one.
+
+    :param float spin:
+        How long before each deadline to stop sleeping and busy-wait
+        instead (in [s]). Sleeps are only as precise as the scheduler of
+        the OS, so this should exceed its typical oversleep. 0 sleeps
+        until the deadline, ``float('inf')`` always busy-waits.
+
+    :param Optional[int] tick_ID:
+        If not ``None``, wait for the next tick of the robotic control loop
+        of that device (see :func:`forcedimension_core.drd.waitForTick()`)
+        instead of sleeping. The control loop then sets the rate and
+        ``frequency`` is only used for the statistics. ``policy`` has no
+        effect.
+
+    :param Optional[float] resolution:
+        The width of the bins of the period and jitter histograms (in
+        [s]). Defaults to 1/32 of the period.
+
+    :param int bins:
+        The number of bins of each histogram.
+
+    :param Callable[[], float] clock:
+        The monotonic clock (in [s]).
+
+    :param Callable[[float], None] sleep:
+        The function to sleep with (in [s]).
+
+    :raises ValueError:
+        If ``frequency`` is not positive or ``spin`` is negative.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], object],
+        frequency: float,
+        policy: OverrunPolicy = OverrunPolicy.SKIP,
+        spin: float = 2e-4,
+        tick_ID: Optional[int] = None,
+        resolution: Optional[float] = None,
+        bins: int = 64,
+        clock: Callable[[], float] = os_independent.getTime,
+        sleep: Callable[[float], None] = os_independent.sleep
+    ):
+        if frequency <= 0.:
+            raise ValueError("frequency must be positive.")
+
+        if spin < 0.:
+            raise ValueError("spin must not be negative.")
+
+        self._func = func
+        self._period = 1. / frequency
+        self._policy = OverrunPolicy(policy)
+        self._spin = spin
+        self._tick_ID = tick_ID
+        self._clock = clock
+        self._sleep = sleep
+        self._running = False
+
+        if resolution is None:
+            resolution = self._period / 32
+
+        #: The timing statistics of the loop. They accumulate over calls to
+        #: :meth:`run()` until reset.
+        self.stats = LoopStats(resolution, bins)
+
+    @property
+    def period(self) -> float:
+        """
+        The target period (in [s]).
+        """
+
+        return self._period
+
+    @property
+    def frequency(self) -> float:
+        """
+        The target frequency (in [Hz]).
+        """
+
+        return 1. / self._period
+
+    @property
+    def policy(self) -> OverrunPolicy:
+        """
+        What the loop does when a tick finishes after the deadline of the
+        next one.
+        """
+
+        return self._policy
+
+    @property
+    def running(self) -> bool:
+        """
+        ``True`` while :meth:`run()` is looping.
+        """
+
+        return self._running
+
+    def stop(self):
+        """
+        Make :meth:`run()` return after the current tick. Can be called
+        from the loop function or from another thread.
+        """
+
+        self._running = False
+
+    def run(self, ticks: Optional[int] = None):
+        """
+        Run the loop until the loop function returns a truthy value,
+        :meth:`stop()` is called, or ``ticks`` ticks were run.
+
+        The first tick runs immediately.
+
+        :param Optional[int] ticks:
+            The maximum number of ticks to run. Runs indefinitely if
+            ``None``.
+        """
+
+        func = self._func
+        clock = self._clock
+        period = self._period
+        stats = self.stats
+        record_period = stats._record_period
+        tick = self._tick_ID is not None
+        wait = self._wait_for_tick if tick else self._wait
+
+        self._running = True
+        end = None if ticks is None else stats.ticks + ticks
+        deadline = clock()
+        last = None
+
+        try:
+            while self._running and stats.ticks != end:
+                wait(deadline)
+                start = clock()
+
+                if tick:
+                    # The control loop keeps the schedule, so a tick is
+                    # only late relative to its own start.
+                    deadline = start
+
+                if last is not None:
+                    elapsed = start - last
+                    record_period(elapsed, abs(elapsed - period))
+
+                last = start
+                stats.ticks += 1
+
+                if func():
+                    break
+
+                deadline += period
+
+                if (late := clock() - deadline) >= 0.:
+                    deadline = self._overrun(deadline, late)
+        finally:
+            self._running = False
+
+    def _overrun(self, deadline: float, late: float) -> float:
+        # The deadline of the next tick has passed, and so have those of
+        # the ticks after it that fit in the time it is late by.
+        missed = int(late / self._period) + 1
+        self.stats._record_overrun(missed)
+
+        if self._policy is OverrunPolicy.SKIP:
+            return deadline + missed * self._period
+
+        if self._policy is OverrunPolicy.RESET:
+            return deadline + late
+
+        return deadline
+
+    def _wait(self, deadline: float):
+        clock = self._clock
+
+        if (left := deadline - clock() - self._spin) > 0.:
+            self._sleep(left)
+
+        while clock() < deadline:
+            pass
+
+    def _wait_for_tick(self, deadline: float):
+        drd.waitForTick(self._tick_ID)
@@ -0,0 +1,254 @@
+"""
+A background thread that polls the state of a device and publishes it to
+other threads.
+
+Only the :class:`Poller` thread talks to the device. It reads the whole
+state with :func:`forcedimension_core.dhd.direct.getState()`, during which
+ctypes releases the GIL, into one of two
+:class:`forcedimension_core.containers.DeviceState` buffers and publishes
+it by bumping a sequence number. Readers copy the latest published buffer
+and check the sequence number afterwards, retrying in the rare case the
+poller came back around to that buffer while they were copying (a
+seqlock). The poller never waits for readers and readers never take a
+lock.
+"""
+
+import ctypes as ct
+import threading
+from array import array
+from typing import NamedTuple, Optional
+
+import forcedimension_core.containers as containers
+import forcedimension_core.dhd.direct as direct
+from forcedimension_core.dhd import os_independent
+from forcedimension_core.loop import Loop
+
+
+class Snapshot(NamedTuple):
+    """
+    Identifies a state read from a :class:`Poller`.
+    """
+
+    #: The number of states the poller had published when this one was,
+    #: counting it.
+    sequence: int
+
+    #: When the state was read (in [s], see
+    #: :func:`forcedimension_core.dhd.os_independent.getTime()`).
+    time: float
+
+
+class Poller:
+    """
+    Polls the state of a device in a background thread.
+
+    .. code-block:: python
+
+        with Poller(ID) as poller:
+            state = containers.DeviceState()
+
+            while True:
+                snapshot = poller.read(state)
+                draw(state.position, poller.age(snapshot))
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param Optional[float] frequency:
+        The rate to poll at (in [Hz]) with a
+        :class:`forcedimension_core.loop.Loop`. Polls as fast as the device
+        allows if ``None``.
+    """
+
+    def __init__(self, ID: int = -1, frequency: Optional[float] = None):
+        self._ID = ID
+        self._frequency = frequency
+        self._states = (containers.DeviceState(), containers.DeviceState())
+        self._times = array('d', (0., 0.))
+        self._sequence = 0
+        self._begun = 0
+        self._errors = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[Loop] = None
+        self._started = 0.
+        self._stopped: Optional[float] = None
+
+    @property
+    def ID(self) -> int:
+        return self._ID
+
+    @property
+    def sequence(self) -> int:
+        """
+        The number of states published.
+        """
+
+        return self._sequence
+
+    @property
+    def errors(self) -> int:
+        """
+        The number of polls that failed. Failed polls publish nothing.
+        """
+
+        return self._errors
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def loop(self) -> Optional[Loop]:
+        """
+        The loop polling at a fixed rate, with its timing statistics.
+        ``None`` if the poller polls as fast as it can.
+        """
+
+        return self._loop
+
+    @property
+    def rate(self) -> float:
+        """
+        The average rate states were published at since the poller was
+        started (in [Hz]), or NaN if it never was.
+        """
+
+        if self._sequence == 0:
+            return float('nan')
+
+        end = os_independent.getTime() if self._stopped is None else (
+            self._stopped
+        )
+
+        return self._sequence / (end - self._started)
+
+    def start(self):
+        """
+        Start polling in a new daemon thread.
+
+        :raises RuntimeError:
+            If the poller is already running.
+        """
+
+        if self._running:
+            raise RuntimeError("The poller is already running.")
+
+        self._running = True
+        self._stopped = None
+        self._started = os_independent.getTime()
+
+        if self._frequency is not None:
+            self._loop = Loop(self._poll, self._frequency)
+
+        self._thread = threading.Thread(
+            target=self._run, name=f'Poller-{self._ID}', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop polling and wait for the thread to exit.
+
+        :param Optional[float] timeout:
+            How long to wait for the thread (in [s]). Waits indefinitely if
+            ``None``.
+        """
+
+        self._running = False
+
+        if self._loop is not None:
+            self._loop.stop()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        if self._stopped is None:
+            self._stopped = os_independent.getTime()
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _run(self):
+        try:
+            if self._loop is not None:
+                self._loop.run()
+                return
+
+            poll = self._poll
+
+            while self._running:
+                poll()
+        finally:
+            self._running = False
+
+    def _poll(self):
+        # Readers copy the buffer of the last published state, so this one
+        # is free unless a reader is more than a whole poll behind, which
+        # it notices with _begun.
+        self._begun = begun = self._sequence + 1
+        i = begun & 1
+
+        if direct.getState(self._states[i], self._ID) < 0:
+            self._errors += 1
+        else:
+            self._times[i] = os_independent.getTime()
+            self._sequence = begun
+
+        return not self._running
+
+    def read(self, out: containers.DeviceState) -> Snapshot:
+        """
+        Copy the latest published state into ``out``. Never blocks the
+        poller.
+
+        :param DeviceState out:
+            The state to copy into, either a
+            :class:`forcedimension_core.containers.DeviceState` or a
+            :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+        :raises RuntimeError:
+            If no state was published yet.
+
+        :returns:
+            Which state was copied and when it was read.
+        """
+
+        size = ct.sizeof(containers._state.DeviceStateData)
+        dst = ct.addressof(out.data)
+
+        while True:
+            if (sequence := self._sequence) == 0:
+                raise RuntimeError("No state was published yet.")
+
+            i = sequence & 1
+            state = self._states[i]
+            ct.memmove(dst, ct.addressof(state.data), size)
+            capabilities = state._capabilities
+            time = self._times[i]
+
+            # The buffer is only rewritten from the second poll begun
+            # after it was published.
+            if self._begun - sequence < 2:
+                out._capabilities = capabilities
+                return Snapshot(sequence, time)
+
+    def age(self, snapshot: Snapshot) -> float:
+        """
+        How long ago the state of ``snapshot`` was read (in [s]).
+        """
+
+        return os_independent.getTime() - snapshot.time
+
+    def behind(self, snapshot: Snapshot) -> int:
+        """
+        How many states were published after the one of ``snapshot``.
+        """
+
+        return self._sequence - snapshot.sequence
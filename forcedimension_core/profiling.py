@@ -0,0 +1,346 @@
+"""
+Latency instrumentation of the calls into the library.
+
+While a :class:`Profiler` is enabled with
+:func:`forcedimension_core.runtime.enable_profiling()`, every symbol of
+libdhd/libdrd the bindings call is replaced by a wrapper timing it with
+:func:`time.perf_counter_ns()`. Each symbol keeps :class:`FunctionStats`: a
+count, the total, minimum and maximum latency and a log-linear histogram
+like HdrHistogram's, whose buckets are never wider than a fixed fraction
+of their lower bound. Disabling the profiler puts the library functions
+back, so the bindings pay nothing for instrumentation they do not use.
+
+.. code-block:: python
+
+    profiler = runtime.enable_profiling()
+    run_loop()
+    runtime.disable_profiling()
+
+    for name, stats in profiler.stats.items():
+        print(name, stats.count, stats.mean, stats.percentile(99.))
+
+    profiler.export_json('profile.json')
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+from array import array
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+
+class FunctionStats:
+    """
+    The latencies of the calls to one symbol of the library.
+
+    Latencies are counted in a histogram of ``2 ** precision`` buckets of
+    1 ns followed by ``2 ** (precision - 1)`` buckets per power of two, so
+    a bucket is never wider than ``2 ** (1 - precision)`` times its lower
+    bound. Latencies past ``2 ** 40`` ns (about 18 minutes) are counted in
+    the last bucket.
+
+    :param str name:
+        The name of the symbol, e.g. ``'dhdGetPosition'``.
+
+    :param int precision:
+        The number of significant bits of the histogram buckets.
+    """
+
+    def __init__(self, name: str, precision: int = 5):
+        if precision < 1:
+            raise ValueError("precision must be positive.")
+
+        self._name = name
+        self._precision = precision
+        self._lock = threading.Lock()
+
+        buckets = _index(1 << 40, precision) + 1
+
+        #: The number of calls per bucket (see :meth:`bucket()`).
+        self.hist = array('Q', bytes(8 * buckets))
+
+        self.reset()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def precision(self) -> int:
+        """
+        The number of significant bits of the histogram buckets.
+        """
+
+        return self._precision
+
+    def reset(self):
+        """
+        Clear the statistics.
+        """
+
+        with self._lock:
+            #: The number of calls.
+            self.count = 0
+
+            #: The total latency (in [ns]).
+            self.total_ns = 0
+
+            #: The lowest latency (in [ns]), 0 if there were no calls.
+            self.min_ns = 0
+
+            #: The highest latency (in [ns]).
+            self.max_ns = 0
+
+            for i in range(len(self.hist)):
+                self.hist[i] = 0
+
+    @property
+    def total(self) -> float:
+        """
+        The total latency (in [s]).
+        """
+
+        return self.total_ns / 1e9
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean latency (in [s]), or NaN if there were no calls.
+        """
+
+        if self.count == 0:
+            return float('nan')
+
+        return self.total_ns / 1e9 / self.count
+
+    @property
+    def min(self) -> float:
+        """
+        The lowest latency (in [s]), or NaN if there were no calls.
+        """
+
+        return self.min_ns / 1e9 if self.count else float('nan')
+
+    @property
+    def max(self) -> float:
+        """
+        The highest latency (in [s]), or NaN if there were no calls.
+        """
+
+        return self.max_ns / 1e9 if self.count else float('nan')
+
+    def bucket(self, i: int) -> Tuple[int, int]:
+        """
+        Get the latencies counted in bucket ``i`` of :attr:`hist`, as a
+        half-open range (in [ns]).
+        """
+
+        lower = _lower(i, self._precision)
+
+        return lower, _lower(i + 1, self._precision)
+
+    def percentile(self, q: float) -> float:
+        """
+        Get the latency (in [s]) that ``q`` percent of the calls did not
+        exceed, to the precision of the histogram. NaN if there were no
+        calls.
+
+        :param float q:
+            The percentile, from 0 to 100.
+        """
+
+        if not 0. <= q <= 100.:
+            raise ValueError("q must be between 0 and 100.")
+
+        if (count := self.count) == 0:
+            return float('nan')
+
+        rank = max(1, -(-count * q // 100))
+        seen = 0
+
+        for i, n in enumerate(self.hist):
+            if (seen := seen + n) >= rank:
+                # The highest latency the bucket can hold, but no more
+                # than was seen.
+                return min(self.bucket(i)[1] - 1, self.max_ns) / 1e9
+
+        return self.max_ns / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the statistics as a JSON-serializable dictionary, with the
+        latencies in [ns] and only the buckets that counted calls.
+        """
+
+        return {
+            'count': self.count,
+            'total_ns': self.total_ns,
+            'min_ns': self.min_ns,
+            'max_ns': self.max_ns,
+            'buckets': [
+                [*self.bucket(i), n] for i, n in enumerate(self.hist) if n
+            ],
+        }
+
+    def _record(self, ns: int):
+        with self._lock:
+            if self.count == 0 or ns < self.min_ns:
+                self.min_ns = ns
+
+            if ns > self.max_ns:
+                self.max_ns = ns
+
+            self.count += 1
+            self.total_ns += ns
+            i = _index(ns, self._precision)
+            self.hist[min(i, len(self.hist) - 1)] += 1
+
+
+def _index(ns: int, precision: int) -> int:
+    if (shift := ns.bit_length() - precision) <= 0:
+        return ns
+
+    # The top `precision` bits of ns, past the first half-range.
+    half = 1 << (precision - 1)
+
+    return 2 * half + (shift - 1) * half + (ns >> shift) - half
+
+
+def _lower(i: int, precision: int) -> int:
+    if i < (1 << precision):
+        return i
+
+    half = 1 << (precision - 1)
+    shift, rem = divmod(i - 2 * half, half)
+
+    return (half + rem) << (shift + 1)
+
+
+class Profiler:
+    """
+    Collects the latencies of the calls into the library. Enable it with
+    :func:`forcedimension_core.runtime.enable_profiling()`.
+
+    :param int trace:
+        The number of the most recent calls to keep as trace events for
+        :meth:`export_chrome_trace()`. 0 keeps none.
+
+    :param int precision:
+        The number of significant bits of the histogram buckets (see
+        :class:`FunctionStats`).
+    """
+
+    def __init__(self, trace: int = 0, precision: int = 5):
+        if trace < 0:
+            raise ValueError("trace must not be negative.")
+
+        self._precision = precision
+        self._lock = threading.Lock()
+
+        #: The statistics of each symbol called, by name.
+        self.stats: Dict[str, FunctionStats] = {}
+
+        #: The most recent calls as ``(name, start, duration, thread)``,
+        #: with times in [ns] of :func:`time.perf_counter_ns()`.
+        self.events: Optional[Deque[Tuple[str, int, int, int]]] = (
+            collections.deque(maxlen=trace) if trace else None
+        )
+
+    def reset(self):
+        """
+        Clear the statistics and trace events.
+        """
+
+        for stats in list(self.stats.values()):
+            stats.reset()
+
+        if self.events is not None:
+            self.events.clear()
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Get a function that calls ``func`` and records its latency as that
+        of the symbol ``name``.
+        """
+
+        with self._lock:
+            if (stats := self.stats.get(name)) is None:
+                stats = self.stats[name] = FunctionStats(name, self._precision)
+
+        record = stats._record
+        clock = time.perf_counter_ns
+
+        if (events := self.events) is None:
+            def profiled(*args):
+                start = clock()
+
+                try:
+                    return func(*args)
+                finally:
+                    record(clock() - start)
+        else:
+            append = events.append
+            get_ident = threading.get_ident
+
+            def profiled(*args):
+                start = clock()
+
+                try:
+                    return func(*args)
+                finally:
+                    duration = clock() - start
+                    record(duration)
+                    append((name, start, duration, get_ident()))
+
+        profiled.__name__ = name
+        profiled.__wrapped__ = func  # type: ignore
+
+        return profiled
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the statistics of every symbol called as a JSON-serializable
+        dictionary (see :meth:`FunctionStats.to_dict()`).
+        """
+
+        return {
+            name: stats.to_dict()
+            for name, stats in sorted(self.stats.items()) if stats.count
+        }
+
+    def export_json(self, path: str):
+        """
+        Write the statistics of every symbol called to ``path`` as JSON.
+        """
+
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def export_chrome_trace(self, path: str):
+        """
+        Write the trace events to ``path`` in the trace event format of
+        Chrome, which ``chrome://tracing`` and Perfetto open.
+
+        :raises RuntimeError:
+            If the profiler does not keep trace events.
+        """
+
+        if self.events is None:
+            raise RuntimeError("The profiler does not keep trace events.")
+
+        pid = os.getpid()
+
+        with open(path, 'w') as file:
+            json.dump({
+                'displayTimeUnit': 'ns',
+                'traceEvents': [
+                    {
+                        'name': name, 'cat': name[:3], 'ph': 'X',
+                        'ts': start / 1000, 'dur': duration / 1000,
+                        'pid': pid, 'tid': tid
+                    }
+                    for name, start, duration, tid in list(self.events)
+                ],
+            }, file)
@@ -0,0 +1,357 @@
+"""
+A stand-in for libdhd and libdrd that replays recorded telemetry.
+
+:class:`ReplayLibrary` is a :class:`forcedimension_core.virtual.VirtualLibrary`
+whose devices follow recordings made with
+:class:`forcedimension_core.telemetry.Recorder` instead of a dynamics model.
+Position, orientation, velocities, gripper, buttons, joint angles, encoders
+and status are served from the memory-mapped recording at the replay time,
+and the most recent force commands are captured in
+:attr:`ReplayLibrary.commands` so the output of a controller can be diffed
+between runs.
+
+The replay time either follows the wall clock, scaled by ``speed``, or, if
+``speed`` is ``None``, is simulated: it only advances when the controller
+sleeps (see :func:`forcedimension_core.dhd.os_independent.sleep()`) and by
+``tick`` each time it is read. A controller driven by a
+:class:`forcedimension_core.loop.Loop` then replays deterministically and as
+fast as it can compute, e.g. in CI.
+
+Select it with the ``FORCEDIM_BACKEND=replay`` environment variable before
+importing the package, or install one explicitly::
+
+    from forcedimension_core import runtime
+    from forcedimension_core.replay import ReplayLibrary
+
+    lib = ReplayLibrary(['session.fdt'], speed=None)
+    runtime.install(lib)
+
+When selected through the environment, the library is configured from:
+
+- ``FORCEDIM_REPLAY_LOGS``: the recordings, one per device, separated by
+  :data:`os.pathsep`.
+- ``FORCEDIM_REPLAY_DEVICES``: comma separated
+  :class:`forcedimension_core.constants.DeviceType` names, one per
+  recording (default ``OMEGA7_RIGHT``).
+- ``FORCEDIM_REPLAY_SPEED``: the speed, or ``sim`` for simulated time
+  (default 1).
+- ``FORCEDIM_REPLAY_COMMANDS``: the number of force commands to keep
+  (default 100000, 0 to capture none).
+"""
+
+import collections
+import math
+import os
+import threading
+import time
+from typing import (
+    Any, Callable, Deque, List, Mapping, NamedTuple, Optional, Sequence,
+    Tuple
+)
+
+from forcedimension_core import telemetry
+from forcedimension_core.constants import MAX_STATUS, DeviceType
+from forcedimension_core.virtual import VirtualDevice, VirtualLibrary
+
+
+class Command(NamedTuple):
+    """
+    A force command captured by a :class:`ReplayLibrary`.
+    """
+
+    #: The replay time the command was sent at (in [s]).
+    time: float
+
+    #: The index of the device.
+    device: int
+
+    #: The symbol called, e.g. ``'dhdSetForce'``.
+    name: str
+
+    #: The arguments, without the device ID.
+    args: Tuple[Any, ...]
+
+
+class ReplayDevice(VirtualDevice):
+    """
+    A device whose state follows a recording.
+
+    :param Any records:
+        The records, as returned by
+        :func:`forcedimension_core.telemetry.load()`.
+
+    :param Callable[[], float] clock:
+        The replay time (in [s]) relative to the first record.
+
+    :param DeviceType devtype:
+        The type of device that was recorded.
+
+    :param int serial:
+        The serial number reported by the device.
+    """
+
+    def __init__(
+        self,
+        records: Any,
+        clock: Callable[[], float],
+        devtype: DeviceType = DeviceType.OMEGA7_RIGHT,
+        serial: int = 0
+    ):
+        super().__init__(devtype, serial)
+
+        if len(records) == 0:
+            raise ValueError("The recording is empty.")
+
+        self.records = records
+        self._times = records['time']
+        self._start = float(self._times[0])
+
+        # The records are a NumPy array, so searching needs no import.
+        self._search = self._times.searchsorted
+        self._clock = clock
+        self._index = -1
+        self._record: Any = None
+
+        self.update()
+
+    @property
+    def index(self) -> int:
+        """
+        The index of the record being replayed.
+        """
+
+        return self._index
+
+    @property
+    def finished(self) -> bool:
+        """
+        ``True`` once the replay time is past the last record.
+        """
+
+        return self._index == len(self.records) - 1
+
+    def update(self) -> None:
+        """
+        Move to the record at the replay time.
+        """
+
+        index = int(
+            self._search(self._start + self._clock(), side='right')
+        ) - 1
+        index = min(max(index, 0), len(self.records) - 1)
+
+        if index == self._index:
+            return
+
+        self._index = index
+        self._record = record = self.records[index]
+
+        self.pos = record['position'].tolist()
+        self.vel = record['linear_velocity'].tolist()
+        self.angular_vel = record['angular_velocity'].tolist()
+        self.force = record['force'].tolist()
+        self.torque = record['torque'].tolist()
+        self.gripper_angle = float(record['gripper_angle'])
+        self.gripper_vel = float(record['gripper_angular_velocity'])
+        self.gripper_force = float(record['gripper_force'])
+        self.button_mask = int(record['buttons'])
+
+        # The inverse of VirtualDevice.frame()
+        r = record['frame'].tolist()
+        self.orientation = [
+            math.atan2(-r[5], r[8]),
+            math.asin(max(-1., min(1., r[2]))),
+            math.atan2(-r[1], r[0]),
+        ]
+
+    def frame(self) -> List[float]:
+        return self._record['frame'].tolist()
+
+    def joint_angles(self) -> List[float]:
+        return self._record['joint_angles'].tolist()
+
+    def encoders(self) -> List[int]:
+        return self._record['encoders'].tolist()
+
+    def status(self) -> List[int]:
+        return self._record['status'][:MAX_STATUS].tolist()
+
+
+class ReplayLibrary(VirtualLibrary):
+    """
+    Replays recordings in place of libdhd/libdrd. Devices are opened in the
+    order of ``logs``.
+
+    :param Sequence[Any] logs:
+        One recording per device, either the path of a telemetry file or
+        records returned by :func:`forcedimension_core.telemetry.load()`.
+
+    :param Optional[Sequence[DeviceType]] devtypes:
+        The type of each device. Defaults to
+        :data:`forcedimension_core.constants.DeviceType.OMEGA7_RIGHT`.
+
+    :param Optional[float] speed:
+        How much faster than the recording to replay, or ``None`` to
+        simulate time.
+
+    :param float tick:
+        How much simulated time each read of the time takes (in [s]).
+
+    :param int max_commands:
+        The number of the most recent force commands to keep in
+        :attr:`commands`. 0 captures none.
+
+    :raises ValueError:
+        If ``speed`` is not positive, ``max_commands`` is negative, or a
+        recording is empty or is not a telemetry file.
+    """
+
+    def __init__(
+        self,
+        logs: Sequence[Any],
+        devtypes: Optional[Sequence[DeviceType]] = None,
+        speed: Optional[float] = 1.,
+        tick: float = 1e-6,
+        max_commands: int = 100_000
+    ):
+        if speed is not None and speed <= 0.:
+            raise ValueError("speed must be positive.")
+
+        if max_commands < 0:
+            raise ValueError("max_commands must not be negative.")
+
+        if devtypes is None:
+            devtypes = [DeviceType.OMEGA7_RIGHT] * len(logs)
+
+        self.speed = speed
+        self.tick = tick
+        self._now = 0.
+        self._started = time.perf_counter()
+        self._commands_lock = threading.Lock()
+
+        #: The most recent force commands sent, in order.
+        self.commands: Deque[Command] = collections.deque(maxlen=max_commands)
+
+        #: The number of force commands discarded because :attr:`commands`
+        #: was full.
+        self.dropped_commands = 0
+
+        super().__init__(devices=[
+            ReplayDevice(
+                telemetry.load(log) if isinstance(log, (str, os.PathLike))
+                else log,
+                self.time, devtype, serial=i + 1
+            )
+            for i, (log, devtype) in enumerate(zip(logs, devtypes))
+        ])
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str]) -> 'ReplayLibrary':
+        """
+        Construct a library configured by the ``FORCEDIM_REPLAY_*``
+        environment variables.
+
+        :raises KeyError:
+            If a device type is not valid.
+
+        :raises ValueError:
+            If a variable is not valid.
+        """
+
+        logs = [
+            log for log in environ.get('FORCEDIM_REPLAY_LOGS', '').split(
+                os.pathsep
+            ) if log
+        ]
+
+        if not logs:
+            raise ValueError("FORCEDIM_REPLAY_LOGS is not set.")
+
+        devtypes = [
+            DeviceType[name.strip().upper()]
+            for name in environ.get('FORCEDIM_REPLAY_DEVICES', '').split(',')
+            if name.strip()
+        ] or None
+
+        if devtypes is not None and len(devtypes) != len(logs):
+            raise ValueError(
+                "FORCEDIM_REPLAY_DEVICES must name one device per log."
+            )
+
+        speed = environ.get('FORCEDIM_REPLAY_SPEED', '1')
+
+        return cls(
+            logs, devtypes, speed=None if speed == 'sim' else float(speed),
+            max_commands=int(environ.get('FORCEDIM_REPLAY_COMMANDS', 100_000))
+        )
+
+    def time(self) -> float:
+        """
+        The replay time (in [s]) since the start of the recordings.
+        """
+
+        if self.speed is None:
+            return self._now
+
+        return self.speed * (time.perf_counter() - self._started)
+
+    def rewind(self):
+        """
+        Restart the replay from the first records and forget the captured
+        commands.
+        """
+
+        self._now = 0.
+        self._started = time.perf_counter()
+
+        with self._commands_lock:
+            self.commands.clear()
+            self.dropped_commands = 0
+
+        for dev in self.devices:
+            dev.update()
+
+    def __getattr__(self, name: str) -> Any:
+        func = super().__getattr__(name)
+
+        # Symbols are only looked up once, then cached on the instance.
+        capture = name.startswith(('dhdSetForce', 'drdSetForce'))
+
+        if capture and self.commands.maxlen:
+            func._impl = self._capture(name, func._impl)
+            func._rebuild()
+
+        return func
+
+    def _capture(
+        self, name: str, impl: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        def capture(*args):
+            ID = args[-1]
+            device = self._default if ID == -1 else ID
+
+            with self._commands_lock:
+                if len(self.commands) == self.commands.maxlen:
+                    self.dropped_commands += 1
+
+                self.commands.append(
+                    Command(self.time(), device, name, args[:-1])
+                )
+
+            return impl(*args)
+
+        capture.__name__ = name
+
+        return capture
+
+    def _dhdGetTime(self):
+        if self.speed is None:
+            self._now += self.tick
+
+        return self.time()
+
+    def _dhdSleep(self, sec):
+        if self.speed is None:
+            self._now += sec
+        else:
+            time.sleep(sec / self.speed)
@@ -5,14 +5,20 @@ import os
 import pathlib
 import platform
 import sys
+import threading
 import unittest.mock as __mock
-from typing import Final, Iterable, Set
+from typing import (
+    Any, Callable, Dict, Final, Iterable, List, NamedTuple, Optional, Set,
+    Tuple
+)
 
+from forcedimension_core import _device_info, _spec, discovery
 from forcedimension_core.containers import VersionTuple
 
 VERSION_TARGET = VersionTuple(3, 16, 0, 0)
 
 SUPPORTED_PLATFORMS: Final[Set[str]] = {'linux', 'win32', 'cygwin', 'darwin'}
+SUPPORTED_BACKENDS: Final[Set[str]] = {'native', 'virtual', 'replay'}
 
 _ctypes_impl = ctypes
 _getpass_impl = getpass
@@ -21,10 +27,30 @@ _os_impl = os
 _pathlib_impl = pathlib
 _platform_impl = platform
 _sys_impl = sys
+_discovery_impl = discovery
 
 _test_load = False
 
 
+def _get_sdk_dirs_win32():
+    if _sys_impl.platform == 'cygwin':
+        root = _os_impl.path.join(
+            _os_impl.path.sep + 'cygdrive',
+            _pathlib_impl.Path.home().drive[0].lower()
+        )
+    else:
+        root = _pathlib_impl.Path.home().drive + _os_impl.path.sep
+
+    app_local = _os_impl.path.join(
+        root, 'Users', _getpass_impl.getuser(), 'AppData', 'Local'
+    )
+
+    return (
+        _os_impl.path.join(root, "Program Files", "Force Dimension"),
+        _os_impl.path.join(app_local, "Force Dimension")
+    )
+
+
 def _get_search_paths_win32(search_dirs: Iterable[str] = ()):
     search_dirs = list(search_dirs)
 
@@ -41,26 +67,11 @@ def _get_search_paths_win32(search_dirs: Iterable[str] = ()):
             )
         )
 
-    if _sys_impl.platform == 'cygwin':
-        root = _os_impl.path.join(
-            _os_impl.path.sep + 'cygdrive',
-            _pathlib_impl.Path.home().drive[0].lower()
-        )
-    else:
-        root = _pathlib_impl.Path.home().drive + _os_impl.path.sep
-
-    app_local = _os_impl.path.join(
-        root, 'Users', _getpass_impl.getuser(), 'AppData', 'Local'
-    )
-
-    lib_versions = _glob_impl.glob(
-        f'{_os_impl.path.join(root, "Program Files", "Force Dimension")}'
-        f'{_os_impl.path.sep}sdk-*'
-    )
+    sdk_dir, sdk_dir_local = _get_sdk_dirs_win32()
 
+    lib_versions = _glob_impl.glob(f'{sdk_dir}{_os_impl.path.sep}sdk-*')
     lib_versions_local = _glob_impl.glob(
-        f'{_os_impl.path.join(app_local, "Force Dimension")}'
-        f'{_os_impl.path.sep}sdk-*'
+        f'{sdk_dir_local}{_os_impl.path.sep}sdk-*'
     )
 
     lib_versions.sort()
@@ -81,30 +92,37 @@ def _get_search_paths_win32(search_dirs: Iterable[str] = ()):
     return search_dirs
 
 
+def _get_sdk_lib_folder_unix(libpath: str):
+    if _sys_impl.platform == 'linux':
+        platform_name = 'lin'
+        compiler = 'gcc'
+    else:
+        platform_name = 'mac'
+        compiler = 'clang'
+
+    return _os_impl.path.realpath(
+        _os_impl.path.join(
+            libpath,
+            "lib",
+            "release",
+            f"{platform_name}-{_platform_impl.machine()}-{compiler}",
+        )
+    )
+
+
 def _get_search_paths_unix(search_dirs: Iterable[str] = ()):
     search_dirs = list(search_dirs)
-    machine = _platform_impl.machine()
 
     if _sys_impl.platform == 'linux':
         lib_file_glob = "libdrd.so.*"
         lib_file = "libdrd.so"
-        platform_name = 'lin'
-        compiler = 'gcc'
     else:
         lib_file_glob = "libdrd.*dylib"
         lib_file = "libdrd.dylib"
-        platform_name = 'mac'
-        compiler = 'clang'
 
     if (libpath := _os_impl.environ.get('FDSDK')):
-        lib_folder = _os_impl.path.realpath(
-            _os_impl.path.join(
-                libpath,
-                "lib",
-                "release",
-                f"{platform_name}-{machine}-{compiler}",  # noqa
-            )
-        )
+        lib_folder = _get_sdk_lib_folder_unix(libpath)
+
         # type: ignore
         if (glob_res := _glob_impl.glob(f"{lib_folder}/{lib_file_glob}")):  # noqa
             glob_res.sort()
@@ -113,14 +131,7 @@ def _get_search_paths_unix(search_dirs: Iterable[str] = ()):
     # Legacy support for the old environment variable
 
     if (libpath := _os_impl.environ.get('FORCEDIM_SDK')):
-        lib_folder = _os_impl.path.realpath(
-            _os_impl.path.join(
-                libpath,
-                "lib",
-                "release",
-                f"{platform_name}-{machine}-{compiler}",  # type: ignore
-            )
-        )
+        lib_folder = _get_sdk_lib_folder_unix(libpath)
 
         if (glob_res := _glob_impl.glob(f"{lib_folder}/{lib_file_glob}")):  # noqa
             glob_res.sort()
@@ -196,6 +207,78 @@ def _get_version(lib: _ctypes_impl.CDLL):
     )
 
 
+def _get_discovery_key() -> str:
+    return '|'.join((
+        _sys_impl.platform,
+        _platform_impl.machine(),
+        _platform_impl.architecture()[0],
+        _os_impl.environ.get('FDSDK') or '',
+        _os_impl.environ.get('FORCEDIM_SDK') or ''
+    ))
+
+
+def _get_watch_dirs():
+    """
+    Directories whose contents determine the result of the library search.
+    A change in any of them invalidates a cached search result.
+    """
+
+    if _sys_impl.platform == 'win32' or _sys_impl.platform == 'cygwin':
+        watch_dirs = list(_get_sdk_dirs_win32())
+
+        if (libpath := _os_impl.environ.get('FDSDK')):
+            watch_dirs.append(_os_impl.path.join(libpath, 'bin'))
+
+        return watch_dirs
+
+    watch_dirs = [
+        os.path.join(_os_impl.path.expanduser('~'), '.local', 'lib'),
+        os.path.join(_os_impl.path.sep, 'usr', 'local', 'lib')
+    ]
+
+    for env in ('FDSDK', 'FORCEDIM_SDK'):
+        if (libpath := _os_impl.environ.get(env)):
+            watch_dirs.append(_get_sdk_lib_folder_unix(libpath))
+
+    return watch_dirs
+
+
+def _open(lib_path: str, silent: bool = False):
+    # Make sure to add the directory to PATH for Windows DLL loading
+    if _sys_impl.platform == "win32":
+
+        path = _os_impl.environ.get('PATH')
+        directory, _ = _os_impl.path.split(lib_path)
+
+        if not path:
+            _os_impl.environ['PATH'] = directory
+        else:
+            if directory not in path:
+                _os_impl.environ['PATH'] = f"{directory};{path}"
+
+    try:
+        lib = _ctypes_impl.CDLL(lib_path)
+    except OSError:
+        if not silent:
+            _sys_impl.stderr.write(
+                "Library was found but could not be loaded. Do you "
+                "have missing dependencies?\n"
+                "Ensure you have libusb-1."
+            )
+
+        return None
+    if (version := _get_version(lib)) < VERSION_TARGET:  # type: ignore
+        if not silent:
+            _sys_impl.stderr.write(
+                f"Invalid version. v{version} found "
+                f"but v{VERSION_TARGET} is required.\n"
+            )
+
+        return None
+
+    return lib
+
+
 def _should_mock():
     sphinx_build = (
         _os_impl.environ.get('__fdsdkpy_sphinx_build__', 'False') == 'True'
@@ -208,16 +291,280 @@ def _should_mock():
     return sphinx_build or unittest
 
 
+class _Unbound:
+    """
+    Stands in for a symbol that has not been resolved yet. Calling it
+    resolves the symbol, which replaces every reference to the stand-in
+    with the resolved function, then forwards the call.
+    """
+
+    __slots__ = ('_lib', '_name')
+
+    def __init__(self, lib: '_LazyLibrary', name: str):
+        self._lib = lib
+        self._name = name
+
+    def __call__(self, *args):
+        return getattr(self._lib, self._name)(*args)
+
+    def __repr__(self):
+        return f'<unbound symbol {self._name}>'
+
+
+class _LazyLibrary:
+    """
+    Wraps a loaded library and defers symbol resolution until first use.
+
+    Prototypes are recorded from :mod:`forcedimension_core._spec` with
+    :meth:`declare_all` when the library is loaded. The first lookup of a
+    symbol resolves it from the underlying library, assigns its
+    ``argtypes`` and ``restype``, and caches it as an instance attribute so
+    later lookups never reach :meth:`__getattr__`.
+
+    Wrapper modules additionally hold direct references to the symbols they
+    call (see :meth:`bind`), so a call costs a single global lookup instead
+    of two attribute lookups. Whenever a symbol is resolved, replaced or
+    discarded, every reference to it is updated under a lock.
+    """
+
+    def __init__(self, lib: Any):
+        self._lib = lib
+        self._prototypes: Dict[str, Tuple[List[Any], Any]] = {}
+        self._sites: Dict[str, List[Tuple[Dict[str, Any], str]]] = {}
+        self._unbound: Dict[str, _Unbound] = {}
+        self._wrap: Optional[Callable[[str, Any], Any]] = None
+        self._lock = threading.RLock()
+
+    def declare(self, name: str, argtypes: List[Any], restype: Any) -> None:
+        """
+        Record the prototype of ``name`` without resolving the symbol.
+        """
+
+        with self._lock:
+            self._prototypes[name] = (argtypes, restype)
+
+            # A symbol resolved before it was (re)declared must be retyped.
+            if self.__dict__.pop(name, None) is not None:
+                self._publish(name, self._get_unbound(name))
+
+    def declare_all(
+        self, prototypes: Dict[str, Tuple[List[Any], Any]]
+    ) -> None:
+        """
+        Record the prototypes of many symbols at once (see :meth:`declare`).
+        """
+
+        with self._lock:
+            self._prototypes.update(prototypes)
+
+            for name in prototypes:
+                if self.__dict__.pop(name, None) is not None:
+                    self._publish(name, self._get_unbound(name))
+
+    def bind(self, namespace: Dict[str, Any], name: str) -> Any:
+        """
+        Register ``namespace['_' + name]`` (e.g. a module's ``globals()``)
+        as a reference to the symbol ``name``, kept up to date as the symbol
+        is resolved or the library is replaced.
+
+        :returns:
+            The current value of the reference: the resolved function, or a
+            stand-in that resolves it on first call.
+        """
+
+        with self._lock:
+            self._sites.setdefault(name, []).append((namespace, '_' + name))
+
+            if (func := self.__dict__.get(name)) is None:
+                func = self._get_unbound(name)
+
+            return func
+
+    def preload(self, symbols: Optional[Iterable[str]] = None) -> None:
+        """
+        Resolve and type ``symbols`` (or every declared symbol) ahead of
+        time.
+        """
+
+        for name in (self._prototypes if symbols is None else symbols):
+            getattr(self, name)
+
+    def _get_unbound(self, name: str) -> _Unbound:
+        if (unbound := self._unbound.get(name)) is None:
+            unbound = self._unbound[name] = _Unbound(self, name)
+
+        return unbound
+
+    def _publish(self, name: str, func: Any) -> None:
+        for namespace, key in self._sites.get(name, ()):
+            namespace[key] = func
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        with self._lock:
+            # Another thread may have resolved it while this one waited.
+            if (func := self.__dict__.get(name)) is not None:
+                return func
+
+            func = getattr(self._lib, name)
+
+            if (prototype := self._prototypes.get(name)) is not None:
+                func.argtypes, func.restype = prototype
+
+            if self._wrap is not None:
+                func = self._wrap(name, func)
+
+            self.__dict__[name] = func
+            self._publish(name, func)
+
+        return func
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+            return
+
+        with self._lock:
+            self.__dict__[name] = value
+            self._publish(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name.startswith('_'):
+            object.__delattr__(self, name)
+            return
+
+        with self._lock:
+            if self.__dict__.pop(name, None) is None:
+                raise AttributeError(name)
+
+            self._publish(name, self._get_unbound(name))
+
+    def instrument(self, wrap: Optional[Callable[[str, Any], Any]]) -> None:
+        """
+        Replace every symbol by ``wrap(name, symbol)`` as it is resolved,
+        starting with those already resolved, or, if ``wrap`` is ``None``,
+        put the symbols back. Wrappers must set ``__wrapped__`` to the
+        symbol.
+        """
+
+        with self._lock:
+            self._wrap = wrap
+
+            for name in [name for name in self.__dict__ if name[0] != '_']:
+                func = self.__dict__[name]
+                func = getattr(func, '__wrapped__', func)
+
+                if wrap is not None:
+                    func = wrap(name, func)
+
+                self.__dict__[name] = func
+                self._publish(name, func)
+
+    def install(self, lib: Any) -> None:
+        """
+        Replace the underlying library. Symbols resolved from the previous
+        library are discarded and resolved again from ``lib`` on next use.
+        """
+
+        with self._lock:
+            self._lib = lib
+
+            for name in [name for name in self.__dict__ if name[0] != '_']:
+                del self.__dict__[name]
+                self._publish(name, self._get_unbound(name))
+
+
+def _load_virtual(silent: bool = False):
+    from forcedimension_core import virtual
+
+    try:
+        return virtual.VirtualLibrary.from_env(_os_impl.environ)
+    except (KeyError, ValueError) as ex:
+        if not silent:
+            _sys_impl.stderr.write(
+                f"Invalid virtual backend configuration: {ex}\n"
+            )
+
+        return None
+
+
+def _load_replay(silent: bool = False):
+    from forcedimension_core import replay
+
+    try:
+        return replay.ReplayLibrary.from_env(_os_impl.environ)
+    except (KeyError, ValueError, OSError) as ex:
+        if not silent:
+            _sys_impl.stderr.write(
+                f"Invalid replay backend configuration: {ex}\n"
+            )
+
+        return None
+
+
 def load(
     search_dirs=(),
     silent=False,
+    backend: Optional[str] = None
 ):
+    """
+    Load the library backing the bindings.
+
+    :param Iterable[str] search_dirs:
+        Paths to try before the default install locations of libdrd.
+        Only used by the ``'native'`` backend.
+
+    :param bool silent:
+        If ``True``, nothing is written to stderr on failure.
+
+    :param Optional[str] backend:
+        ``'native'`` loads libdrd from the Force Dimension SDK.
+        ``'virtual'`` creates a
+        :class:`forcedimension_core.virtual.VirtualLibrary` configured from
+        the ``FORCEDIM_VIRTUAL_*`` environment variables. ``'replay'``
+        creates a :class:`forcedimension_core.replay.ReplayLibrary`
+        configured from the ``FORCEDIM_REPLAY_*`` environment variables.
+        If ``None``, the
+        ``FORCEDIM_BACKEND`` environment variable is used, defaulting to
+        ``'native'``.
+
+    :returns:
+        The library, or ``None`` if it could not be loaded.
+    """
 
     if _os_impl.environ.get('__fdsdkpy_unittest_runtime__', 'False') == 'True':
         return None
 
-    if _should_mock() and not _test_load:
-        return __mock.Mock()
+    if backend is None:
+        if _should_mock() and not _test_load:
+            return __mock.Mock()
+
+        backend = _os_impl.environ.get('FORCEDIM_BACKEND') or 'native'
+
+    if backend not in SUPPORTED_BACKENDS:
+        if not silent:
+            _sys_impl.stderr.write(
+                f"Unknown backend \"{backend}\". Expected one of: "
+                f"{', '.join(sorted(SUPPORTED_BACKENDS))}\n"
+            )
+
+        return None
+
+    if backend == 'virtual':
+        return _load_virtual(silent)
+
+    if backend == 'replay':
+        return _load_replay(silent)
+
+    # The cache only remembers where the default search found libdrd.
+    if (use_cache := not search_dirs and _discovery_impl is not None):
+        key = _get_discovery_key()
+
+        if (lib_path := _discovery_impl.lookup(key)) is not None:
+            if (lib := _open(lib_path, silent=True)) is not None:
+                return lib
 
     if not (search_dirs := _get_search_paths(search_dirs, silent)):
         return None
@@ -226,39 +573,11 @@ def load(
         if not _os_impl.path.isfile(lib_path):
             continue
 
-        # Make sure to add the directory to PATH for Windows DLL loading
-        if _sys_impl.platform == "win32":
-
-            path = _os_impl.environ.get('PATH')
-            directory, _ = _os_impl.path.split(lib_path)
+        if (lib := _open(lib_path, silent)) is not None and use_cache:
+            _discovery_impl.store(key, lib_path, _get_watch_dirs())
 
-            if not path:
-                _os_impl.environ['PATH'] = directory
-            else:
-                if directory not in path:
-                    _os_impl.environ['PATH'] = f"{directory};{path}"
+        return lib
 
-        try:
-            lib = _ctypes_impl.CDLL(lib_path)
-        except OSError:
-            if not silent:
-                _sys_impl.stderr.write(
-                    "Library was found but could not be loaded. Do you "
-                    "have missing dependencies?\n"
-                    "Ensure you have libusb-1."
-                )
-
-            return None
-        if (version := _get_version(lib)) < VERSION_TARGET:  # type: ignore
-            if not silent:
-                _sys_impl.stderr.write(
-                    f"Invalid version. v{version} found "
-                    f"but v{VERSION_TARGET} is required.\n"
-                )
-
-            return None
-
-        return lib  # type: ignore
     if not silent:
         _sys_impl.stderr.write(
             "Could not find libdrd. Is it installed?\n"  # type: ignore
@@ -274,5 +593,296 @@ if (_libdrd_load := load()) is None:
         ""
     )
 
-_libdrd = _libdrd_load
-_libdhd = _libdrd_load
+_libdrd = _LazyLibrary(_libdrd_load)
+_libdrd.declare_all(_spec.PROTOTYPES)
+_libdhd = _libdrd
+_profiler: Any = None
+
+
+def preload(symbols: Optional[Iterable[str]] = None) -> None:
+    """
+    Resolve and register the prototypes of the given library symbols ahead
+    of time. Symbols are otherwise resolved the first time the function
+    that wraps them is called, which adds a small one-time latency to that
+    call. Call this before entering a control loop to move that cost out of
+    the loop.
+
+    :param Optional[Iterable[str]] symbols:
+        Names of the symbols to resolve (e.g. ``'dhdGetPosition'``). If
+        ``None``, every symbol declared by the imported modules is resolved.
+
+    :raises AttributeError:
+        If one of the symbols is not exported by the loaded library.
+    """
+
+    _libdrd.preload(symbols)
+
+
+_C_TYPES: Dict[Any, str] = {
+    None: 'void',
+    ctypes.c_bool: 'bool',
+    ctypes.c_byte: 'signed char',
+    ctypes.c_ubyte: 'unsigned char',
+    ctypes.c_char: 'char',
+    ctypes.c_char_p: 'char *',
+    ctypes.c_short: 'short',
+    ctypes.c_ushort: 'unsigned short',
+    ctypes.c_int: 'int',
+    ctypes.c_uint: 'unsigned int',
+    ctypes.c_long: 'long',
+    ctypes.c_ulong: 'unsigned long',
+    ctypes.c_longlong: 'long long',
+    ctypes.c_ulonglong: 'unsigned long long',
+    ctypes.c_float: 'float',
+    ctypes.c_double: 'double',
+    ctypes.c_void_p: 'void *',
+}
+
+
+def _c_type(ctype: Any) -> str:
+    if ctype in _C_TYPES:
+        return _C_TYPES[ctype]
+
+    if hasattr(ctype, '_type_') and issubclass(ctype, ctypes._Pointer):
+        return f'{_c_type(ctype._type_)} *'
+
+    raise TypeError(f"No C equivalent for {ctype!r}")
+
+
+class SymbolAddress(NamedTuple):
+    """
+    A function of the library as compiled code calls it: its address and
+    its C prototype.
+    """
+
+    #: The name of the symbol, e.g. ``'dhdGetPosition'``.
+    name: str
+
+    #: The address of the function.
+    address: int
+
+    #: The ctypes types of the arguments.
+    argtypes: Tuple[Any, ...]
+
+    #: The ctypes type of the return value, ``None`` for ``void``.
+    restype: Any
+
+    @property
+    def _params(self) -> str:
+        return ', '.join(map(_c_type, self.argtypes)) or 'void'
+
+    @property
+    def declaration(self) -> str:
+        """
+        The C declaration of the function, e.g.
+        ``'int dhdGetPosition(double *, double *, double *, signed char);'``,
+        as :meth:`cffi.FFI.cdef()` accepts it.
+        """
+
+        return f'{_c_type(self.restype)} {self.name}({self._params});'
+
+    @property
+    def pointer_type(self) -> str:
+        """
+        The C type of a pointer to the function, e.g.
+        ``'int (*)(double *, double *, double *, signed char)'``, as
+        :meth:`cffi.FFI.cast()` accepts it.
+        """
+
+        return f'{_c_type(self.restype)} (*)({self._params})'
+
+    def functype(self) -> Any:
+        """
+        Get the :func:`ctypes.CFUNCTYPE` of the function.
+        """
+
+        return ctypes.CFUNCTYPE(self.restype, *self.argtypes)
+
+    def to_ctypes(self) -> Any:
+        """
+        Get a ctypes function pointer to the function, which Numba can
+        call from ``nopython`` code.
+        """
+
+        return self.functype()(self.address)
+
+
+def _address(func: Any) -> Optional[int]:
+    # Profiled symbols are wrappers. Compiled code calls the function
+    # itself.
+    func = getattr(func, '__wrapped__', func)
+
+    try:
+        return ctypes.cast(func, ctypes.c_void_p).value
+    except (ctypes.ArgumentError, TypeError):
+        return None
+
+
+def symbol_addresses(
+    symbols: Optional[Iterable[str]] = None
+) -> Dict[str, SymbolAddress]:
+    """
+    Resolve library symbols and get their addresses and C prototypes, so
+    compiled code (e.g. a Numba or cffi control loop) can call the library
+    without going through Python. Arguments are then passed as raw
+    pointers, such as the ``ptr`` of the containers.
+
+    Calls through the addresses are not profiled (see
+    :func:`enable_profiling()`). The addresses are those of the library
+    currently installed and become invalid when it is replaced (see
+    :func:`install()`).
+
+    :param Optional[Iterable[str]] symbols:
+        Names of the symbols to resolve (e.g. ``'dhdGetPosition'``). If
+        ``None``, every declared symbol that the library exports as a C
+        function is included.
+
+    :raises KeyError:
+        If one of ``symbols`` has no declared prototype.
+
+    :raises AttributeError:
+        If one of ``symbols`` is not exported by the loaded library.
+
+    :raises ValueError:
+        If one of ``symbols`` has no C address, e.g. a function of the
+        virtual backend that takes or returns a string.
+
+    :returns:
+        The :class:`SymbolAddress` of each symbol, by name.
+    """
+
+    addresses = {}
+
+    for name in (_libdrd._prototypes if symbols is None else symbols):
+        if (prototype := _libdrd._prototypes.get(name)) is None:
+            raise KeyError(f"{name} has no declared prototype.")
+
+        try:
+            func = getattr(_libdrd, name)
+        except AttributeError:
+            if symbols is None:
+                continue
+
+            raise
+
+        if (address := _address(func)) is None:
+            if symbols is None:
+                continue
+
+            raise ValueError(f"{name} has no C address.")
+
+        argtypes, restype = prototype
+        addresses[name] = SymbolAddress(
+            name, address, tuple(argtypes), restype
+        )
+
+    return addresses
+
+
+def cdef(symbols: Optional[Iterable[str]] = None) -> str:
+    """
+    Get the C declarations of library symbols, one per line, to pass to
+    :meth:`cffi.FFI.cdef()`.
+
+    :param Optional[Iterable[str]] symbols:
+        Names of the symbols to declare. If ``None``, every declared
+        symbol is included.
+    """
+
+    names = sorted(_libdrd._prototypes) if symbols is None else symbols
+    lines = []
+
+    for name in names:
+        argtypes, restype = _libdrd._prototypes[name]
+        lines.append(
+            SymbolAddress(name, 0, tuple(argtypes), restype).declaration
+        )
+
+    return '\n'.join(lines)
+
+
+def install(lib: Any) -> Any:
+    """
+    Make every binding call into ``lib`` instead of the currently loaded
+    library, e.g. ``install(load(backend='virtual'))``. The device
+    information cached by :func:`forcedimension_core.dhd.getDeviceInfo()`
+    is dropped.
+
+    :param Any lib:
+        A library as returned by :func:`load()`.
+
+    :returns:
+        The previously installed library, which can be passed back to
+        :func:`install()` to restore it.
+    """
+
+    previous = _libdrd._lib
+    _libdrd.install(lib)
+    _device_info.clear()
+
+    return previous
+
+
+def get_library() -> Any:
+    """
+    Get the library currently backing the bindings.
+    """
+
+    return _libdrd._lib
+
+
+def enable_profiling(trace: int = 0, precision: int = 5) -> Any:
+    """
+    Start timing every call into the library (see
+    :mod:`forcedimension_core.profiling`). Calls are only wrapped while
+    profiling is enabled, so they cost nothing extra otherwise. Profiling
+    carries over to libraries installed later.
+
+    :param int trace:
+        The number of the most recent calls to keep as trace events.
+
+    :param int precision:
+        The number of significant bits of the latency histograms.
+
+    :returns:
+        The new :class:`forcedimension_core.profiling.Profiler`, which
+        replaces the previous one if profiling was already enabled.
+    """
+
+    global _profiler
+
+    from forcedimension_core.profiling import Profiler
+
+    profiler = Profiler(trace, precision)
+    _libdrd.instrument(None)
+    _libdrd.instrument(profiler.wrap)
+    _profiler = profiler
+
+    return profiler
+
+
+def disable_profiling() -> Any:
+    """
+    Stop timing calls into the library.
+
+    :returns:
+        The :class:`forcedimension_core.profiling.Profiler` with the
+        statistics collected, or ``None`` if profiling was not enabled.
+    """
+
+    global _profiler
+
+    profiler = _profiler
+    _libdrd.instrument(None)
+    _profiler = None
+
+    return profiler
+
+
+def get_profiler() -> Any:
+    """
+    Get the :class:`forcedimension_core.profiling.Profiler` collecting the
+    statistics, or ``None`` if profiling is not enabled.
+    """
+
+    return _profiler
@@ -0,0 +1,363 @@
+"""
+Streaming telemetry of device states to disk.
+
+A :class:`Recorder` copies each
+:class:`forcedimension_core.containers.DeviceState` it is given, with a
+timestamp, into a preallocated chunk of records in the calling thread. Full
+chunks are written by a background thread, so the loop recording never
+touches the disk. Memory is bounded by the number of chunks: if the disk
+cannot keep up and every chunk is waiting to be written, samples are
+dropped and counted instead. So are the samples after writing fails, and
+the error is raised when the recorder is closed.
+
+Files start with a 16 byte header (:data:`MAGIC`, the format version and
+the size of a record) followed by :class:`TelemetryRecord` records
+back-to-back, so recordings can be appended to and read while they are
+being written. :func:`load()` maps a file as a NumPy structured array whose
+fields are the columns, e.g. ``load(path)['position']``.
+"""
+
+import collections
+import ctypes as ct
+import os
+import queue
+import struct
+import threading
+from ctypes import c_double
+from typing import Any, BinaryIO, Optional
+
+from forcedimension_core.containers._state import DeviceStateData
+
+#: The first bytes of a telemetry file.
+MAGIC = b'FDTELEM\0'
+
+#: The version of the file format.
+VERSION = 1
+
+_header = struct.Struct('<8sII')
+
+
+class TelemetryRecord(ct.Structure):
+    """
+    A record of a telemetry file: a timestamp (in [s]) followed by the
+    fields of a device state.
+    """
+
+    _fields_ = (('time', c_double),) + DeviceStateData._fields_
+
+
+class Recorder:
+    """
+    Records device states to the file at ``path``, appending to it if it
+    exists. A partly written record at the end of the file is dropped first.
+
+    .. code-block:: python
+
+        state = containers.DeviceState()
+
+        with Recorder('session.fdt') as recorder:
+            while running:
+                dhd.direct.getState(state, ID)
+                ...
+                recorder.record(state)
+
+        print(recorder.dropped)
+
+    :param str path:
+        The file to record to.
+
+    :param int chunk_size:
+        The number of records per chunk.
+
+    :param int chunks:
+        The number of chunks, which bounds the memory used to
+        ``chunks * chunk_size`` records.
+
+    :raises ValueError:
+        If ``chunk_size`` or ``chunks`` is not positive, or the file exists
+        and is not a telemetry file of this version.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 4096, chunks: int = 8):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+
+        if chunks <= 0:
+            raise ValueError("chunks must be positive.")
+
+        self._file = _open(path)
+        self._path = path
+        self._chunk_size = chunk_size
+        self._chunks = tuple(
+            (TelemetryRecord * chunk_size)() for _ in range(chunks)
+        )
+        self._free = collections.deque(self._chunks[1:])
+        self._full: 'queue.SimpleQueue[Any]' = queue.SimpleQueue()
+
+        self._chunk: Optional[Any] = self._chunks[0]
+        self._address = ct.addressof(self._chunks[0])
+        self._index = 0
+        self._time = c_double()
+
+        # Imported here so the replay backend can read recordings while the
+        # bindings are being loaded.
+        from forcedimension_core.dhd import os_independent
+
+        self._get_time = os_independent.getTime
+        self._recorded = 0
+        self._dropped = 0
+
+        # Records lost to a failed write, only updated by the writer thread
+        self._lost = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._writer = threading.Thread(
+            target=self._write, name=f'Recorder-{path}', daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def recorded(self) -> int:
+        """
+        The number of samples recorded, including those not written yet.
+        """
+
+        return self._recorded - self._lost
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of samples dropped because every chunk was waiting to
+        be written, or because writing failed (see :attr:`error`).
+        """
+
+        return self._dropped + self._lost
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """
+        The error writing to the file failed with, if any. Samples are
+        dropped from then on, and the error is raised by :meth:`close()`.
+        """
+
+        return self._error
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of full chunks waiting to be written.
+        """
+
+        return self._full.qsize()
+
+    def record(self, state: Any, time: Optional[float] = None) -> bool:
+        """
+        Record ``state``. Copies it and returns without waiting on the
+        disk.
+
+        :param DeviceState state:
+            The state to record, either a
+            :class:`forcedimension_core.containers.DeviceState` or a
+            :class:`forcedimension_core.containers.numpy.DeviceState`.
+
+        :param Optional[float] time:
+            The timestamp of the sample (in [s]). Defaults to now (see
+            :func:`forcedimension_core.dhd.os_independent.getTime()`).
+
+        :raises RuntimeError:
+            If the recorder is closed.
+
+        :returns:
+            ``True`` if the sample was recorded, ``False`` if it was
+            dropped.
+        """
+
+        if self._error is not None and not self._closed:
+            self._dropped += 1
+            return False
+
+        if self._chunk is None:
+            if self._closed:
+                raise RuntimeError("The recorder is closed.")
+
+            if not self._next_chunk():
+                self._dropped += 1
+                return False
+
+        if time is None:
+            time = self._get_time()
+
+        self._time.value = time
+        dst = self._address + self._index * ct.sizeof(TelemetryRecord)
+        ct.memmove(dst, ct.addressof(self._time), ct.sizeof(c_double))
+        ct.memmove(
+            dst + TelemetryRecord.position.offset,  # type: ignore
+            ct.addressof(state.data), ct.sizeof(DeviceStateData)
+        )
+
+        self._recorded += 1
+        self._index += 1
+
+        if self._index == self._chunk_size:
+            self._hand_off()
+
+        return True
+
+    def flush(self):
+        """
+        Hand the records of the current chunk to the writer thread, even if
+        the chunk is not full.
+        """
+
+        if self._chunk is not None and self._index > 0:
+            self._hand_off()
+
+    def close(self):
+        """
+        Write every record and close the file.
+
+        :raises OSError:
+            If writing failed.
+        """
+
+        if self._closed:
+            return
+
+        self.flush()
+        self._closed = True
+        self._chunk = None
+        self._full.put(None)
+        self._writer.join()
+        self._file.close()
+
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _hand_off(self):
+        self._full.put((self._chunk, self._index))
+        self._chunk = None
+        self._next_chunk()
+
+    def _next_chunk(self) -> bool:
+        try:
+            chunk = self._free.popleft()
+        except IndexError:
+            return False
+
+        self._chunk = chunk
+        self._address = ct.addressof(chunk)
+        self._index = 0
+
+        return True
+
+    def _write(self):
+        file = self._file
+        size = ct.sizeof(TelemetryRecord)
+
+        while (item := self._full.get()) is not None:
+            chunk, n = item
+
+            try:
+                if self._error is None:
+                    file.write(memoryview(chunk).cast('B')[:n * size])
+                else:
+                    self._lost += n
+            except BaseException as ex:
+                # Keep recycling chunks so the recorder only drops samples.
+                self._lost += n
+                self._error = ex
+
+            self._free.append(chunk)
+
+        if self._error is None:
+            try:
+                file.flush()
+            except BaseException as ex:
+                self._error = ex
+
+
+def _open(path: str) -> BinaryIO:
+    file = open(path, 'a+b')
+
+    try:
+        file.seek(0)
+
+        if (header := file.read(_header.size)):
+            _check_header(header, path)
+
+            # Drop a record left partly written, e.g. by a process that
+            # died, so the records appended stay aligned.
+            size = os.fstat(file.fileno()).st_size
+            if (tail := (size - _header.size) % ct.sizeof(TelemetryRecord)):
+                file.truncate(size - tail)
+        else:
+            file.write(
+                _header.pack(MAGIC, VERSION, ct.sizeof(TelemetryRecord))
+            )
+    except BaseException:
+        file.close()
+        raise
+
+    return file
+
+
+def _check_header(header: bytes, path: str):
+    if len(header) != _header.size:
+        raise ValueError(f"{path} is not a telemetry file.")
+
+    magic, version, record_size = _header.unpack(header)
+
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a telemetry file.")
+
+    if version != VERSION or record_size != ct.sizeof(TelemetryRecord):
+        raise ValueError(
+            f"{path} is a telemetry file of version {version}, expected "
+            f"{VERSION}."
+        )
+
+
+def load(path: str) -> Any:
+    """
+    Map the records of a telemetry file as a read-only NumPy structured
+    array, with one field per column of :class:`TelemetryRecord`. A
+    trailing record being written is left out.
+
+    :param str path:
+        The file to load.
+
+    :raises ImportError:
+        If NumPy is not installed.
+
+    :raises ValueError:
+        If the file is not a telemetry file of this version.
+
+    :returns:
+        A :class:`numpy.memmap` of the records.
+    """
+
+    import numpy as np
+
+    with open(path, 'rb') as file:
+        _check_header(file.read(_header.size), path)
+
+    dtype = np.dtype(TelemetryRecord)
+    count = (os.path.getsize(path) - _header.size) // dtype.itemsize
+
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+
+    return np.memmap(
+        path, dtype=dtype, mode='r', offset=_header.size, shape=(count,)
+    )
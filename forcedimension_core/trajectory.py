@@ -0,0 +1,336 @@
+"""
+Streaming of precomputed trajectories to the robotic control loop.
+
+A :class:`TrajectoryStreamer` feeds an array of waypoints to
+:func:`forcedimension_core.drd.trackPos()`,
+:func:`forcedimension_core.drd.direct.track()` or
+:func:`forcedimension_core.drd.direct.trackAllEnc()` from a dedicated
+thread, one waypoint every few ticks of the control loop (see
+:func:`forcedimension_core.drd.waitForTick()`), so the waypoint rate is set
+by the control loop rather than by the timing of the calling thread.
+
+The waypoints are converted once, when the streamer is created, into
+buffers the bindings take as is. Sending a waypoint allocates nothing.
+"""
+
+import ctypes as ct
+import math
+import threading
+from ctypes import c_double, c_int
+from typing import Any, Callable, Optional, Tuple
+
+import forcedimension_core.containers as containers
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.expert.direct as expert_direct
+import forcedimension_core.drd as drd
+import forcedimension_core.drd.direct as drd_direct
+from forcedimension_core.constants import MAX_DOF
+from forcedimension_core.containers import _state
+from forcedimension_core.loop import Loop
+
+
+class TrajectoryStreamer:
+    """
+    Streams waypoints to the robotic control loop of a device in a
+    background thread. The device must be regulated (see
+    :func:`forcedimension_core.drd.regulatePos()`) for tracking to have an
+    effect.
+
+    The kind of waypoints is given by the shape and type of ``waypoints``:
+
+    - ``(N, 3)``: end-effector positions (in [m]), sent with
+      :func:`forcedimension_core.drd.trackPos()`.
+    - ``(N, MAX_DOF)`` of floats: Cartesian 7-DOF configurations, sent with
+      :func:`forcedimension_core.drd.direct.track()`.
+    - ``(N, MAX_DOF)`` of integers: encoder positions, sent with
+      :func:`forcedimension_core.drd.direct.trackAllEnc()`.
+
+    .. code-block:: python
+
+        path = np.stack((x, y, z), axis=1)
+
+        with TrajectoryStreamer(path, ID=ID) as streamer:
+            while not streamer.wait(0.1):
+                print(streamer.progress, streamer.error)
+
+    :param Any waypoints:
+        The waypoints, as an array-like NumPy can convert.
+
+    :param int ID:
+        Device ID (see :ref:`multiple_devices` section for details).
+
+    :param int ticks:
+        The number of ticks of the control loop to hold each waypoint for.
+
+    :raises ImportError:
+        If NumPy is not installed.
+
+    :raises ValueError:
+        If ``waypoints`` does not have one of the shapes above, or
+        ``ticks`` is not positive.
+    """
+
+    def __init__(self, waypoints: Any, ID: int = -1, ticks: int = 1):
+        # Imported here since NumPy is optional.
+        import numpy as np
+
+        if ticks <= 0:
+            raise ValueError("ticks must be positive.")
+
+        waypoints = np.asarray(waypoints)
+
+        if waypoints.ndim != 2 or waypoints.shape[1] not in (3, MAX_DOF):
+            raise ValueError(
+                f"waypoints must have shape (N, 3) or (N, {MAX_DOF}), got "
+                f"{waypoints.shape}."
+            )
+
+        self._ID = ID
+        self._ticks = ticks
+        self._encoders = waypoints.shape[1] == MAX_DOF and (
+            waypoints.dtype.kind in 'iu'
+        )
+
+        self._track: Callable[[Any, int], int]
+        self._steps: Tuple[Tuple[int, Any], ...]
+
+        if waypoints.shape[1] == 3:
+            self._waypoints = waypoints.astype(c_double)
+            self._track = drd.trackPos
+            self._steps = tuple(
+                (i + 1, tuple(waypoint))
+                for i, waypoint in enumerate(self._waypoints.tolist())
+            )
+        else:
+            ctype, row = (c_int, _state.DOFIntView) if self._encoders else (
+                c_double, _state.DOFFloatView
+            )
+
+            self._waypoints = np.ascontiguousarray(waypoints, dtype=ctype)
+            self._track = (
+                drd_direct.trackAllEnc if self._encoders else drd_direct.track
+            )
+
+            # Rows are passed by pointer through their ptr, so they are not
+            # given the per-element aliases of View.at().
+            size = ct.sizeof(row)
+            self._steps = tuple(
+                (i + 1, row.from_buffer(self._waypoints, i * size))
+                for i in range(len(self._waypoints))
+            )
+
+        self._measured = (
+            containers.DOFInt() if self._encoders else containers.Vec3()
+        )
+
+        self._count = len(self._steps)
+        self._index = 0
+        self._errors = 0
+        self._hold = 0
+        self._paused = False
+        self._running = False
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[Loop] = None
+        self._iter = iter(self._steps)
+
+    @property
+    def ID(self) -> int:
+        return self._ID
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def index(self) -> int:
+        """
+        The number of waypoints sent.
+        """
+
+        return self._index
+
+    @property
+    def progress(self) -> float:
+        """
+        The fraction of the waypoints sent, from 0 to 1.
+        """
+
+        return self._index / self._count if self._count else 1.
+
+    @property
+    def errors(self) -> int:
+        """
+        The number of waypoints the device rejected.
+        """
+
+        return self._errors
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def done(self) -> bool:
+        """
+        ``True`` once every waypoint was sent.
+        """
+
+        return self._index == self._count
+
+    @property
+    def loop(self) -> Optional[Loop]:
+        """
+        The loop feeding the waypoints, with its timing statistics.
+        """
+
+        return self._loop
+
+    @property
+    def error(self) -> float:
+        """
+        How far the device was from the last waypoint sent, measured right
+        after it was sent: the distance (in [m]) for positions and
+        configurations, or the largest difference (in increments) for
+        encoders. NaN if no waypoint was sent yet.
+        """
+
+        if (index := self._index) == 0:
+            return float('nan')
+
+        target = self._waypoints[index - 1]
+
+        if self._encoders:
+            return float(max(
+                abs(int(target[i]) - self._measured[i])
+                for i in range(MAX_DOF)
+            ))
+
+        return math.dist(self._measured, target[:3].tolist())
+
+    def start(self):
+        """
+        Start streaming from the next waypoint in a new daemon thread.
+
+        :raises RuntimeError:
+            If the streamer is already running or every waypoint was sent.
+        """
+
+        if self._running:
+            raise RuntimeError("The streamer is already running.")
+
+        if self.done:
+            raise RuntimeError("Every waypoint was sent.")
+
+        # The control loop sets the rate, the frequency is only used for
+        # the statistics.
+        if (frequency := drd.getCtrlFreq(self._ID)) <= 0.:
+            frequency = 4.
+
+        self._running = True
+        self._done.clear()
+        self._loop = Loop(
+            self._step, 1000. * frequency / self._ticks, tick_ID=self._ID
+        )
+        self._thread = threading.Thread(
+            target=self._run, name=f'TrajectoryStreamer-{self._ID}',
+            daemon=True
+        )
+        self._thread.start()
+
+    def pause(self):
+        """
+        Hold the last waypoint sent until :meth:`resume()` is called.
+        """
+
+        self._paused = True
+
+    def resume(self):
+        """
+        Continue streaming after :meth:`pause()`.
+        """
+
+        self._paused = False
+
+    def cancel(self, timeout: Optional[float] = None):
+        """
+        Stop streaming and wait for the thread to exit. The device keeps
+        tracking the last waypoint sent. Streaming continues from the next
+        waypoint if started again.
+
+        :param Optional[float] timeout:
+            How long to wait for the thread (in [s]). Waits indefinitely if
+            ``None``.
+        """
+
+        self._running = False
+
+        if self._loop is not None:
+            self._loop.stop()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the streamer stops, either because every waypoint was
+        sent or because it was cancelled.
+
+        :param Optional[float] timeout:
+            How long to wait (in [s]). Waits indefinitely if ``None``.
+
+        :returns:
+            ``True`` if the streamer stopped, ``False`` on timeout.
+        """
+
+        return self._done.wait(timeout)
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, *args):
+        self.cancel()
+
+    def _run(self):
+        try:
+            self._loop.run()  # type: ignore
+        finally:
+            self._running = False
+            self._done.set()
+
+    def _step(self) -> bool:
+        if not self._running:
+            return True
+
+        if self._paused:
+            return False
+
+        if self._hold:
+            self._hold -= 1
+            return False
+
+        try:
+            index, waypoint = next(self._iter)
+        except StopIteration:
+            return True
+
+        ID = self._ID
+
+        if self._track(waypoint, ID) < 0:
+            self._errors += 1
+
+        if self._encoders:
+            expert_direct.getEnc(self._measured, 0xff, ID)
+        else:
+            dhd.getPosition(self._measured, ID)
+
+        self._index = index
+        self._hold = self._ticks - 1
+
+        return index == self._count
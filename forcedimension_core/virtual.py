@@ -0,0 +1,2140 @@
+"""
+A pure-Python stand-in for libdhd and libdrd.
+
+:class:`VirtualLibrary` implements the symbols bound by
+:mod:`forcedimension_core.dhd`, :mod:`forcedimension_core.dhd.expert` and
+:mod:`forcedimension_core.drd` on top of simulated devices. Each device
+follows a configurable dynamics model (:class:`PointMassModel` or
+:class:`DeltaModel`), and every call that would talk to a device can be
+delayed by a settable communication latency. This allows bindings, control
+loops and multi-device orchestration to be exercised and load-tested without
+hardware.
+
+Select it with the ``FORCEDIM_BACKEND=virtual`` environment variable before
+importing the package, or install one explicitly::
+
+    from forcedimension_core import runtime
+    from forcedimension_core.virtual import VirtualLibrary
+
+    runtime.install(VirtualLibrary(devices=2, latency=250e-6))
+
+When selected through the environment, the library is configured from:
+
+- ``FORCEDIM_VIRTUAL_DEVICES``: comma separated
+  :class:`forcedimension_core.constants.DeviceType` names
+  (default ``OMEGA7_RIGHT``).
+- ``FORCEDIM_VIRTUAL_MODEL``: ``point-mass`` (default) or ``delta``.
+- ``FORCEDIM_VIRTUAL_LATENCY``: communication latency in [s] (default 0).
+"""
+
+import ctypes as ct
+import math
+import threading
+import time
+from ctypes import c_char_p
+from typing import (
+    Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
+)
+
+from forcedimension_core.constants import (
+    MAX_DOF, MAX_STATUS, ComMode, DeviceType, ErrorNum
+)
+
+#: Joint angle resolution of the simulated encoders in [increments/rad].
+ENC_PER_RAD: float = 1e4
+
+#: Force (or torque) produced per motor command increment in [N].
+FORCE_PER_MOTOR_INC: float = 1e-3
+
+#: Motor command corresponding to zero force.
+MOTOR_ZERO: int = 32768
+
+#: Simulated SDK version reported by ``dhdGetSDKVersion``.
+SDK_VERSION: Tuple[int, int, int, int] = (3, 16, 0, 0)
+
+_ERROR_STRS = (
+    b'no error',
+    b'undocumented error',
+    b'communication error',
+    b'device controller busy',
+    b'no driver found',
+    b'no device found',
+    b'operation not available',
+    b'operation timed out',
+    b'geometric error',
+    b'expert mode disabled',
+    b'feature not implemented',
+    b'out of memory',
+    b'device not ready',
+    b'file not found',
+    b'device configuration failed',
+    b'index outside valid range',
+    b'feature or device no longer supported',
+    b'argument is null or invalid',
+    b'redundant encoder integrity test failed',
+    b'feature is not enabled',
+    b'device is in use',
+    b'invalid parameter',
+    b'robotic regulation is not running',
+)
+
+_SYSTEM_NAMES = {
+    DeviceType.DELTA3: b'delta.3',
+    DeviceType.OMEGA3: b'omega.3',
+    DeviceType.OMEGA6_RIGHT: b'omega.6',
+    DeviceType.OMEGA6_LEFT: b'omega.6',
+    DeviceType.OMEGA7_RIGHT: b'omega.7',
+    DeviceType.OMEGA7_LEFT: b'omega.7',
+    DeviceType.CONTROLLER: b'controller',
+    DeviceType.CONTROLLER_HR: b'controller',
+    DeviceType.CUSTOM: b'custom',
+    DeviceType.SIGMA3: b'sigma.3',
+    DeviceType.SIGMA7_RIGHT: b'sigma.7',
+    DeviceType.SIGMA7_LEFT: b'sigma.7',
+    DeviceType.LAMBDA3: b'lambda.3',
+    DeviceType.LAMBDA7_RIGHT: b'lambda.7',
+    DeviceType.LAMBDA7_LEFT: b'lambda.7',
+    DeviceType.FALCON: b'falcon',
+}
+
+_WRIST = {
+    DeviceType.OMEGA6_RIGHT, DeviceType.OMEGA6_LEFT,
+    DeviceType.OMEGA7_RIGHT, DeviceType.OMEGA7_LEFT,
+    DeviceType.SIGMA7_RIGHT, DeviceType.SIGMA7_LEFT,
+    DeviceType.LAMBDA7_RIGHT, DeviceType.LAMBDA7_LEFT,
+}
+
+_ACTIVE_WRIST = {
+    DeviceType.SIGMA7_RIGHT, DeviceType.SIGMA7_LEFT,
+    DeviceType.LAMBDA7_RIGHT, DeviceType.LAMBDA7_LEFT,
+}
+
+_GRIPPER = {
+    DeviceType.OMEGA7_RIGHT, DeviceType.OMEGA7_LEFT,
+    DeviceType.SIGMA7_RIGHT, DeviceType.SIGMA7_LEFT,
+    DeviceType.LAMBDA7_RIGHT, DeviceType.LAMBDA7_LEFT,
+}
+
+_LEFT_HANDED = {
+    DeviceType.OMEGA6_LEFT, DeviceType.OMEGA7_LEFT,
+    DeviceType.SIGMA7_LEFT, DeviceType.LAMBDA7_LEFT,
+}
+
+_BASE = {DeviceType.DELTA3, DeviceType.OMEGA3, DeviceType.SIGMA3}
+
+Vector = Tuple[float, float, float]
+
+
+class PointMassModel:
+    """
+    Models the end-effector as a damped point mass confined to a spherical
+    workspace. Joint space is Cartesian space scaled by ``joint_scale``,
+    as if every DELTA axis was an independent prismatic joint.
+    """
+
+    def __init__(
+        self,
+        mass: float = 0.2,
+        damping: float = 2.,
+        workspace_radius: float = 0.08,
+        joint_scale: float = 10.,
+        max_force: float = 12.
+    ):
+        self.mass = mass
+        self.damping = damping
+        self.workspace_radius = workspace_radius
+        self.joint_scale = joint_scale
+        self.max_force = max_force
+
+    def step(
+        self, pos: List[float], vel: List[float], force: Sequence[float],
+        dt: float
+    ) -> None:
+        """
+        Integrate the dynamics in place over ``dt`` seconds.
+        """
+
+        # Semi-implicit Euler is stable as long as the step is short
+        # compared to the mass/damping time constant.
+        n = max(1, math.ceil(dt / 1e-3))
+        h = dt / n
+        m = self.mass
+        b = self.damping
+
+        for _ in range(n):
+            for i in range(3):
+                vel[i] += h * (force[i] - b * vel[i]) / m
+                pos[i] += h * vel[i]
+
+        self.confine(pos, vel)
+
+    def confine(self, pos: List[float], vel: List[float]) -> None:
+        r = math.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
+
+        if r > self.workspace_radius:
+            for i in range(3):
+                pos[i] *= self.workspace_radius / r
+                vel[i] = 0.
+
+    def forward(self, q: Sequence[float]) -> Vector:
+        """
+        Convert DELTA joint angles (in [rad]) to a position (in [m]).
+
+        :raises ValueError:
+            If the joint angles do not correspond to a valid pose.
+        """
+
+        s = self.joint_scale
+        return (q[0] / s, q[1] / s, q[2] / s)
+
+    def inverse(self, p: Sequence[float]) -> Vector:
+        """
+        Convert a position (in [m]) to DELTA joint angles (in [rad]).
+
+        :raises ValueError:
+            If the position is outside of the reachable workspace.
+        """
+
+        s = self.joint_scale
+        return (p[0] * s, p[1] * s, p[2] * s)
+
+    def jacobian(self, q: Sequence[float]) -> List[List[float]]:
+        """
+        Numerically evaluate the DELTA Jacobian at ``q``.
+        """
+
+        h = 1e-7
+        p0 = self.forward(q)
+        jac = [[0.] * 3 for _ in range(3)]
+
+        for j in range(3):
+            dq = list(q)
+            dq[j] += h
+            p1 = self.forward(dq)
+
+            for i in range(3):
+                jac[i][j] = (p1[i] - p0[i]) / h
+
+        return jac
+
+
+class DeltaModel(PointMassModel):
+    """
+    Extends :class:`PointMassModel` with the kinematics of a rotary DELTA
+    parallel mechanism. The dynamics remain those of a point mass, but
+    encoder readings and the conversions between joint angles and positions
+    follow the DELTA geometry.
+
+    :param float base_radius:
+        Side length of the fixed base triangle in [m].
+
+    :param float effector_radius:
+        Side length of the end-effector triangle in [m].
+
+    :param float upper_arm:
+        Length of the motor driven arms in [m].
+
+    :param float lower_arm:
+        Length of the parallelogram arms in [m].
+
+    :param float home_angle:
+        Joint angle (in [rad]) of every arm when the end-effector is at the
+        origin of the device coordinate system.
+    """
+
+    def __init__(
+        self,
+        *args,
+        base_radius: float = 0.2,
+        effector_radius: float = 0.06,
+        upper_arm: float = 0.1,
+        lower_arm: float = 0.2,
+        home_angle: float = 0.3,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.base_radius = base_radius
+        self.effector_radius = effector_radius
+        self.upper_arm = upper_arm
+        self.lower_arm = lower_arm
+
+        self._home = (0., 0., 0.)
+        self._home = self.forward((home_angle, home_angle, home_angle))
+
+    def forward(self, q: Sequence[float]) -> Vector:
+        f = self.base_radius
+        e = self.effector_radius
+        rf = self.upper_arm
+        re = self.lower_arm
+
+        tan30 = 1 / math.sqrt(3)
+        t = (f - e) * tan30 / 2
+
+        y1 = -(t + rf * math.cos(q[0]))
+        z1 = -rf * math.sin(q[0])
+        y2 = (t + rf * math.cos(q[1])) / 2
+        x2 = y2 * math.sqrt(3)
+        z2 = -rf * math.sin(q[1])
+        y3 = (t + rf * math.cos(q[2])) / 2
+        x3 = -y3 * math.sqrt(3)
+        z3 = -rf * math.sin(q[2])
+
+        dnm = (y2 - y1) * x3 - (y3 - y1) * x2
+
+        w1 = y1 * y1 + z1 * z1
+        w2 = x2 * x2 + y2 * y2 + z2 * z2
+        w3 = x3 * x3 + y3 * y3 + z3 * z3
+
+        a1 = (z2 - z1) * (y3 - y1) - (z3 - z1) * (y2 - y1)
+        b1 = -((w2 - w1) * (y3 - y1) - (w3 - w1) * (y2 - y1)) / 2
+        a2 = -(z2 - z1) * x3 + (z3 - z1) * x2
+        b2 = ((w2 - w1) * x3 - (w3 - w1) * x2) / 2
+
+        a = a1 * a1 + a2 * a2 + dnm * dnm
+        b = 2 * (a1 * b1 + a2 * (b2 - y1 * dnm) - z1 * dnm * dnm)
+        c = (b2 - y1 * dnm) ** 2 + b1 * b1 + dnm * dnm * (z1 * z1 - re * re)
+
+        if (d := b * b - 4 * a * c) < 0:
+            raise ValueError("Joint angles do not correspond to a valid pose")
+
+        z0 = -(b + math.sqrt(d)) / (2 * a)
+        x0 = (a1 * z0 + b1) / dnm
+        y0 = (a2 * z0 + b2) / dnm
+
+        home = self._home
+        return (x0 - home[0], y0 - home[1], z0 - home[2])
+
+    def _arm_angle(self, x0: float, y0: float, z0: float) -> float:
+        rf = self.upper_arm
+        re = self.lower_arm
+        tan30 = 1 / math.sqrt(3)
+
+        y1 = -0.5 * tan30 * self.base_radius
+        y0 -= 0.5 * tan30 * self.effector_radius
+
+        a = (x0 * x0 + y0 * y0 + z0 * z0 + rf * rf - re * re - y1 * y1)
+        a /= 2 * z0
+        b = (y1 - y0) / z0
+
+        if (d := -(a + b * y1) ** 2 + rf * (b * b * rf + rf)) < 0:
+            raise ValueError("Position is outside of the workspace")
+
+        yj = (y1 - a * b - math.sqrt(d)) / (b * b + 1)
+        zj = a + b * yj
+
+        return math.atan(-zj / (y1 - yj)) + (math.pi if yj > y1 else 0.)
+
+    def inverse(self, p: Sequence[float]) -> Vector:
+        home = self._home
+        x = p[0] + home[0]
+        y = p[1] + home[1]
+        z = p[2] + home[2]
+
+        cos120 = -0.5
+        sin120 = math.sqrt(3) / 2
+
+        return (
+            self._arm_angle(x, y, z),
+            self._arm_angle(
+                x * cos120 + y * sin120, y * cos120 - x * sin120, z
+            ),
+            self._arm_angle(
+                x * cos120 - y * sin120, y * cos120 + x * sin120, z
+            )
+        )
+
+
+class VirtualDevice:
+    """
+    The simulated state of a single device.
+
+    :param DeviceType devtype:
+        The type of device to simulate.
+
+    :param Optional[int] serial:
+        The serial number reported by the device.
+
+    :param Optional[PointMassModel] model:
+        The dynamics model. Defaults to a :class:`PointMassModel`.
+    """
+
+    def __init__(
+        self,
+        devtype: DeviceType = DeviceType.OMEGA7_RIGHT,
+        serial: int = 0,
+        model: Optional[PointMassModel] = None
+    ):
+        self.devtype = DeviceType(devtype)
+        self.serial = serial
+        self.model = PointMassModel() if model is None else model
+        self.lock = threading.RLock()
+
+        self.is_open = False
+        self.pos = [0., 0., 0.]
+        self.vel = [0., 0., 0.]
+        self.force = [0., 0., 0.]
+        self.torque = [0., 0., 0.]
+        self.orientation = [0., 0., 0.]
+        self.angular_vel = [0., 0., 0.]
+        self.gripper_angle = 0.
+        self.gripper_vel = 0.
+        self.gripper_force = 0.
+
+        #: Bit mask of pressed buttons. Set this to simulate button presses.
+        self.button_mask = 0
+
+        self.force_enabled = False
+        self.gripper_force_enabled = True
+        self.brakes = True
+        self.gravity_compensation = True
+        self.expert_mode = False
+        self.com_mode = ComMode.VIRTUAL
+        self.timeguard = 0
+        self.watchdog = 0
+        self.output = 0
+        self.effector_mass = 0.
+        self.device_angle = 0.
+        self.base_angle_x = 0.
+        self.base_angle_z = 0.
+        self.standard_gravity = 9.81
+        self.max_force = -1.
+        self.max_torque = -1.
+        self.max_gripper_force = -1.
+        self.velocity_threshold = 10
+        self.velocity_config = {
+            'linear': (20, 0), 'angular': (20, 0), 'gripper': (20, 0)
+        }
+        self.emulate_button = False
+        self.motors = [MOTOR_ZERO] * MAX_DOF
+
+        # Robotic SDK (DRD) state
+        self.initialized = False
+        self.regulating = False
+        self.regulate = {'pos': True, 'rot': True, 'grip': True}
+        self.filtering = True
+        self.target: Optional[List[float]] = None
+        self.target_orientation: Optional[List[float]] = None
+        self.target_gripper: Optional[float] = None
+        self.ctrl_freq = 4.
+        self.priorities = (0, 0)
+        self.mot_ratio_max = 1.
+        self.enc_gains = [1., 0., 0.]
+        self.params = {
+            f'{kind}.{mode}': [1., 1., 1.]
+            for kind in ('pos', 'rot', 'grip', 'enc')
+            for mode in ('move', 'track')
+        }
+
+        self._t = time.perf_counter()
+        self._com_count = 0
+        self._com_t = self._t
+
+    @property
+    def has_wrist(self) -> bool:
+        return self.devtype in _WRIST
+
+    @property
+    def has_active_wrist(self) -> bool:
+        return self.devtype in _ACTIVE_WRIST
+
+    @property
+    def has_gripper(self) -> bool:
+        return self.devtype in _GRIPPER
+
+    @property
+    def is_left_handed(self) -> bool:
+        return self.devtype in _LEFT_HANDED
+
+    @property
+    def has_base(self) -> bool:
+        return self.devtype in _BASE
+
+    @property
+    def is_moving(self) -> bool:
+        return any(
+            target is not None for target in
+            (self.target, self.target_orientation, self.target_gripper)
+        )
+
+    def update(self) -> None:
+        """
+        Advance the simulation to the current time.
+        """
+
+        now = time.perf_counter()
+
+        if (dt := now - self._t) <= 0:
+            return
+
+        self._t = now
+
+        if self.regulating:
+            self._regulate(dt)
+        elif self.force_enabled and not self.brakes:
+            self.model.step(self.pos, self.vel, self.force, dt)
+        else:
+            self.vel[:] = (0., 0., 0.)
+
+    def _regulate(self, dt: float) -> None:
+        if (target := self.target) is not None:
+            vmax = self.params['pos.move'][0]
+            delta = [t - p for t, p in zip(target, self.pos)]
+            dist = math.sqrt(sum(d * d for d in delta))
+
+            if dist <= vmax * dt:
+                self.pos[:] = target
+                self.vel[:] = (0., 0., 0.)
+                self.target = None
+            else:
+                for i in range(3):
+                    self.vel[i] = vmax * delta[i] / dist
+                    self.pos[i] += self.vel[i] * dt
+        else:
+            self.vel[:] = (0., 0., 0.)
+
+        if (target := self.target_orientation) is not None:
+            step = math.radians(self.params['rot.move'][0]) * dt
+
+            for i in range(3):
+                diff = target[i] - self.orientation[i]
+                self.orientation[i] += max(-step, min(step, diff))
+
+            if self.orientation == target:
+                self.target_orientation = None
+
+        if (grip := self.target_gripper) is not None:
+            step = math.radians(self.params['grip.move'][0]) * dt
+            diff = grip - self.gripper_angle
+            self.gripper_angle += max(-step, min(step, diff))
+
+            if self.gripper_angle == grip:
+                self.target_gripper = None
+
+    def joint_angles(self) -> List[float]:
+        q = [0.] * MAX_DOF
+        q[0:3] = self.model.inverse(self.pos)
+        q[3:6] = self.orientation
+        q[6] = self.gripper_angle
+
+        return q
+
+    def encoders(self) -> List[int]:
+        return [round(q * ENC_PER_RAD) for q in self.joint_angles()]
+
+    def frame(self) -> List[float]:
+        a, b, g = self.orientation
+        ca, sa = math.cos(a), math.sin(a)
+        cb, sb = math.cos(b), math.sin(b)
+        cg, sg = math.cos(g), math.sin(g)
+
+        # R = Rx(a) Ry(b) Rz(g)
+        return [
+            cb * cg, -cb * sg, sb,
+            ca * sg + sa * sb * cg, ca * cg - sa * sb * sg, -sa * cb,
+            sa * sg - ca * sb * cg, sa * cg + ca * sb * sg, ca * cb,
+        ]
+
+    def status(self) -> List[int]:
+        return [
+            1,  # power
+            int(self.is_open),
+            1,  # started
+            0,  # reset
+            int(not self.force_enabled),
+            int(self.force_enabled),
+            int(self.brakes),
+            int(self.has_active_wrist and self.force_enabled),
+            int(self.has_wrist),
+            0,  # error
+            int(self.gravity_compensation),
+            int(self.timeguard > 0),
+            int(self.has_wrist),
+            0,  # redundancy
+            0,  # forceoffcause
+            0,  # locks
+            0xFF if self.initialized else 0,
+        ]
+
+
+# How long before the end of a simulated delay to stop sleeping (in [s]).
+_SPIN = 2e-4
+
+
+def _busy_wait(duration: float) -> None:
+    if duration <= 0:
+        return
+
+    deadline = time.perf_counter() + duration
+
+    # Sleep for all but the end of the delay, then yield until the deadline,
+    # so other threads keep running while a call waits.
+    if (left := duration - _SPIN) > 0.:
+        time.sleep(left)
+
+    while time.perf_counter() < deadline:
+        time.sleep(0)
+
+
+def _device_call(error: Any = -1, com: bool = True):
+    """
+    Resolve the trailing device ID argument of a symbol implementation,
+    simulate the communication latency if ``com`` is set, and advance the
+    device simulation before calling the implementation with the device.
+    """
+
+    def decorator(impl: Callable[..., Any]):
+        def wrapper(self: 'VirtualLibrary', *args):
+            if (dev := self._get_device(args[-1])) is None:
+                return error
+
+            if com:
+                _busy_wait(self.latency)
+
+            with dev.lock:
+                if com:
+                    dev._com_count += 1
+
+                dev.update()
+                return impl(self, dev, *args[:-1])
+
+        wrapper.__name__ = impl.__name__
+        wrapper.__doc__ = impl.__doc__
+
+        return wrapper
+
+    return decorator
+
+
+class _VirtualFunction:
+    """
+    Gives a Python implementation the calling convention of a foreign
+    function. Once ``argtypes`` and ``restype`` are assigned, calls go
+    through a ctypes callback with that prototype, so arguments are
+    converted exactly as they would be for the real library.
+    """
+
+    def __init__(self, impl: Callable[..., Any]):
+        self.__name__ = impl.__name__
+        self._impl = impl
+        self._argtypes: Optional[Tuple[Any, ...]] = None
+        self._restype: Any = ct.c_int
+        self._call: Callable[..., Any] = impl
+
+    @property
+    def argtypes(self):
+        return self._argtypes
+
+    @argtypes.setter
+    def argtypes(self, argtypes):
+        self._argtypes = tuple(argtypes)
+        self._rebuild()
+
+    @property
+    def restype(self):
+        return self._restype
+
+    @restype.setter
+    def restype(self, restype):
+        self._restype = restype
+        self._rebuild()
+
+    def _rebuild(self):
+        argtypes = self._argtypes
+
+        # ctypes callbacks cannot write to string buffers or return
+        # strings safely, so those are called directly.
+        if argtypes is None or c_char_p in (*argtypes, self._restype):
+            self._call = self._impl
+            return
+
+        self._call = ct.CFUNCTYPE(self._restype, *argtypes)(self._impl)
+
+    @property
+    def _as_parameter_(self):
+        # The callback gives the function a C address (see
+        # forcedimension_core.runtime.symbol_addresses()).
+        if not isinstance(self._call, ct._CFuncPtr):
+            raise AttributeError('_as_parameter_')
+
+        return self._call
+
+    def __call__(self, *args):
+        return self._call(*args)
+
+
+class VirtualLibrary:
+    """
+    Simulates libdhd/libdrd for one or more virtual devices. Attribute
+    access mirrors a loaded :class:`ctypes.CDLL`: every ``dhd*`` and
+    ``drd*`` symbol is returned as a callable whose ``argtypes`` and
+    ``restype`` can be assigned.
+
+    :param devices:
+        Either the number of devices to simulate, or a sequence of
+        :class:`VirtualDevice` or
+        :class:`forcedimension_core.constants.DeviceType`.
+
+    :param float latency:
+        Simulated communication latency (in [s]) added to every call that
+        communicates with a device.
+
+    :param model:
+        Either ``'point-mass'`` or ``'delta'``. Used for devices created
+        by the library.
+
+    The last error is kept per thread, but the default device (selected by
+    the open functions, ``dhdSetDevice`` and ``drdSetDevice``) is shared by
+    every thread. Threads driving different devices should pass their
+    device ID explicitly.
+    """
+
+    def __init__(
+        self,
+        devices: Union[int, Sequence[Union[VirtualDevice, DeviceType]]] = 1,
+        latency: float = 0.,
+        model: str = 'point-mass'
+    ):
+        if isinstance(devices, int):
+            devices = [DeviceType.OMEGA7_RIGHT] * devices
+
+        self.devices: List[VirtualDevice] = [
+            dev if isinstance(dev, VirtualDevice) else VirtualDevice(
+                dev, serial=i + 1, model=self.make_model(model)
+            )
+            for i, dev in enumerate(devices)
+        ]
+
+        #: Simulated communication latency in [s].
+        self.latency = latency
+
+        self._default = -1
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+    @staticmethod
+    def make_model(model: str) -> PointMassModel:
+        if model == 'point-mass':
+            return PointMassModel()
+
+        if model == 'delta':
+            return DeltaModel()
+
+        raise ValueError(f"Unknown virtual device model: {model}")
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str]) -> 'VirtualLibrary':
+        """
+        Construct a library configured by the ``FORCEDIM_VIRTUAL_*``
+        environment variables.
+
+        :raises ValueError:
+            If a variable is not valid.
+        """
+
+        devtypes = [
+            DeviceType[name.strip().upper()]
+            for name in environ.get(
+                'FORCEDIM_VIRTUAL_DEVICES', 'OMEGA7_RIGHT'
+            ).split(',')
+            if name.strip()
+        ]
+
+        return cls(
+            devices=devtypes,
+            latency=float(environ.get('FORCEDIM_VIRTUAL_LATENCY', 0.)),
+            model=environ.get('FORCEDIM_VIRTUAL_MODEL', 'point-mass')
+        )
+
+    def __getattr__(self, name: str) -> _VirtualFunction:
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        if (impl := getattr(self, f'_{name}', None)) is None:
+            if not name.startswith(('dhd', 'drd')):
+                raise AttributeError(name)
+
+            impl = self._not_implemented(name)
+
+        func = _VirtualFunction(impl)
+        self.__dict__[name] = func
+
+        return func
+
+    def _not_implemented(self, name: str):
+        def impl(*args):
+            self._set_error(ErrorNum.NOT_IMPLEMENTED)
+            return -1
+
+        impl.__name__ = name
+
+        return impl
+
+    @property
+    def last_error(self) -> ErrorNum:
+        return getattr(self._local, 'error', ErrorNum.NO_ERROR)
+
+    def _set_error(self, errno: ErrorNum) -> None:
+        self._local.error = errno
+
+    def _get_device(self, ID: int) -> Optional[VirtualDevice]:
+        if ID == -1:
+            ID = self._default
+
+        if not (0 <= ID < len(self.devices)) or not self.devices[ID].is_open:
+            self._set_error(ErrorNum.NO_DEVICE_FOUND)
+            return None
+
+        return self.devices[ID]
+
+    def _open_index(self, index: int) -> int:
+        if not (0 <= index < len(self.devices)):
+            self._set_error(ErrorNum.NO_DEVICE_FOUND)
+            return -1
+
+        self.devices[index].is_open = True
+        self._default = index
+
+        return index
+
+    # --- Error management ---------------------------------------------------
+
+    def _dhdErrorGetLast(self):
+        return int(self.last_error)
+
+    def _dhdErrorGetLastStr(self):
+        return _ERROR_STRS[self.last_error]
+
+    def _dhdErrorGetStr(self, error):
+        return _ERROR_STRS[error]
+
+    # --- Device management --------------------------------------------------
+
+    def _dhdEnableSimulator(self, enable):
+        pass
+
+    def _dhdGetDeviceCount(self):
+        return len(self.devices)
+
+    def _dhdGetAvailableCount(self):
+        return sum(not dev.is_open for dev in self.devices)
+
+    def _dhdSetDevice(self, ID):
+        if not (0 <= ID < len(self.devices)) or not self.devices[ID].is_open:
+            self._set_error(ErrorNum.NO_DEVICE_FOUND)
+            return -1
+
+        self._default = ID
+        return 0
+
+    def _dhdGetDeviceID(self):
+        return self._default
+
+    def _dhdOpen(self):
+        with self._lock:
+            for i, dev in enumerate(self.devices):
+                if not dev.is_open:
+                    return self._open_index(i)
+
+        self._set_error(ErrorNum.NO_DEVICE_FOUND)
+        return -1
+
+    def _dhdOpenID(self, index):
+        with self._lock:
+            return self._open_index(index)
+
+    def _dhdOpenType(self, devtype):
+        with self._lock:
+            for i, dev in enumerate(self.devices):
+                if not dev.is_open and dev.devtype == devtype:
+                    return self._open_index(i)
+
+        self._set_error(ErrorNum.NO_DEVICE_FOUND)
+        return -1
+
+    def _dhdOpenSerial(self, serial):
+        with self._lock:
+            for i, dev in enumerate(self.devices):
+                if not dev.is_open and dev.serial == serial:
+                    return self._open_index(i)
+
+        self._set_error(ErrorNum.NO_DEVICE_FOUND)
+        return -1
+
+    @_device_call()
+    def _dhdClose(self, dev):
+        dev.is_open = False
+        dev.regulating = False
+        dev.force_enabled = False
+        return 0
+
+    @_device_call()
+    def _dhdGetSerialNumber(self, dev, sn):
+        sn[0] = dev.serial
+        return 0
+
+    @_device_call()
+    def _dhdCheckControllerMemory(self, dev):
+        return 0
+
+    @_device_call()
+    def _dhdStop(self, dev):
+        dev.force_enabled = False
+        dev.brakes = True
+        return 0
+
+    @_device_call()
+    def _dhdGetComMode(self, dev):
+        return int(dev.com_mode)
+
+    @_device_call()
+    def _dhdSetComMode(self, dev, mode):
+        return 0
+
+    @_device_call()
+    def _dhdEnableForce(self, dev, enable):
+        dev.force_enabled = bool(enable)
+        dev.brakes = not enable
+        return 0
+
+    @_device_call()
+    def _dhdEnableGripperForce(self, dev, enable):
+        dev.gripper_force_enabled = bool(enable)
+        return 0
+
+    @_device_call()
+    def _dhdGetSystemType(self, dev):
+        return int(dev.devtype)
+
+    @_device_call()
+    def _dhdGetSystemRev(self, dev):
+        return 0
+
+    @_device_call(error=None)
+    def _dhdGetSystemName(self, dev):
+        return _SYSTEM_NAMES.get(dev.devtype, b'unknown')
+
+    @_device_call()
+    def _dhdGetVersion(self, dev, ver):
+        ver[0] = 3.
+        return 0
+
+    def _dhdGetSDKVersion(self, major, minor, release, revision):
+        major[0], minor[0], release[0], revision[0] = SDK_VERSION
+
+    @_device_call()
+    def _dhdGetComponentVersionStr(self, dev, component, buffer, size):
+        version = b'virtual-1.0'
+        ct.memmove(buffer, version, min(len(version), size - 1))
+        return 0
+
+    @_device_call()
+    def _dhdGetStatus(self, dev, out):
+        for i, val in enumerate(dev.status()[:MAX_STATUS]):
+            out[i] = val
+
+        return 0
+
+    @_device_call()
+    def _dhdGetDeviceAngleRad(self, dev, out):
+        out[0] = dev.device_angle
+        return 0
+
+    @_device_call()
+    def _dhdGetDeviceAngleDeg(self, dev, out):
+        out[0] = math.degrees(dev.device_angle)
+        return 0
+
+    @_device_call()
+    def _dhdGetEffectorMass(self, dev, out):
+        out[0] = dev.effector_mass
+        return 0
+
+    @_device_call(error=False)
+    def _dhdHasBase(self, dev):
+        return dev.has_base
+
+    @_device_call(error=False)
+    def _dhdHasWrist(self, dev):
+        return dev.has_wrist
+
+    @_device_call(error=False)
+    def _dhdHasActiveWrist(self, dev):
+        return dev.has_active_wrist
+
+    @_device_call(error=False)
+    def _dhdHasGripper(self, dev):
+        return dev.has_gripper
+
+    @_device_call(error=False)
+    def _dhdHasActiveGripper(self, dev):
+        return dev.has_gripper
+
+    @_device_call(error=False)
+    def _dhdIsLeftHanded(self, dev):
+        return dev.is_left_handed
+
+    @_device_call()
+    def _dhdGetButton(self, dev, index):
+        return (dev.button_mask >> index) & 1
+
+    @_device_call(error=0)
+    def _dhdGetButtonMask(self, dev):
+        return dev.button_mask
+
+    @_device_call()
+    def _dhdSetOutput(self, dev, output):
+        dev.output = output
+        return 0
+
+    @_device_call()
+    def _dhdReset(self, dev):
+        return 0
+
+    @_device_call()
+    def _dhdWaitForReset(self, dev, timeout):
+        return 0
+
+    @_device_call()
+    def _dhdSetStandardGravity(self, dev, g):
+        dev.standard_gravity = g
+        return 0
+
+    @_device_call()
+    def _dhdSetGravityCompensation(self, dev, val):
+        dev.gravity_compensation = bool(val)
+        return 0
+
+    @_device_call()
+    def _dhdSetBrakes(self, dev, val):
+        dev.brakes = bool(val)
+        return 0
+
+    @_device_call()
+    def _dhdSetDeviceAngleRad(self, dev, angle):
+        dev.device_angle = angle
+        return 0
+
+    @_device_call()
+    def _dhdSetDeviceAngleDeg(self, dev, angle):
+        dev.device_angle = math.radians(angle)
+        return 0
+
+    @_device_call()
+    def _dhdSetEffectorMass(self, dev, mass):
+        dev.effector_mass = mass
+        return 0
+
+    @_device_call()
+    def _dhdEmulateButton(self, dev, val):
+        dev.emulate_button = bool(val)
+        return 0
+
+    @_device_call()
+    def _dhdSetTimeGuard(self, dev, us):
+        dev.timeguard = us
+        return 0
+
+    @_device_call()
+    def _dhdSetVelocityThreshold(self, dev, val):
+        dev.velocity_threshold = val
+        return 0
+
+    @_device_call()
+    def _dhdGetVelocityThreshold(self, dev, out):
+        out[0] = dev.velocity_threshold
+        return 0
+
+    @_device_call()
+    def _dhdGetBaseAngleXRad(self, dev, out):
+        out[0] = dev.base_angle_x
+        return 0
+
+    @_device_call()
+    def _dhdGetBaseAngleXDeg(self, dev, out):
+        out[0] = math.degrees(dev.base_angle_x)
+        return 0
+
+    @_device_call()
+    def _dhdSetBaseAngleXRad(self, dev, angle):
+        dev.base_angle_x = angle
+        return 0
+
+    @_device_call()
+    def _dhdSetBaseAngleXDeg(self, dev, angle):
+        dev.base_angle_x = math.radians(angle)
+        return 0
+
+    @_device_call()
+    def _dhdGetBaseAngleZRad(self, dev, out):
+        out[0] = dev.base_angle_z
+        return 0
+
+    @_device_call()
+    def _dhdGetBaseAngleZDeg(self, dev, out):
+        out[0] = math.degrees(dev.base_angle_z)
+        return 0
+
+    @_device_call()
+    def _dhdSetBaseAngleZRad(self, dev, angle):
+        dev.base_angle_z = angle
+        return 0
+
+    @_device_call()
+    def _dhdSetBaseAngleZDeg(self, dev, angle):
+        dev.base_angle_z = math.radians(angle)
+        return 0
+
+    @_device_call(error=-1.)
+    def _dhdGetComFreq(self, dev):
+        now = time.perf_counter()
+        freq = dev._com_count / max(now - dev._com_t, 1e-9) / 1e3
+        dev._com_count = 0
+        dev._com_t = now
+
+        return freq
+
+    @_device_call()
+    def _dhdSetMaxForce(self, dev, val):
+        dev.max_force = val
+        return 0
+
+    @_device_call(error=-1.)
+    def _dhdGetMaxForce(self, dev):
+        return dev.max_force
+
+    @_device_call()
+    def _dhdSetMaxTorque(self, dev, val):
+        dev.max_torque = val
+        return 0
+
+    @_device_call(error=-1.)
+    def _dhdGetMaxTorque(self, dev):
+        return dev.max_torque
+
+    @_device_call()
+    def _dhdSetMaxGripperForce(self, dev, val):
+        dev.max_gripper_force = val
+        return 0
+
+    @_device_call(error=-1.)
+    def _dhdGetMaxGripperForce(self, dev):
+        return dev.max_gripper_force
+
+    def _velocity_config(self, kind):
+        @_device_call()
+        def impl(self, dev, ms, mode):
+            dev.velocity_config[kind] = (ms, mode)
+            return 0
+
+        return lambda *args: impl(self, *args)
+
+    @property
+    def _dhdConfigLinearVelocity(self):
+        return self._velocity_config('linear')
+
+    @property
+    def _dhdConfigAngularVelocity(self):
+        return self._velocity_config('angular')
+
+    @property
+    def _dhdConfigGripperVelocity(self):
+        return self._velocity_config('gripper')
+
+    @_device_call()
+    def _dhdSetVibration(self, dev, freq, amplitude, profile):
+        return 0
+
+    # --- Kinematics -------------------------------------------------------
+
+    @_device_call()
+    def _dhdGetPosition(self, dev, px, py, pz):
+        px[0], py[0], pz[0] = dev.pos
+        return 0
+
+    @_device_call()
+    def _dhdGetForce(self, dev, fx, fy, fz):
+        fx[0], fy[0], fz[0] = dev.force
+        return 0
+
+    @_device_call()
+    def _dhdSetForce(self, dev, fx, fy, fz):
+        dev.force[:] = (fx, fy, fz)
+        return 0
+
+    @_device_call()
+    def _dhdGetOrientationRad(self, dev, oa, ob, og):
+        oa[0], ob[0], og[0] = dev.orientation
+        return 0
+
+    @_device_call()
+    def _dhdGetOrientationDeg(self, dev, oa, ob, og):
+        oa[0], ob[0], og[0] = map(math.degrees, dev.orientation)
+        return 0
+
+    @_device_call()
+    def _dhdGetPositionAndOrientationRad(self, dev, px, py, pz, oa, ob, og):
+        px[0], py[0], pz[0] = dev.pos
+        oa[0], ob[0], og[0] = dev.orientation
+        return 0
+
+    @_device_call()
+    def _dhdGetPositionAndOrientationDeg(self, dev, px, py, pz, oa, ob, og):
+        px[0], py[0], pz[0] = dev.pos
+        oa[0], ob[0], og[0] = map(math.degrees, dev.orientation)
+        return 0
+
+    @_device_call()
+    def _dhdGetPositionAndOrientationFrame(self, dev, px, py, pz, matrix):
+        px[0], py[0], pz[0] = dev.pos
+
+        for i, val in enumerate(dev.frame()):
+            matrix[i] = val
+
+        return 0
+
+    @_device_call()
+    def _dhdGetOrientationFrame(self, dev, matrix):
+        for i, val in enumerate(dev.frame()):
+            matrix[i] = val
+
+        return 0
+
+    @_device_call()
+    def _dhdGetForceAndTorque(self, dev, fx, fy, fz, tx, ty, tz):
+        fx[0], fy[0], fz[0] = dev.force
+        tx[0], ty[0], tz[0] = dev.torque
+        return 0
+
+    @_device_call()
+    def _dhdSetForceAndTorque(self, dev, fx, fy, fz, tx, ty, tz):
+        dev.force[:] = (fx, fy, fz)
+        dev.torque[:] = (tx, ty, tz)
+        return 0
+
+    @_device_call()
+    def _dhdGetForceAndTorqueAndGripperForce(
+        self, dev, fx, fy, fz, tx, ty, tz, fg
+    ):
+        fx[0], fy[0], fz[0] = dev.force
+        tx[0], ty[0], tz[0] = dev.torque
+        fg[0] = dev.gripper_force
+        return 0
+
+    @_device_call()
+    def _dhdSetForceAndTorqueAndGripperForce(
+        self, dev, fx, fy, fz, tx, ty, tz, fg
+    ):
+        dev.force[:] = (fx, fy, fz)
+        dev.torque[:] = (tx, ty, tz)
+        dev.gripper_force = fg
+        return 0
+
+    @_device_call()
+    def _dhdSetForceAndGripperForce(self, dev, fx, fy, fz, fg):
+        dev.force[:] = (fx, fy, fz)
+        dev.gripper_force = fg
+        return 0
+
+    @_device_call()
+    def _dhdSetForceAndWristJointTorques(self, dev, fx, fy, fz, t0, t1, t2):
+        dev.force[:] = (fx, fy, fz)
+        dev.torque[:] = (t0, t1, t2)
+        return 0
+
+    @_device_call()
+    def _dhdSetForceAndWristJointTorquesAndGripperForce(
+        self, dev, fx, fy, fz, t0, t1, t2, fg
+    ):
+        dev.force[:] = (fx, fy, fz)
+        dev.torque[:] = (t0, t1, t2)
+        dev.gripper_force = fg
+        return 0
+
+    @_device_call()
+    def _dhdGetLinearVelocity(self, dev, vx, vy, vz):
+        vx[0], vy[0], vz[0] = dev.vel
+        return 0
+
+    @_device_call()
+    def _dhdGetAngularVelocityRad(self, dev, wx, wy, wz):
+        wx[0], wy[0], wz[0] = dev.angular_vel
+        return 0
+
+    @_device_call()
+    def _dhdGetAngularVelocityDeg(self, dev, wx, wy, wz):
+        wx[0], wy[0], wz[0] = map(math.degrees, dev.angular_vel)
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperAngleRad(self, dev, out):
+        out[0] = dev.gripper_angle
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperAngleDeg(self, dev, out):
+        out[0] = math.degrees(dev.gripper_angle)
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperGap(self, dev, out):
+        out[0] = self._angle_to_gap(dev.gripper_angle)
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperAngularVelocityRad(self, dev, out):
+        out[0] = dev.gripper_vel
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperAngularVelocityDeg(self, dev, out):
+        out[0] = math.degrees(dev.gripper_vel)
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperLinearVelocity(self, dev, out):
+        out[0] = 0.03 * dev.gripper_vel
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperThumbPos(self, dev, px, py, pz):
+        half = self._angle_to_gap(dev.gripper_angle) / 2
+        px[0], py[0], pz[0] = dev.pos[0], dev.pos[1] + half, dev.pos[2]
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperFingerPos(self, dev, px, py, pz):
+        half = self._angle_to_gap(dev.gripper_angle) / 2
+        px[0], py[0], pz[0] = dev.pos[0], dev.pos[1] - half, dev.pos[2]
+        return 0
+
+    @staticmethod
+    def _angle_to_gap(angle: float) -> float:
+        return 0.06 * math.sin(angle / 2)
+
+    @staticmethod
+    def _gap_to_angle(gap: float) -> float:
+        return 2 * math.asin(max(-1., min(1., gap / 0.06)))
+
+    # --- Expert SDK -------------------------------------------------------
+
+    def _dhdEnableExpertMode(self):
+        for dev in self.devices:
+            dev.expert_mode = True
+
+        return 0
+
+    def _dhdDisableExpertMode(self):
+        for dev in self.devices:
+            dev.expert_mode = False
+
+        return 0
+
+    @_device_call()
+    def _dhdPreset(self, dev, val, mask):
+        return 0
+
+    @_device_call()
+    def _dhdSetWatchdog(self, dev, val):
+        dev.watchdog = val
+        return 0
+
+    @_device_call()
+    def _dhdGetWatchdog(self, dev, out):
+        out[0] = dev.watchdog
+        return 0
+
+    @_device_call()
+    def _dhdGetEnc(self, dev, out, mask):
+        enc = dev.encoders()
+
+        for i in range(MAX_DOF):
+            if mask & (1 << i):
+                out[i] = enc[i]
+
+        return 0
+
+    @_device_call()
+    def _dhdGetEncoder(self, dev, index):
+        if not (0 <= index < MAX_DOF):
+            self._set_error(ErrorNum.INVALID_INDEX)
+            return -1
+
+        return dev.encoders()[index]
+
+    @_device_call()
+    def _dhdGetDeltaEncoders(self, dev, e0, e1, e2):
+        e0[0], e1[0], e2[0] = dev.encoders()[0:3]
+        return 0
+
+    @_device_call()
+    def _dhdGetWristEncoders(self, dev, e0, e1, e2):
+        e0[0], e1[0], e2[0] = dev.encoders()[3:6]
+        return 0
+
+    @_device_call()
+    def _dhdGetGripperEncoder(self, dev, out):
+        out[0] = dev.encoders()[6]
+        return 0
+
+    @_device_call()
+    def _dhdGetEncRange(self, dev, enc_min, enc_max):
+        for i in range(MAX_DOF):
+            enc_min[i] = -round(math.pi * ENC_PER_RAD)
+            enc_max[i] = round(math.pi * ENC_PER_RAD)
+
+        return 0
+
+    @_device_call()
+    def _dhdGetEncVelocities(self, dev, out):
+        for i in range(MAX_DOF):
+            out[i] = 0.
+
+        return 0
+
+    @_device_call()
+    def _dhdGetJointAngles(self, dev, out):
+        for i, q in enumerate(dev.joint_angles()):
+            out[i] = q
+
+        return 0
+
+    @_device_call()
+    def _dhdGetJointVelocities(self, dev, out):
+        for i in range(MAX_DOF):
+            out[i] = 0.
+
+        return 0
+
+    @_device_call()
+    def _dhdGetJointAngleRange(self, dev, jmin, jmax):
+        for i in range(MAX_DOF):
+            jmin[i] = -math.pi
+            jmax[i] = math.pi
+
+        return 0
+
+    @_device_call()
+    def _dhdGetDeltaJointAngles(self, dev, j0, j1, j2):
+        j0[0], j1[0], j2[0] = dev.joint_angles()[0:3]
+        return 0
+
+    @_device_call()
+    def _dhdGetWristJointAngles(self, dev, j0, j1, j2):
+        j0[0], j1[0], j2[0] = dev.orientation
+        return 0
+
+    @_device_call()
+    def _dhdGetDeltaJacobian(self, dev, out):
+        jac = dev.model.jacobian(dev.joint_angles()[0:3])
+
+        for i in range(3):
+            for j in range(3):
+                out[3 * i + j] = jac[i][j]
+
+        return 0
+
+    @_device_call()
+    def _dhdGetWristJacobian(self, dev, out):
+        for i in range(9):
+            out[i] = 1. if i % 4 == 0 else 0.
+
+        return 0
+
+    @_device_call()
+    def _dhdUpdateEncoders(self, dev):
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaEncoderToPosition(self, dev, e0, e1, e2, px, py, pz):
+        try:
+            px[0], py[0], pz[0] = dev.model.forward(
+                (e0 / ENC_PER_RAD, e1 / ENC_PER_RAD, e2 / ENC_PER_RAD)
+            )
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaPositionToEncoder(self, dev, px, py, pz, e0, e1, e2):
+        try:
+            q = dev.model.inverse((px, py, pz))
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        e0[0], e1[0], e2[0] = (round(qi * ENC_PER_RAD) for qi in q)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaEncodersToJointAngles(self, dev, e0, e1, e2, j0, j1, j2):
+        j0[0] = e0 / ENC_PER_RAD
+        j1[0] = e1 / ENC_PER_RAD
+        j2[0] = e2 / ENC_PER_RAD
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaJointAnglesToEncoders(self, dev, j0, j1, j2, e0, e1, e2):
+        e0[0] = round(j0 * ENC_PER_RAD)
+        e1[0] = round(j1 * ENC_PER_RAD)
+        e2[0] = round(j2 * ENC_PER_RAD)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaJointAnglesToJacobian(self, dev, j0, j1, j2, out):
+        try:
+            jac = dev.model.jacobian((j0, j1, j2))
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        for i in range(3):
+            for j in range(3):
+                out[3 * i + j] = jac[i][j]
+
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaGravityJointTorques(self, dev, j0, j1, j2, q0, q1, q2):
+        q0[0] = q1[0] = q2[0] = 0.
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristGravityJointTorques(self, dev, j0, j1, j2, q0, q1, q2):
+        q0[0] = q1[0] = q2[0] = 0.
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaJointTorquesExtrema(self, dev, j0, j1, j2, qmin, qmax):
+        for i in range(3):
+            qmin[i] = -dev.model.max_force
+            qmax[i] = dev.model.max_force
+
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristJointTorquesExtrema(self, dev, j0, j1, j2, qmin, qmax):
+        for i in range(3):
+            qmin[i] = -1.
+            qmax[i] = 1.
+
+        return 0
+
+    @staticmethod
+    def _to_motor(val: float) -> int:
+        return max(0, min(0xFFFF, MOTOR_ZERO + round(val / FORCE_PER_MOTOR_INC)))
+
+    @staticmethod
+    def _from_motor(mot: int) -> float:
+        return (mot - MOTOR_ZERO) * FORCE_PER_MOTOR_INC
+
+    @_device_call(com=False)
+    def _dhdDeltaMotorToForce(self, dev, m0, m1, m2, e0, e1, e2, fx, fy, fz):
+        fx[0], fy[0], fz[0] = map(self._from_motor, (m0, m1, m2))
+        return 0
+
+    @_device_call(com=False)
+    def _dhdDeltaForceToMotor(self, dev, fx, fy, fz, e0, e1, e2, m0, m1, m2):
+        m0[0], m1[0], m2[0] = map(self._to_motor, (fx, fy, fz))
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristMotorToTorque(
+        self, dev, m0, m1, m2, e0, e1, e2, tx, ty, tz
+    ):
+        tx[0], ty[0], tz[0] = map(self._from_motor, (m0, m1, m2))
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristTorqueToMotor(
+        self, dev, tx, ty, tz, e0, e1, e2, m0, m1, m2
+    ):
+        m0[0], m1[0], m2[0] = map(self._to_motor, (tx, ty, tz))
+        return 0
+
+    @_device_call(com=False)
+    def _dhdGripperMotorToForce(self, dev, mot, force, enc):
+        force[0] = self._from_motor(mot)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdGripperForceToMotor(self, dev, force, mot, enc):
+        mot[0] = self._to_motor(force)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristEncoderToOrientation(self, dev, e0, e1, e2, oa, ob, og):
+        oa[0] = e0 / ENC_PER_RAD
+        ob[0] = e1 / ENC_PER_RAD
+        og[0] = e2 / ENC_PER_RAD
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristOrientationToEncoder(self, dev, oa, ob, og, e0, e1, e2):
+        e0[0] = round(oa * ENC_PER_RAD)
+        e1[0] = round(ob * ENC_PER_RAD)
+        e2[0] = round(og * ENC_PER_RAD)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristEncodersToJointAngles(self, dev, e0, e1, e2, j0, j1, j2):
+        j0[0] = e0 / ENC_PER_RAD
+        j1[0] = e1 / ENC_PER_RAD
+        j2[0] = e2 / ENC_PER_RAD
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristJointAnglesToEncoders(self, dev, j0, j1, j2, e0, e1, e2):
+        e0[0] = round(j0 * ENC_PER_RAD)
+        e1[0] = round(j1 * ENC_PER_RAD)
+        e2[0] = round(j2 * ENC_PER_RAD)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdWristJointAnglesToJacobian(self, dev, j0, j1, j2, out):
+        for i in range(9):
+            out[i] = 1. if i % 4 == 0 else 0.
+
+        return 0
+
+    @_device_call(com=False)
+    def _dhdJointAnglesToInertiaMatrix(self, dev, joint_angles, out):
+        for i in range(36):
+            out[i] = dev.model.mass if i % 7 == 0 else 0.
+
+        return 0
+
+    @_device_call(com=False)
+    def _dhdJointAnglesToGravityJointTorques(self, dev, joint_angles, out, mask):
+        for i in range(MAX_DOF):
+            if mask & (1 << i):
+                out[i] = 0.
+
+        return 0
+
+    @_device_call(com=False)
+    def _dhdGripperEncoderToAngleRad(self, dev, enc, out):
+        out[0] = enc / ENC_PER_RAD
+        return 0
+
+    @_device_call(com=False)
+    def _dhdGripperEncoderToGap(self, dev, enc, out):
+        out[0] = self._angle_to_gap(enc / ENC_PER_RAD)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdGripperAngleRadToEncoder(self, dev, angle, out):
+        out[0] = round(angle * ENC_PER_RAD)
+        return 0
+
+    @_device_call(com=False)
+    def _dhdGripperGapToEncoder(self, dev, gap, out):
+        out[0] = round(self._gap_to_angle(gap) * ENC_PER_RAD)
+        return 0
+
+    @_device_call()
+    def _dhdSetMotor(self, dev, index, val):
+        if not (0 <= index < MAX_DOF):
+            self._set_error(ErrorNum.INVALID_INDEX)
+            return -1
+
+        dev.motors[index] = val
+        return 0
+
+    @_device_call()
+    def _dhdSetDeltaMotor(self, dev, m0, m1, m2):
+        dev.motors[0:3] = (m0, m1, m2)
+        dev.force[:] = map(self._from_motor, (m0, m1, m2))
+        return 0
+
+    @_device_call()
+    def _dhdSetWristMotor(self, dev, m0, m1, m2):
+        dev.motors[3:6] = (m0, m1, m2)
+        return 0
+
+    @_device_call()
+    def _dhdSetGripperMotor(self, dev, mot):
+        dev.motors[6] = mot
+        return 0
+
+    @_device_call()
+    def _dhdSetMot(self, dev, mot, mask):
+        for i in range(MAX_DOF):
+            if mask & (1 << i):
+                dev.motors[i] = mot[i]
+
+        return 0
+
+    @_device_call()
+    def _dhdPreloadMot(self, dev, mot, mask):
+        return 0
+
+    @_device_call()
+    def _dhdSetBrk(self, dev, mask):
+        dev.brakes = bool(mask)
+        return 0
+
+    @_device_call()
+    def _dhdSetDeltaJointTorques(self, dev, t0, t1, t2):
+        dev.force[:] = (t0, t1, t2)
+        return 0
+
+    @_device_call()
+    def _dhdSetWristJointTorques(self, dev, t0, t1, t2):
+        dev.torque[:] = (t0, t1, t2)
+        return 0
+
+    @_device_call()
+    def _dhdSetJointTorques(self, dev, torques, mask):
+        for i in range(3):
+            if mask & (1 << i):
+                dev.force[i] = torques[i]
+
+            if mask & (1 << (i + 3)):
+                dev.torque[i] = torques[i + 3]
+
+        return 0
+
+    @_device_call()
+    def _dhdControllerSetDevice(self, dev, devtype):
+        dev.devtype = DeviceType(devtype)
+        return 0
+
+    def _dhdReadConfigFromFile(self, filename, ID):
+        self._set_error(ErrorNum.FILE_NOT_FOUND)
+        return -1
+
+    # --- OS independent -------------------------------------------------------
+
+    def _dhdKbHit(self):
+        return False
+
+    def _dhdKbGet(self):
+        return 0
+
+    def _dhdGetTime(self):
+        return time.perf_counter() - self._t0
+
+    def _dhdSleep(self, sec):
+        time.sleep(sec)
+
+    # --- Robotic SDK (DRD) --------------------------------------------------
+
+    def _drdOpen(self):
+        return self._dhdOpen()
+
+    def _drdOpenID(self, index):
+        return self._dhdOpenID(index)
+
+    def _drdSetDevice(self, ID):
+        return self._dhdSetDevice(ID)
+
+    def _drdGetDeviceID(self):
+        return self._default
+
+    @_device_call()
+    def _drdClose(self, dev):
+        dev.regulating = False
+        dev.is_open = False
+        return 0
+
+    @_device_call(error=False, com=False)
+    def _drdIsSupported(self, dev):
+        return dev.devtype not in (DeviceType.FALCON, DeviceType.CUSTOM)
+
+    @_device_call(error=False, com=False)
+    def _drdIsRunning(self, dev):
+        return dev.regulating
+
+    @_device_call(error=False, com=False)
+    def _drdIsMoving(self, dev):
+        return dev.is_moving
+
+    @_device_call(error=False, com=False)
+    def _drdIsFiltering(self, dev):
+        return dev.filtering
+
+    @_device_call(error=False, com=False)
+    def _drdIsInitialized(self, dev):
+        return dev.initialized
+
+    @_device_call()
+    def _drdAutoInit(self, dev):
+        dev.initialized = True
+        return 0
+
+    @_device_call()
+    def _drdPrecisionInit(self, dev):
+        dev.initialized = True
+        return 0
+
+    @_device_call()
+    def _drdCheckInit(self, dev):
+        if not dev.initialized:
+            self._set_error(ErrorNum.DEVICE_NOT_READY)
+            return -1
+
+        return 0
+
+    @_device_call()
+    def _drdStart(self, dev):
+        if not dev.initialized:
+            self._set_error(ErrorNum.DEVICE_NOT_READY)
+            return -1
+
+        dev.regulating = True
+        dev.force_enabled = True
+        dev.brakes = False
+        return 0
+
+    @_device_call()
+    def _drdStop(self, dev, frc):
+        dev.regulating = False
+        dev.target = dev.target_orientation = dev.target_gripper = None
+        dev.force_enabled = bool(frc)
+        dev.brakes = not frc
+        return 0
+
+    @_device_call(com=False)
+    def _drdGetPriorities(self, dev, prio, ctrlprio):
+        prio[0], ctrlprio[0] = dev.priorities
+        return 0
+
+    @_device_call(com=False)
+    def _drdSetPriorities(self, dev, prio, ctrlprio):
+        dev.priorities = (prio, ctrlprio)
+        return 0
+
+    @_device_call()
+    def _drdEnableFilter(self, dev, on):
+        dev.filtering = bool(on)
+        return 0
+
+    @_device_call(com=False)
+    def _drdGetPositionAndOrientation(
+        self, dev, px, py, pz, oa, ob, og, pg, matrix
+    ):
+        px[0], py[0], pz[0] = dev.pos
+        oa[0], ob[0], og[0] = dev.orientation
+        pg[0] = self._angle_to_gap(dev.gripper_angle)
+
+        for i, val in enumerate(dev.frame()):
+            matrix[i] = val
+
+        return 0
+
+    @_device_call(com=False)
+    def _drdGetVelocity(self, dev, vx, vy, vz, wx, wy, wz, vg):
+        vx[0], vy[0], vz[0] = dev.vel
+        wx[0], wy[0], wz[0] = dev.angular_vel
+        vg[0] = 0.03 * dev.gripper_vel
+        return 0
+
+    @_device_call(error=-1., com=False)
+    def _drdGetCtrlFreq(self, dev):
+        return dev.ctrl_freq if dev.regulating else 0.
+
+    @_device_call()
+    def _drdSetForceAndTorqueAndGripperForce(
+        self, dev, fx, fy, fz, tx, ty, tz, fg
+    ):
+        dev.force[:] = (fx, fy, fz)
+        dev.torque[:] = (tx, ty, tz)
+        dev.gripper_force = fg
+        return 0
+
+    @_device_call()
+    def _drdSetForceAndWristJointTorquesAndGripperForce(
+        self, dev, fx, fy, fz, t0, t1, t2, fg
+    ):
+        dev.force[:] = (fx, fy, fz)
+        dev.torque[:] = (t0, t1, t2)
+        dev.gripper_force = fg
+        return 0
+
+    @_device_call(com=False)
+    def _drdRegulatePos(self, dev, on):
+        dev.regulate['pos'] = bool(on)
+        return 0
+
+    @_device_call(com=False)
+    def _drdRegulateRot(self, dev, on):
+        dev.regulate['rot'] = bool(on)
+        return 0
+
+    @_device_call(com=False)
+    def _drdRegulateGrip(self, dev, on):
+        dev.regulate['grip'] = bool(on)
+        return 0
+
+    def _move(
+        self, dev: VirtualDevice, block: bool, pos=None, rot=None, grip=None
+    ) -> int:
+        if not dev.regulating:
+            self._set_error(ErrorNum.NO_REGULATION)
+            return -1
+
+        if pos is not None:
+            dev.target = list(pos)
+
+        if rot is not None:
+            dev.target_orientation = list(rot)
+
+        if grip is not None:
+            dev.target_gripper = grip
+
+        if block:
+            # Release the device lock so other threads can observe the
+            # motion while this one waits for it to finish.
+            depth = 0
+            while True:
+                try:
+                    dev.lock.release()
+                    depth += 1
+                except RuntimeError:
+                    break
+
+            try:
+                while True:
+                    with dev.lock:
+                        dev.update()
+
+                        if not dev.is_moving:
+                            break
+
+                    time.sleep(1e-3)
+            finally:
+                for _ in range(depth):
+                    dev.lock.acquire()
+
+        return 0
+
+    @_device_call()
+    def _drdMoveTo(self, dev, pos, block):
+        return self._move(
+            dev, block,
+            pos=(pos[0], pos[1], pos[2]),
+            rot=(pos[3], pos[4], pos[5]),
+            grip=pos[6] if dev.has_gripper else None
+        )
+
+    @_device_call()
+    def _drdMoveToPos(self, dev, px, py, pz, block):
+        return self._move(dev, block, pos=(px, py, pz))
+
+    @_device_call()
+    def _drdMoveToRot(self, dev, oa, ob, og, block):
+        return self._move(dev, block, rot=(oa, ob, og))
+
+    @_device_call()
+    def _drdMoveToGrip(self, dev, pg, block):
+        return self._move(dev, block, grip=pg)
+
+    @_device_call()
+    def _drdMoveToEnc(self, dev, e0, e1, e2, block):
+        try:
+            pos = dev.model.forward(
+                (e0 / ENC_PER_RAD, e1 / ENC_PER_RAD, e2 / ENC_PER_RAD)
+            )
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        return self._move(dev, block, pos=pos)
+
+    @_device_call()
+    def _drdMoveToAllEnc(self, dev, enc, block):
+        try:
+            pos = dev.model.forward(
+                (enc[0] / ENC_PER_RAD, enc[1] / ENC_PER_RAD,
+                 enc[2] / ENC_PER_RAD)
+            )
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        return self._move(
+            dev, block,
+            pos=pos,
+            rot=tuple(enc[i] / ENC_PER_RAD for i in range(3, 6)),
+            grip=enc[6] / ENC_PER_RAD if dev.has_gripper else None
+        )
+
+    def _track(self, dev: VirtualDevice, pos=None, rot=None, grip=None):
+        if not dev.regulating:
+            self._set_error(ErrorNum.NO_REGULATION)
+            return -1
+
+        if pos is not None:
+            dev.pos[:] = pos
+            dev.target = None
+
+        if rot is not None:
+            dev.orientation[:] = rot
+            dev.target_orientation = None
+
+        if grip is not None:
+            dev.gripper_angle = grip
+            dev.target_gripper = None
+
+        return 0
+
+    @_device_call()
+    def _drdTrack(self, dev, pos):
+        return self._track(
+            dev,
+            pos=(pos[0], pos[1], pos[2]),
+            rot=(pos[3], pos[4], pos[5]),
+            grip=pos[6] if dev.has_gripper else None
+        )
+
+    @_device_call()
+    def _drdTrackPos(self, dev, px, py, pz):
+        return self._track(dev, pos=(px, py, pz))
+
+    @_device_call()
+    def _drdTrackRot(self, dev, oa, ob, og):
+        return self._track(dev, rot=(oa, ob, og))
+
+    @_device_call()
+    def _drdTrackGrip(self, dev, pg):
+        return self._track(dev, grip=pg)
+
+    @_device_call()
+    def _drdTrackEnc(self, dev, e0, e1, e2):
+        try:
+            pos = dev.model.forward(
+                (e0 / ENC_PER_RAD, e1 / ENC_PER_RAD, e2 / ENC_PER_RAD)
+            )
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        return self._track(dev, pos=pos)
+
+    @_device_call()
+    def _drdTrackAllEnc(self, dev, enc):
+        try:
+            pos = dev.model.forward(
+                (enc[0] / ENC_PER_RAD, enc[1] / ENC_PER_RAD,
+                 enc[2] / ENC_PER_RAD)
+            )
+        except ValueError:
+            self._set_error(ErrorNum.GEOMETRY)
+            return -1
+
+        return self._track(
+            dev,
+            pos=pos,
+            rot=tuple(enc[i] / ENC_PER_RAD for i in range(3, 6)),
+            grip=enc[6] / ENC_PER_RAD if dev.has_gripper else None
+        )
+
+    @_device_call()
+    def _drdHold(self, dev):
+        dev.target = dev.target_orientation = dev.target_gripper = None
+        return 0
+
+    @_device_call()
+    def _drdLock(self, dev, mask, init):
+        return 0
+
+    @_device_call(com=False)
+    def _drdSetMotRatioMax(self, dev, scale):
+        dev.mot_ratio_max = scale
+        return 0
+
+    @_device_call(error=-1., com=False)
+    def _drdGetMotRatioMax(self, dev):
+        return dev.mot_ratio_max
+
+    def _gain(self, index: int, setter: bool):
+        if setter:
+            @_device_call(com=False)
+            def impl(self, dev, gain):
+                dev.enc_gains[index] = gain
+                return 0
+        else:
+            @_device_call(error=-1., com=False)
+            def impl(self, dev):
+                return dev.enc_gains[index]
+
+        return lambda *args: impl(self, *args)
+
+    @property
+    def _drdSetEncPGain(self):
+        return self._gain(0, True)
+
+    @property
+    def _drdGetEncPGain(self):
+        return self._gain(0, False)
+
+    @property
+    def _drdSetEncIGain(self):
+        return self._gain(1, True)
+
+    @property
+    def _drdGetEncIGain(self):
+        return self._gain(1, False)
+
+    @property
+    def _drdSetEncDGain(self):
+        return self._gain(2, True)
+
+    @property
+    def _drdGetEncDGain(self):
+        return self._gain(2, False)
+
+    def _param(self, key: str, setter: bool):
+        if setter:
+            @_device_call(com=False)
+            def impl(self, dev, vmax, amax, jerk):
+                dev.params[key] = [vmax, amax, jerk]
+                return 0
+        else:
+            @_device_call(com=False)
+            def impl(self, dev, vmax, amax, jerk):
+                vmax[0], amax[0], jerk[0] = dev.params[key]
+                return 0
+
+        return lambda *args: impl(self, *args)
+
+    def __dir__(self):
+        return [
+            name[1:] for name in dir(type(self))
+            if name.startswith(('_dhd', '_drd'))
+        ]
+
+
+def _make_param_properties():
+    for kind, name in (
+        ('pos', 'Pos'), ('rot', 'Rot'), ('grip', 'Grip'), ('enc', 'Enc')
+    ):
+        for mode, mode_name in (('move', 'Move'), ('track', 'Track')):
+            for prefix, setter in (('Set', True), ('Get', False)):
+                symbol = f'_drd{prefix}{name}{mode_name}Param'
+                setattr(
+                    VirtualLibrary, symbol,
+                    property(
+                        lambda self, key=f'{kind}.{mode}', setter=setter:
+                        self._param(key, setter)
+                    )
+                )
+
+
+_make_param_properties()
+
+
+def _wait_for_tick(self: VirtualLibrary, ID: int) -> None:
+    if (dev := self._get_device(ID)) is None:
+        return
+
+    period = 1e-3 / dev.ctrl_freq
+    now = time.perf_counter()
+    _busy_wait(period - (now % period))
+
+
+VirtualLibrary._drdWaitForTick = _wait_for_tick  # type: ignore
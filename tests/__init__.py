@@ -4,8 +4,22 @@ os.environ['__fdsdkpy_unittest__'] = 'True'
 
 from tests.dhd import TestExpertSDK, TestOSIndependentSDK, TestStandardSDK
 from tests.drd import TestRoboticSDK
+from tests.test_aio import TestAio
+from tests.test_allocations import TestAllocations
+from tests.test_batch import TestBatch
+from tests.test_checked import TestChecked
 from tests.test_constants import TestConstants
 from tests.test_containers import TestContainers
+from tests.test_device import TestDevice
+from tests.test_discovery import TestDiscovery
+from tests.test_loop import TestLoop
 from tests.test_numpy_containers import TestNumpyContainers
+from tests.test_poller import TestPoller
+from tests.test_profiling import TestProfiling
+from tests.test_replay import TestReplay
 from tests.test_runtime import TestRuntime
+from tests.test_shared import TestShared
+from tests.test_telemetry import TestTelemetry
+from tests.test_trajectory import TestTrajectory
 from tests.test_util import TestUtil
+from tests.test_virtual import TestVirtual
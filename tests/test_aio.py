@@ -0,0 +1,133 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import unittest
+
+import forcedimension_core.drd as drd
+from forcedimension_core import aio, runtime
+from forcedimension_core.constants import DeviceType
+from forcedimension_core.virtual import VirtualLibrary
+
+
+class TestAio(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(devices=[DeviceType.OMEGA7_RIGHT] * 3)
+        self._previous = runtime.install(self.lib)
+
+    def tearDown(self):
+        aio.shutdown()
+        runtime.install(self._previous)
+
+    def test_concurrent(self):
+        async def home(index):
+            ID = await aio.openID(index)
+            self.assertEqual(await aio.autoInit(ID), 0)
+            self.assertEqual(drd.start(ID), 0)
+
+            self.assertEqual(
+                await aio.moveToPos((0.01 * index, 0., 0.), ID), 0
+            )
+
+            return ID, threading.current_thread()
+
+        async def main():
+            return await asyncio.gather(*(home(i) for i in range(3)))
+
+        results = asyncio.run(main())
+
+        for index, (ID, thread) in enumerate(results):
+            dev = self.lib.devices[ID]
+            self.assertTrue(dev.initialized)
+            self.assertFalse(dev.is_moving)
+            self.assertEqual(dev.pos, [0.01 * index, 0., 0.])
+
+            # The event loop thread never called into the device.
+            self.assertIs(thread, threading.main_thread())
+
+    def test_affinity(self):
+        async def main():
+            ID = await aio.open()
+
+            return [
+                await aio.run(ID, threading.get_ident) for _ in range(5)
+            ] + [await aio.run(ID + 1, threading.get_ident)]
+
+        idents = asyncio.run(main())
+
+        self.assertEqual(len(set(idents[:5])), 1)
+        self.assertNotEqual(idents[0], idents[5])
+        self.assertNotEqual(idents[0], threading.get_ident())
+
+    def test_open_thread(self):
+        calls = []
+        drd_open_id = self.lib.drdOpenID._impl
+
+        def open_id(index):
+            calls.append(threading.current_thread().name)
+            return drd_open_id(index)
+
+        self.lib.drdOpenID._impl = open_id
+        self.lib.drdOpenID._rebuild()
+
+        async def main():
+            return await asyncio.gather(*(aio.openID(i) for i in range(3)))
+
+        self.assertEqual(sorted(asyncio.run(main())), [0, 1, 2])
+
+        # Every device is opened from the dedicated thread.
+        self.assertEqual(len(set(calls)), 1)
+        self.assertTrue(calls[0].startswith('forcedimension-aio-open'))
+
+    def test_lazy(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys\n"
+            "import forcedimension_core\n"
+            "assert 'forcedimension_core.aio' not in sys.modules\n"
+            "assert forcedimension_core.aio.open\n"
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+
+    def test_cancel(self):
+        async def main():
+            ID = await aio.openType(DeviceType.OMEGA7_RIGHT)
+            await aio.autoInit(ID)
+            drd.start(ID)
+
+            # Slow enough to still be moving when cancelled
+            self.lib.devices[ID].params['pos.move'][0] = 0.01
+
+            task = asyncio.ensure_future(aio.moveToPos((0.05, 0., 0.), ID))
+            await asyncio.sleep(0.01)
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return ID
+
+        ID = asyncio.run(main())
+
+        self.assertFalse(self.lib.devices[ID].is_moving)
+        self.assertLess(self.lib.devices[ID].pos[0], 0.05)
+
+    def test_errors(self):
+        async def main():
+            ID = await aio.openSerial(2)
+
+            # Not regulated
+            result = await aio.moveTo((0.,) * 8, ID)
+
+            self.assertEqual(await aio.waitForReset(None, ID), 0)
+            self.assertEqual(await aio.precisionInit(ID), 0)
+            self.assertEqual(await aio.close(ID), 0)
+            self.assertNotIn(ID, aio._executors)
+
+            return ID, result
+
+        ID, result = asyncio.run(main())
+
+        self.assertEqual(result, -1)
+        self.assertEqual(self.lib.devices[ID].serial, 2)
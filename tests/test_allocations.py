@@ -0,0 +1,150 @@
+import gc
+import tracemalloc
+import unittest
+from ctypes import c_double
+from typing import Any, Callable, List
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.expert as expert
+import forcedimension_core.drd as drd
+import forcedimension_core.runtime as runtime
+from forcedimension_core import containers
+
+libdhd = runtime._libdhd
+
+
+def _noop(*args):
+    return 0
+
+
+class TestAllocations(unittest.TestCase):
+    """
+    The standard wrappers reuse per-thread scratch buffers, so in steady
+    state a call allocates nothing besides what the library call itself
+    does. The library symbols are replaced by a Python function that
+    allocates nothing either, which leaves only the wrapper to measure.
+    """
+
+    def stub(self, *symbols: str):
+        for symbol in symbols:
+            setattr(libdhd, symbol, _noop)
+            self.addCleanup(delattr, libdhd, symbol)
+
+    def assertNoAllocations(self, func: Callable[..., Any], *args: Any):
+        # Reach the steady state (e.g. create this thread's buffers and
+        # fill the interpreter's free lists).
+        for _ in range(10):
+            func(*args)
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        tracemalloc.start()
+
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+            if gc_enabled:
+                gc.enable()
+
+        self.assertEqual(peak, 0, f"{func.__qualname__} allocated memory")
+
+    def test_standard(self):
+        self.stub(
+            'dhdGetPosition', 'dhdGetForce', 'dhdGetOrientationRad',
+            'dhdGetPositionAndOrientationRad', 'dhdGetForceAndTorque',
+            'dhdGetPositionAndOrientationFrame', 'dhdGetLinearVelocity',
+            'dhdGetAngularVelocityRad', 'dhdGetOrientationFrame'
+        )
+
+        out = containers.Vec3()
+        out2 = containers.Vec3()
+        matrix: List[List[float]] = [[0.] * 3 for _ in range(3)]
+
+        self.assertNoAllocations(dhd.getPosition, out)
+        self.assertNoAllocations(dhd.getForce, out)
+        self.assertNoAllocations(dhd.getOrientationRad, out)
+        self.assertNoAllocations(dhd.getPositionAndOrientationRad, out, out2)
+        self.assertNoAllocations(dhd.getForceAndTorque, out, out2)
+        self.assertNoAllocations(
+            dhd.getPositionAndOrientationFrame, out, matrix
+        )
+        self.assertNoAllocations(dhd.getLinearVelocity, out)
+        self.assertNoAllocations(dhd.getAngularVelocityRad, out)
+        self.assertNoAllocations(dhd.getOrientationFrame, matrix)
+
+    def test_expert(self):
+        self.stub(
+            'dhdGetDeltaEncoders', 'dhdDeltaEncoderToPosition',
+            'dhdGetEnc', 'dhdGetJointAngles', 'dhdGetDeltaJacobian',
+            'dhdJointAnglesToInertiaMatrix', 'dhdSetMot'
+        )
+
+        enc = containers.Enc3()
+        out = containers.Vec3()
+        dof_int = containers.DOFInt()
+        dof_float = containers.DOFFloat()
+        mat3: List[List[float]] = [[0.] * 3 for _ in range(3)]
+        mat6: List[List[float]] = [[0.] * 6 for _ in range(6)]
+
+        self.assertNoAllocations(expert.getDeltaEncoders, enc)
+        self.assertNoAllocations(expert.deltaEncoderToPosition, enc, out)
+        self.assertNoAllocations(expert.getEnc, dof_int)
+        self.assertNoAllocations(expert.getJointAngles, dof_float)
+        self.assertNoAllocations(expert.getDeltaJacobian, mat3)
+        self.assertNoAllocations(
+            expert.jointAnglesToIntertiaMatrix, dof_float, mat6
+        )
+        self.assertNoAllocations(expert.setMot, containers.DOFMotor())
+
+    def test_drd(self):
+        self.stub(
+            'drdGetPositionAndOrientation', 'drdGetVelocity', 'drdTrack',
+            'drdMoveTo'
+        )
+
+        p = containers.Vec3()
+        o = containers.Vec3()
+        pg = c_double()
+        matrix: List[List[float]] = [[0.] * 3 for _ in range(3)]
+        pos = containers.DOFFloat()
+
+        self.assertNoAllocations(
+            drd.getPositionAndOrientation, p, o, pg, matrix
+        )
+        self.assertNoAllocations(drd.getVelocity, p, o, pg)
+        self.assertNoAllocations(drd.track, pos)
+        self.assertNoAllocations(drd.moveTo, pos, False)
+
+    def test_history(self):
+        from forcedimension_core.containers import numpy as np_containers
+
+        history = np_containers.History(4)
+
+        def record():
+            history.slot
+            history.advance()
+
+        self.assertNoAllocations(record)
+
+    def test_trajectory(self):
+        import numpy as np
+
+        from forcedimension_core.constants import MAX_DOF
+        from forcedimension_core.trajectory import TrajectoryStreamer
+
+        self.stub(
+            'drdTrackPos', 'drdTrack', 'drdTrackAllEnc', 'dhdGetPosition',
+            'dhdGetEnc'
+        )
+
+        for waypoints in (
+            np.zeros((1000, 3)), np.zeros((1000, MAX_DOF)),
+            np.zeros((1000, MAX_DOF), dtype=int)
+        ):
+            streamer = TrajectoryStreamer(waypoints)
+            streamer._running = True
+
+            self.assertNoAllocations(streamer._step)
@@ -0,0 +1,138 @@
+import threading
+import unittest
+from array import array
+
+import numpy as np
+
+import forcedimension_core.dhd as dhd
+from forcedimension_core import runtime
+from forcedimension_core.constants import DeviceType
+from forcedimension_core.dhd.adaptors import DHDErrorGeometry
+from forcedimension_core.dhd.expert import batch
+from forcedimension_core.virtual import VirtualLibrary
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(
+            devices=[DeviceType.OMEGA7_RIGHT], model='delta'
+        )
+        self._previous = runtime.install(self.lib)
+        self.ID = dhd.open()
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def test_delta(self):
+        enc = np.array(
+            [[i * 50, -i * 30, i * 20] for i in range(100)], dtype=np.int32
+        )
+
+        pos = np.empty(enc.shape)
+        batch.deltaEncoderToPosition(enc, pos, self.ID)
+
+        for row, expected in zip(enc.tolist(), pos.tolist()):
+            out = [0., 0., 0.]
+            self.assertEqual(
+                dhd.expert.deltaEncoderToPosition(row, out, self.ID), 0
+            )
+            self.assertEqual(out, expected)
+
+        threaded = np.empty(enc.shape)
+        batch.deltaEncoderToPosition(enc, threaded, self.ID, workers=3)
+        np.testing.assert_array_equal(threaded, pos)
+
+        out = np.empty(enc.shape, dtype=np.int32)
+        batch.deltaPositionToEncoder(pos, out, self.ID, workers=4)
+
+        for row, expected in zip(pos.tolist(), out.tolist()):
+            enc_row = [0, 0, 0]
+            dhd.expert.deltaPositionToEncoder(row, enc_row, self.ID)
+            self.assertEqual(enc_row, expected)
+
+    def test_wrist(self):
+        # Any C-contiguous buffer of the right type works.
+        enc = array('i', range(30))
+        orientation = array('d', bytes(8 * 30))
+
+        batch.wristEncoderToOrientation(
+            memoryview(enc).cast('B').cast('i', (10, 3)),
+            memoryview(orientation).cast('B').cast('d', (10, 3)),
+            self.ID
+        )
+
+        for i in range(0, 30, 3):
+            out = [0., 0., 0.]
+            dhd.expert.wristEncoderToOrientation(enc[i:i + 3], out, self.ID)
+            self.assertEqual(out, orientation[i:i + 3].tolist())
+
+        enc_out = np.zeros((10, 3), dtype=np.int32)
+        batch.wristOrientationToEncoder(
+            np.frombuffer(orientation).reshape(10, 3), enc_out, self.ID
+        )
+        self.assertEqual(enc_out.ravel().tolist(), enc.tolist())
+
+        # Nothing to convert
+        batch.wristOrientationToEncoder(
+            np.empty((0, 3)), np.empty((0, 3), dtype=np.int32), self.ID
+        )
+
+    def test_errors(self):
+        enc = np.zeros((4, 3), dtype=np.int32)
+        pos = np.empty((4, 3))
+
+        self.assertRaises(
+            TypeError, batch.deltaEncoderToPosition, enc.astype(np.int64), pos
+        )
+        self.assertRaises(
+            TypeError, batch.deltaEncoderToPosition, enc, pos.astype(np.int32)
+        )
+        self.assertRaises(
+            ValueError, batch.deltaEncoderToPosition, enc, pos[:3]
+        )
+        self.assertRaises(
+            ValueError, batch.deltaEncoderToPosition, enc[:, :2], pos
+        )
+        self.assertRaises(
+            ValueError, batch.deltaEncoderToPosition, enc[::2], pos[:2]
+        )
+        self.assertRaises(
+            ValueError, batch.deltaEncoderToPosition, enc, pos, workers=0
+        )
+
+        pos.flags.writeable = False
+        self.assertRaises(TypeError, batch.deltaEncoderToPosition, enc, pos)
+
+        # Out of the workspace
+        far = np.zeros((6, 3))
+        far[4] = (10., 10., 10.)
+
+        for workers in (1, 2):
+            with self.assertRaises(DHDErrorGeometry) as cm:
+                batch.deltaPositionToEncoder(
+                    far, np.empty((6, 3), dtype=np.int32), self.ID, workers
+                )
+
+            self.assertTrue(cm.exception.op.endswith(
+                'batch.deltaPositionToEncoder[4]'
+            ))
+            self.assertEqual(cm.exception.ID, self.ID)
+
+    def test_workers(self):
+        threads = set()
+        impl = self.lib.dhdWristEncoderToOrientation._impl
+
+        def record(*args):
+            threads.add(threading.get_ident())
+            return impl(*args)
+
+        self.lib.dhdWristEncoderToOrientation._impl = record
+        self.lib.dhdWristEncoderToOrientation._rebuild()
+
+        batch.wristEncoderToOrientation(
+            np.zeros((64, 3), dtype=np.int32), np.empty((64, 3)), self.ID,
+            workers=4
+        )
+
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertGreater(len(threads), 0)
@@ -0,0 +1,132 @@
+import os
+import subprocess
+import sys
+import types
+import unittest
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.drd as drd
+from forcedimension_core import _checked, containers, runtime
+from forcedimension_core.constants import (
+    TIMEGUARD, ComMode, DeviceType, ErrorNum
+)
+from forcedimension_core.dhd import checked
+from forcedimension_core.dhd.adaptors import (
+    DHDError, DHDErrorDeviceNotReady, DHDErrorNoDeviceFound,
+    DHDErrorNoRegulation
+)
+from forcedimension_core.virtual import VirtualLibrary
+
+
+class TestChecked(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(devices=[DeviceType.OMEGA7_RIGHT])
+        self._previous = runtime.install(self.lib)
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def test_success(self):
+        ID = checked.open()
+        self.assertEqual(ID, 0)
+
+        pos = containers.Vec3()
+        self.assertEqual(checked.getPosition(pos, ID), 0)
+        self.assertEqual(checked.getPosition(pos), 0)
+        self.assertEqual(checked.setForce((0., 0., 1.), ID), 0)
+        self.assertEqual(checked.getSerialNumber(ID), dhd.getSerialNumber(ID))
+        self.assertEqual(checked.close(ID), 0)
+
+    def test_errors(self):
+        with self.assertRaises(DHDErrorNoDeviceFound) as cm:
+            checked.getPosition(containers.Vec3(), 3)
+
+        self.assertIn('forcedimension_core.dhd.getPosition', str(cm.exception))
+        self.assertIn('device 3', str(cm.exception))
+
+        ID = drd.open()
+        self.assertRaises(DHDErrorDeviceNotReady, drd.checked.start, ID)
+
+        self.lib.devices[ID].initialized = True
+        self.assertEqual(drd.checked.start(ID), 0)
+        drd.stop(True, ID)
+
+        with self.assertRaises(DHDErrorNoRegulation):
+            drd.checked.moveToPos((0., 0., 0.), True, ID)
+
+        self.assertRaises(DHDError, drd.checked.getCtrlFreq, 3)
+
+    def test_timeguard(self):
+        ID = checked.open()
+        runtime._libdhd.dhdSetForce = lambda *args: TIMEGUARD
+
+        self.assertEqual(checked.setForce((0., 0., 0.), ID), TIMEGUARD)
+
+    def test_rebind(self):
+        ID = checked.open()
+        calls = []
+        runtime._libdhd.dhdGetButton = lambda index, ID: 0
+        runtime._libdhd.dhdSetForce = lambda *args: calls.append(args) or -1
+
+        # The checked functions call the symbols the runtime binds now.
+        self.assertEqual(checked.getButton(0, ID), 0)
+        self.assertRaises(DHDError, checked.setForce, (0., 0., 0.), ID)
+        self.assertEqual(len(calls), 1)
+
+    def test_selection(self):
+        for name in (
+            'getPosition', 'setForce', 'open', 'getVersion', 'getSystemType',
+            'getComMode'
+        ):
+            self.assertTrue(hasattr(checked, name), name)
+
+        # Functions that do not report failure with -1
+        for name in ('errorGetLast', 'getSystemName', 'hasWrist', 'getMaxForce'):
+            self.assertFalse(hasattr(checked, name), name)
+
+        self.assertIs(checked.getPosition.__wrapped__, dhd.getPosition)
+        self.assertEqual(checked.getPosition.__defaults__, (-1,))
+
+    def test_enum(self):
+        ID = checked.open()
+        self.assertEqual(checked.getSystemType(ID), DeviceType.OMEGA7_RIGHT)
+        self.assertIsInstance(checked.getComMode(ID), ComMode)
+
+        # -1 is checked before it is converted to the enum.
+        self.assertRaises(DHDErrorNoDeviceFound, checked.getSystemType, 3)
+        self.assertRaises(DHDErrorNoDeviceFound, checked.getComMode, 3)
+
+    def test_variadic(self):
+        module = types.ModuleType('variadic')
+
+        def fail(*args, ID=-1):
+            return -1
+
+        self.lib._set_error(ErrorNum.TIMEOUT)
+        check = _checked._checked(module, 'fail', fail)
+
+        with self.assertRaises(DHDError) as cm:
+            check(1, ID=2)
+
+        self.assertEqual(cm.exception.ID, 2)
+
+        def fail(enc, ID=-1, **kwargs):
+            return -1
+
+        check = _checked._checked(module, 'fail', fail)
+
+        # A positional ID is reported too.
+        with self.assertRaises(DHDError) as cm:
+            check(0, 3)
+
+        self.assertEqual(cm.exception.ID, 3)
+
+    def test_lazy(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys\n"
+            "import forcedimension_core.dhd as dhd\n"
+            "assert 'forcedimension_core.dhd.checked' not in sys.modules\n"
+            "assert dhd.checked.getPosition\n"
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
@@ -1,7 +1,7 @@
 import importlib
 import os
 import unittest
-from ctypes import c_int
+from ctypes import c_int, sizeof
 from random import randint, random
 
 import pydantic
@@ -574,3 +574,44 @@ class TestContainers(unittest.TestCase):
                     data.mat6x6[i, j],
                     data_dct['mat6x6'][i][j]
                 )
+
+    def testDeviceState(self):
+        state = containers.DeviceState()
+
+        self.assertEqual(list(state.position), [0., 0., 0.])
+        self.assertEqual(state.frame[0, 0], 1.)
+        self.assertEqual(state.frame[0, 1], 0.)
+        self.assertEqual(state.buttons, 0)
+        self.assertIsNone(state.has_wrist)
+        self.assertIsNone(state.has_gripper)
+
+        state._capabilities = (0, True, False)
+        self.assertTrue(state.has_wrist)
+        self.assertFalse(state.has_gripper)
+
+        # Every part of the state views the same buffer
+        state.position.y = 1.
+        state.frame[1, 2] = 2.
+        state.torque[2] = 3.
+        state.joint_angles[7] = 4.
+        state.encoders[3] = 5
+        state.gripper_gap.value = 6.
+        state.buttons = 0b10
+        state.status.error = 1
+
+        self.assertEqual(list(state.data.position), [0., 1., 0.])
+        self.assertEqual(state.data.frame[5], 2.)
+        self.assertEqual(state.data.torque[2], 3.)
+        self.assertEqual(state.data.joint_angles[7], 4.)
+        self.assertEqual(state.data.encoders[3], 5)
+        self.assertEqual(state.data.gripper_gap, 6.)
+        self.assertEqual(state.data.buttons, 0b10)
+        self.assertEqual(state.data.status[9], 1)
+
+        state.data.linear_velocity[0] = 7.
+        self.assertEqual(state.linear_velocity[0], 7.)
+        self.assertEqual(state.linear_velocity.ptrs[0].value, 7.)
+        self.assertEqual(state.position.ptrs[1].value, 1.)
+        self.assertEqual(state.frame.ptr[5], 2.)
+        self.assertEqual(state.status.ptr[9], 1)
+        self.assertEqual(state.nbytes, sizeof(state.data))
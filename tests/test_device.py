@@ -0,0 +1,208 @@
+import inspect
+import unittest
+from unittest import mock
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.drd as drd
+from forcedimension_core import device, runtime
+from forcedimension_core.constants import DeviceType, Handedness
+from forcedimension_core.containers import Capabilities, DeviceInfo
+from forcedimension_core.device import Device, OpenReport, open_all
+from forcedimension_core.dhd.adaptors import DHDError, DHDErrorNoDeviceFound
+from forcedimension_core.virtual import VirtualLibrary
+
+
+class TestDevice(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(
+            devices=[DeviceType.OMEGA7_RIGHT, DeviceType.DELTA3]
+        )
+        self._previous = runtime.install(self.lib)
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def test_open(self):
+        with Device.open() as first:
+            self.assertEqual(first.ID, 0)
+            self.assertFalse(first.robotic)
+
+            second = Device.openType(DeviceType.DELTA3)
+            self.assertEqual(second.ID, 1)
+
+            with self.assertRaises(DHDErrorNoDeviceFound):
+                Device.open()
+
+            self.assertEqual(second.close(), 0)
+
+        self.assertFalse(self.lib.devices[0].is_open)
+
+        with Device.openID(1, robotic=True) as dev:
+            self.assertTrue(dev.robotic)
+            self.assertEqual(dev.ID, 1)
+
+        self.assertRaises(DHDError, Device.openID, 5)
+
+    def test_bound(self):
+        with Device.openID(1) as dev:
+            self.assertEqual(dev.dhd.getSystemType(), DeviceType.DELTA3)
+            self.assertEqual(dev.drd.autoInit(), 0)
+            self.assertTrue(dev.drd.isInitialized())
+            self.assertEqual(dev.drd.start(), 0)
+            self.assertEqual(dev.drd.moveToPos([0.01, 0., 0.], True), 0)
+
+            out = [0., 0., 0.]
+            self.assertEqual(dev.dhd.getPosition(out), 0)
+            self.assertEqual(out, [0.01, 0., 0.])
+
+            # Functions without an ID are not bound
+            self.assertFalse(hasattr(dev.dhd, 'getDeviceCount'))
+
+            self.assertNotIn(
+                'ID', inspect.signature(dev.dhd.getPosition).parameters
+            )
+            self.assertEqual(
+                dev.dhd.getPosition.__doc__, dhd.getPosition.__doc__
+            )
+
+            self.assertEqual(dev.drd.stop(False), 0)
+
+        # The binders are only built for the first device
+        misses = device._module_binders.cache_info().misses
+
+        with Device.openID(0) as dev:
+            self.assertEqual(dev.dhd.getSystemType(), DeviceType.OMEGA7_RIGHT)
+
+        self.assertEqual(device._module_binders.cache_info().misses, misses)
+
+    def test_state(self):
+        with Device.open() as dev:
+            self.lib.devices[dev.ID].pos = [0.01, 0.02, 0.03]
+
+            self.assertEqual(dev.getPosition(), 0)
+            self.assertEqual(list(dev.position), [0.01, 0.02, 0.03])
+
+            self.assertEqual(dev.setForceAndTorque([1., 2., 3.], [0.] * 3), 0)
+            self.assertEqual(dev.getForceAndTorque(), 0)
+            self.assertEqual(list(dev.force), [1., 2., 3.])
+            self.assertEqual(dev.setForce([0., 0., 1.]), 0)
+            self.assertEqual(dev.getForce(), 0)
+            self.assertEqual(list(dev.force), [0., 0., 1.])
+
+            self.lib.devices[dev.ID].button_mask = 0b10
+            self.assertEqual(dev.getButtonMask(), 0b10)
+
+            self.assertEqual(dev.getGripperAngleRad(), 0)
+            self.assertEqual(dev.getPositionAndOrientationRad(), 0)
+            self.assertEqual(dev.getLinearVelocity(), 0)
+            self.assertEqual(dev.getAngularVelocityRad(), 0)
+
+        self.assertEqual(dev.getPosition(), -1)
+
+    def test_query(self):
+        with Device.openID(1) as dev:
+            self.assertIsNone(dev.info)
+
+            info = dev.query()
+            self.assertIs(dev.info, info)
+            self.assertIsInstance(info, DeviceInfo)
+            self.assertEqual(info.devtype, DeviceType.DELTA3)
+            self.assertEqual(info.serial, 2)
+            self.assertEqual(info.name, dhd.getSystemName(1))
+            self.assertEqual(
+                info.capabilities,
+                Capabilities(True, False, False, False, False, False)
+            )
+
+    def test_device_info(self):
+        ID = drd.openID(0)
+        profiler = runtime.enable_profiling()
+        self.addCleanup(runtime.disable_profiling)
+
+        info = dhd.getDeviceInfo(ID)
+        self.assertIsNotNone(info)
+        self.assertEqual(info.devtype, DeviceType.OMEGA7_RIGHT)  # type: ignore
+        self.assertEqual(info.dof, 7)  # type: ignore
+        self.assertEqual(info.handedness, Handedness.RIGHT)  # type: ignore
+        self.assertEqual(info.type_str, 'omega.7 right')  # type: ignore
+        self.assertTrue(info.capabilities.active_gripper)  # type: ignore
+
+        # Served from memory, also for the default device
+        self.assertIs(dhd.getDeviceInfo(ID), info)
+        self.assertIs(dhd.getDeviceInfo(), info)
+        self.assertEqual(profiler.stats['dhdGetSystemType'].count, 1)
+
+        # So are the capabilities
+        self.assertTrue(dhd.hasWrist(ID))
+        self.assertTrue(dhd.hasGripper(ID))
+        self.assertTrue(dhd.hasActiveGripper(ID))
+        self.assertFalse(dhd.isLeftHanded(ID))
+        self.assertEqual(profiler.stats['dhdHasWrist'].count, 1)
+        self.assertEqual(profiler.stats['dhdHasGripper'].count, 1)
+
+        drd.close(ID)
+        self.assertIsNone(dhd.getDeviceInfo(ID))
+
+        ID = dhd.openID(0)
+        self.assertIsNot(dhd.getDeviceInfo(ID), info)
+        self.assertEqual(dhd.getDeviceInfo(ID), info)
+        self.assertEqual(profiler.stats['dhdGetSystemType'].count, 3)
+
+        runtime.install(self.lib)
+        self.assertIsNot(dhd.getDeviceInfo(ID), info)
+
+    def test_open_all(self):
+        # Every call that communicates with a device takes 5 ms.
+        self.lib.latency = 5e-3
+
+        devices, report = open_all()
+
+        self.assertEqual([dev.ID for dev in devices], [0, 1])
+        self.assertTrue(all(dev.robotic for dev in devices))
+        self.assertEqual(
+            [dev.info.devtype for dev in devices],  # type: ignore
+            [DeviceType.OMEGA7_RIGHT, DeviceType.DELTA3]
+        )
+        self.assertTrue(devices[0].info.capabilities.gripper)  # type: ignore
+        self.assertTrue(all(dev.initialized for dev in self.lib.devices))
+
+        self.assertIsInstance(report, OpenReport)
+        self.assertEqual([t.index for t in report.devices], [0, 1])
+        self.assertTrue(all(t.query > 0. for t in report.devices))
+        self.assertTrue(all(t.init > 0. for t in report.devices))
+        self.assertIn('enumerate', str(report))
+
+        # The devices were opened in parallel.
+        self.assertLess(
+            report.total, sum(t.total for t in report.devices)
+        )
+
+        for dev in devices:
+            dev.close()
+
+        devices, report = open_all(robotic=False, init=False)
+        self.assertFalse(any(dev.robotic for dev in devices))
+        self.assertTrue(all(t.init == 0. for t in report.devices))
+
+        for dev in devices:
+            dev.close()
+
+        self.assertRaises(ValueError, open_all, False, True)
+
+    def test_open_all_error(self):
+        def autoInit(ID=-1):
+            return -1 if ID == 1 else 0
+
+        with mock.patch.object(drd, 'autoInit', autoInit):
+            self.assertRaises(DHDError, open_all)
+
+        self.assertFalse(any(dev.is_open for dev in self.lib.devices))
+
+        self.lib.devices.clear()
+        devices, report = open_all()
+        self.assertEqual(devices, [])
+        self.assertEqual(report.devices, ())
+
+        # Counting the devices failed, rather than finding none.
+        with mock.patch.object(dhd, 'getDeviceCount', lambda: -1):
+            self.assertRaises(DHDError, open_all)
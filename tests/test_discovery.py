@@ -0,0 +1,156 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from forcedimension_core import discovery
+
+
+class TestDiscovery(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cache_dir = os.environ.get('FORCEDIM_CACHE_DIR')
+        os.environ['FORCEDIM_CACHE_DIR'] = os.path.join(
+            self._tmp.name, 'cache'
+        )
+
+        self.lib_dir = os.path.join(self._tmp.name, 'lib')
+        os.mkdir(self.lib_dir)
+
+        self.lib_path = os.path.join(self.lib_dir, 'libdrd.so.3.16.0')
+        with open(self.lib_path, 'w') as f:
+            f.write('')
+
+    def tearDown(self):
+        if self._cache_dir is None:
+            os.environ.pop('FORCEDIM_CACHE_DIR')
+        else:
+            os.environ['FORCEDIM_CACHE_DIR'] = self._cache_dir
+
+        self._tmp.cleanup()
+
+    def test_cache_file(self):
+        self.assertEqual(
+            discovery.cache_file(),
+            os.path.join(self._tmp.name, 'cache', discovery.CACHE_FILE_NAME)
+        )
+
+    def test_store_lookup(self):
+        self.assertIsNone(discovery.lookup('key'))
+
+        discovery.store('key', self.lib_path, [self.lib_dir])
+        self.assertEqual(discovery.lookup('key'), self.lib_path)
+        self.assertIsNone(discovery.lookup('other key'))
+
+        discovery.store('other key', self.lib_path)
+        self.assertEqual(discovery.lookup('key'), self.lib_path)
+        self.assertEqual(discovery.lookup('other key'), self.lib_path)
+        self.assertSetEqual(
+            set(discovery.entries()), {'key', 'other key'}
+        )
+
+        # Missing libraries are not cached
+        discovery.store('missing', os.path.join(self.lib_dir, 'missing.so'))
+        self.assertIsNone(discovery.lookup('missing'))
+
+    def test_stale(self):
+        discovery.store('key', self.lib_path, [self.lib_dir])
+
+        # A new SDK version appearing in a watched directory
+        with open(os.path.join(self.lib_dir, 'libdrd.so.3.17.0'), 'w'):
+            pass
+
+        os.utime(self.lib_dir, ns=(0, 0))
+        self.assertIsNone(discovery.lookup('key'))
+
+        discovery.store('key', self.lib_path, [self.lib_dir])
+        self.assertEqual(discovery.lookup('key'), self.lib_path)
+
+        # The cached library being replaced
+        os.utime(self.lib_path, ns=(0, 0))
+        self.assertIsNone(discovery.lookup('key'))
+
+        discovery.store('key', self.lib_path, [self.lib_dir])
+        os.remove(self.lib_path)
+        self.assertIsNone(discovery.lookup('key'))
+
+        self.assertTrue(discovery.is_stale({}))
+        self.assertTrue(discovery.is_stale({'path': 1, 'mtime': 0}))
+
+    def test_corrupt(self):
+        os.makedirs(discovery.cache_dir())
+
+        with open(discovery.cache_file(), 'w') as f:
+            f.write('not json')
+
+        self.assertIsNone(discovery.lookup('key'))
+        self.assertDictEqual(discovery.entries(), {})
+
+        discovery.store('key', self.lib_path)
+        self.assertEqual(discovery.lookup('key'), self.lib_path)
+
+    def test_clear(self):
+        self.assertFalse(discovery.clear())
+
+        discovery.store('key', self.lib_path)
+        self.assertTrue(discovery.clear())
+        self.assertIsNone(discovery.lookup('key'))
+
+    def test_main(self):
+        discovery.store('key', self.lib_path)
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(discovery.main(['path']), 0)
+        self.assertEqual(out.getvalue().strip(), discovery.cache_file())
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            discovery.main(['show'])
+        self.assertIn(self.lib_path, out.getvalue())
+        self.assertIn('valid', out.getvalue())
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            discovery.main(['clear'])
+        self.assertEqual(out.getvalue().strip(), "Cache cleared.")
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            discovery.main([])
+        self.assertIn("No entries", out.getvalue())
+
+    def test_cli_without_sdk(self):
+        # The cache CLI must not need libdrd.
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        env = dict(os.environ)
+        env.pop('__fdsdkpy_unittest__', None)
+        env['__fdsdkpy_unittest_runtime__'] = 'True'
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'forcedimension_core', 'cache', 'path'],
+            cwd=root, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), discovery.cache_file())
+
+        # Only the modules that need the library raise ImportError
+        result = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import forcedimension_core as fdsdk; fdsdk.telemetry'
+            ],
+            cwd=root, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        for module in ('runtime', 'dhd'):
+            result = subprocess.run(
+                [
+                    sys.executable, '-c',
+                    'import forcedimension_core as fdsdk; '
+                    f'fdsdk.{module}'
+                ],
+                cwd=root, env=env, capture_output=True, text=True
+            )
+            self.assertIn('ImportError', result.stderr)
@@ -0,0 +1,156 @@
+import unittest
+
+import forcedimension_core.loop as loop
+from forcedimension_core.loop import Loop, LoopStats, OverrunPolicy
+
+
+class FakeClock:
+    """
+    A clock that moves when slept on, when a tick does work and by a
+    microsecond every read, so the schedule of a loop is deterministic.
+    """
+
+    def __init__(self):
+        self.now = 0.
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        self.now += 1e-6
+
+        return self.now
+
+    def sleep(self, sec: float):
+        self.sleeps.append(sec)
+        self.now += sec
+
+
+class TestLoop(unittest.TestCase):
+    def make_loop(self, work, frequency=1000., **kwargs):
+        clock = FakeClock()
+        starts = []
+
+        def tick():
+            starts.append(clock.now)
+            clock.now += work(len(starts))
+
+        return Loop(
+            tick, frequency, spin=0., clock=clock, sleep=clock.sleep,
+            **kwargs
+        ), starts
+
+    def test_rate(self):
+        fixed, starts = self.make_loop(lambda _: 2e-4)
+        fixed.run(5)
+
+        self.assertEqual(len(starts), 5)
+
+        for i, start in enumerate(starts):
+            self.assertAlmostEqual(start, i * 1e-3, delta=1e-5)
+
+        stats = fixed.stats
+        self.assertEqual(stats.ticks, 5)
+        self.assertEqual(stats.overruns, 0)
+        self.assertAlmostEqual(stats.mean_period, 1e-3, delta=1e-5)
+        self.assertAlmostEqual(stats.max_jitter, 0., delta=1e-5)
+        self.assertEqual(sum(stats.period_hist), 4)
+        self.assertEqual(stats.jitter_hist[0], 4)
+
+        # Bin i of the period histogram is [i, i + 1) * resolution
+        self.assertAlmostEqual(stats.resolution, 1e-3 / 32)
+        self.assertEqual(sum(stats.period_hist[31:33]), 4)
+
+    def test_stop(self):
+        clock = FakeClock()
+        calls = []
+
+        def tick():
+            calls.append(clock.now)
+            return len(calls) == 3
+
+        fixed = Loop(tick, 1000., clock=clock, sleep=clock.sleep)
+        fixed.run()
+        self.assertEqual(len(calls), 3)
+        self.assertFalse(fixed.running)
+
+        calls.clear()
+        fixed = Loop(
+            lambda: calls.append(0) or fixed.stop(), 1000.,
+            clock=clock, sleep=clock.sleep
+        )
+        fixed.run()
+        self.assertEqual(len(calls), 1)
+
+    def test_overrun_policies(self):
+        # The second tick takes 2.5 periods
+        def work(n):
+            return 2.5e-3 if n == 2 else 1e-4
+
+        skip, starts = self.make_loop(work, policy=OverrunPolicy.SKIP)
+        skip.run(4)
+        self.assertEqual(
+            [round(s * 1e4) for s in starts], [0, 10, 40, 50]
+        )
+        self.assertEqual(skip.stats.overruns, 1)
+        self.assertEqual(skip.stats.missed, 2)
+        self.assertEqual(skip.stats.overrun_hist[1], 1)
+
+        catch_up, starts = self.make_loop(work, policy=OverrunPolicy.CATCH_UP)
+        catch_up.run(5)
+        self.assertEqual(
+            [round(s * 1e4) for s in starts], [0, 10, 35, 36, 40]
+        )
+
+        reset, starts = self.make_loop(work, policy=OverrunPolicy.RESET)
+        reset.run(4)
+        self.assertEqual(
+            [round(s * 1e4) for s in starts], [0, 10, 35, 45]
+        )
+
+    def test_hybrid_wait(self):
+        clock = FakeClock()
+        fixed = Loop(
+            lambda: None, 1000., spin=2e-4, clock=clock, sleep=clock.sleep
+        )
+        fixed.run(2)
+
+        # Sleeps until the spin window, then busy-waits on the clock.
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 8e-4, delta=1e-5)
+
+    def test_wait_for_tick(self):
+        clock = FakeClock()
+        ticks = []
+
+        def wait_for_tick(ID):
+            ticks.append(ID)
+            clock.now += 5e-4
+
+        self.addCleanup(
+            setattr, loop.drd, '_drdWaitForTick', loop.drd._drdWaitForTick
+        )
+        loop.drd._drdWaitForTick = wait_for_tick
+
+        ticked = Loop(
+            lambda: None, 2000., tick_ID=1, clock=clock, sleep=clock.sleep
+        )
+        ticked.run(3)
+
+        self.assertEqual(ticks, [1, 1, 1])
+        self.assertEqual(clock.sleeps, [])
+        self.assertAlmostEqual(ticked.stats.mean_period, 5e-4, delta=1e-5)
+
+    def test_stats(self):
+        self.assertRaises(ValueError, LoopStats, 0., 8)
+        self.assertRaises(ValueError, LoopStats, 1., 0)
+        self.assertRaises(ValueError, Loop, lambda: None, 0.)
+
+        stats = LoopStats(1e-4, 4)
+        stats._record_period(1e-3, 5e-5)
+        stats._record_overrun(10)
+        self.assertEqual(list(stats.period_hist), [0, 0, 0, 1])
+        self.assertEqual(list(stats.jitter_hist), [1, 0, 0, 0])
+        self.assertEqual(list(stats.overrun_hist), [0, 0, 0, 1])
+
+        stats.reset()
+        self.assertEqual(list(stats.period_hist), [0, 0, 0, 0])
+        self.assertEqual(stats.overruns, 0)
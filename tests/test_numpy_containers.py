@@ -414,3 +414,86 @@ class TestNumpyContainers(unittest.TestCase):
                     data.mat6x6[i, j],
                     data_dct['mat6x6'][i][j]
                 )
+
+    def testDeviceState(self):
+        state = containers.numpy.DeviceState()
+
+        self.assertIsInstance(state.position, containers.numpy.Vec3)
+        self.assertIsInstance(state.frame, containers.numpy.Mat3x3)
+        self.assertTrue(np.array_equal(state.frame, np.eye(3)))
+        self.assertIsInstance(state.status, containers.Status)
+        self.assertIsNone(state.has_wrist)
+
+        state._capabilities = (0, False, True)
+        self.assertFalse(state.has_wrist)
+        self.assertTrue(state.has_gripper)
+
+        # Every part of the state views the same buffer
+        self.assertIsInstance(state.joint_angles, containers.numpy.DOFFloat)
+        self.assertIsInstance(state.encoders, containers.numpy.DOFInt)
+
+        state.position[1] = 1.
+        state.frame[1, 2] = 2.
+        state.torque[2] = 3.
+        state.joint_angles.wrist[0] = 4.
+        state.encoders[3] = 5
+
+        self.assertEqual(list(state.data.position), [0., 1., 0.])
+        self.assertEqual(state.data.frame[5], 2.)
+        self.assertEqual(state.data.torque[2], 3.)
+        self.assertEqual(state.data.joint_angles[3], 4.)
+        self.assertEqual(state.data.encoders[3], 5)
+
+        state.data.linear_velocity[0] = 7.
+        self.assertEqual(state.linear_velocity[0], 7.)
+        self.assertEqual(state.linear_velocity.ptrs[0].value, 7.)
+        self.assertEqual(state.frame.ptr[5], 2.)
+        self.assertEqual(state.joint_angles.ptr[3], 4.)
+        self.assertEqual(state.encoders.ptr[3], 5)
+
+    def testHistory(self):
+        self.assertRaises(ValueError, containers.numpy.History, 0)
+        self.assertRaises(
+            ValueError, containers.numpy.History, 4, containers.numpy.DOFInt
+        )
+
+        history = containers.numpy.History(4)
+        self.assertEqual(history.data.shape, (4, 3))
+        self.assertEqual(len(history), 0)
+        self.assertIsInstance(history.slot, containers.numpy.Vec3)
+
+        # The slot is a view over the row at the cursor
+        history.slot.ptrs[1].contents.value = 1.
+        self.assertEqual(history.data[0, 1], 1.)
+        history.advance()
+
+        for i in range(2, 6):
+            history.append((i, i, i))
+
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history.cursor, 1)
+
+        older, newer = history.segments()
+        self.assertTrue(np.shares_memory(older, history.data))
+        self.assertTrue(np.shares_memory(newer, history.data))
+        self.assertEqual(
+            np.concatenate((older, newer))[:, 0].tolist(), [2., 3., 4., 5.]
+        )
+
+        window = history.window(1)
+        self.assertTrue(np.shares_memory(window, history.data))
+        self.assertEqual(window[:, 0].tolist(), [5.])
+
+        window = history.window(3)
+        self.assertFalse(np.shares_memory(window, history.data))
+        self.assertEqual(window[:, 0].tolist(), [3., 4., 5.])
+        self.assertRaises(ValueError, history.segments, 5)
+
+        history.clear()
+        self.assertEqual(len(history), 0)
+        self.assertEqual(len(history.window()), 0)
+
+        frames = containers.numpy.History(2, containers.numpy.Mat3x3)
+        self.assertIsInstance(frames.slot, containers.numpy.Mat3x3)
+        frames.slot[1, 2] = 1.
+        self.assertEqual(frames.data[0, 5], 1.)
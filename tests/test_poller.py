@@ -0,0 +1,92 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from forcedimension_core import containers, runtime
+from forcedimension_core.constants import DeviceType
+from forcedimension_core.poller import Poller, Snapshot
+from forcedimension_core.virtual import VirtualLibrary
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.direct as direct
+
+
+class TestPoller(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(devices=[DeviceType.OMEGA7_RIGHT])
+        self._previous = runtime.install(self.lib)
+        self.ID = dhd.open()
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def wait_for(self, poller: Poller, sequence: int):
+        while poller.sequence < sequence:
+            threading.Event().wait(1e-4)
+
+    def test_read(self):
+        self.lib.devices[self.ID].pos = [0.01, 0.02, 0.03]
+        poller = Poller(self.ID)
+        state = containers.DeviceState()
+
+        self.assertRaises(RuntimeError, poller.read, state)
+
+        with poller:
+            self.assertTrue(poller.running)
+            self.assertRaises(RuntimeError, poller.start)
+            self.wait_for(poller, 1)
+
+            snapshot = poller.read(state)
+            self.assertIsInstance(snapshot, Snapshot)
+            self.assertGreaterEqual(snapshot.sequence, 1)
+            self.assertEqual(list(state.position), [0.01, 0.02, 0.03])
+            self.assertTrue(state.has_wrist)
+
+            self.lib.devices[self.ID].pos = [0.04, 0.05, 0.06]
+            self.wait_for(poller, poller.sequence + 2)
+
+            later = poller.read(state)
+            self.assertGreater(later.sequence, snapshot.sequence)
+            self.assertGreater(later.time, snapshot.time)
+            self.assertEqual(list(state.position), [0.04, 0.05, 0.06])
+            self.assertGreaterEqual(poller.age(later), 0.)
+            self.assertGreater(poller.behind(snapshot), 0)
+
+        self.assertFalse(poller.running)
+        self.assertEqual(poller.errors, 0)
+        self.assertGreater(poller.rate, 0.)
+
+    def test_untorn(self):
+        # Every poll writes its number into each coordinate of the position,
+        # yielding to the reader in between. A torn read would mix them.
+        count = [0]
+
+        def get_state(out, ID):
+            count[0] += 1
+
+            for i in range(3):
+                out.data.position[i] = count[0]
+                time.sleep(0)
+
+            return 0
+
+        state = containers.DeviceState()
+
+        with mock.patch.object(direct, 'getState', get_state):
+            with Poller(self.ID) as poller:
+                self.wait_for(poller, 1)
+
+                for _ in range(1000):
+                    poller.read(state)
+                    self.assertEqual(len(set(state.position)), 1)
+
+        self.assertGreater(count[0], 1)
+
+    def test_frequency(self):
+        with Poller(self.ID, frequency=1000.) as poller:
+            self.wait_for(poller, 5)
+
+        self.assertIsNotNone(poller.loop)
+        self.assertGreaterEqual(poller.loop.stats.ticks, 5)  # type: ignore
+        self.assertIsNone(Poller(self.ID).loop)
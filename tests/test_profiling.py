@@ -0,0 +1,127 @@
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.drd as drd
+from forcedimension_core import containers, runtime
+from forcedimension_core.profiling import FunctionStats, Profiler
+from forcedimension_core.virtual import VirtualLibrary
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary()
+        self._previous = runtime.install(self.lib)
+        self.ID = dhd.open()
+
+    def tearDown(self):
+        runtime.disable_profiling()
+        runtime.install(self._previous)
+
+    def test_profile(self):
+        pos = containers.Vec3()
+        dhd.getPosition(pos, self.ID)
+        self.assertIsNone(runtime.get_profiler())
+
+        profiler = runtime.enable_profiling(trace=4)
+        self.assertIs(runtime.get_profiler(), profiler)
+
+        # Symbols resolved before and after profiling was enabled
+        for _ in range(5):
+            dhd.getPosition(pos, self.ID)
+            drd.isMoving(self.ID)
+
+        stats = profiler.stats['dhdGetPosition']
+        self.assertEqual(stats.count, 5)
+        self.assertEqual(profiler.stats['drdIsMoving'].count, 5)
+        self.assertLessEqual(stats.min, stats.mean)
+        self.assertLessEqual(stats.mean, stats.max)
+        self.assertLessEqual(stats.percentile(50.), stats.max)
+        self.assertGreater(stats.percentile(100.), 0.)
+        self.assertEqual(sum(stats.hist), 5)
+        self.assertEqual(len(profiler.events), 4)  # type: ignore
+
+        self.assertIs(runtime.disable_profiling(), profiler)
+        self.assertIsNone(runtime.get_profiler())
+
+        # The library functions are back
+        self.assertIs(runtime._libdhd.dhdGetPosition, self.lib.dhdGetPosition)
+        self.assertIs(dhd._dhdGetPosition, self.lib.dhdGetPosition)
+
+        dhd.getPosition(pos, self.ID)
+        self.assertEqual(stats.count, 5)
+
+        profiler.reset()
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(sum(stats.hist), 0)
+        self.assertEqual(len(profiler.events), 0)  # type: ignore
+
+    def test_install(self):
+        profiler = runtime.enable_profiling()
+        runtime.install(VirtualLibrary())
+
+        dhd.open()
+        self.assertEqual(profiler.stats['dhdOpen'].count, 1)
+
+    def test_export(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        profiler = runtime.enable_profiling(trace=10)
+        dhd.getButtonMask(self.ID)
+        dhd.getButtonMask(self.ID)
+
+        path = os.path.join(directory.name, 'profile.json')
+        profiler.export_json(path)
+
+        with open(path) as file:
+            profile = json.load(file)
+
+        self.assertEqual(profile['dhdGetButtonMask']['count'], 2)
+        self.assertEqual(
+            sum(n for _, _, n in profile['dhdGetButtonMask']['buckets']), 2
+        )
+
+        path = os.path.join(directory.name, 'trace.json')
+        profiler.export_chrome_trace(path)
+
+        with open(path) as file:
+            events = json.load(file)['traceEvents']
+
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[0]['name'], 'dhdGetButtonMask')
+        self.assertEqual(events[0]['ph'], 'X')
+        self.assertLessEqual(events[0]['ts'], events[1]['ts'])
+
+        self.assertRaises(RuntimeError, Profiler().export_chrome_trace, path)
+
+    def test_histogram(self):
+        stats = FunctionStats('dhdGetPosition', precision=5)
+        rng = random.Random(0)
+
+        for ns in [0, 1, 31, 32, 33, 1000, 10 ** 6, 10 ** 9] + [
+            rng.randrange(1, 1 << 40) for _ in range(1000)
+        ]:
+            stats.reset()
+            stats._record(ns)
+
+            i = next(i for i, n in enumerate(stats.hist) if n)
+            lower, upper = stats.bucket(i)
+            self.assertTrue(lower <= ns < upper, (ns, lower, upper))
+            self.assertLessEqual(upper - lower, max(1, lower / 16))
+
+        stats.reset()
+
+        for ns in range(1, 101):
+            stats._record(ns * 1000)
+
+        self.assertAlmostEqual(stats.percentile(50.), 50e-6, delta=50e-6 / 16)
+        self.assertEqual(stats.percentile(100.), stats.max)
+        self.assertEqual(stats.min_ns, 1000)
+        self.assertEqual(stats.min, 1e-6)
+        self.assertRaises(ValueError, stats.percentile, 101.)
+        self.assertTrue(math.isnan(FunctionStats('dhdOpen').mean))
@@ -0,0 +1,187 @@
+import os
+import tempfile
+import unittest
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.expert as expert
+from forcedimension_core import containers, runtime, telemetry
+from forcedimension_core.constants import MAX_DOF, DeviceType
+from forcedimension_core.dhd import os_independent
+from forcedimension_core.loop import Loop
+from forcedimension_core.replay import Command, ReplayLibrary
+from forcedimension_core.telemetry import Recorder
+from forcedimension_core.virtual import VirtualDevice
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'session.fdt')
+
+        # 10 samples at 100 Hz, starting 5 s in
+        state = containers.DeviceState()
+        frames = VirtualDevice()
+
+        with Recorder(self.path) as recorder:
+            for i in range(10):
+                state.position[:] = [i, 2 * i, 3 * i]
+                state.linear_velocity[:] = [-i, 0., 0.]
+                state.buttons = i
+                state.encoders[:] = [i] * MAX_DOF
+                state.status[1] = 1
+
+                frames.orientation = [0.1 * i, 0.05 * i, -0.1 * i]
+                state.frame[:] = frames.frame()
+
+                recorder.record(state, 5. + i / 100)
+
+        self.lib = ReplayLibrary([self.path], speed=None, tick=1e-9)
+        self._previous = runtime.install(self.lib)
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def test_replay(self):
+        pos = containers.Vec3()
+        vel = containers.Vec3()
+        orientation = containers.Vec3()
+        enc = containers.DOFInt()
+
+        self.assertEqual(dhd.open(), 0)
+
+        dhd.getPosition(pos)
+        self.assertEqual(list(pos), [0., 0., 0.])
+
+        os_independent.sleep(0.025)
+        self.assertAlmostEqual(os_independent.getTime(), 0.025)
+
+        dhd.getPosition(pos)
+        dhd.getLinearVelocity(vel)
+        dhd.getOrientationRad(orientation)
+        expert.getEnc(enc)
+
+        self.assertEqual(list(pos), [2., 4., 6.])
+        self.assertEqual(list(vel), [-2., 0., 0.])
+        self.assertEqual(dhd.getButtonMask(), 2)
+        self.assertEqual(list(enc), [2] * MAX_DOF)
+
+        for actual, expected in zip(orientation, (0.2, 0.1, -0.2)):
+            self.assertAlmostEqual(actual, expected)
+
+        status = containers.Status()
+        dhd.getStatus(status)
+        self.assertEqual(status.connected, 1)
+
+        # The last sample is held once the recording ends.
+        self.assertFalse(self.lib.devices[0].finished)
+        os_independent.sleep(1.)
+        dhd.getPosition(pos)
+        self.assertEqual(list(pos), [9., 18., 27.])
+        self.assertTrue(self.lib.devices[0].finished)
+
+        self.lib.rewind()
+        dhd.getPosition(pos)
+        self.assertEqual(list(pos), [0., 0., 0.])
+
+    def test_commands(self):
+        self.assertEqual(dhd.open(), 0)
+
+        def tick():
+            pos = containers.Vec3()
+            dhd.getPosition(pos)
+            dhd.setForce([-pos[0], 0., 0.])
+
+        Loop(tick, 100., spin=0.).run(ticks=10)
+
+        self.assertEqual(len(self.lib.commands), 10)
+
+        for i, command in enumerate(self.lib.commands):
+            self.assertIsInstance(command, Command)
+            self.assertEqual(command.name, 'dhdSetForce')
+            self.assertEqual(command.device, 0)
+            self.assertAlmostEqual(command.time, i / 100)
+            self.assertEqual(command.args, (-float(i), 0., 0.))
+
+        # Deterministic
+        commands = list(self.lib.commands)
+        self.lib.rewind()
+        self.assertEqual(list(self.lib.commands), [])
+
+        Loop(tick, 100., spin=0.).run(ticks=10)
+        self.assertEqual(list(self.lib.commands), commands)
+
+    def test_max_commands(self):
+        lib = ReplayLibrary([self.path], speed=None, max_commands=4)
+        runtime.install(lib)
+        self.assertEqual(dhd.open(), 0)
+
+        for i in range(10):
+            dhd.setForce([float(i), 0., 0.])
+
+        # Only the most recent commands are kept
+        self.assertEqual(
+            [command.args[0] for command in lib.commands], [6., 7., 8., 9.]
+        )
+        self.assertEqual(lib.dropped_commands, 6)
+
+        lib.rewind()
+        self.assertEqual(len(lib.commands), 0)
+        self.assertEqual(lib.dropped_commands, 0)
+
+        lib = ReplayLibrary([self.path], speed=None, max_commands=0)
+        runtime.install(lib)
+        self.assertEqual(dhd.open(), 0)
+        self.assertEqual(dhd.setForce([1., 0., 0.]), 0)
+        self.assertEqual(len(lib.commands), 0)
+
+        with self.assertRaises(ValueError):
+            ReplayLibrary([self.path], max_commands=-1)
+
+    def test_speed(self):
+        records = telemetry.load(self.path)
+        lib = ReplayLibrary([records, records], speed=1000.)
+
+        self.assertEqual(len(lib.devices), 2)
+        self.assertGreater(lib.time(), 0.)
+
+        lib._dhdSleep(0.05)
+        lib.devices[0].update()
+        self.assertGreaterEqual(lib.devices[0].index, 9)
+
+        self.assertRaises(ValueError, ReplayLibrary, [self.path], speed=0.)
+        self.assertRaises(ValueError, ReplayLibrary, [records[:0]])
+
+    def test_load(self):
+        lib = ReplayLibrary.from_env({
+            'FORCEDIM_REPLAY_LOGS': os.pathsep.join((self.path, self.path)),
+            'FORCEDIM_REPLAY_DEVICES': 'sigma7_left, falcon',
+            'FORCEDIM_REPLAY_SPEED': 'sim'
+        })
+
+        self.assertEqual(
+            [dev.devtype for dev in lib.devices],
+            [DeviceType.SIGMA7_LEFT, DeviceType.FALCON]
+        )
+        self.assertIsNone(lib.speed)
+
+        with self.assertRaises(ValueError):
+            ReplayLibrary.from_env({})
+
+        with self.assertRaises(ValueError):
+            ReplayLibrary.from_env({
+                'FORCEDIM_REPLAY_LOGS': self.path,
+                'FORCEDIM_REPLAY_DEVICES': 'falcon, falcon'
+            })
+
+        environ = runtime._os_impl.environ
+        environ['FORCEDIM_REPLAY_LOGS'] = self.path
+
+        try:
+            self.assertIsInstance(
+                runtime.load(backend='replay', silent=True), ReplayLibrary
+            )
+        finally:
+            del environ['FORCEDIM_REPLAY_LOGS']
+
+        self.assertIsNone(runtime.load(backend='replay', silent=True))
@@ -12,6 +12,7 @@ from random import randint
 from typing import Optional, Set, Type
 
 import forcedimension_core.runtime as runtime
+from forcedimension_core import _spec, discovery
 
 
 class MockDHD:
@@ -570,8 +571,286 @@ class TestRuntime(unittest.TestCase):
             ]
         )
 
+    def test_lazy_library(self):
+        class Symbol:
+            argtypes = None
+            restype = None
+
+        class Lib:
+            resolved = []
+
+            def __getattr__(self, name):
+                Lib.resolved.append(name)
+                return Symbol()
+
+        lib = runtime._LazyLibrary(Lib())
+        lib.declare('dhdGetPosition', [c_int, c_int], c_int)
+        lib.declare('dhdGetForce', [c_int], c_int)
+        self.assertListEqual(Lib.resolved, [])
+
+        func = lib.dhdGetPosition
+        self.assertListEqual(Lib.resolved, ['dhdGetPosition'])
+        self.assertListEqual(func.argtypes, [c_int, c_int])
+        self.assertIs(func.restype, c_int)
+
+        # Resolved symbols are cached
+        self.assertIs(lib.dhdGetPosition, func)
+        self.assertListEqual(Lib.resolved, ['dhdGetPosition'])
+
+        # Redeclaring a symbol forces it to be resolved and typed again
+        lib.declare('dhdGetPosition', [c_int], None)
+        self.assertIsNot(lib.dhdGetPosition, func)
+        self.assertListEqual(lib.dhdGetPosition.argtypes, [c_int])
+        self.assertIsNone(lib.dhdGetPosition.restype)
+
+        Lib.resolved.clear()
+        lib.preload(['dhdGetForce'])
+        self.assertListEqual(Lib.resolved, ['dhdGetForce'])
+
+        Lib.resolved.clear()
+        lib.declare('dhdGetButton', [c_int], c_int)
+        lib.preload()
+        self.assertListEqual(Lib.resolved, ['dhdGetButton'])
+
+        self.assertRaises(AttributeError, lambda: lib._private)
+
+    def test_lazy_library_bind(self):
+        class Symbol:
+            argtypes = None
+            restype = None
+
+            def __call__(self, *args):
+                return 1
+
+        class Lib:
+            def __getattr__(self, name):
+                return Symbol()
+
+        lib = runtime._LazyLibrary(Lib())
+        lib.declare('dhdGetPosition', [c_int], c_int)
+
+        namespace = {}
+        namespace['_dhdGetPosition'] = lib.bind(namespace, 'dhdGetPosition')
+        unbound = namespace['_dhdGetPosition']
+        self.assertIsInstance(unbound, runtime._Unbound)
+
+        # The first call resolves the symbol and replaces the reference
+        self.assertEqual(unbound(0), 1)
+        func = namespace['_dhdGetPosition']
+        self.assertIs(func, lib.dhdGetPosition)
+        self.assertListEqual(func.argtypes, [c_int])
+
+        # References bound after resolution get the resolved symbol
+        self.assertIs(lib.bind({}, 'dhdGetPosition'), func)
+
+        def mock(*args):
+            return 2
+
+        lib.dhdGetPosition = mock
+        self.assertIs(namespace['_dhdGetPosition'], mock)
+
+        del lib.dhdGetPosition
+        self.assertIs(namespace['_dhdGetPosition'], unbound)
+
+        lib.dhdGetPosition
+        lib.install(Lib())
+        self.assertIs(namespace['_dhdGetPosition'], unbound)
+        self.assertNotIn('dhdGetPosition', vars(lib))
+
+        lib.dhdGetPosition
+        lib.declare('dhdGetPosition', [], None)
+        self.assertIs(namespace['_dhdGetPosition'], unbound)
+        self.assertIsNone(lib.dhdGetPosition.restype)
+
+    def test_spec(self):
+        # Every symbol the bindings call has a prototype, and vice versa.
+        self.assertEqual(
+            set(runtime._libdhd._prototypes), set(runtime._libdhd._sites)
+        )
+
+        for argtypes, restype in _spec.PROTOTYPES.values():
+            self.assertIsInstance(argtypes, list)
+
+        class Symbol:
+            def __call__(self, *args):
+                return 0
+
+        class Lib:
+            def __getattr__(self, name):
+                return Symbol()
+
+        lib = runtime._LazyLibrary(Lib())
+        lib.declare_all({'dhdGetPosition': ([c_int], c_int)})
+
+        namespace = {}
+        namespace['_dhdGetPosition'] = lib.bind(namespace, 'dhdGetPosition')
+        self.assertListEqual(lib.dhdGetPosition.argtypes, [c_int])
+
+        # Resolved symbols are retyped
+        lib.declare_all({'dhdGetPosition': ([], None)})
+        self.assertIsInstance(namespace['_dhdGetPosition'], runtime._Unbound)
+        self.assertIsNone(lib.dhdGetPosition.restype)
+
+    def test_preload(self):
+        runtime.preload(['dhdGetPosition', 'drdMoveTo'])
+        self.assertIn('dhdGetPosition', vars(runtime._libdhd))
+        self.assertIn('drdMoveTo', vars(runtime._libdrd))
+
+        runtime.preload()
+
+        for name in runtime._libdhd._prototypes:
+            self.assertIn(name, vars(runtime._libdhd))
+
+    def test_symbol_addresses(self):
+        from forcedimension_core import containers, dhd
+        from forcedimension_core.virtual import VirtualLibrary
+
+        lib = VirtualLibrary()
+        previous = runtime.install(lib)
+        self.addCleanup(runtime.install, previous)
+        self.addCleanup(runtime.disable_profiling)
+
+        ID = dhd.open()
+        lib.devices[ID].pos[:] = [0.01, 0.02, 0.03]
+        runtime.enable_profiling()
+
+        symbols = runtime.symbol_addresses()
+        symbol = symbols['dhdGetPosition']
+        self.assertIsInstance(symbol.address, int)
+        self.assertEqual(
+            symbol.declaration,
+            'int dhdGetPosition(double *, double *, double *, signed char);'
+        )
+        self.assertEqual(
+            symbols['dhdSetForce'].pointer_type,
+            'int (*)(double, double, double, signed char)'
+        )
+
+        # Called through the address, bypassing the profiler
+        pos = containers.Vec3()
+        self.assertEqual(symbol.to_ctypes()(*pos.ptrs, ID), 0)
+        self.assertEqual(list(pos), [0.01, 0.02, 0.03])
+        self.assertEqual(
+            runtime.get_profiler().stats['dhdGetPosition'].count, 0
+        )
+
+        # Strings have no C address in the virtual library.
+        self.assertNotIn('dhdGetSystemName', symbols)
+        self.assertRaises(
+            ValueError, runtime.symbol_addresses, ['dhdGetSystemName']
+        )
+        self.assertRaises(
+            KeyError, runtime.symbol_addresses, ['dhdMissing']
+        )
+
+        self.assertEqual(
+            runtime.cdef(['dhdGetEnc', 'dhdErrorGetLastStr']),
+            'int dhdGetEnc(int *, unsigned char, signed char);\n'
+            'char * dhdErrorGetLastStr(void);'
+        )
+        self.assertEqual(
+            len(runtime.cdef().splitlines()), len(runtime._libdrd._prototypes)
+        )
+
+    def test_load_cached(self):
+        class MockDiscovery:
+            cached: Optional[str] = None
+            stored = {}
+
+            @staticmethod
+            def lookup(key):
+                return MockDiscovery.cached
+
+            @staticmethod
+            def store(key, path, watch=()):
+                MockDiscovery.stored[key] = (path, list(watch))
+
+        runtime._test_load = True
+        runtime._ctypes_impl = MockCtypes
+        runtime._discovery_impl = MockDiscovery
+        runtime._getpass_impl = MockGetPass
+        runtime._glob_impl = MockGlob
+        runtime._sys_impl = MockSys
+        runtime._os_impl = MockOS
+        runtime._pathlib_impl = MockPathlib
+        runtime._platform_impl = MockPlatform
+
+        MockCtypes.should_load_successfully = True
+        MockDHD.major = 3
+        MockDHD.minor = 16
+        MockPlatform.machine_type = 'x86_64'
+        MockSys.platform = 'linux'
+        MockEnviron.FDSDK = '/home/GeneEric/forcedimension_sdk'
+        MockEnviron.FORCEDIM_SDK = ''
+        MockOS.sep = '/'
+        MockOS.path.sep = MockOS.sep
+        MockOS.path.HOME = '/home/GeneEric'
+
+        lib_path = (
+            '/home/GeneEric/forcedimension_sdk/lib/release/lin-x86_64-gcc/'
+            'libdrd.so.3.16.0'
+        )
+        MockOS.path.VALID_PATHS = {lib_path}
+
+        # A miss falls back to the full search and stores the result
+        self.assertEqual(runtime.load().path, lib_path)  # type: ignore
+        key = runtime._get_discovery_key()
+        self.assertIn('/home/GeneEric/forcedimension_sdk', key)
+
+        path, watch = MockDiscovery.stored[key]
+        self.assertEqual(path, lib_path)
+        self.assertListEqual(
+            watch,
+            [
+                '/home/GeneEric/.local/lib',
+                '/usr/local/lib',
+                os.path.realpath(
+                    '/home/GeneEric/forcedimension_sdk/lib/release/'
+                    'lin-x86_64-gcc'
+                )
+            ]
+        )
+
+        # A hit skips the search entirely
+        MockDiscovery.stored.clear()
+        MockDiscovery.cached = '/opt/cached/libdrd.so'
+        MockOS.path.VALID_PATHS = set()
+        self.assertEqual(
+            runtime.load().path, '/opt/cached/libdrd.so'  # type: ignore
+        )
+        self.assertDictEqual(MockDiscovery.stored, {})
+
+        # A cached library that can no longer be loaded is ignored
+        MockDHD.minor = 15
+        MockSys.stderr.data = ""
+        self.assertIsNone(runtime.load())
+        self.assertEqual(
+            MockSys.stderr.data, "Could not find libdrd. Is it installed?\n"
+        )
+        MockDHD.minor = 16
+
+        # Explicit search directories bypass the cache
+        MockOS.path.VALID_PATHS = {'/opt/libdrd.so'}
+        self.assertEqual(
+            runtime.load(['/opt/libdrd.so']).path,  # type: ignore
+            '/opt/libdrd.so'
+        )
+        self.assertDictEqual(MockDiscovery.stored, {})
+
+        runtime._ctypes_impl = ctypes
+        runtime._getpass_impl = getpass
+        runtime._glob_impl = glob
+        runtime._os_impl = os
+        runtime._pathlib_impl = pathlib
+        runtime._platform_impl = platform
+        runtime._sys_impl = sys
+        runtime._discovery_impl = discovery
+
+        runtime._test_load = False
+
     def test_load(self):
         runtime._test_load = True
+        runtime._discovery_impl = None
 
         runtime._ctypes_impl = MockCtypes
 
@@ -715,5 +994,6 @@ class TestRuntime(unittest.TestCase):
         runtime._pathlib_impl = pathlib
         runtime._platform_impl = platform
         runtime._sys_impl = sys
+        runtime._discovery_impl = discovery
 
         runtime._test_load = False
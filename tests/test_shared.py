@@ -0,0 +1,153 @@
+import gc
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import forcedimension_core.containers as containers
+from forcedimension_core.containers import shared
+from forcedimension_core.containers.shared import (
+    StatePublisher, StateSubscriber
+)
+
+
+# Attaches from an unrelated process, with its own resource tracker.
+_SUBSCRIBER = '''
+import sys
+
+import forcedimension_core.containers as containers
+from forcedimension_core.containers.shared import StateSubscriber
+
+subscriber = StateSubscriber(sys.argv[1])
+state = containers.DeviceState()
+print(subscriber.read(state).sequence)
+del state
+subscriber.close()
+'''
+
+
+def _subscribe(name, queue):
+    subscriber = StateSubscriber(name)
+    state = containers.DeviceState()
+    snapshot = subscriber.read(state)
+    queue.put((snapshot.sequence, list(state.position), state.buttons))
+
+    del state
+    subscriber.close()
+
+
+class TestShared(unittest.TestCase):
+    def test_view(self):
+        buffer = bytearray(
+            shared.sizeof(containers.Vec3)
+            + shared.sizeof(containers.numpy.DOFFloat)
+        )
+
+        vec = shared.view(containers.Vec3, buffer)
+        vec.y = 1.
+        self.assertEqual(vec.ptrs[1].value, 1.)
+        self.assertEqual(np.frombuffer(buffer, count=3).tolist(), [0., 1., 0.])
+
+        dof = shared.view(containers.numpy.DOFFloat, buffer, 24)
+        self.assertIsInstance(dof, containers.numpy.DOFFloat)
+        dof.ptr[2] = 2.
+        self.assertEqual(np.frombuffer(buffer, offset=24)[2], 2.)
+
+        self.assertRaises(ValueError, shared.sizeof, containers.Status)
+        self.assertRaises(ValueError, shared.view, containers.Status, buffer)
+
+    def test_publish(self):
+        with StatePublisher() as publisher:
+            with StateSubscriber(publisher.name) as subscriber:
+                out = containers.DeviceState()
+                self.assertRaises(RuntimeError, subscriber.read, out)
+                self.assertRaises(RuntimeError, subscriber.view)
+
+                state = publisher.begin()
+                state.position[:] = [0.01, 0.02, 0.03]
+                publisher.publish(1.)
+                del state
+
+                snapshot = subscriber.read(out)
+                self.assertEqual(snapshot, (1, 1.))
+                self.assertEqual(list(out.position), [0.01, 0.02, 0.03])
+                self.assertEqual(subscriber.behind(snapshot), 0)
+
+                view, snapshot = subscriber.view()
+                self.assertEqual(list(view.position), [0.01, 0.02, 0.03])
+                self.assertTrue(subscriber.valid(snapshot))
+
+                # The next state goes into the other buffer.
+                out.position[0] = 0.04
+                publisher.write(out, 2.)
+                self.assertTrue(subscriber.valid(snapshot))
+                self.assertEqual(subscriber.behind(snapshot), 1)
+
+                publisher.begin()
+                self.assertFalse(subscriber.valid(snapshot))
+
+                del view
+                gc.collect()
+
+    def test_numpy_states(self):
+        with StatePublisher(state_type=containers.numpy.DeviceState) as pub:
+            state = pub.begin()
+            self.assertIsInstance(state.position, containers.numpy.Vec3)
+            self.assertTrue(np.array_equal(state.frame, np.eye(3)))
+            state.position[2] = 3.
+            pub.publish(1.)
+            del state
+
+            with StateSubscriber(
+                pub.name, containers.numpy.DeviceState
+            ) as subscriber:
+                view, _ = subscriber.view()
+                self.assertEqual(view.position[2], 3.)
+                del view
+
+    def test_processes(self):
+        ctx = multiprocessing.get_context('spawn')
+        queue = ctx.Queue()
+
+        with StatePublisher() as publisher:
+            state = containers.DeviceState()
+            state.position[:] = [0.01, 0.02, 0.03]
+            state.buttons = 0b101
+            publisher.write(state, 1.)
+
+            process = ctx.Process(
+                target=_subscribe, args=(publisher.name, queue)
+            )
+            process.start()
+            result = queue.get(timeout=30)
+            process.join(30)
+
+        self.assertEqual(result, (1, [0.01, 0.02, 0.03], 0b101))
+
+    def test_independent_process(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        with StatePublisher() as publisher:
+            publisher.write(containers.DeviceState(), 1.)
+
+            result = subprocess.run(
+                [sys.executable, '-c', _SUBSCRIBER, publisher.name],
+                cwd=root, capture_output=True, text=True, timeout=60
+            )
+            self.assertEqual(result.stdout.strip(), '1', result.stderr)
+
+            # The segment outlives the subscriber process.
+            with StateSubscriber(publisher.name) as subscriber:
+                self.assertEqual(subscriber.sequence, 1)
+
+    def test_platform(self):
+        with StatePublisher() as publisher:
+            with mock.patch('platform.machine', return_value='arm64'):
+                self.assertRaises(RuntimeError, StatePublisher)
+                self.assertRaises(
+                    RuntimeError, StateSubscriber, publisher.name
+                )
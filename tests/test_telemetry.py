@@ -0,0 +1,123 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+import forcedimension_core.containers as containers
+from forcedimension_core import telemetry
+from forcedimension_core.telemetry import Recorder
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'session.fdt')
+
+    def test_record(self):
+        state = containers.DeviceState()
+
+        with Recorder(self.path, chunk_size=4, chunks=3) as recorder:
+            for i in range(10):
+                state.position[:] = [i, 2 * i, 3 * i]
+                state.buttons = i
+                self.assertTrue(recorder.record(state, i / 1000))
+
+            self.assertEqual(recorder.recorded, 10)
+
+        self.assertEqual(recorder.dropped, 0)
+
+        records = telemetry.load(self.path)
+        self.assertEqual(len(records), 10)
+        self.assertTrue(np.allclose(records['time'], np.arange(10) / 1000))
+        self.assertEqual(records['position'][3].tolist(), [3., 6., 9.])
+        self.assertEqual(records['buttons'].tolist(), list(range(10)))
+        self.assertEqual(
+            records['frame'][0].tolist(), np.eye(3).ravel().tolist()
+        )
+
+        # Recordings are appended to
+        with Recorder(self.path) as recorder:
+            recorder.record(containers.numpy.DeviceState(), 1.)
+
+        self.assertEqual(len(telemetry.load(self.path)), 11)
+        self.assertRaises(RuntimeError, recorder.record, state, 0.)
+
+    def test_drop(self):
+        state = containers.DeviceState()
+        recorder = Recorder(self.path, chunk_size=2, chunks=2)
+
+        # Stall the writer until both chunks are full.
+        stall = threading.Event()
+        write = recorder._file.write
+
+        def stalled_write(data):
+            stall.wait()
+            return write(data)
+
+        recorder._file.write = stalled_write  # type: ignore
+
+        recorded = [recorder.record(state, 0.) for _ in range(6)]
+        self.assertEqual(recorded.count(False), 2)
+        self.assertEqual(recorder.dropped, 2)
+
+        stall.set()
+        recorder.close()
+
+        self.assertEqual(len(telemetry.load(self.path)), 4)
+
+    def test_partial_record(self):
+        state = containers.DeviceState()
+
+        with Recorder(self.path) as recorder:
+            recorder.record(state, 1.)
+
+        # A process died partway through the second record
+        with open(self.path, 'ab') as file:
+            file.write(b'\x01' * 10)
+
+        with Recorder(self.path) as recorder:
+            state.buttons = 3
+            recorder.record(state, 2.)
+
+        records = telemetry.load(self.path)
+        self.assertEqual(records['time'].tolist(), [1., 2.])
+        self.assertEqual(records['buttons'].tolist(), [0, 3])
+
+    def test_write_error(self):
+        state = containers.DeviceState()
+        recorder = Recorder(self.path, chunk_size=2, chunks=2)
+
+        def failed_write(data):
+            raise OSError("No space left on device")
+
+        recorder._file.write = failed_write  # type: ignore
+
+        self.assertTrue(recorder.record(state, 0.))
+        self.assertTrue(recorder.record(state, 0.))
+
+        # Let the writer fail on the first chunk and stop
+        recorder._full.put(None)
+        recorder._writer.join()
+
+        self.assertIsInstance(recorder.error, OSError)
+        self.assertEqual(recorder.recorded, 0)
+        self.assertEqual(recorder.dropped, 2)
+
+        # Later samples are dropped
+        self.assertFalse(recorder.record(state, 0.))
+        self.assertEqual(recorder.dropped, 3)
+
+        self.assertRaises(OSError, recorder.close)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Recorder, self.path, 0)
+        self.assertRaises(ValueError, Recorder, self.path, 1, 0)
+
+        with open(self.path, 'wb') as file:
+            file.write(b'not telemetry at all')
+
+        self.assertRaises(ValueError, Recorder, self.path)
+        self.assertRaises(ValueError, telemetry.load, self.path)
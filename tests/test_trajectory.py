@@ -0,0 +1,111 @@
+import threading
+import unittest
+
+import numpy as np
+
+import forcedimension_core.drd as drd
+from forcedimension_core import runtime
+from forcedimension_core.constants import MAX_DOF, DeviceType
+from forcedimension_core.trajectory import TrajectoryStreamer
+from forcedimension_core.virtual import VirtualLibrary
+
+
+class TestTrajectory(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(devices=[DeviceType.OMEGA7_RIGHT])
+        self._previous = runtime.install(self.lib)
+        self.ID = drd.open()
+        self.dev = self.lib.devices[self.ID]
+        self.dev.initialized = True
+        drd.start(self.ID)
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def test_positions(self):
+        path = np.linspace((0., 0., 0.), (0.01, 0.02, 0.03), 20)
+        streamer = TrajectoryStreamer(path, self.ID)
+
+        self.assertEqual(len(streamer), 20)
+        self.assertEqual(streamer.progress, 0.)
+        self.assertTrue(np.isnan(streamer.error))
+
+        with streamer:
+            self.assertTrue(streamer.wait(5.))
+
+        self.assertTrue(streamer.done)
+        self.assertEqual(streamer.index, 20)
+        self.assertEqual(streamer.progress, 1.)
+        self.assertEqual(streamer.errors, 0)
+        self.assertAlmostEqual(streamer.error, 0.)
+        self.assertEqual(self.dev.pos, [0.01, 0.02, 0.03])
+        self.assertEqual(streamer.loop.stats.ticks, 20)  # type: ignore
+        self.assertRaises(RuntimeError, streamer.start)
+
+    def test_configurations(self):
+        path = np.zeros((4, MAX_DOF))
+        path[:, 0] = np.arange(4) / 1000
+        path[:, 3] = 0.1
+
+        with TrajectoryStreamer(path, self.ID, ticks=2) as streamer:
+            self.assertTrue(streamer.wait(5.))
+
+        self.assertEqual(self.dev.pos, [0.003, 0., 0.])
+        self.assertEqual(self.dev.orientation, [0.1, 0., 0.])
+        self.assertEqual(streamer.loop.stats.ticks, 7)  # type: ignore
+
+    def test_encoders(self):
+        enc = np.zeros((3, MAX_DOF), dtype=np.int64)
+        enc[:, 0] = (0, 100, 200)
+
+        with TrajectoryStreamer(enc, self.ID) as streamer:
+            self.assertTrue(streamer.wait(5.))
+
+        self.assertEqual(streamer.index, 3)
+        self.assertEqual(streamer.errors, 0)
+        self.assertLessEqual(streamer.error, 1.)
+
+    def test_pause_cancel(self):
+        path = np.zeros((1000, 3))
+        path[:, 0] = np.arange(1000) / 1e6
+        streamer = TrajectoryStreamer(path, self.ID)
+
+        streamer.pause()
+        self.assertTrue(streamer.paused)
+        streamer.start()
+        self.assertRaises(RuntimeError, streamer.start)
+        self.assertFalse(streamer.wait(0.01))
+        self.assertEqual(streamer.index, 0)
+
+        streamer.resume()
+
+        while streamer.index < 10:
+            threading.Event().wait(1e-4)
+
+        streamer.cancel()
+        self.assertTrue(streamer.wait(0.))
+        self.assertFalse(streamer.running)
+
+        index = streamer.index
+        self.assertFalse(streamer.done)
+        self.assertEqual(self.dev.pos[0], path[index - 1, 0])
+
+        # Continues from the next waypoint
+        streamer.start()
+        self.assertTrue(streamer.wait(5.))
+        self.assertTrue(streamer.done)
+
+    def test_errors(self):
+        drd.stop(True, self.ID)
+
+        with TrajectoryStreamer(np.zeros((3, 3)), self.ID) as streamer:
+            self.assertTrue(streamer.wait(5.))
+
+        self.assertEqual(streamer.errors, 3)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, TrajectoryStreamer, np.zeros(3))
+        self.assertRaises(ValueError, TrajectoryStreamer, np.zeros((3, 4)))
+        self.assertRaises(
+            ValueError, TrajectoryStreamer, np.zeros((3, 3)), ticks=0
+        )
@@ -1,4 +1,5 @@
 from math import nan
+import pickle
 import unittest
 
 import pydantic
@@ -413,6 +414,69 @@ class TestUtil(unittest.TestCase):
             DHDErrorNoRegulation
         )
 
+    def test_error_attributes(self):
+        for errno in ErrorNum:
+            if errno == ErrorNum.NO_ERROR:
+                continue
+
+            exc_type = fd.util.errno_to_exception(errno)
+            self.assertEqual(exc_type.errnum, errno)
+
+            error = exc_type(op='forcedimension_core.dhd.getPosition', ID=1)
+            self.assertIsInstance(str(error), str)
+            self.assertEqual(str(pickle.loads(pickle.dumps(error))), str(error))
+            self.assertEqual(error.args, (str(error),))
+            self.assertEqual(
+                pickle.loads(pickle.dumps(error)).args, error.args
+            )
+
+        error = DHDErrorTimeout(op='forcedimension_core.dhd.getPosition', ID=1)
+        self.assertEqual(error.op, 'forcedimension_core.dhd.getPosition')
+        self.assertEqual(error.ID, 1)
+        self.assertEqual(
+            str(error),
+            'forcedimension_core.dhd.getPosition failed. timeout occured on '
+            'device 1'
+        )
+
+        # The message follows the attributes
+        error.ID = 2
+        self.assertTrue(str(error).endswith('device 2'))
+        self.assertEqual(error.args, (str(error),))
+        self.assertEqual(repr(error), f"DHDErrorTimeout({str(error)!r})")
+
+        self.assertEqual(
+            str(DHDErrorFeatureNotAvailable(op='getWatchdog', ID=0)),
+            'getWatchdog is not available on device 0 because it is not '
+            'supported on this device.'
+        )
+        self.assertEqual(str(DHDError("Failed.")), "Failed.")
+
+    def test_error_reset(self):
+        error = DHDErrorTimeout(op='forcedimension_core.dhd.getPosition')
+        tracebacks = []
+
+        for ID in range(3):
+            try:
+                try:
+                    raise KeyError
+                except KeyError:
+                    raise error.reset(ID=ID)
+            except DHDErrorTimeout as caught:
+                self.assertIs(caught, error)
+                self.assertEqual(caught.ID, ID)
+                tracebacks.append(caught.__traceback__)
+
+        # Each raise starts a fresh traceback
+        self.assertTrue(all(tb.tb_next is None for tb in tracebacks))
+        self.assertIsInstance(error.__context__, KeyError)
+
+        self.assertIs(error.reset(), error)
+        self.assertEqual(error.ID, 2)
+        self.assertEqual(error.op, 'forcedimension_core.dhd.getPosition')
+        self.assertIsNone(error.__traceback__)
+        self.assertIsNone(error.__context__)
+
     def test_TrajectoryGenParams(self):
         class Model(pydantic.BaseModel):
             params: TrajectoryGenParams = pydantic.Field(
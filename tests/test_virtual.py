@@ -0,0 +1,258 @@
+import math
+import time
+import unittest
+
+import forcedimension_core.dhd as dhd
+import forcedimension_core.dhd.direct as direct
+import forcedimension_core.dhd.expert as expert
+import forcedimension_core.drd as drd
+from forcedimension_core import containers, runtime
+from forcedimension_core.constants import DeviceType, ErrorNum
+from forcedimension_core.virtual import (
+    DeltaModel, PointMassModel, VirtualDevice, VirtualLibrary
+)
+
+
+class TestVirtual(unittest.TestCase):
+    def setUp(self):
+        self.lib = VirtualLibrary(
+            devices=[DeviceType.OMEGA7_RIGHT, DeviceType.DELTA3]
+        )
+        self._previous = runtime.install(self.lib)
+
+    def tearDown(self):
+        runtime.install(self._previous)
+
+    def test_install(self):
+        self.assertIs(runtime.get_library(), self.lib)
+
+    def test_load(self):
+        self.assertIsInstance(
+            runtime.load(backend='virtual', silent=True), VirtualLibrary
+        )
+        self.assertIsNone(runtime.load(backend='invalid', silent=True))
+
+    def test_from_env(self):
+        lib = VirtualLibrary.from_env({
+            'FORCEDIM_VIRTUAL_DEVICES': 'sigma7_left, falcon',
+            'FORCEDIM_VIRTUAL_MODEL': 'delta',
+            'FORCEDIM_VIRTUAL_LATENCY': '0.001'
+        })
+
+        self.assertEqual(
+            [dev.devtype for dev in lib.devices],
+            [DeviceType.SIGMA7_LEFT, DeviceType.FALCON]
+        )
+        self.assertIsInstance(lib.devices[0].model, DeltaModel)
+        self.assertEqual(lib.latency, 0.001)
+
+        self.assertIsInstance(
+            VirtualLibrary.from_env({}).devices[0].model, PointMassModel
+        )
+
+        with self.assertRaises(KeyError):
+            VirtualLibrary.from_env({'FORCEDIM_VIRTUAL_DEVICES': 'invalid'})
+
+        with self.assertRaises(ValueError):
+            VirtualLibrary.from_env({'FORCEDIM_VIRTUAL_MODEL': 'invalid'})
+
+    def test_device_management(self):
+        self.assertEqual(dhd.getDeviceCount(), 2)
+        self.assertEqual(dhd.getAvailableCount(), 2)
+
+        self.assertEqual(dhd.getPosition(containers.Vec3()), -1)
+        self.assertEqual(dhd.errorGetLast(), ErrorNum.NO_DEVICE_FOUND)
+
+        self.assertEqual(dhd.openType(DeviceType.DELTA3), 1)
+        self.assertEqual(dhd.open(), 0)
+        self.assertEqual(dhd.open(), -1)
+        self.assertEqual(dhd.getAvailableCount(), 0)
+
+        self.assertEqual(dhd.getSystemType(), DeviceType.OMEGA7_RIGHT)
+        self.assertEqual(dhd.getSystemType(1), DeviceType.DELTA3)
+        self.assertEqual(dhd.getSystemName(), 'omega.7')
+        self.assertTrue(dhd.hasGripper())
+        self.assertFalse(dhd.hasWrist(1))
+
+        self.assertEqual(dhd.setDevice(1), 0)
+        self.assertEqual(dhd.getDeviceID(), 1)
+        self.assertEqual(dhd.close(), 0)
+        self.assertEqual(dhd.getDeviceID(), 1)
+        self.assertEqual(dhd.getPosition(containers.Vec3()), -1)
+        self.assertEqual(dhd.close(0), 0)
+
+    def test_force_dynamics(self):
+        ID = dhd.open()
+        pos = containers.Vec3()
+
+        self.assertEqual(dhd.setForce([1., 0., 0.], ID), 0)
+        self.assertEqual(dhd.getPosition(pos, ID), 0)
+        self.assertEqual(list(pos), [0., 0., 0.])
+
+        self.assertEqual(dhd.enableForce(True, ID), 0)
+        dhd.getPosition(pos, ID)
+        time.sleep(0.02)
+        dhd.getPosition(pos, ID)
+
+        self.assertGreater(pos[0], 0.)
+        self.assertEqual(pos[1], 0.)
+        self.assertLessEqual(
+            math.sqrt(sum(p * p for p in pos)),
+            self.lib.devices[ID].model.workspace_radius
+        )
+
+        force = containers.Vec3()
+        self.assertEqual(dhd.getForce(force, ID), 0)
+        self.assertEqual(list(force), [1., 0., 0.])
+
+    def test_get_state(self):
+        omega = dhd.open()
+        delta = dhd.openType(DeviceType.DELTA3)
+
+        self.lib.devices[omega].pos = [0.01, 0.02, 0.03]
+        self.lib.devices[omega].gripper_angle = 0.5
+        self.lib.devices[omega].button_mask = 0b11
+        self.lib.devices[delta].pos = [0.04, 0.05, 0.06]
+
+        calls = []
+        has_wrist = self.lib.dhdHasWrist
+
+        def counting_has_wrist(ID):
+            calls.append(ID)
+            return has_wrist(ID)
+
+        # Discarded by runtime.install() in tearDown()
+        runtime._libdhd.dhdHasWrist = counting_has_wrist
+
+        for get_state in (dhd.getState, direct.getState):
+            calls.clear()
+
+            state = containers.DeviceState()
+            self.assertIsNone(state.has_wrist)
+
+            self.assertEqual(get_state(state, omega), 0)
+            self.assertEqual(get_state(state, omega), 0)
+            self.assertEqual(calls, [omega])
+
+            self.assertTrue(state.has_wrist)
+            self.assertTrue(state.has_gripper)
+            self.assertEqual(list(state.position), [0.01, 0.02, 0.03])
+            self.assertEqual(list(state.data.position), [0.01, 0.02, 0.03])
+            self.assertEqual(state.gripper_angle.value, 0.5)
+            self.assertEqual(state.buttons, 0b11)
+            self.assertTrue(state.status.connected)
+
+            self.assertEqual(get_state(state, delta), 0)
+            self.assertEqual(calls, [omega, delta])
+            self.assertFalse(state.has_wrist)
+            self.assertFalse(state.has_gripper)
+            self.assertEqual(list(state.position), [0.04, 0.05, 0.06])
+
+            # Parts the device lacks are left untouched
+            self.assertEqual(state.gripper_angle.value, 0.5)
+            self.assertEqual(state.buttons, 0)
+
+        dhd.close(omega)
+        self.assertEqual(dhd.getState(containers.DeviceState(), omega), -1)
+
+    def test_buttons(self):
+        ID = dhd.open()
+        self.lib.devices[ID].button_mask = 0b101
+
+        self.assertEqual(dhd.getButton(0, ID), 1)
+        self.assertEqual(dhd.getButton(1, ID), 0)
+        self.assertEqual(dhd.getButtonMask(ID), 0b101)
+
+    def test_delta_kinematics(self):
+        lib = VirtualLibrary(devices=1, model='delta')
+        runtime.install(lib)
+
+        ID = dhd.open()
+        enc = containers.Enc3()
+        pos = containers.Vec3()
+
+        self.assertEqual(expert.getDeltaEncoders(enc, ID), 0)
+        self.assertEqual(expert.deltaEncoderToPosition(enc, pos, ID), 0)
+
+        for p in pos:
+            self.assertAlmostEqual(p, 0., places=6)
+
+        self.assertEqual(
+            expert.deltaPositionToEncoder([0.01, -0.02, 0.03], enc, ID), 0
+        )
+        self.assertEqual(expert.deltaEncoderToPosition(enc, pos, ID), 0)
+
+        for actual, expected in zip(pos, [0.01, -0.02, 0.03]):
+            self.assertAlmostEqual(actual, expected, places=4)
+
+        self.assertEqual(
+            expert.deltaPositionToEncoder([1., 1., 1.], enc, ID), -1
+        )
+        self.assertEqual(dhd.errorGetLast(), ErrorNum.GEOMETRY)
+
+    def test_drd(self):
+        ID = drd.openID(0)
+
+        self.assertFalse(drd.isInitialized(ID))
+        self.assertEqual(drd.start(ID), -1)
+        self.assertEqual(drd.autoInit(ID), 0)
+        self.assertEqual(drd.start(ID), 0)
+        self.assertTrue(drd.isRunning(ID))
+
+        self.assertEqual(drd.moveToPos([0.02, 0., 0.], True, ID), 0)
+        self.assertFalse(drd.isMoving(ID))
+
+        pos = containers.Vec3()
+        dhd.getPosition(pos, ID)
+        self.assertEqual(list(pos), [0.02, 0., 0.])
+
+        self.assertEqual(drd.trackPos([0., 0.01, 0.], ID), 0)
+        dhd.getPosition(pos, ID)
+        self.assertEqual(list(pos), [0., 0.01, 0.])
+
+        self.assertEqual(drd.stop(False, ID), 0)
+        self.assertFalse(drd.isRunning(ID))
+        self.assertEqual(drd.trackPos([0., 0., 0.], ID), -1)
+        self.assertEqual(dhd.errorGetLast(), ErrorNum.NO_REGULATION)
+
+    def test_latency(self):
+        self.lib.latency = 0.005
+        ID = dhd.open()
+
+        t0 = time.perf_counter()
+        dhd.getPosition(containers.Vec3(), ID)
+        self.assertGreaterEqual(time.perf_counter() - t0, 0.005)
+
+        t0 = time.perf_counter()
+        expert.deltaEncoderToPosition(
+            [0, 0, 0], containers.Vec3(), ID
+        )
+        self.assertLess(time.perf_counter() - t0, 0.005)
+
+        # Short delays are mostly slept, not spun
+        self.lib.latency = 0.001
+
+        t0 = time.perf_counter()
+        cpu0 = time.process_time()
+        for _ in range(20):
+            dhd.getPosition(containers.Vec3(), ID)
+        self.assertLess(
+            time.process_time() - cpu0, (time.perf_counter() - t0) / 2
+        )
+
+    def test_not_implemented(self):
+        self.assertEqual(self.lib.dhdUnknownSymbol(), -1)
+        self.assertEqual(self.lib.last_error, ErrorNum.NOT_IMPLEMENTED)
+
+        with self.assertRaises(AttributeError):
+            self.lib.unknownSymbol
+
+    def test_virtual_device(self):
+        dev = VirtualDevice(DeviceType.SIGMA7_LEFT)
+
+        self.assertTrue(dev.has_active_wrist)
+        self.assertTrue(dev.is_left_handed)
+        self.assertEqual(len(dev.status()), 17)
+        self.assertEqual(
+            dev.frame(), [1., 0., 0., 0., 1., 0., 0., 0., 1.]
+        )